@@ -0,0 +1,41 @@
+"""Layer 1: Create import_checkpoints table for resumable batches
+
+Revision ID: 002
+Revises: 001
+Create Date: 2025-02-03
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # One checkpoint per in-flight batch: processing options plus the
+    # position of the last confirmed chunk (CSV byte offset/row, GDB feature index)
+    op.create_table(
+        'import_checkpoints',
+        sa.Column('batch_id', UUID, primary_key=True),
+        sa.Column('file_format', sa.VARCHAR(10), nullable=False),
+        sa.Column('options', JSONB, nullable=False),
+        sa.Column('position', JSONB, nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column('resume_count', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.ForeignKeyConstraint(['batch_id'], ['import_batches.batch_id'], name='fk_import_checkpoints_batch',
+                                ondelete='CASCADE'),
+        sa.CheckConstraint("file_format IN ('GDB', 'CSV')", name='check_checkpoint_file_format')
+    )
+
+    # Stale checkpoints (no progress for a while) are the resume candidates
+    op.create_index('idx_import_checkpoints_updated', 'import_checkpoints', ['updated_at'])
+
+
+def downgrade() -> None:
+    op.drop_table('import_checkpoints')
@@ -0,0 +1,33 @@
+"""Layer 1: Add parent_batch_id to import_batches for multi-layer GDB uploads
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Layers of one GDB upload run as child batches; their progress rolls up
+    # into the parent row, which settles once no child is processing
+    op.add_column('import_batches', sa.Column('parent_batch_id', UUID, nullable=True))
+    op.create_foreign_key(
+        'fk_import_batches_parent', 'import_batches', 'import_batches',
+        ['parent_batch_id'], ['batch_id'], ondelete='CASCADE'
+    )
+    op.create_index('idx_import_batches_parent', 'import_batches', ['parent_batch_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_import_batches_parent', table_name='import_batches')
+    op.drop_constraint('fk_import_batches_parent', 'import_batches', type_='foreignkey')
+    op.drop_column('import_batches', 'parent_batch_id')
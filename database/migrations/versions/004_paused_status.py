@@ -0,0 +1,32 @@
+"""Layer 1: Allow the 'paused' import batch status
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Batches pause while RabbitMQ is unreachable (publishing circuit breaker open)
+    op.drop_constraint('check_status', 'import_batches', type_='check')
+    op.create_check_constraint(
+        'check_status', 'import_batches',
+        "status IN ('processing', 'paused', 'completed', 'failed')"
+    )
+
+
+def downgrade() -> None:
+    op.execute("UPDATE import_batches SET status = 'processing' WHERE status = 'paused'")
+    op.drop_constraint('check_status', 'import_batches', type_='check')
+    op.create_check_constraint(
+        'check_status', 'import_batches',
+        "status IN ('processing', 'completed', 'failed')"
+    )
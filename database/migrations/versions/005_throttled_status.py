@@ -0,0 +1,32 @@
+"""Layer 1: Allow the 'throttled' import batch status
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Batches are throttled while the deduplication queue nears its x-max-length
+    op.drop_constraint('check_status', 'import_batches', type_='check')
+    op.create_check_constraint(
+        'check_status', 'import_batches',
+        "status IN ('processing', 'paused', 'throttled', 'completed', 'failed')"
+    )
+
+
+def downgrade() -> None:
+    op.execute("UPDATE import_batches SET status = 'processing' WHERE status = 'throttled'")
+    op.drop_constraint('check_status', 'import_batches', type_='check')
+    op.create_check_constraint(
+        'check_status', 'import_batches',
+        "status IN ('processing', 'paused', 'completed', 'failed')"
+    )
@@ -0,0 +1,129 @@
+"""
+Benchmark the CSV parser engines on a synthetic parcel CSV.
+
+Generates a V11 parcel CSV of the requested size (default 1GB), then runs
+each engine through the same path as process_csv_async minus publishing:
+read_csv_chunks -> ChunkValidator -> message dicts. Every engine runs in a
+fresh process so peak RSS is comparable.
+
+Usage:
+    cd services/ingestion-api
+    PYTHONPATH=../shared python benchmarks/benchmark_csv_engines.py --size-mb 1024
+"""
+
+import argparse
+import multiprocessing
+import random
+import resource
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+FLOAT_FIELDS = ["CNTASSDVALUE", "LNDVALUE", "IMPVALUE", "ESTFMKVALUE", "ASSDACRES", "GISACRES"]
+STRING_FIELDS = [
+    "STATEID", "PARCELID", "TAXPARCELID", "ADDNUM", "STREETNAME", "STREETTYPE",
+    "PLACENAME", "ZIPCODE", "CONAME", "OWNERNME1", "OWNERNME2", "PSTLADRESS",
+    "SITEADRESS", "ASSESSYEAR", "PROPCLASS", "SCHOOLDIST", "SCHOOLDISTNO",
+]
+
+
+def generate_parcel_csv(path: Path, size_mb: int, seed: int = 11) -> int:
+    """Write a synthetic parcel CSV of roughly size_mb megabytes; returns row count."""
+    rng = random.Random(seed)
+    header = STRING_FIELDS + FLOAT_FIELDS + ["geometry_wkt", "geometry_type"]
+    target = size_mb * 1024 * 1024
+    rows = 0
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(",".join(header) + "\n")
+        written = 0
+        while written < target:
+            x, y = rng.uniform(500000, 700000), rng.uniform(250000, 450000)
+            ring = ", ".join(
+                f"{x + dx:.3f} {y + dy:.3f}"
+                for dx, dy in ((0, 0), (30, 0), (30, 40), (0, 40), (0, 0))
+            )
+            values = [
+                f"WI{rows:09d}", f"{rows:012d}", f"T{rows}", str(rng.randint(1, 9999)),
+                rng.choice(["MAIN", "OAK", "STATE", "UNIVERSITY"]), "ST", "MADISON",
+                "53703", "DANE", f"OWNER {rng.randint(1, 10**6)}", "",
+                f"\"{rng.randint(1, 9999)} MAIN ST, MADISON WI\"",
+                f"{rng.randint(1, 9999)} MAIN ST", "2024", "1", "MADISON", "3269",
+            ] + [
+                f"{rng.uniform(0, 10**6):.2f}" if rng.random() > 0.05 else ""
+                for _ in FLOAT_FIELDS
+            ] + [f"\"POLYGON(({ring}))\"", "Polygon"]
+
+            line = ",".join(values) + "\n"
+            f.write(line)
+            written += len(line)
+            rows += 1
+
+    return rows
+
+
+def _run_engine(csv_path: str, engine: str, chunk_size: int, results) -> None:
+    """Read, validate and build messages with one engine (runs in a child process)."""
+    from shared.models import V11ParcelRecord
+    from services.chunk_validator import get_chunk_validator
+    from services.csv_processor import read_csv_chunks
+
+    validator = get_chunk_validator(V11ParcelRecord)
+    start = time.perf_counter()
+    rows = valid = 0
+
+    for chunk in read_csv_chunks(Path(csv_path), "utf-8", chunk_size, engine):
+        if engine == "arrow":
+            result = validator.validate_arrow(chunk)
+        else:
+            result = validator.validate(chunk)
+
+        messages = [
+            {"source_row_number": rows + pos + 1, "raw_data": raw_data}
+            for pos, raw_data in enumerate(result.records)
+            if raw_data is not None
+        ]
+        rows += len(chunk)
+        valid += len(messages)
+
+    elapsed = time.perf_counter() - start
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    results.put((engine, rows, valid, elapsed, peak_rss_mb))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size-mb", type=int, default=1024, help="Synthetic CSV size (default: 1024)")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Rows per chunk (default: 10000)")
+    parser.add_argument("--csv", type=Path, help="Use an existing parcel CSV instead of generating one")
+    parser.add_argument("--engines", nargs="+", default=["pandas", "arrow"])
+    args = parser.parse_args()
+
+    csv_path = args.csv
+    if csv_path is None:
+        csv_path = Path(f"/tmp/benchmark_parcels_{args.size_mb}mb.csv")
+        if not csv_path.exists():
+            print(f"Generating {csv_path} ...")
+            generate_parcel_csv(csv_path, args.size_mb)
+
+    size_mb = csv_path.stat().st_size / (1024 * 1024)
+    print(f"File: {csv_path} ({size_mb:.0f} MB), chunk size {args.chunk_size}")
+    print(f"{'engine':<8} {'rows':>10} {'valid':>10} {'seconds':>9} {'rows/s':>10} {'MB/s':>7} {'peak RSS MB':>12}")
+
+    ctx = multiprocessing.get_context("spawn")
+    for engine in args.engines:
+        results = ctx.Queue()
+        process = ctx.Process(target=_run_engine, args=(str(csv_path), engine, args.chunk_size, results))
+        process.start()
+        engine, rows, valid, elapsed, peak = results.get()
+        process.join()
+        print(
+            f"{engine:<8} {rows:>10} {valid:>10} {elapsed:>9.1f} {rows / elapsed:>10.0f} "
+            f"{size_mb / elapsed:>7.1f} {peak:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
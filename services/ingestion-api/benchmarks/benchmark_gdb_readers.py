@@ -0,0 +1,152 @@
+"""
+Benchmark the GDB reader engines on a synthetic county parcel layer.
+
+Writes a V11 parcel layer of the requested size (default 400k features,
+GeoPackage through the same GDAL/OGR stack as a File Geodatabase), then runs
+process_gdb_async with each reader engine with publishing and progress
+tracking stubbed out, so the numbers cover read -> transform -> WKT ->
+validate -> hash -> message. Every engine runs in a fresh process, with the
+event loop lag sampled alongside (what a /status request would wait).
+
+Usage:
+    cd services/ingestion-api
+    PYTHONPATH=../shared python benchmarks/benchmark_gdb_readers.py --features 400000
+    PYTHONPATH=../shared python benchmarks/benchmark_gdb_readers.py --crs EPSG:4326  # with reprojection
+    PYTHONPATH=../shared python benchmarks/benchmark_gdb_readers.py --geometry-format wkb  # WKB pass-through
+"""
+
+import argparse
+import multiprocessing
+import random
+import resource
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+STRING_FIELDS = [
+    "STATEID", "PARCELID", "TAXPARCELID", "ADDNUM", "STREETNAME", "STREETTYPE",
+    "PLACENAME", "ZIPCODE", "CONAME", "OWNERNME1", "OWNERNME2", "PSTLADRESS",
+    "SITEADRESS", "ASSESSYEAR", "PROPCLASS", "SCHOOLDIST", "SCHOOLDISTNO",
+]
+FLOAT_FIELDS = ["CNTASSDVALUE", "LNDVALUE", "IMPVALUE", "ESTFMKVALUE", "ASSDACRES", "GISACRES"]
+
+
+def generate_parcel_layer(path: Path, features: int, crs: str, seed: int = 11) -> None:
+    """Write a synthetic parcel layer of 5-vertex polygons in Wisconsin (EPSG:3071), then reproject."""
+    import geopandas as gpd
+    import numpy as np
+    import shapely
+
+    rng = random.Random(seed)
+    columns = {
+        "STATEID": [f"WI{i:09d}" for i in range(features)],
+        "PARCELID": [f"{i:012d}" for i in range(features)],
+        "TAXPARCELID": [f"T{i}" for i in range(features)],
+        "ADDNUM": [str(rng.randint(1, 9999)) for _ in range(features)],
+        "STREETNAME": [rng.choice(["MAIN", "OAK", "STATE", "UNIVERSITY"]) for _ in range(features)],
+        "OWNERNME1": [f"OWNER {rng.randint(1, 10**6)}" for _ in range(features)],
+    }
+    for name in STRING_FIELDS:
+        columns.setdefault(name, [rng.choice(["MADISON", "DANE", "2024", "1", ""]) for _ in range(features)])
+    for name in FLOAT_FIELDS:
+        columns[name] = [rng.uniform(0, 10**6) if rng.random() > 0.05 else None for _ in range(features)]
+
+    x = np.array([rng.uniform(500000, 700000) for _ in range(features)])
+    y = np.array([rng.uniform(250000, 450000) for _ in range(features)])
+    offsets = np.array([(0, 0), (30, 0), (30, 40), (0, 40), (0, 0)], dtype=float)
+    rings = np.stack([x[:, None] + offsets[:, 0], y[:, None] + offsets[:, 1]], axis=-1)
+    polygons = shapely.polygons(rings)
+
+    gdf = gpd.GeoDataFrame(columns, geometry=polygons, crs="EPSG:3071")
+    if crs != "EPSG:3071":
+        gdf = gdf.to_crs(crs)
+    gdf.to_file(path, layer="V11_Parcels", driver="GPKG")
+
+
+def _run_engine(layer_path: str, engine: str, chunk_size: int, geometry_format: str, results) -> None:
+    """Process the layer with one engine (runs in a child process)."""
+    import asyncio
+    import gc
+    import logging
+    from unittest.mock import AsyncMock, patch
+    from uuid import uuid4
+    from services.gdb_processor import process_gdb_async
+    from services.loop_monitor import LoopLagMonitor, run_loop_lag_monitor
+
+    logging.disable(logging.WARNING)
+    published = []
+
+    def publish(queue, messages):
+        published.append(len(messages))
+        return [True] * len(messages)
+
+    monitor = LoopLagMonitor(window=100_000)
+    gc.collect()
+    gc.freeze()  # As main.py does after startup
+
+    async def run() -> None:
+        lag_task = asyncio.create_task(run_loop_lag_monitor(0.01, warn_ms=10_000, monitor=monitor))
+        await process_gdb_async(
+            Path(layer_path), "V11_Parcels", uuid4(), "Benchmark",
+            chunk_size=chunk_size, reader_engine=engine, geometry_format=geometry_format
+        )
+        lag_task.cancel()
+
+    with patch("services.gdb_processor.publish_batch", side_effect=publish), \
+         patch("services.gdb_processor.update_batch_progress", new_callable=AsyncMock), \
+         patch("services.gdb_processor.complete_batch", new_callable=AsyncMock):
+        start = time.perf_counter()
+        asyncio.run(run())
+        elapsed = time.perf_counter() - start
+
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    lag = monitor.snapshot()
+    results.put((engine, sum(published), elapsed, peak_rss_mb, lag["p99_ms"], lag["max_ms"]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--features", type=int, default=400_000, help="Parcels in the layer (default: 400000)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Features per chunk (default: 1000)")
+    parser.add_argument("--crs", default="EPSG:3071", help="Layer CRS; anything else is reprojected on read")
+    parser.add_argument("--layer", type=Path, help="Use an existing layer instead of generating one")
+    parser.add_argument("--engines", nargs="+", default=["fiona", "arrow"])
+    parser.add_argument("--geometry-format", choices=["wkt", "wkb", "both"], default="wkt")
+    args = parser.parse_args()
+
+    layer_path = args.layer
+    if layer_path is None:
+        layer_path = Path(f"/tmp/benchmark_parcels_{args.features}_{args.crs.replace(':', '')}.gpkg")
+        if not layer_path.exists():
+            print(f"Generating {layer_path} ...")
+            generate_parcel_layer(layer_path, args.features, args.crs)
+
+    print(
+        f"Layer: {layer_path} ({args.crs}), chunk size {args.chunk_size}, "
+        f"geometry format {args.geometry_format}"
+    )
+    print(
+        f"{'engine':<8} {'messages':>10} {'seconds':>9} {'features/s':>11} {'peak RSS MB':>12} "
+        f"{'lag p99 ms':>11} {'lag max ms':>11}"
+    )
+
+    ctx = multiprocessing.get_context("spawn")
+    for engine in args.engines:
+        results = ctx.Queue()
+        process = ctx.Process(
+            target=_run_engine,
+            args=(str(layer_path), engine, args.chunk_size, args.geometry_format, results)
+        )
+        process.start()
+        engine, messages, elapsed, peak, lag_p99, lag_max = results.get()
+        process.join()
+        print(
+            f"{engine:<8} {messages:>10} {elapsed:>9.1f} {messages / elapsed:>11.0f} {peak:>12.0f} "
+            f"{lag_p99:>11.1f} {lag_max:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark the deduplication message codecs on V11 parcel messages.
+
+Builds real deduplication messages from a synthetic parcel CSV (same path
+as process_csv_async: read_csv_chunks -> ChunkValidator -> content hashes),
+trains a zstd dictionary on a separate sample, then reports bytes per
+record and encode/decode throughput for every codec in shared.codecs.
+
+Usage:
+    cd services/ingestion-api
+    PYTHONPATH=../shared python benchmarks/benchmark_message_codecs.py --rows 50000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from benchmark_csv_engines import generate_parcel_csv  # noqa: E402
+
+CODECS = ["json", "orjson", "msgpack", "json+zstd", "msgpack+zstd", "msgpack+zstd (dict)"]
+
+
+def build_messages(csv_path: Path, limit: int):
+    """Deduplication messages for the first `limit` rows of a parcel CSV."""
+    from uuid import uuid4
+    from shared.hash_utils import HASH_VERSION, compute_content_hashes
+    from shared.models import V11ParcelRecord
+    from services.chunk_validator import get_chunk_validator
+    from services.csv_processor import read_csv_chunks
+
+    validator = get_chunk_validator(V11ParcelRecord)
+    batch_id = str(uuid4())
+    messages = []
+
+    for chunk in read_csv_chunks(csv_path, "utf-8", 10000, "arrow"):
+        result = validator.validate_arrow(chunk)
+        hashes = compute_content_hashes("PARCEL", result.columns, len(result.records))
+        for pos, raw_data in enumerate(result.records):
+            if raw_data is None:
+                continue
+            messages.append({
+                "batch_id": batch_id,
+                "source_type": "PARCEL",
+                "source_file": "Benchmark/V11_Parcels",
+                "source_row_number": len(messages) + 1,
+                "content_hash": hashes[pos],
+                "hash_version": HASH_VERSION,
+                "raw_data": raw_data,
+            })
+            if len(messages) >= limit:
+                return messages
+
+    return messages
+
+
+def measure(spec: str, messages) -> tuple:
+    """(bytes/record, encode records/s, decode records/s) of one codec."""
+    from shared.codecs import decode_message, get_codec
+
+    get_codec.cache_clear()
+    codec = get_codec(spec)
+
+    start = time.perf_counter()
+    bodies = [codec.encode(message) for message in messages]
+    encode_seconds = time.perf_counter() - start
+
+    bodies = [body.encode("utf-8") if isinstance(body, str) else body for body in bodies]
+    start = time.perf_counter()
+    for body in bodies:
+        decode_message(body, codec.content_type, codec.content_encoding)
+    decode_seconds = time.perf_counter() - start
+
+    size = sum(len(body) for body in bodies) / len(bodies)
+    return size, len(messages) / encode_seconds, len(messages) / decode_seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=50000, help="Messages to encode (default: 50000)")
+    parser.add_argument("--train-rows", type=int, default=5000, help="Messages to train the dictionary on")
+    parser.add_argument("--dict-size", type=int, default=16 * 1024, help="zstd dictionary size in bytes")
+    args = parser.parse_args()
+
+    from shared.codecs import train_zstd_dictionary
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "parcels.csv"
+        # ~250 bytes per CSV row; generate enough for training + measured rows
+        generate_parcel_csv(csv_path, max(1, (args.rows + args.train_rows) * 400 // (1024 * 1024)))
+        messages = build_messages(csv_path, args.rows + args.train_rows)
+
+        training, messages = messages[:args.train_rows], messages[args.train_rows:]
+        dictionary_path = Path(tmp) / "v11.zdict"
+        dictionary_path.write_bytes(
+            train_zstd_dictionary(training, serializer="msgpack", dict_size=args.dict_size)
+        )
+
+        print(f"{len(messages)} messages, dictionary trained on {len(training)} ({args.dict_size} bytes)")
+        print(f"{'codec':<22} {'bytes/rec':>10} {'vs json':>8} {'encode rec/s':>13} {'decode rec/s':>13}")
+
+        baseline = None
+        for name in CODECS:
+            spec = name.split(" ")[0]
+            if name.endswith("(dict)"):
+                os.environ["RABBITMQ_ZSTD_DICTIONARY"] = str(dictionary_path)
+            else:
+                os.environ.pop("RABBITMQ_ZSTD_DICTIONARY", None)
+
+            size, encode_rate, decode_rate = measure(spec, messages)
+            baseline = baseline or size
+            print(
+                f"{name:<22} {size:>10.0f} {size / baseline:>7.0%} "
+                f"{encode_rate:>13,.0f} {decode_rate:>13,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
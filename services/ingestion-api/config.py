@@ -5,6 +5,9 @@ Inherits common settings from shared.config.BaseServiceSettings and adds
 ingestion-api specific configuration.
 """
 
+from pathlib import Path
+from typing import Literal, Optional
+
 from pydantic import Field
 from shared.config import BaseServiceSettings
 
@@ -69,15 +72,116 @@ class Settings(BaseServiceSettings):
         ge=100,
         le=10000
     )
+    CSV_PARSER_ENGINE: Literal["pandas", "arrow"] = Field(
+        "pandas",
+        description="Default CSV parser engine ('arrow' streams Arrow record batches)"
+    )
+    CSV_PARALLEL_WORKERS: int = Field(
+        1,
+        description="Worker processes for large CSV files split into byte ranges (1 = sequential)",
+        ge=1,
+        le=64
+    )
     DEFAULT_LAYER_NAME: str = Field(
         "V11_Parcels",
         description="Default GDB layer name for Wisconsin V11 parcels"
     )
+    GDB_READ_IN_PLACE: bool = Field(
+        True,
+        description="Read uploaded .gdb.zip archives in place (GDAL /vsizip/) instead of extracting them"
+    )
+    GDB_READER_ENGINE: Literal["fiona", "arrow"] = Field(
+        "arrow",
+        description="GDB reader engine ('arrow' reads pyogrio record batches, 'fiona' feature by feature)"
+    )
+    GDB_GEOMETRY_FORMAT: Literal["wkt", "wkb", "both"] = Field(
+        "wkt",
+        description="Geometry format of GDB parcel messages (geometry_wkt, hex WKB geometry_wkb, or both)"
+    )
+    GDB_GRID_SIZE: float = Field(
+        0.0,
+        description="Coordinate grid in EPSG:3071 metres that GDB geometries are snapped to (0 = full precision)",
+        ge=0
+    )
+    GDB_SIMPLIFY_TOLERANCE: float = Field(
+        0.0,
+        description="Topology-preserving simplification tolerance in metres for GDB geometries (0 = off)",
+        ge=0
+    )
+    GDB_PARALLEL_WORKERS: int = Field(
+        1,
+        description="Worker processes per GDB layer, which is split into feature ranges (1 = sequential)",
+        ge=1,
+        le=64
+    )
+    GDB_MAX_CONCURRENT_LAYERS: int = Field(
+        4,
+        description="Layers of a multi-layer GDB upload processed at the same time",
+        ge=1,
+        le=32
+    )
+    PARCEL_GEOMETRY_METRICS: bool = Field(
+        True,
+        description="Attach the bbox, centroid and area of every parcel geometry (GDB and CSV) to its message"
+    )
+    PREWARM_PROCESSORS: list[Literal["gdb", "csv"]] = Field(
+        default=[],
+        description="Processors imported at startup instead of by their first job (e.g. [\"gdb\", \"csv\"])"
+    )
     CRS_TARGET: int = Field(
         3071,
         description="Target CRS EPSG code (Wisconsin Transverse Mercator)"
     )
 
+    # === Resume Configuration ===
+    RESUME_INTERRUPTED_BATCHES: bool = Field(
+        True,
+        description="Resume batches interrupted by a restart from their last checkpoint"
+    )
+    RESUME_STALE_SECONDS: int = Field(
+        300,
+        description="Seconds without checkpoint progress before a processing batch counts as interrupted",
+        ge=30,
+        le=86400
+    )
+
+    # === Duplicate Suppression Configuration ===
+    HASH_INDEX_ENABLED: bool = Field(
+        True,
+        description="Skip publishing records whose content hash is in the local hash index"
+    )
+    HASH_INDEX_REFRESH_SECONDS: int = Field(
+        900,
+        description="Seconds between incremental hash index refreshes from raw_imports",
+        ge=30,
+        le=86400
+    )
+
+    # === Event Loop Monitoring ===
+    LOOP_LAG_INTERVAL_SECONDS: float = Field(
+        0.25,
+        description="Seconds between event loop lag samples (reported by /health)",
+        gt=0,
+        le=60
+    )
+    LOOP_LAG_WARN_MS: int = Field(
+        250,
+        description="Log a warning when the event loop lags more than this many milliseconds",
+        ge=1
+    )
+
+    # === Publish Spool Configuration ===
+    PUBLISH_SPOOL_ENABLED: bool = Field(
+        True,
+        description="Spool messages the broker does not take to local disk and replay them once it recovers"
+    )
+    SPOOL_DRAIN_INTERVAL_SECONDS: float = Field(
+        5.0,
+        description="Seconds between replays of the publish spool",
+        gt=0,
+        le=3600
+    )
+
     # === RabbitMQ Configuration ===
     RABBITMQ_EXCHANGE: str = Field(
         "ingestion.direct",
@@ -131,6 +235,22 @@ class Settings(BaseServiceSettings):
         """Get maximum upload size in bytes."""
         return self.MAX_UPLOAD_SIZE_MB * 1024 * 1024
 
+    @property
+    def hash_index_path(self) -> Optional[Path]:
+        """Get the local hash index file path (None when suppression is disabled)."""
+        if not self.HASH_INDEX_ENABLED:
+            return None
+        return Path(self.TEMP_STORAGE_PATH) / "hash-index" / "content_hashes.bin"
+
+    @property
+    def publish_spool_path(self) -> Optional[Path]:
+        """Get the publish spool directory (RABBITMQ_SPOOL_PATH or under TEMP_STORAGE_PATH; None when disabled)."""
+        if not self.PUBLISH_SPOOL_ENABLED:
+            return None
+        if self.RABBITMQ_SPOOL_PATH:
+            return Path(self.RABBITMQ_SPOOL_PATH)
+        return Path(self.TEMP_STORAGE_PATH) / "publish-spool"
+
     @property
     def is_development(self) -> bool:
         """Check if running in development mode."""
@@ -9,8 +9,11 @@ Provides endpoints for:
 - Health monitoring
 """
 
+import asyncio
+import gc
 import logging
-from contextlib import asynccontextmanager
+import os
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime, timezone
 
 from fastapi import FastAPI, Request
@@ -18,12 +21,24 @@ from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from shared.database import get_db_pool, close_db_pool, check_db_health
-from shared.rabbitmq import check_rabbitmq_health, close_rabbitmq_connection
+from shared.aio_rabbitmq import (
+    check_rabbitmq_health,
+    close_rabbitmq_connection,
+    publisher_backpressure_stats,
+    publisher_breaker_stats,
+    publisher_pool_stats,
+    publisher_spool_stats,
+    run_spool_drainer,
+)
 from routers import csv_ingest, gdb_ingest, status
 from models.schemas import HealthResponse, ErrorResponse
 from config import Settings
 from exceptions import register_exception_handlers
 from middleware import RequestIDMiddleware
+from services.batch_resume import run_resume_watcher
+from services.hash_index import run_hash_index_refresher
+from services.lazy_imports import prewarm_processors
+from services.loop_monitor import loop_lag_monitor, run_loop_lag_monitor
 
 # Configure structured logging
 from services.logging_utils import StructuredFormatter
@@ -54,11 +69,19 @@ async def lifespan(app: FastAPI):
     Lifespan context manager for startup and shutdown events.
 
     Startup:
+        - Export the settings shared modules read from the environment
         - Initialize database connection pool
+        - Point publishers at the publish spool and start replaying it
         - Initialize RabbitMQ connection
+        - Start resuming interrupted batches from their checkpoints
+        - Start refreshing the local content hash index
+        - Start sampling event loop lag
+        - Import the processors listed in PREWARM_PROCESSORS
+        - Freeze startup objects out of garbage collection
         - Log service configuration
 
     Shutdown:
+        - Stop the resume watcher, hash index refresher, loop lag monitor and spool drainer
         - Close database pool
         - Close RabbitMQ connection
     """
@@ -72,18 +95,73 @@ async def lifespan(app: FastAPI):
     logger.info("=" * 80)
 
     try:
+        # Shared modules (e.g. the message codec) read some settings with
+        # os.getenv; export them so .env values apply here and in range workers
+        settings.export_environment()
+
         # Initialize database connection pool
         logger.info("Initializing database connection pool...")
         await get_db_pool()
         logger.info("Database connection pool initialized")
 
+        # Spool what the broker does not take; publishers of this process and of
+        # its range workers (spawned, so they inherit the environment) read the path
+        spool_drainer = None
+        if settings.publish_spool_path is not None:
+            os.environ["RABBITMQ_SPOOL_PATH"] = str(settings.publish_spool_path)
+            spool_drainer = asyncio.create_task(
+                run_spool_drainer(settings.SPOOL_DRAIN_INTERVAL_SECONDS, settings.RABBITMQ_SPOOL_DRAIN_RATE)
+            )
+            logger.info(
+                f"Publish spool enabled ({settings.publish_spool_path}, "
+                f"replay at {settings.RABBITMQ_SPOOL_DRAIN_RATE} messages/s)"
+            )
+
         # Test RabbitMQ connection
         logger.info("Testing RabbitMQ connection...")
-        if check_rabbitmq_health():
+        if await check_rabbitmq_health():
             logger.info("RabbitMQ connection established")
         else:
             logger.warning("RabbitMQ health check failed (will retry on first use)")
 
+        # Resume batches interrupted by a restart (once their checkpoint is stale)
+        resume_watcher = None
+        if settings.RESUME_INTERRUPTED_BATCHES:
+            resume_watcher = asyncio.create_task(
+                run_resume_watcher(settings.RESUME_STALE_SECONDS)
+            )
+            logger.info(
+                f"Batch resume enabled (stale after {settings.RESUME_STALE_SECONDS}s)"
+            )
+
+        # Keep the local content hash index in step with raw_imports
+        hash_index_refresher = None
+        if settings.hash_index_path is not None:
+            hash_index_refresher = asyncio.create_task(
+                run_hash_index_refresher(
+                    settings.hash_index_path, settings.HASH_INDEX_REFRESH_SECONDS
+                )
+            )
+            logger.info(
+                f"Duplicate suppression enabled (index: {settings.hash_index_path}, "
+                f"refresh every {settings.HASH_INDEX_REFRESH_SECONDS}s)"
+            )
+
+        # Sample event loop lag (reported by /health)
+        loop_monitor = asyncio.create_task(
+            run_loop_lag_monitor(settings.LOOP_LAG_INTERVAL_SECONDS, settings.LOOP_LAG_WARN_MS)
+        )
+
+        # Processors are otherwise imported by their first job
+        if settings.PREWARM_PROCESSORS:
+            await prewarm_processors(settings.PREWARM_PROCESSORS)
+            logger.info(f"Prewarmed processors: {', '.join(settings.PREWARM_PROCESSORS)}")
+
+        # Long-lived startup objects (modules, settings, pools) are never garbage;
+        # freezing them keeps full collections during ingest from stalling the loop
+        gc.collect()
+        gc.freeze()
+
         logger.info("Startup complete")
 
     except Exception as e:
@@ -96,6 +174,12 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down Ingestion API...")
 
     try:
+        for task in (resume_watcher, hash_index_refresher, loop_monitor, spool_drainer):
+            if task is not None:
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+
         # Close database pool
         logger.info("Closing database connection pool...")
         await close_db_pool()
@@ -103,7 +187,7 @@ async def lifespan(app: FastAPI):
 
         # Close RabbitMQ connection
         logger.info("Closing RabbitMQ connection...")
-        close_rabbitmq_connection()
+        await close_rabbitmq_connection()
         logger.info("RabbitMQ connection closed")
 
         logger.info("Shutdown complete")
@@ -208,6 +292,8 @@ async def health_check() -> HealthResponse:
     - RabbitMQ connectivity
     - Storage availability
 
+    Also reports recent event loop lag and publishing channel pool utilization.
+
     Returns:
     - 200 OK: All services healthy
     - 200 OK (degraded): Some services unhealthy
@@ -225,7 +311,7 @@ async def health_check() -> HealthResponse:
 
     # Check RabbitMQ
     try:
-        rabbitmq_healthy = check_rabbitmq_health()
+        rabbitmq_healthy = await check_rabbitmq_health()
         services["rabbitmq"] = "healthy" if rabbitmq_healthy else "unhealthy"
     except Exception as e:
         logger.error(f"RabbitMQ health check failed: {e}")
@@ -255,7 +341,12 @@ async def health_check() -> HealthResponse:
         status=status,
         timestamp=datetime.now(timezone.utc),
         services=services,
-        version="1.0.0"
+        version="1.0.0",
+        event_loop_lag=loop_lag_monitor.snapshot(),
+        publisher_pool=publisher_pool_stats(),
+        publisher_breaker=publisher_breaker_stats(),
+        publisher_spool=publisher_spool_stats(),
+        publisher_backpressure=publisher_backpressure_stats()
     )
 
     # Return 503 if unhealthy (for k8s liveness probes)
@@ -10,7 +10,7 @@ Defines data models for:
 """
 
 from datetime import datetime, timezone
-from typing import Literal, Optional
+from typing import Dict, List, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
@@ -59,6 +59,10 @@ class IngestResponse(BaseModel):
         description="Estimated processing time in minutes (null if unknown)",
         ge=0
     )
+    child_batches: Optional[Dict[str, UUID]] = Field(
+        None,
+        description="Child batch ID per layer of a multi-layer GDB upload (null otherwise)"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -97,9 +101,12 @@ class BatchStatusResponse(BaseModel):
         ...,
         description="File format of the upload"
     )
-    status: Literal["processing", "completed", "failed"] = Field(
+    status: Literal["processing", "paused", "throttled", "completed", "failed"] = Field(
         ...,
-        description="Current batch status"
+        description=(
+            "Current batch status ('paused' while RabbitMQ is unavailable, "
+            "'throttled' while the deduplication queue is nearly full)"
+        )
     )
     total_records: Optional[int] = Field(
         None,
@@ -136,7 +143,7 @@ class BatchStatusResponse(BaseModel):
     )
     error: Optional[str] = Field(
         None,
-        description="Error message if status is 'failed' (null otherwise)"
+        description="Error message if status is 'failed', pause or throttle reason if 'paused' or 'throttled' (null otherwise)"
     )
     progress_percent: Optional[float] = Field(
         None,
@@ -144,6 +151,14 @@ class BatchStatusResponse(BaseModel):
         ge=0.0,
         le=100.0
     )
+    parent_batch_id: Optional[UUID] = Field(
+        None,
+        description="Batch this batch reports into (one layer of a multi-layer GDB upload)"
+    )
+    child_batch_ids: List[UUID] = Field(
+        default_factory=list,
+        description="Child batches reporting into this batch (one per layer)"
+    )
 
     @field_validator("progress_percent", mode="before")
     @classmethod
@@ -244,6 +259,26 @@ class HealthResponse(BaseModel):
         None,
         description="Service version (from environment or package metadata)"
     )
+    event_loop_lag: dict[str, float] = Field(
+        default_factory=dict,
+        description="Recent event loop lag (last_ms, p50_ms, p99_ms, max_ms)"
+    )
+    publisher_pool: dict[str, float] = Field(
+        default_factory=dict,
+        description="Publishing channel pool utilization (size, open, in_use, idle, waiting, utilization, ...)"
+    )
+    publisher_breaker: dict[str, float] = Field(
+        default_factory=dict,
+        description="Publishing circuit breaker (open, consecutive_failures, trips, retry_in_seconds)"
+    )
+    publisher_spool: dict[str, float] = Field(
+        default_factory=dict,
+        description="Local publish spool (segments, bytes, appended, replayed; empty when disabled)"
+    )
+    publisher_backpressure: dict[str, dict[str, float]] = Field(
+        default_factory=dict,
+        description="Backpressure per bounded queue published to (depth, fill, consumers, drain_rate, throttled, rate, ...)"
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -255,7 +290,22 @@ class HealthResponse(BaseModel):
                     "rabbitmq": "healthy",
                     "storage": "healthy"
                 },
-                "version": "1.0.0"
+                "version": "1.0.0",
+                "event_loop_lag": {"last_ms": 0.4, "p50_ms": 0.3, "p99_ms": 2.1, "max_ms": 3.5},
+                "publisher_pool": {
+                    "size": 8, "open": 2, "in_use": 1, "idle": 1, "waiting": 0,
+                    "utilization": 0.125, "leases": 412, "recycled": 0, "avg_wait_ms": 0.01
+                },
+                "publisher_breaker": {
+                    "open": 0.0, "consecutive_failures": 0, "trips": 0, "retry_in_seconds": 0.0
+                },
+                "publisher_spool": {"segments": 0, "bytes": 0, "appended": 0, "replayed": 0},
+                "publisher_backpressure": {
+                    "deduplication": {
+                        "depth": 612000, "fill": 0.612, "consumers": 4, "drain_rate": 5200.0,
+                        "throttled": 1, "rate": 7300.0, "throttled_seconds": 42.5
+                    }
+                }
             }
         }
     )
@@ -6,19 +6,25 @@ Provides REST API endpoints for uploading CSV files:
 - POST /api/v1/ingest/retr - Upload RETR CSV
 """
 
+import asyncio
 import logging
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 import aiofiles
 from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, UploadFile
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 
 from models.schemas import CSVUploadRequest, IngestResponse, ErrorResponse
-from services.csv_processor import process_csv_async, count_csv_rows, validate_csv_format
+from services.upload_inspector import UploadInspector
 from services.batch_tracker import create_batch
+from services.lazy_imports import PROCESSOR_MODULES, import_processor, lazy_function
 from config import Settings
 
+# CSV processor functions, imported with pandas and pyarrow by the first CSV upload
+process_csv_async = lazy_function(PROCESSOR_MODULES["csv"], "process_csv_async", is_async=True)
+validate_csv_format = lazy_function(PROCESSOR_MODULES["csv"], "validate_csv_format")
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/ingest", tags=["csv-ingestion"])
@@ -27,13 +33,18 @@ router = APIRouter(prefix="/api/v1/ingest", tags=["csv-ingestion"])
 settings = Settings()
 
 
-async def save_upload_file(upload_file: UploadFile, destination: Path) -> int:
+async def save_upload_file(
+    upload_file: UploadFile,
+    destination: Path,
+    inspector: Optional[UploadInspector] = None
+) -> int:
     """
     Save uploaded file to disk.
 
     Args:
         upload_file: The uploaded file
         destination: Destination path
+        inspector: Optional inspector fed with each chunk as it is written
 
     Returns:
         int: Number of bytes written
@@ -51,6 +62,8 @@ async def save_upload_file(upload_file: UploadFile, destination: Path) -> int:
         while chunk := await upload_file.read(1024 * 1024):  # 1MB chunks
             await f.write(chunk)
             bytes_written += len(chunk)
+            if inspector is not None:
+                await asyncio.to_thread(inspector.feed, chunk)  # CPU work, off the loop
 
     logger.info(f"Saved upload file to {destination} ({bytes_written} bytes)")
     return bytes_written
@@ -139,7 +152,10 @@ def validate_file_size(
 async def upload_parcel_csv(
     background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="CSV file containing parcel records"),
-    source_name: str = Form(..., description="Name of the data source (e.g., 'Dane County 2025')")
+    source_name: str = Form(..., description="Name of the data source (e.g., 'Dane County 2025')"),
+    parser_engine: Optional[Literal["pandas", "arrow"]] = Form(
+        None, description="CSV parser engine (defaults to the CSV_PARSER_ENGINE setting)"
+    )
 ) -> IngestResponse:
     """
     Upload and process a parcel CSV file.
@@ -148,6 +164,7 @@ async def upload_parcel_csv(
         background_tasks: FastAPI background tasks
         file: Uploaded CSV file
         source_name: Name of the data source
+        parser_engine: Optional CSV parser engine override ('pandas' or 'arrow')
 
     Returns:
         IngestResponse with batch_id and status
@@ -182,11 +199,17 @@ async def upload_parcel_csv(
         temp_dir = Path(settings.TEMP_STORAGE_PATH) / "csv"
         temp_file = temp_dir / f"{validated_source_name.replace(' ', '_')}_{file.filename}"
 
-        file_size_bytes = await save_upload_file(file, temp_file)
+        # Inspect encoding, header, sample and row count while the upload streams
+        inspector = UploadInspector()
+        file_size_bytes = await save_upload_file(file, temp_file, inspector)
         validate_file_size(file_size_bytes, settings.max_upload_size_bytes)
 
+        # Load the CSV processor (pandas, pyarrow) off the event loop
+        await import_processor("csv")
+        inspection = inspector.finish()
+
         # Validate it's actually a CSV
-        is_valid, validation_error = validate_csv_format(temp_file)
+        is_valid, validation_error = validate_csv_format(temp_file, inspection=inspection)
         if not is_valid:
             temp_file.unlink()  # Delete invalid file
             raise HTTPException(
@@ -198,20 +221,27 @@ async def upload_parcel_csv(
                 }
             )
 
-        # Count rows (for progress tracking)
-        try:
-            total_rows = await count_csv_rows(temp_file)
-        except Exception as e:
-            logger.warning(f"Could not count CSV rows: {e}")
-            total_rows = None
+        # Row count from the upload inspection (for progress tracking)
+        total_rows = inspection.row_count
 
-        # Create batch record
+        # Create batch record (with processor arguments, so it can be resumed)
         batch_id = await create_batch(
             source_name=validated_source_name,
             source_type="PARCEL",
             file_format="CSV",
             file_size_bytes=file_size_bytes,
-            total_records=total_rows
+            total_records=total_rows,
+            processing_options={
+                "csv_path": str(temp_file),
+                "source_type": "PARCEL",
+                "source_name": validated_source_name,
+                "chunk_size": settings.BATCH_SIZE,
+                "parser_engine": parser_engine or settings.CSV_PARSER_ENGINE,
+                "workers": settings.CSV_PARALLEL_WORKERS,
+                "encoding": inspection.encoding,
+                "hash_index_path": str(settings.hash_index_path) if settings.hash_index_path else None,
+                "geometry_metrics": settings.PARCEL_GEOMETRY_METRICS
+            }
         )
 
         # Start background processing
@@ -221,7 +251,12 @@ async def upload_parcel_csv(
             source_type="PARCEL",
             batch_id=batch_id,
             source_name=validated_source_name,
-            chunk_size=settings.BATCH_SIZE
+            chunk_size=settings.BATCH_SIZE,
+            inspection=inspection,
+            parser_engine=parser_engine or settings.CSV_PARSER_ENGINE,
+            workers=settings.CSV_PARALLEL_WORKERS,
+            hash_index_path=settings.hash_index_path,
+            geometry_metrics=settings.PARCEL_GEOMETRY_METRICS
         )
 
         # Calculate estimated time (rough estimate: 5000 records/sec)
@@ -282,7 +317,10 @@ async def upload_parcel_csv(
 async def upload_retr_csv(
     background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="CSV file containing RETR records"),
-    source_name: str = Form(..., description="Name of the data source (e.g., 'Wisconsin DOR RETR Q1 2025')")
+    source_name: str = Form(..., description="Name of the data source (e.g., 'Wisconsin DOR RETR Q1 2025')"),
+    parser_engine: Optional[Literal["pandas", "arrow"]] = Form(
+        None, description="CSV parser engine (defaults to the CSV_PARSER_ENGINE setting)"
+    )
 ) -> IngestResponse:
     """
     Upload and process a RETR CSV file.
@@ -291,6 +329,7 @@ async def upload_retr_csv(
         background_tasks: FastAPI background tasks
         file: Uploaded CSV file
         source_name: Name of the data source
+        parser_engine: Optional CSV parser engine override ('pandas' or 'arrow')
 
     Returns:
         IngestResponse with batch_id and status
@@ -315,11 +354,17 @@ async def upload_retr_csv(
         temp_dir = Path(settings.TEMP_STORAGE_PATH) / "csv"
         temp_file = temp_dir / f"{validated_source_name.replace(' ', '_')}_{file.filename}"
 
-        file_size_bytes = await save_upload_file(file, temp_file)
+        # Inspect encoding, header, sample and row count while the upload streams
+        inspector = UploadInspector()
+        file_size_bytes = await save_upload_file(file, temp_file, inspector)
         validate_file_size(file_size_bytes, settings.max_upload_size_bytes)
 
+        # Load the CSV processor (pandas, pyarrow) off the event loop
+        await import_processor("csv")
+        inspection = inspector.finish()
+
         # Validate it's actually a CSV
-        is_valid, validation_error = validate_csv_format(temp_file)
+        is_valid, validation_error = validate_csv_format(temp_file, inspection=inspection)
         if not is_valid:
             temp_file.unlink()  # Delete invalid file
             raise HTTPException(
@@ -331,20 +376,26 @@ async def upload_retr_csv(
                 }
             )
 
-        # Count rows
-        try:
-            total_rows = await count_csv_rows(temp_file)
-        except Exception as e:
-            logger.warning(f"Could not count CSV rows: {e}")
-            total_rows = None
+        # Row count from the upload inspection (for progress tracking)
+        total_rows = inspection.row_count
 
-        # Create batch record
+        # Create batch record (with processor arguments, so it can be resumed)
         batch_id = await create_batch(
             source_name=validated_source_name,
             source_type="RETR",
             file_format="CSV",
             file_size_bytes=file_size_bytes,
-            total_records=total_rows
+            total_records=total_rows,
+            processing_options={
+                "csv_path": str(temp_file),
+                "source_type": "RETR",
+                "source_name": validated_source_name,
+                "chunk_size": settings.BATCH_SIZE,
+                "parser_engine": parser_engine or settings.CSV_PARSER_ENGINE,
+                "workers": settings.CSV_PARALLEL_WORKERS,
+                "encoding": inspection.encoding,
+                "hash_index_path": str(settings.hash_index_path) if settings.hash_index_path else None
+            }
         )
 
         # Start background processing
@@ -354,7 +405,11 @@ async def upload_retr_csv(
             source_type="RETR",
             batch_id=batch_id,
             source_name=validated_source_name,
-            chunk_size=settings.BATCH_SIZE
+            chunk_size=settings.BATCH_SIZE,
+            inspection=inspection,
+            parser_engine=parser_engine or settings.CSV_PARSER_ENGINE,
+            workers=settings.CSV_PARALLEL_WORKERS,
+            hash_index_path=settings.hash_index_path
         )
 
         # Calculate estimated time
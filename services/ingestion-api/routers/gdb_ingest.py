@@ -7,24 +7,27 @@ Provides REST API endpoints for uploading GDB files:
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
+from uuid import UUID
 import aiofiles
 from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, UploadFile
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 
 from models.schemas import GDBUploadRequest, IngestResponse, ErrorResponse
-from services.gdb_processor import (
-    extract_gdb,
-    inspect_gdb,
-    count_features,
-    process_gdb_async,
-    validate_gdb_format,
-    cleanup_gdb
-)
 from services.batch_tracker import create_batch
+from services.lazy_imports import PROCESSOR_MODULES, import_processor, lazy_function
 from config import Settings
 
+# GDB processor functions, imported with the geospatial stack by the first GDB upload
+extract_gdb = lazy_function(PROCESSOR_MODULES["gdb"], "extract_gdb")
+inspect_gdb = lazy_function(PROCESSOR_MODULES["gdb"], "inspect_gdb")
+count_features = lazy_function(PROCESSOR_MODULES["gdb"], "count_features")
+process_gdb_async = lazy_function(PROCESSOR_MODULES["gdb"], "process_gdb_async", is_async=True)
+process_gdb_layers_async = lazy_function(PROCESSOR_MODULES["gdb"], "process_gdb_layers_async", is_async=True)
+validate_gdb_format = lazy_function(PROCESSOR_MODULES["gdb"], "validate_gdb_format")
+cleanup_gdb = lazy_function(PROCESSOR_MODULES["gdb"], "cleanup_gdb")
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/ingest", tags=["gdb-ingestion"])
@@ -138,10 +141,13 @@ def validate_file_size(
     - V11 fields: STATEID, PARCELID, etc.
 
     Optional parameters:
-    - layer_name: Specific layer to process (default: "V11_Parcels")
+    - layer_name: Specific layer to process (default: "V11_Parcels"). Several
+      comma-separated layers are processed concurrently, each under its own
+      child batch; the returned batch_id is the parent batch, whose counts
+      include all layers
 
     The GDB will be:
-    1. Extracted and inspected
+    1. Opened in place from the zip (or extracted) and inspected
     2. Validated for correct CRS and schema
     3. Transformed to EPSG:3071 if needed
     4. Processed in chunks and published to RabbitMQ
@@ -154,7 +160,21 @@ async def upload_parcel_gdb(
     background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="GDB .zip file containing parcel records"),
     source_name: str = Form(..., description="Name of the data source (e.g., 'Dane County 2025')"),
-    layer_name: Optional[str] = Form(None, description="Layer name to process (default: V11_Parcels)")
+    layer_name: Optional[str] = Form(
+        None, description="Layer name to process, or comma-separated layer names (default: V11_Parcels)"
+    ),
+    reader_engine: Optional[Literal["fiona", "arrow"]] = Form(
+        None, description="GDB reader engine (defaults to the GDB_READER_ENGINE setting)"
+    ),
+    geometry_format: Optional[Literal["wkt", "wkb", "both"]] = Form(
+        None, description="Geometry format of the messages (defaults to the GDB_GEOMETRY_FORMAT setting)"
+    ),
+    grid_size: Optional[float] = Form(
+        None, ge=0, description="Coordinate grid in metres, e.g. 0.01 (defaults to the GDB_GRID_SIZE setting)"
+    ),
+    simplify_tolerance: Optional[float] = Form(
+        None, ge=0, description="Simplification tolerance in metres (defaults to the GDB_SIMPLIFY_TOLERANCE setting)"
+    )
 ) -> IngestResponse:
     """
     Upload and process a parcel GDB file.
@@ -163,7 +183,12 @@ async def upload_parcel_gdb(
         background_tasks: FastAPI background tasks
         file: Uploaded GDB zip file
         source_name: Name of the data source
-        layer_name: Optional layer name (defaults to settings.DEFAULT_LAYER_NAME)
+        layer_name: Optional layer name, or comma-separated layer names
+            (defaults to settings.DEFAULT_LAYER_NAME)
+        reader_engine: Optional GDB reader engine override ('fiona' or 'arrow')
+        geometry_format: Optional geometry format override ('wkt', 'wkb' or 'both')
+        grid_size: Optional coordinate grid override in metres (0: full precision)
+        simplify_tolerance: Optional simplification tolerance override in metres (0: off)
 
     Returns:
         IngestResponse with batch_id and status
@@ -177,12 +202,16 @@ async def upload_parcel_gdb(
     try:
         # Validate form data using Pydantic
         try:
-            upload_request = GDBUploadRequest(
-                source_name=source_name,
-                layer_name=layer_name
-            )
+            layer_names = [name.strip() for name in layer_name.split(",") if name.strip()]
+            validated_layer_names = []
+            for name in layer_names or [layer_name]:
+                upload_request = GDBUploadRequest(
+                    source_name=source_name,
+                    layer_name=name
+                )
+                validated_layer_names.append(upload_request.layer_name or settings.DEFAULT_LAYER_NAME)
             validated_source_name = upload_request.source_name
-            validated_layer_name = upload_request.layer_name or settings.DEFAULT_LAYER_NAME
+            validated_layer_names = list(dict.fromkeys(validated_layer_names))
 
         except ValidationError as e:
             raise HTTPException(
@@ -211,10 +240,13 @@ async def upload_parcel_gdb(
         file_size_bytes = await save_upload_file(file, temp_file)
         validate_file_size(file_size_bytes, settings.max_upload_size_bytes)
 
-        # Extract the GDB
+        # Load the GDB processor (fiona, geopandas, shapely, pyproj) off the event loop
+        await import_processor("gdb")
+
+        # Extract the GDB (or read it straight from the zip)
         extract_dir = temp_dir / f"{safe_source_name}_extract"
         try:
-            gdb_path = extract_gdb(temp_file, extract_dir)
+            gdb_path = extract_gdb(temp_file, extract_dir, in_place=settings.GDB_READ_IN_PLACE)
         except Exception as e:
             # Cleanup on extraction failure
             temp_file.unlink(missing_ok=True)
@@ -262,8 +294,9 @@ async def upload_parcel_gdb(
                 }
             )
 
-        # Verify the requested layer exists
-        if validated_layer_name not in gdb_info["layers"]:
+        # Verify the requested layers exist
+        missing_layers = [name for name in validated_layer_names if name not in gdb_info["layers"]]
+        if missing_layers:
             # Cleanup
             temp_file.unlink(missing_ok=True)
             cleanup_gdb(extract_dir)
@@ -272,60 +305,139 @@ async def upload_parcel_gdb(
                 status_code=400,
                 detail={
                     "error": "LayerNotFound",
-                    "message": f"Layer '{validated_layer_name}' not found in GDB",
+                    "message": f"Layer '{missing_layers[0]}' not found in GDB",
                     "detail": {
-                        "requested_layer": validated_layer_name,
+                        "requested_layer": missing_layers[0],
                         "available_layers": gdb_info["layers"]
                     }
                 }
             )
 
-        # Get feature count for the layer
-        layer_info = gdb_info["layer_info"].get(validated_layer_name, {})
+        # Get feature counts for the layers (only their metadata is read)
+        layer_features = {}
+        for name in validated_layer_names:
+            layer_info = gdb_info["layer_info"].get(name, {})
 
-        # Check if layer inspection failed
-        if "error" in layer_info:
-            gdb_path.parent.rmdir() if gdb_path.parent.exists() else None
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "LayerInspectionError",
-                    "message": f"Failed to inspect layer '{validated_layer_name}': {layer_info['error']}",
-                    "detail": {
-                        "layer_name": validated_layer_name,
-                        "error": layer_info['error']
+            # Check if layer inspection failed
+            if "error" in layer_info:
+                temp_file.unlink(missing_ok=True)
+                cleanup_gdb(extract_dir)
+                raise HTTPException(
+                    status_code=400,
+                    detail={
+                        "error": "LayerInspectionError",
+                        "message": f"Failed to inspect layer '{name}': {layer_info['error']}",
+                        "detail": {
+                            "layer_name": name,
+                            "error": layer_info['error']
+                        }
                     }
-                }
-            )
+                )
+
+            layer_features[name] = layer_info.get("feature_count")
 
-        total_features = layer_info.get("feature_count")
+        known_counts = [count for count in layer_features.values() if count is not None]
+        total_features = sum(known_counts) if len(known_counts) == len(layer_features) else None
 
         # Format feature count for logging
         features_str = f"{total_features:,}" if total_features is not None else "unknown"
+        layers_str = ", ".join(f"'{name}'" for name in validated_layer_names)
 
         logger.info(
             f"GDB inspection complete: {len(gdb_info['layers'])} layer(s), "
-            f"processing '{validated_layer_name}' with {features_str} features"
+            f"processing {layers_str} with {features_str} features"
         )
 
-        # Create batch record
-        batch_id = await create_batch(
-            source_name=validated_source_name,
-            source_type="PARCEL",
-            file_format="GDB",
-            file_size_bytes=file_size_bytes,
-            total_records=total_features
-        )
+        reader_engine = reader_engine or settings.GDB_READER_ENGINE
+        geometry_format = geometry_format or settings.GDB_GEOMETRY_FORMAT
+        if grid_size is None:
+            grid_size = settings.GDB_GRID_SIZE
+        if simplify_tolerance is None:
+            simplify_tolerance = settings.GDB_SIMPLIFY_TOLERANCE
+
+        def processing_options(name: str, parent_batch_id: Optional[UUID] = None) -> dict:
+            """Processor arguments of one layer's batch, so it can be resumed."""
+            return {
+                "gdb_path": str(gdb_path),
+                "layer_name": name,
+                "source_name": validated_source_name,
+                "chunk_size": settings.BATCH_SIZE,
+                "upload_path": str(temp_file),
+                "extract_dir": str(extract_dir),
+                "reader_engine": reader_engine,
+                "workers": settings.GDB_PARALLEL_WORKERS,
+                "geometry_format": geometry_format,
+                "grid_size": grid_size,
+                "simplify_tolerance": simplify_tolerance,
+                "geometry_metrics": settings.PARCEL_GEOMETRY_METRICS,
+                "hash_index_path": str(settings.hash_index_path) if settings.hash_index_path else None,
+                "parent_batch_id": str(parent_batch_id) if parent_batch_id else None
+            }
 
-        # Start background processing
-        background_tasks.add_task(
-            process_gdb_async,
-            gdb_path=gdb_path,
-            layer_name=validated_layer_name,
-            batch_id=batch_id,
-            source_name=validated_source_name,
-            chunk_size=settings.BATCH_SIZE
-        )
+        child_batches = None
+        if len(validated_layer_names) == 1:
+            # Create batch record (with processor arguments, so it can be resumed)
+            batch_id = await create_batch(
+                source_name=validated_source_name,
+                source_type="PARCEL",
+                file_format="GDB",
+                file_size_bytes=file_size_bytes,
+                total_records=total_features,
+                processing_options=processing_options(validated_layer_names[0])
+            )
+
+            # Start background processing
+            background_tasks.add_task(
+                process_gdb_async,
+                gdb_path=gdb_path,
+                layer_name=validated_layer_names[0],
+                batch_id=batch_id,
+                source_name=validated_source_name,
+                chunk_size=settings.BATCH_SIZE,
+                hash_index_path=settings.hash_index_path,
+                reader_engine=reader_engine,
+                workers=settings.GDB_PARALLEL_WORKERS,
+                geometry_format=geometry_format,
+                grid_size=grid_size,
+                simplify_tolerance=simplify_tolerance,
+                geometry_metrics=settings.PARCEL_GEOMETRY_METRICS
+            )
+        else:
+            # Parent batch for the upload, one resumable child batch per layer
+            batch_id = await create_batch(
+                source_name=validated_source_name,
+                source_type="PARCEL",
+                file_format="GDB",
+                file_size_bytes=file_size_bytes,
+                total_records=total_features
+            )
+            child_batches = {}
+            for name in validated_layer_names:
+                child_batches[name] = await create_batch(
+                    source_name=validated_source_name,
+                    source_type="PARCEL",
+                    file_format="GDB",
+                    total_records=layer_features[name],
+                    processing_options=processing_options(name, batch_id),
+                    parent_batch_id=batch_id
+                )
+
+            # Start background processing of all layers
+            background_tasks.add_task(
+                process_gdb_layers_async,
+                gdb_path=gdb_path,
+                layer_batches=child_batches,
+                source_name=validated_source_name,
+                chunk_size=settings.BATCH_SIZE,
+                hash_index_path=settings.hash_index_path,
+                reader_engine=reader_engine,
+                workers=settings.GDB_PARALLEL_WORKERS,
+                max_concurrent_layers=settings.GDB_MAX_CONCURRENT_LAYERS,
+                geometry_format=geometry_format,
+                grid_size=grid_size,
+                simplify_tolerance=simplify_tolerance,
+                geometry_metrics=settings.PARCEL_GEOMETRY_METRICS
+            )
 
         # Cleanup temp zip after extraction (GDB dir will be cleaned up after processing)
         background_tasks.add_task(temp_file.unlink, missing_ok=True)
@@ -339,18 +451,22 @@ async def upload_parcel_gdb(
 
         logger.info(
             f"GDB upload accepted: batch_id={batch_id}, "
-            f"layer={validated_layer_name}, features={total_features:,}"
+            f"layers={layers_str}, features={features_str}"
         )
 
         return IngestResponse(
             batch_id=batch_id,
             status="processing",
-            message=f"GDB file upload accepted, processing {total_features:,} features from layer '{validated_layer_name}'",
+            message=(
+                f"GDB file upload accepted, processing {features_str} features from "
+                f"layer{'s' if len(validated_layer_names) > 1 else ''} {layers_str}"
+            ),
             total_records=total_features,
             source_name=validated_source_name,
             source_type="PARCEL",
             file_format="GDB",
-            estimated_time_minutes=estimated_minutes
+            estimated_time_minutes=estimated_minutes,
+            child_batches=child_batches
         )
 
     except HTTPException:
@@ -3,21 +3,27 @@ Batch status tracking endpoints.
 
 Provides REST API endpoints for checking batch processing status:
 - GET /api/v1/ingest/status/{batch_id} - Get batch progress and statistics
+- POST /api/v1/ingest/status/{batch_id}/resume - Resume an interrupted batch
 """
 
 import logging
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, BackgroundTasks, HTTPException
 from fastapi.responses import JSONResponse
 
-from models.schemas import BatchStatusResponse, ErrorResponse
-from services.batch_tracker import fetch_batch
+from models.schemas import BatchStatusResponse, ErrorResponse, IngestResponse
+from services.batch_tracker import claim_stale_checkpoints, fetch_batch, fetch_checkpoint
+from services.batch_resume import resume_batch
+from config import Settings
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/ingest", tags=["status"])
 
+# Initialize settings
+settings = Settings()
+
 
 @router.get(
     "/status/{batch_id}",
@@ -30,7 +36,12 @@ router = APIRouter(prefix="/api/v1/ingest", tags=["status"])
     - Progress percentage (if total_records known)
     - Counts: processed, new, duplicate, failed records
     - Timestamps: started_at, completed_at
-    - Error information (if status is 'failed')
+    - Error information (if status is 'failed'), pause reason (if 'paused':
+      RabbitMQ is unavailable and processing waits for it) or throttle reason
+      (if 'throttled': the deduplication queue is nearly full and publishing
+      slows down until its consumers catch up)
+    - Parent/child batches of multi-layer GDB uploads (a parent's counts
+      include all of its children's)
 
     Use this endpoint to poll for completion after uploading files via:
     - POST /api/v1/ingest/parcel/csv
@@ -39,6 +50,8 @@ router = APIRouter(prefix="/api/v1/ingest", tags=["status"])
 
     **Status Values:**
     - `processing`: Batch is currently being processed
+    - `paused`: Waiting for RabbitMQ to become reachable again
+    - `throttled`: Publishing slowed down by deduplication queue backpressure
     - `completed`: All records processed successfully
     - `failed`: Batch processing encountered a fatal error
 
@@ -101,7 +114,9 @@ async def get_batch_status(batch_id: UUID) -> BatchStatusResponse:
             started_at=batch["started_at"],
             completed_at=batch["completed_at"],
             error=batch["error"],
-            progress_percent=progress_percent
+            progress_percent=progress_percent,
+            parent_batch_id=batch.get("parent_batch_id"),
+            child_batch_ids=batch.get("child_batch_ids") or []
         )
 
         logger.info(
@@ -125,4 +140,110 @@ async def get_batch_status(batch_id: UUID) -> BatchStatusResponse:
         )
 
 
+@router.post(
+    "/status/{batch_id}/resume",
+    response_model=IngestResponse,
+    status_code=202,
+    summary="Resume an interrupted batch",
+    description="""
+    Continue a batch whose processing was interrupted (e.g. by a restart)
+    from the last confirmed chunk recorded in its checkpoint.
+
+    Interrupted batches are also resumed automatically once their checkpoint
+    has made no progress for RESUME_STALE_SECONDS.
+
+    **Response Codes:**
+    - 202 Accepted: Batch claimed, processing resumes in the background
+    - 404 Not Found: No batch with the given ID exists
+    - 409 Conflict: Batch is not processing, paused or throttled, has no checkpoint, or is still making progress
+    - 500 Internal Server Error: Database error
+    """
+)
+async def resume_batch_processing(
+    batch_id: UUID,
+    background_tasks: BackgroundTasks
+) -> IngestResponse:
+    """
+    Resume an interrupted batch from its checkpoint.
+
+    Args:
+        batch_id: UUID of the batch to resume
+        background_tasks: FastAPI background tasks
+
+    Returns:
+        IngestResponse for the resumed batch
+
+    Raises:
+        HTTPException: 404 if batch not found, 409 if it cannot be resumed, 500 on database error
+    """
+    logger.info(f"Resume requested for batch {batch_id}")
+
+    try:
+        batch = await fetch_batch(batch_id)
+
+        if not batch:
+            raise HTTPException(
+                status_code=404,
+                detail={
+                    "error": "BatchNotFound",
+                    "message": f"No batch found with ID {batch_id}",
+                    "detail": {"batch_id": str(batch_id)}
+                }
+            )
+
+        if batch["status"] not in ("processing", "paused", "throttled"):
+            raise HTTPException(
+                status_code=409,
+                detail={
+                    "error": "BatchNotResumable",
+                    "message": f"Batch {batch_id} is {batch['status']}, only processing, paused or throttled batches can be resumed",
+                    "detail": {"batch_id": str(batch_id), "status": batch["status"]}
+                }
+            )
+
+        claimed = await claim_stale_checkpoints(settings.RESUME_STALE_SECONDS, batch_id)
+
+        if not claimed:
+            checkpoint = await fetch_checkpoint(batch_id)
+            if checkpoint is None:
+                message = f"Batch {batch_id} has no checkpoint to resume from"
+                detail = {"batch_id": str(batch_id)}
+            else:
+                message = f"Batch {batch_id} is still making progress"
+                detail = {
+                    "batch_id": str(batch_id),
+                    "last_checkpoint_at": checkpoint["updated_at"].isoformat(),
+                    "stale_after_seconds": settings.RESUME_STALE_SECONDS
+                }
+            raise HTTPException(
+                status_code=409,
+                detail={"error": "BatchNotResumable", "message": message, "detail": detail}
+            )
+
+        background_tasks.add_task(resume_batch, claimed[0])
+
+        return IngestResponse(
+            batch_id=batch_id,
+            status="processing",
+            message=f"Batch resumed after {batch['processed_records']:,} processed records",
+            total_records=batch["total_records"],
+            source_name=batch["source_name"],
+            source_type=batch["source_type"],
+            file_format=batch["file_format"]
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error resuming batch {batch_id}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "InternalServerError",
+                "message": "Failed to resume batch",
+                "detail": {"error": str(e)}
+            }
+        )
+
+
 __all__ = ["router"]
@@ -1,9 +1,19 @@
-"""Processing services for GDB and CSV files."""
+"""
+Processing services for GDB and CSV files.
 
-from . import batch_tracker
-from . import csv_processor
+Submodules are imported on first access, so importing the package does not
+pull in pandas or the geospatial stack (see lazy_imports).
+"""
+
+import importlib
 
 __all__ = [
     "batch_tracker",
     "csv_processor",
 ]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
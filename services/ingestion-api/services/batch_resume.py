@@ -0,0 +1,169 @@
+"""
+Batch resume service.
+
+Continues batches whose background processing was interrupted (pod restart,
+redeploy) from their last checkpoint:
+- A processing batch whose checkpoint made no progress for a while is stale
+- Stale checkpoints are claimed atomically, so one worker resumes each batch
+- The processor re-runs with the stored options from the stored position
+
+Rows published after the last checkpoint are published again on resume;
+the deduplication service absorbs them by content hash.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+from uuid import UUID
+
+from .batch_tracker import claim_stale_checkpoints, fail_batch, fetch_batch
+from .lazy_imports import PROCESSOR_MODULES, import_processor, lazy_function
+from .logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Processor functions, imported by the first resumed batch that needs them
+process_csv_async = lazy_function(PROCESSOR_MODULES["csv"], "process_csv_async", is_async=True)
+process_gdb_async = lazy_function(PROCESSOR_MODULES["gdb"], "process_gdb_async", is_async=True)
+cleanup_gdb = lazy_function(PROCESSOR_MODULES["gdb"], "cleanup_gdb")
+is_virtual_path = lazy_function(PROCESSOR_MODULES["gdb"], "is_virtual_path")
+
+# Resume tasks started outside a request (kept referenced until they finish)
+_resume_tasks: Set[asyncio.Task] = set()
+
+
+async def resume_batch(checkpoint: Dict[str, Any]) -> None:
+    """
+    Re-run the processor of a claimed batch from its checkpoint.
+
+    Args:
+        checkpoint: Claimed checkpoint (see batch_tracker.claim_stale_checkpoints)
+
+    Example:
+        ```python
+        for checkpoint in await claim_stale_checkpoints(300):
+            await resume_batch(checkpoint)
+        ```
+    """
+    batch_id = checkpoint["batch_id"]
+    options = checkpoint["options"]
+    position = checkpoint["position"] or {}
+
+    logger.info(
+        f"Resuming {checkpoint['file_format']} batch {batch_id} "
+        f"(attempt {checkpoint['resume_count']}, position: {position or 'start'})"
+    )
+    await import_processor("csv" if checkpoint["file_format"] == "CSV" else "gdb")
+
+    if checkpoint["file_format"] == "CSV":
+        csv_path = Path(options["csv_path"])
+        if not csv_path.exists():
+            await fail_batch(batch_id, f"Cannot resume: source file {csv_path} no longer exists")
+            return
+
+        await process_csv_async(
+            csv_path=csv_path,
+            source_type=options["source_type"],
+            batch_id=batch_id,
+            source_name=options["source_name"],
+            chunk_size=options["chunk_size"],
+            parser_engine=options["parser_engine"],
+            workers=options["workers"],
+            encoding=options.get("encoding"),
+            resume_from=position,
+            hash_index_path=_hash_index_path(options),
+            geometry_metrics=options.get("geometry_metrics", False)
+        )
+
+    else:
+        gdb_path = options["gdb_path"]
+        if is_virtual_path(gdb_path):
+            # Read in place from the upload
+            if not Path(options["upload_path"]).exists():
+                await fail_batch(batch_id, f"Cannot resume: upload {options['upload_path']} no longer exists")
+                return
+        else:
+            gdb_path = Path(gdb_path)
+            if not gdb_path.exists():
+                await fail_batch(batch_id, f"Cannot resume: extracted GDB {gdb_path} no longer exists")
+                return
+
+        await process_gdb_async(
+            gdb_path=gdb_path,
+            layer_name=options["layer_name"],
+            batch_id=batch_id,
+            source_name=options["source_name"],
+            chunk_size=options["chunk_size"],
+            resume_from=position,
+            hash_index_path=_hash_index_path(options),
+            reader_engine=options.get("reader_engine", "fiona"),
+            workers=options.get("workers", 1),
+            geometry_format=options.get("geometry_format", "wkt"),
+            grid_size=options.get("grid_size", 0.0),
+            simplify_tolerance=options.get("simplify_tolerance", 0.0),
+            geometry_metrics=options.get("geometry_metrics", False)
+        )
+
+        # Sibling layers of a multi-layer upload may still be reading the GDB
+        if options.get("parent_batch_id"):
+            parent = await fetch_batch(UUID(options["parent_batch_id"]))
+            if parent is not None and parent["status"] == "processing":
+                return
+
+        # Same cleanup the upload endpoint schedules after processing
+        Path(options["upload_path"]).unlink(missing_ok=True)
+        cleanup_gdb(Path(options["extract_dir"]))
+
+
+def _hash_index_path(options: Dict[str, Any]) -> Optional[Path]:
+    """Hash index the interrupted run used (absent for batches created before it existed)."""
+    path = options.get("hash_index_path")
+    return Path(path) if path else None
+
+
+async def resume_interrupted_batches(stale_after_seconds: float) -> List[UUID]:
+    """
+    Claim every interrupted batch and resume each one in a background task.
+
+    Args:
+        stale_after_seconds: Seconds without progress before a batch counts as interrupted
+
+    Returns:
+        List of batch IDs being resumed
+    """
+    checkpoints = await claim_stale_checkpoints(stale_after_seconds)
+
+    for checkpoint in checkpoints:
+        task = asyncio.create_task(resume_batch(checkpoint))
+        _resume_tasks.add(task)
+        task.add_done_callback(_resume_tasks.discard)
+
+    return [checkpoint["batch_id"] for checkpoint in checkpoints]
+
+
+async def run_resume_watcher(stale_after_seconds: float) -> None:
+    """
+    Periodically resume interrupted batches (runs for the service lifetime).
+
+    Checks on startup and then every stale_after_seconds, so batches left
+    behind by a crashed worker are picked up once their checkpoint goes stale.
+
+    Args:
+        stale_after_seconds: Seconds without progress before a batch counts as interrupted
+    """
+    while True:
+        try:
+            resumed = await resume_interrupted_batches(stale_after_seconds)
+            if resumed:
+                logger.info(f"Resumed {len(resumed)} interrupted batch(es): {resumed}")
+        except Exception as e:
+            logger.error(f"Failed to resume interrupted batches: {e}", exc_info=True)
+
+        await asyncio.sleep(stale_after_seconds)
+
+
+__all__ = [
+    "resume_batch",
+    "resume_interrupted_batches",
+    "run_resume_watcher",
+]
@@ -3,11 +3,25 @@ Import batch tracking service.
 
 Provides CRUD operations for managing import batches in the database.
 Tracks upload progress, record counts, and batch status.
+
+Batches created with processing options also get a row in import_checkpoints
+holding the position of the last confirmed chunk, written in the same
+transaction as the progress counters, so an interrupted batch can be resumed.
+
+Child batches (one per layer of a multi-layer GDB upload) add their progress
+to their parent batch as well; the parent completes once no child is
+processing, or fails if any child failed.
+
+A batch is paused while the broker is unreachable, and throttled while the
+deduplication queue is too full to take its messages at full speed: it
+keeps its checkpoint, and both refresh the checkpoint so the batch does not
+count as stale.
 """
 
 from uuid import UUID, uuid4
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List
+import json
 import logging
 
 from shared.database import get_db_pool
@@ -20,7 +34,9 @@ async def create_batch(
     source_type: str,
     file_format: str,
     file_size_bytes: Optional[int] = None,
-    total_records: Optional[int] = None
+    total_records: Optional[int] = None,
+    processing_options: Optional[Dict[str, Any]] = None,
+    parent_batch_id: Optional[UUID] = None
 ) -> UUID:
     """
     Create a new import batch record.
@@ -31,6 +47,11 @@ async def create_batch(
         file_format: File format ('GDB', 'CSV')
         file_size_bytes: Size of the uploaded file in bytes
         total_records: Total number of records to process (if known)
+        processing_options: JSON-serializable processor arguments (file path,
+            chunk size, ...); when given, a checkpoint is created so the
+            batch can be resumed if processing is interrupted
+        parent_batch_id: Parent batch this batch reports into (e.g. one
+            layer of a multi-layer GDB upload)
 
     Returns:
         UUID: The batch_id of the created batch
@@ -48,7 +69,7 @@ async def create_batch(
     batch_id = uuid4()
     pool = await get_db_pool()
 
-    async with pool.acquire() as conn:
+    async with pool.acquire() as conn, conn.transaction():
         await conn.execute("""
             INSERT INTO import_batches (
                 batch_id,
@@ -58,8 +79,9 @@ async def create_batch(
                 file_size_bytes,
                 total_records,
                 status,
-                started_at
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+                started_at,
+                parent_batch_id
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
         """,
             batch_id,
             source_name,
@@ -68,9 +90,20 @@ async def create_batch(
             file_size_bytes,
             total_records,
             'processing',
-            datetime.now(timezone.utc)
+            datetime.now(timezone.utc),
+            parent_batch_id
         )
 
+        if processing_options is not None:
+            await conn.execute("""
+                INSERT INTO import_checkpoints (batch_id, file_format, options)
+                VALUES ($1, $2, $3::jsonb)
+            """,
+                batch_id,
+                file_format,
+                json.dumps(processing_options)
+            )
+
     logger.info(f"Created batch {batch_id} for {source_name} ({source_type}/{file_format})")
     return batch_id
 
@@ -80,10 +113,11 @@ async def update_batch_progress(
     processed_count: int,
     new_count: Optional[int] = None,
     duplicate_count: Optional[int] = None,
-    failed_count: Optional[int] = None
+    failed_count: Optional[int] = None,
+    checkpoint: Optional[Dict[str, Any]] = None
 ) -> None:
     """
-    Update batch progress counters.
+    Update batch progress counters (and those of the batch's parent, if any).
 
     Args:
         batch_id: The batch to update
@@ -91,6 +125,8 @@ async def update_batch_progress(
         new_count: Number of new (non-duplicate) records
         duplicate_count: Number of duplicate records found
         failed_count: Number of failed records
+        checkpoint: Position after the confirmed records (e.g. {"row_number": 5000});
+            stored with the counters in one transaction
 
     Example:
         ```python
@@ -104,7 +140,7 @@ async def update_batch_progress(
     """
     pool = await get_db_pool()
 
-    async with pool.acquire() as conn:
+    async with pool.acquire() as conn, conn.transaction():
         await conn.execute("""
             UPDATE import_batches
             SET processed_records = processed_records + $2,
@@ -112,6 +148,7 @@ async def update_batch_progress(
                 duplicate_records = duplicate_records + COALESCE($4, 0),
                 failed_records = failed_records + COALESCE($5, 0)
             WHERE batch_id = $1
+               OR batch_id = (SELECT parent_batch_id FROM import_batches WHERE batch_id = $1)
         """,
             batch_id,
             processed_count,
@@ -120,6 +157,18 @@ async def update_batch_progress(
             failed_count
         )
 
+        if checkpoint is not None:
+            await conn.execute("""
+                UPDATE import_checkpoints
+                SET position = $2::jsonb,
+                    updated_at = $3
+                WHERE batch_id = $1
+            """,
+                batch_id,
+                json.dumps(checkpoint),
+                datetime.now(timezone.utc)
+            )
+
 
 async def complete_batch(batch_id: UUID, total_processed: int) -> None:
     """
@@ -136,7 +185,7 @@ async def complete_batch(batch_id: UUID, total_processed: int) -> None:
     """
     pool = await get_db_pool()
 
-    async with pool.acquire() as conn:
+    async with pool.acquire() as conn, conn.transaction():
         await conn.execute("""
             UPDATE import_batches
             SET status = 'completed',
@@ -148,6 +197,10 @@ async def complete_batch(batch_id: UUID, total_processed: int) -> None:
             datetime.now(timezone.utc),
             total_processed
         )
+        await conn.execute(
+            "DELETE FROM import_checkpoints WHERE batch_id = $1", batch_id
+        )
+        await _settle_parent_batch(conn, batch_id)
 
     logger.info(f"Batch {batch_id} completed with {total_processed} records processed")
 
@@ -167,7 +220,7 @@ async def fail_batch(batch_id: UUID, error_message: str) -> None:
     """
     pool = await get_db_pool()
 
-    async with pool.acquire() as conn:
+    async with pool.acquire() as conn, conn.transaction():
         await conn.execute("""
             UPDATE import_batches
             SET status = 'failed',
@@ -179,10 +232,157 @@ async def fail_batch(batch_id: UUID, error_message: str) -> None:
             datetime.now(timezone.utc),
             error_message
         )
+        await conn.execute(
+            "DELETE FROM import_checkpoints WHERE batch_id = $1", batch_id
+        )
+        await _settle_parent_batch(conn, batch_id)
 
     logger.error(f"Batch {batch_id} failed: {error_message}")
 
 
+async def pause_batch(batch_id: UUID, reason: str) -> None:
+    """
+    Mark a processing batch as paused (broker unavailable).
+
+    Also refreshes the checkpoint's updated_at, so calling it periodically
+    while paused keeps the batch from being claimed as interrupted.
+
+    Args:
+        batch_id: The batch to pause
+        reason: Why the batch is paused (stored in error until it resumes)
+
+    Example:
+        ```python
+        await pause_batch(batch_id, "RabbitMQ circuit breaker open")
+        ```
+    """
+    await _hold_batch(batch_id, 'paused', reason)
+
+
+async def throttle_batch(batch_id: UUID, reason: str) -> None:
+    """
+    Mark a processing batch as throttled (queue backpressure).
+
+    Like pause_batch, refreshes the checkpoint's updated_at, so calling it
+    periodically while throttled keeps the batch from being claimed as
+    interrupted.
+
+    Args:
+        batch_id: The batch to throttle
+        reason: Why the batch is throttled (stored in error until it resumes)
+
+    Example:
+        ```python
+        await throttle_batch(batch_id, "deduplication queue at 93% of its 1,000,000 message limit")
+        ```
+    """
+    await _hold_batch(batch_id, 'throttled', reason)
+
+
+async def _hold_batch(batch_id: UUID, status: str, reason: str) -> None:
+    """Set a processing, paused or throttled batch to `status` and refresh its checkpoint."""
+    pool = await get_db_pool()
+
+    async with pool.acquire() as conn, conn.transaction():
+        held = await conn.fetchval("""
+            UPDATE import_batches
+            SET status = $2,
+                error = $3
+            WHERE batch_id = $1
+              AND status IN ('processing', 'paused', 'throttled')
+            RETURNING status
+        """,
+            batch_id,
+            status,
+            reason
+        )
+        await conn.execute(
+            "UPDATE import_checkpoints SET updated_at = $2 WHERE batch_id = $1",
+            batch_id,
+            datetime.now(timezone.utc)
+        )
+
+    if held:
+        logger.debug(f"Batch {batch_id} {status}: {reason}")
+
+
+async def unpause_batch(batch_id: UUID) -> None:
+    """
+    Mark a paused or throttled batch as processing again.
+
+    Args:
+        batch_id: The batch to continue
+
+    Example:
+        ```python
+        await unpause_batch(batch_id)
+        ```
+    """
+    pool = await get_db_pool()
+
+    async with pool.acquire() as conn, conn.transaction():
+        resumed = await conn.fetchval("""
+            UPDATE import_batches
+            SET status = 'processing',
+                error = NULL
+            WHERE batch_id = $1
+              AND status IN ('paused', 'throttled')
+            RETURNING status
+        """, batch_id)
+        await conn.execute(
+            "UPDATE import_checkpoints SET updated_at = $2 WHERE batch_id = $1",
+            batch_id,
+            datetime.now(timezone.utc)
+        )
+
+    if resumed:
+        logger.info(f"Batch {batch_id} no longer paused or throttled")
+
+
+async def _settle_parent_batch(conn, batch_id: UUID) -> None:
+    """
+    Complete or fail the parent of a finished child batch once no child is processing.
+
+    Runs in the transaction that finished the child. The parent row is
+    locked first, so of two children finishing at the same time the second
+    waits and sees the first one's status.
+    """
+    parent_batch_id = await conn.fetchval(
+        "SELECT parent_batch_id FROM import_batches WHERE batch_id = $1", batch_id
+    )
+    if parent_batch_id is None:
+        return
+
+    await conn.execute(
+        "SELECT 1 FROM import_batches WHERE batch_id = $1 FOR UPDATE", parent_batch_id
+    )
+    settled = await conn.fetchval("""
+        UPDATE import_batches p
+        SET status = CASE WHEN c.failed > 0 THEN 'failed' ELSE 'completed' END,
+            completed_at = $2,
+            error = CASE WHEN c.failed > 0
+                         THEN c.failed || ' of ' || c.total || ' child batches failed'
+                    END
+        FROM (
+            SELECT COUNT(*) AS total,
+                   COUNT(*) FILTER (WHERE status = 'failed') AS failed,
+                   COUNT(*) FILTER (WHERE status IN ('processing', 'paused', 'throttled')) AS processing
+            FROM import_batches
+            WHERE parent_batch_id = $1
+        ) c
+        WHERE p.batch_id = $1
+          AND p.status = 'processing'
+          AND c.processing = 0
+        RETURNING p.status
+    """,
+        parent_batch_id,
+        datetime.now(timezone.utc)
+    )
+
+    if settled:
+        logger.info(f"Parent batch {parent_batch_id} {settled} (last child: {batch_id})")
+
+
 async def fetch_batch(batch_id: UUID) -> Optional[Dict[str, Any]]:
     """
     Fetch a batch record by ID.
@@ -191,7 +391,8 @@ async def fetch_batch(batch_id: UUID) -> Optional[Dict[str, Any]]:
         batch_id: The batch ID to fetch
 
     Returns:
-        Dictionary containing batch data, or None if not found
+        Dictionary containing batch data (with parent_batch_id and
+        child_batch_ids), or None if not found
 
     Example:
         ```python
@@ -219,8 +420,14 @@ async def fetch_batch(batch_id: UUID) -> Optional[Dict[str, Any]]:
                 failed_records,
                 started_at,
                 completed_at,
-                error
-            FROM import_batches
+                error,
+                parent_batch_id,
+                ARRAY(
+                    SELECT c.batch_id FROM import_batches c
+                    WHERE c.parent_batch_id = b.batch_id
+                    ORDER BY c.started_at
+                ) AS child_batch_ids
+            FROM import_batches b
             WHERE batch_id = $1
         """, batch_id)
 
@@ -234,7 +441,7 @@ async def get_batch_statistics() -> Dict[str, Any]:
     Get overall batch processing statistics.
 
     Returns:
-        Dictionary with statistics (total_batches, completed, failed, in_progress)
+        Dictionary with statistics (total_batches, completed, failed, in_progress, paused, throttled)
 
     Example:
         ```python
@@ -252,6 +459,8 @@ async def get_batch_statistics() -> Dict[str, Any]:
                 COUNT(*) FILTER (WHERE status = 'completed') as completed,
                 COUNT(*) FILTER (WHERE status = 'failed') as failed,
                 COUNT(*) FILTER (WHERE status = 'processing') as in_progress,
+                COUNT(*) FILTER (WHERE status = 'paused') as paused,
+                COUNT(*) FILTER (WHERE status = 'throttled') as throttled,
                 SUM(total_records) as total_records,
                 SUM(processed_records) as processed_records,
                 SUM(new_records) as new_records,
@@ -262,11 +471,109 @@ async def get_batch_statistics() -> Dict[str, Any]:
     return dict(row) if row else {}
 
 
+async def fetch_checkpoint(batch_id: UUID) -> Optional[Dict[str, Any]]:
+    """
+    Fetch the checkpoint of a batch.
+
+    Args:
+        batch_id: The batch ID to fetch
+
+    Returns:
+        Dictionary with batch_id, file_format, options, position,
+        resume_count and updated_at, or None if the batch has no checkpoint
+    """
+    pool = await get_db_pool()
+
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow("""
+            SELECT batch_id, file_format, options, position, resume_count, updated_at
+            FROM import_checkpoints
+            WHERE batch_id = $1
+        """, batch_id)
+
+    return _checkpoint_from_row(row) if row else None
+
+
+async def claim_stale_checkpoints(
+    stale_after_seconds: float,
+    batch_id: Optional[UUID] = None
+) -> List[Dict[str, Any]]:
+    """
+    Claim checkpoints of processing batches that stopped making progress.
+
+    A checkpoint is stale when it was not updated for stale_after_seconds
+    (running processors update it after every chunk, paused and throttled
+    ones while they wait). Claiming refreshes updated_at atomically, so
+    concurrent workers never claim the same batch. A claimed paused or
+    throttled batch (its worker died while waiting) is set back to
+    processing.
+
+    Args:
+        stale_after_seconds: Seconds without progress before a batch counts as interrupted
+        batch_id: Claim only this batch (default: every stale batch)
+
+    Returns:
+        List of claimed checkpoints (see fetch_checkpoint)
+
+    Example:
+        ```python
+        for checkpoint in await claim_stale_checkpoints(300):
+            print(checkpoint["batch_id"], checkpoint["position"])
+        ```
+    """
+    now = datetime.now(timezone.utc)
+    pool = await get_db_pool()
+
+    async with pool.acquire() as conn, conn.transaction():
+        rows = await conn.fetch("""
+            UPDATE import_checkpoints c
+            SET updated_at = $1,
+                resume_count = c.resume_count + 1
+            FROM import_batches b
+            WHERE b.batch_id = c.batch_id
+              AND b.status IN ('processing', 'paused', 'throttled')
+              AND c.updated_at < $2
+              AND ($3::uuid IS NULL OR c.batch_id = $3)
+            RETURNING c.batch_id, c.file_format, c.options, c.position,
+                      c.resume_count, c.updated_at
+        """,
+            now,
+            now - timedelta(seconds=stale_after_seconds),
+            batch_id
+        )
+        if rows:
+            await conn.execute("""
+                UPDATE import_batches
+                SET status = 'processing',
+                    error = NULL
+                WHERE batch_id = ANY($1::uuid[])
+                  AND status IN ('paused', 'throttled')
+            """, [row["batch_id"] for row in rows])
+
+    if rows:
+        logger.info(f"Claimed {len(rows)} interrupted batch(es) for resume")
+    return [_checkpoint_from_row(row) for row in rows]
+
+
+def _checkpoint_from_row(row) -> Dict[str, Any]:
+    """Convert an import_checkpoints row, decoding its JSONB columns."""
+    checkpoint = dict(row)
+    for key in ("options", "position"):
+        if isinstance(checkpoint.get(key), str):
+            checkpoint[key] = json.loads(checkpoint[key])
+    return checkpoint
+
+
 __all__ = [
     "create_batch",
     "update_batch_progress",
     "complete_batch",
     "fail_batch",
+    "pause_batch",
+    "throttle_batch",
+    "unpause_batch",
     "fetch_batch",
     "get_batch_statistics",
+    "fetch_checkpoint",
+    "claim_stale_checkpoints",
 ]
@@ -0,0 +1,210 @@
+"""
+Pausing batches while RabbitMQ is unavailable, and throttling them while the
+deduplication queue is too full.
+
+Once the publisher's circuit breaker opens, publish_batch fails fast with
+CircuitOpenError instead of retrying chunk after chunk. The processors then:
+- Keep the messages the broker confirmed before it went away
+- Pause the batch (status 'paused') and wait for a half-open probe to reach
+  the broker, repeating the pause every PAUSE_HEARTBEAT_SECONDS so the
+  checkpoint stays fresh and the resume watcher leaves the batch alone
+- Set the batch back to processing and publish the unconfirmed messages
+
+In the API process the pause is written to import_batches directly; range
+workers report it over their progress queue and the parent writes it while
+merging progress (RangePauses).
+
+With the publish spool enabled, the publisher spools such messages instead
+of raising, so batches only pause when the spool cannot be written.
+
+Publishes to a queue near its x-max-length wait for the publisher's
+backpressure token bucket (see shared.backpressure). While a chunk's
+publish is held back that way, the batch is throttled (status
+'throttled', repeated every PAUSE_HEARTBEAT_SECONDS) and set back to
+processing once the chunk is out.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol, Tuple
+from uuid import UUID
+
+from shared.aio_rabbitmq import CircuitOpenError, backpressure_reason, wait_for_broker
+
+from .batch_tracker import pause_batch, throttle_batch, unpause_batch
+from .logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds between pause heartbeats (well below RESUME_STALE_SECONDS)
+PAUSE_HEARTBEAT_SECONDS = 15.0
+
+# Seconds between looks at the publisher's backpressure while a publish is waiting
+THROTTLE_CHECK_SECONDS = 2.0
+
+
+class PauseHook(Protocol):
+    """
+    Called with the reason and status ('paused' or 'throttled') while the
+    batch waits, and with None once publishing resumes.
+    """
+
+    async def __call__(self, reason: Optional[str], status: str = "paused") -> None:
+        ...
+
+
+PublishBatch = Callable[[str, List[Dict[str, Any]]], Awaitable[List[bool]]]
+
+
+def batch_pause_hook(batch_id: UUID) -> PauseHook:
+    """Pause hook that records the pause or throttle on the batch row (API process)."""
+    async def hook(reason: Optional[str], status: str = "paused") -> None:
+        if reason is None:
+            await unpause_batch(batch_id)
+        elif status == "throttled":
+            await throttle_batch(batch_id, reason)
+        else:
+            await pause_batch(batch_id, reason)
+    return hook
+
+
+def range_pause_hook(progress_queue: Any, index: int) -> PauseHook:
+    """Pause hook that reports (range index, reason, status) on a range worker's progress queue."""
+    async def hook(reason: Optional[str], status: str = "paused") -> None:
+        if progress_queue is not None:
+            progress_queue.put((index, reason, status))
+    return hook
+
+
+async def publish_or_pause(
+    publish: PublishBatch,
+    queue: str,
+    messages: List[Dict[str, Any]],
+    on_pause: PauseHook
+) -> List[bool]:
+    """
+    Publish a batch of messages, pausing while the circuit breaker is open
+    and reporting throttling while backpressure holds the publish back.
+
+    Args:
+        publish: Batch publish function (shared.aio_rabbitmq.publish_batch)
+        queue: The queue name to publish to
+        messages: Messages to publish
+        on_pause: Hook told about pauses and throttling (see batch_pause_hook / range_pause_hook)
+
+    Returns:
+        List[bool]: Per-message outcome, True if the broker confirmed it
+
+    Example:
+        ```python
+        outcomes = await publish_or_pause(
+            publish_batch, 'deduplication', messages, batch_pause_hook(batch_id)
+        )
+        ```
+    """
+    outcomes = [False] * len(messages)
+    pending = list(range(len(messages)))
+
+    while pending:
+        try:
+            results = await _publish_throttled(
+                publish, queue, [messages[index] for index in pending], on_pause
+            )
+        except CircuitOpenError as e:
+            results = e.outcomes
+            paused = str(e)
+        else:
+            paused = None
+
+        for index, published in zip(pending, results):
+            outcomes[index] = published
+        if paused is None:
+            break
+
+        pending = [index for index in pending if not outcomes[index]]
+        if not pending:
+            break
+
+        logger.warning(f"Pausing with {len(pending)} messages unpublished: {paused}")
+        await on_pause(paused)
+        while not await wait_for_broker(PAUSE_HEARTBEAT_SECONDS):
+            await on_pause(paused)
+        await on_pause(None)
+        logger.info(f"RabbitMQ reachable again, publishing {len(pending)} paused messages")
+
+    return outcomes
+
+
+async def _publish_throttled(
+    publish: PublishBatch,
+    queue: str,
+    messages: List[Dict[str, Any]],
+    on_pause: PauseHook
+) -> List[bool]:
+    """
+    Run one publish, reporting the batch as throttled while backpressure holds it back.
+
+    The throttle is reported when first seen and then every
+    PAUSE_HEARTBEAT_SECONDS, and lifted once the publish returns.
+    """
+    task = asyncio.ensure_future(publish(queue, messages))
+    reported_at = None
+    try:
+        while not (await asyncio.wait({task}, timeout=THROTTLE_CHECK_SECONDS))[0]:
+            reason = backpressure_reason(queue)
+            if reason is None:
+                continue
+            if reported_at is None:
+                logger.info(f"Throttling {len(messages)} messages: {reason}")
+            if reported_at is None or time.monotonic() - reported_at >= PAUSE_HEARTBEAT_SECONDS:
+                await on_pause(reason, "throttled")
+                reported_at = time.monotonic()
+    finally:
+        task.cancel()  # No-op once done; stops the publish if we are cancelled
+
+    if reported_at is not None:
+        await on_pause(None)
+    return task.result()
+
+
+class RangePauses:
+    """
+    Pause reports of a batch's range workers, merged in the parent process.
+
+    The batch is paused while any range is paused, otherwise throttled while
+    any range is throttled (repeated on every sync as a heartbeat), and set
+    back to processing once no range is either.
+    """
+
+    def __init__(self, batch_id: UUID):
+        self.batch_id = batch_id
+        self.reasons: Dict[int, Tuple[Optional[str], str]] = {}
+        self.paused = False
+
+    def record(self, index: int, reason: Optional[str], status: str = "paused") -> None:
+        """Record a (range index, reason, status) report from the progress queue."""
+        self.reasons[index] = (reason, status)
+
+    async def sync(self) -> None:
+        """Write the batch's pause state (called after every progress merge)."""
+        held = {status: reason for reason, status in self.reasons.values() if reason is not None}
+        if "paused" in held:
+            await pause_batch(self.batch_id, held["paused"])
+            self.paused = True
+        elif "throttled" in held:
+            await throttle_batch(self.batch_id, held["throttled"])
+            self.paused = True
+        elif self.paused:
+            await unpause_batch(self.batch_id)
+            self.paused = False
+
+
+__all__ = [
+    "PAUSE_HEARTBEAT_SECONDS",
+    "THROTTLE_CHECK_SECONDS",
+    "PauseHook",
+    "batch_pause_hook",
+    "range_pause_hook",
+    "publish_or_pause",
+    "RangePauses",
+]
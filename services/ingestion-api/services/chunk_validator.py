@@ -0,0 +1,425 @@
+"""
+Columnar chunk validation service.
+
+Compiles the Pydantic record models (V11ParcelRecord, RETRRecord, DFIRecord)
+into column-wise coercions that run over a whole DataFrame chunk:
+- Whitespace stripping (matches str_strip_whitespace)
+- Empty-to-null conversion
+- Float/int parsing with a vectorized fast path
+- Required-field checks
+
+Produces the same raw_data payloads as model_dump(exclude_none=True),
+without constructing a model instance per row. Chunks may be pandas
+DataFrames or Arrow tables/record batches (the arrow CSV engine and the
+arrow GDB reader, whose attribute columns are typed).
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import (
+    Annotated, Any, Dict, List, Optional, Sequence, Type, Union, get_args, get_origin
+)
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError
+
+from .logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Characters stripped by pydantic's str_strip_whitespace. Python's str.strip()
+# additionally treats the ASCII separators \x1c-\x1f as whitespace; pydantic does not.
+_STRIP_CHARS = (
+    "\t\n\x0b\x0c\r \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
+
+# Fast-path patterns. Anything else (underscores, inf/nan, padding) falls back
+# to the exact pydantic validator for that field. ASCII digits only: Python's
+# \d also matches Unicode digits (e.g. '١٢', '１２'), which the models reject.
+_FLOAT_PATTERN = r"[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?"
+_INT_PATTERN = r"[+-]?[0-9]+"
+
+# Arrow's int64 cast rejects a leading '+' and overflows past 18 digits
+_ARROW_INT_PATTERN = r"-?[0-9]{1,18}"
+
+
+@dataclass
+class FieldSpec:
+    """Column-level validation rule derived from a model field."""
+
+    name: str
+    kind: str  # 'str', 'float', 'int' or 'generic'
+    required: bool
+    adapter: TypeAdapter
+
+
+@dataclass
+class ChunkValidationResult:
+    """
+    Outcome of validating one DataFrame chunk.
+
+    Attributes:
+        valid_mask: Boolean array, True where the row passed validation
+        errors: Per-row error reason (None for valid rows)
+        records: Per-row raw_data payload (None for invalid rows)
+        columns: Coerced values per model field present in the chunk
+            (None for missing), e.g. for column-wise content hashing
+    """
+
+    valid_mask: np.ndarray
+    errors: List[Optional[str]] = field(default_factory=list)
+    records: List[Optional[Dict[str, Any]]] = field(default_factory=list)
+    columns: Dict[str, Sequence[Any]] = field(default_factory=dict)
+
+    @property
+    def valid_count(self) -> int:
+        """Number of rows that passed validation."""
+        return int(self.valid_mask.sum())
+
+    @property
+    def failed_count(self) -> int:
+        """Number of rows that failed validation."""
+        return len(self.valid_mask) - self.valid_count
+
+
+def _field_kind(annotation: Any) -> str:
+    """Classify a field annotation as str/float/int, or generic for anything else."""
+    if get_origin(annotation) is Union:
+        args = [a for a in get_args(annotation) if a is not type(None)]
+        if len(args) != 1:
+            return "generic"
+        annotation = args[0]
+
+    if annotation is str:
+        return "str"
+    if annotation is float:
+        return "float"
+    if annotation is int:
+        return "int"
+    return "generic"
+
+
+def _is_arrow_number(arrow_type: pa.DataType, kind: str) -> bool:
+    """Whether a typed Arrow column converts to the field kind as pydantic would (float(v) / int(v))."""
+    if kind == "float":
+        return pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+    if kind == "int":
+        return pa.types.is_integer(arrow_type) and arrow_type != pa.uint64()
+    return False
+
+
+class ChunkValidator:
+    """
+    Vectorized validator for a Pydantic record model.
+
+    Each model field becomes a column rule. Values that fit the fast path are
+    coerced for the whole column at once; anything unusual is handed to a
+    per-field TypeAdapter so results stay identical to the model.
+
+    Example:
+        ```python
+        validator = get_chunk_validator(V11ParcelRecord)
+        result = validator.validate(chunk)
+        print(result.valid_count, result.failed_count)
+        ```
+    """
+
+    def __init__(self, model_class: Type[BaseModel]):
+        self.model_class = model_class
+        self.strip_whitespace = bool(model_class.model_config.get("str_strip_whitespace"))
+
+        adapter_config = ConfigDict(str_strip_whitespace=self.strip_whitespace)
+        self.fields: List[FieldSpec] = []
+
+        for name, info in model_class.model_fields.items():
+            kind = "generic" if info.metadata else _field_kind(info.annotation)
+            annotation = (
+                Annotated[(info.annotation, *info.metadata)]
+                if info.metadata else info.annotation
+            )
+            self.fields.append(FieldSpec(
+                name=name,
+                kind=kind,
+                required=info.is_required(),
+                adapter=TypeAdapter(annotation, config=adapter_config),
+            ))
+
+    def validate(self, chunk: pd.DataFrame) -> ChunkValidationResult:
+        """
+        Validate a DataFrame chunk column by column.
+
+        Empty strings and NaN are treated as missing, exactly like the
+        previous per-row path.
+
+        Args:
+            chunk: DataFrame with columns named after model fields (extra columns ignored)
+
+        Returns:
+            ChunkValidationResult with validity mask, error reasons and raw_data payloads
+        """
+        n_rows = len(chunk)
+        row_errors: List[List[str]] = [[] for _ in range(n_rows)]
+        names: List[str] = []
+        columns: List[np.ndarray] = []
+
+        for spec in self.fields:
+            if spec.name not in chunk.columns:
+                if spec.required:
+                    for errors in row_errors:
+                        errors.append(f"{spec.name}: Field required")
+                continue
+
+            series = chunk[spec.name]
+            if isinstance(series, pd.DataFrame):
+                # Duplicate column names: pydantic sees the last value in a row dict
+                series = series.iloc[:, -1]
+
+            values = self._coerce_column(spec, series, row_errors)
+            names.append(spec.name)
+            columns.append(values)
+
+        return self._assemble(n_rows, names, columns, row_errors)
+
+    def validate_arrow(self, batch: Union[pa.Table, pa.RecordBatch]) -> ChunkValidationResult:
+        """
+        Validate an Arrow table or record batch column by column.
+
+        Stripping, empty checks and number parsing run as Arrow compute
+        kernels over the string buffers; Python objects are only created for
+        the model's columns when the payloads are assembled.
+
+        Args:
+            batch: Arrow data with columns named after model fields (extra columns ignored)
+
+        Returns:
+            ChunkValidationResult with validity mask, error reasons and raw_data payloads
+        """
+        n_rows = batch.num_rows
+        row_errors: List[List[str]] = [[] for _ in range(n_rows)]
+        names: List[str] = []
+        columns: List[Sequence[Any]] = []
+
+        for spec in self.fields:
+            indices = batch.schema.get_all_field_indices(spec.name)
+            if not indices:
+                if spec.required:
+                    for errors in row_errors:
+                        errors.append(f"{spec.name}: Field required")
+                continue
+
+            # Duplicate column names: pydantic sees the last value in a row dict
+            array = batch.column(indices[-1])
+
+            if pa.types.is_string(array.type) or pa.types.is_large_string(array.type):
+                values = self._coerce_arrow_column(spec, array, row_errors)
+            elif _is_arrow_number(array.type, spec.kind):
+                values = self._coerce_arrow_numbers(spec, array, row_errors)
+            else:
+                series = pd.Series(array.to_pylist(), dtype=object)
+                values = self._coerce_column(spec, series, row_errors)
+
+            names.append(spec.name)
+            columns.append(values)
+
+        return self._assemble(n_rows, names, columns, row_errors)
+
+    @staticmethod
+    def _assemble(
+        n_rows: int,
+        names: List[str],
+        columns: List[Sequence[Any]],
+        row_errors: List[List[str]]
+    ) -> ChunkValidationResult:
+        """Build per-row payloads and error reasons from coerced columns."""
+        valid_mask = np.fromiter((not e for e in row_errors), dtype=bool, count=n_rows)
+
+        records: List[Optional[Dict[str, Any]]] = [None] * n_rows
+        errors: List[Optional[str]] = [None] * n_rows
+
+        rows = zip(*columns) if columns else [()] * n_rows
+        for pos, row_values in enumerate(rows):
+            if valid_mask[pos]:
+                records[pos] = {
+                    name: value
+                    for name, value in zip(names, row_values)
+                    if value is not None
+                }
+            else:
+                errors[pos] = "; ".join(row_errors[pos])
+
+        return ChunkValidationResult(
+            valid_mask=valid_mask,
+            errors=errors,
+            records=records,
+            columns=dict(zip(names, columns)),
+        )
+
+    def _coerce_column(
+        self,
+        spec: FieldSpec,
+        series: pd.Series,
+        row_errors: List[List[str]]
+    ) -> np.ndarray:
+        """
+        Coerce one column, recording per-row errors in place.
+
+        Returns:
+            Object array of Python values (None for missing)
+        """
+        n_rows = len(series)
+        raw = series.to_numpy(dtype=object, na_value=None)
+        out = np.full(n_rows, None, dtype=object)
+
+        missing = pd.isna(series).to_numpy(dtype=bool) | (raw == "")
+        present = ~missing
+
+        if spec.required:
+            for pos in np.flatnonzero(missing):
+                row_errors[pos].append(f"{spec.name}: Field required")
+
+        if not present.any():
+            return out
+
+        # Split present values into fast-path candidates and fallbacks
+        fast = np.zeros(n_rows, dtype=bool)
+        if spec.kind != "generic":
+            fast = present & self._string_mask(series, raw)
+
+        if spec.kind == "str" and fast.any():
+            subset = series[fast].astype(object)
+            out[fast] = (
+                subset.str.strip(_STRIP_CHARS) if self.strip_whitespace else subset
+            ).to_numpy(dtype=object)
+
+        elif spec.kind in ("float", "int") and fast.any():
+            pattern = _FLOAT_PATTERN if spec.kind == "float" else _INT_PATTERN
+            subset = series[fast].astype(object)
+            matched = subset.str.fullmatch(pattern).to_numpy(dtype=bool, na_value=False)
+
+            fast_positions = np.flatnonzero(fast)
+            parsed_positions = fast_positions[matched]
+            parsed = raw[parsed_positions]
+
+            if spec.kind == "float":
+                out[parsed_positions] = parsed.astype(np.float64).tolist()
+            else:
+                out[parsed_positions] = [int(v) for v in parsed]
+
+            fast[fast_positions[~matched]] = False
+
+        # Exact per-value fallback for everything the fast path did not handle
+        for pos in np.flatnonzero(present & ~fast):
+            try:
+                out[pos] = spec.adapter.validate_python(raw[pos])
+            except ValidationError as e:
+                out[pos] = None
+                message = e.errors()[0]["msg"] if e.errors() else str(e)
+                row_errors[pos].append(f"{spec.name}: {message}")
+
+        return out
+
+    def _coerce_arrow_column(
+        self,
+        spec: FieldSpec,
+        array: Union[pa.Array, pa.ChunkedArray],
+        row_errors: List[List[str]]
+    ) -> List[Any]:
+        """
+        Coerce one Arrow string column, recording per-row errors in place.
+
+        Returns:
+            List of Python values (None for missing)
+        """
+        missing = pc.fill_null(pc.or_(pc.is_null(array), pc.equal(array, "")), True)
+
+        if spec.required:
+            for pos in np.flatnonzero(missing.to_numpy(zero_copy_only=False)):
+                row_errors[pos].append(f"{spec.name}: Field required")
+
+        fallback = pc.invert(missing)
+
+        if spec.kind == "str":
+            values = pc.utf8_trim(array, _STRIP_CHARS) if self.strip_whitespace else array
+            out = pc.if_else(missing, pa.scalar(None, array.type), values).to_pylist()
+            fallback = None
+
+        elif spec.kind in ("float", "int"):
+            pattern = _FLOAT_PATTERN if spec.kind == "float" else _ARROW_INT_PATTERN
+            matched = pc.fill_null(pc.match_substring_regex(array, f"^(?:{pattern})$"), False)
+            target = pa.float64() if spec.kind == "float" else pa.int64()
+
+            parsed = pc.cast(pc.if_else(matched, array, pa.scalar(None, array.type)), target)
+            out = parsed.to_pylist()
+            fallback = pc.and_(fallback, pc.invert(matched))
+
+        else:
+            out = [None] * len(array)
+
+        # Exact per-value fallback for everything the fast path did not handle
+        if fallback is not None:
+            positions = np.flatnonzero(fallback.to_numpy(zero_copy_only=False))
+            if len(positions):
+                raw = pc.take(array, pa.array(positions)).to_pylist()
+                for pos, value in zip(positions, raw):
+                    try:
+                        out[pos] = spec.adapter.validate_python(value)
+                    except ValidationError as e:
+                        message = e.errors()[0]["msg"] if e.errors() else str(e)
+                        row_errors[pos].append(f"{spec.name}: {message}")
+
+        return out
+
+    @staticmethod
+    def _coerce_arrow_numbers(
+        spec: FieldSpec,
+        array: Union[pa.Array, pa.ChunkedArray],
+        row_errors: List[List[str]]
+    ) -> List[Any]:
+        """
+        Coerce a typed Arrow number column (e.g. GDB attributes) into a float/int field.
+
+        Returns:
+            List of Python values (None for missing)
+        """
+        if spec.required:
+            missing = pc.is_null(array).to_numpy(zero_copy_only=False)
+            for pos in np.flatnonzero(missing):
+                row_errors[pos].append(f"{spec.name}: Field required")
+
+        target = pa.float64() if spec.kind == "float" else pa.int64()
+        return pc.cast(array, target, safe=False).to_pylist()
+
+    @staticmethod
+    def _string_mask(series: pd.Series, raw: np.ndarray) -> np.ndarray:
+        """Boolean mask of cells that hold Python strings."""
+        if pd.api.types.infer_dtype(series, skipna=True) in ("string", "empty"):
+            return np.ones(len(raw), dtype=bool)
+        return np.fromiter((isinstance(v, str) for v in raw), dtype=bool, count=len(raw))
+
+
+@lru_cache(maxsize=None)
+def get_chunk_validator(model_class: Type[BaseModel]) -> ChunkValidator:
+    """
+    Get the (cached) chunk validator for a record model.
+
+    Args:
+        model_class: Pydantic model class (e.g., V11ParcelRecord)
+
+    Returns:
+        ChunkValidator compiled from the model's field definitions
+    """
+    logger.debug(f"Compiling chunk validator for {model_class.__name__}")
+    return ChunkValidator(model_class)
+
+
+__all__ = [
+    "ChunkValidator",
+    "ChunkValidationResult",
+    "FieldSpec",
+    "get_chunk_validator",
+]
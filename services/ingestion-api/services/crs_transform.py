@@ -0,0 +1,111 @@
+"""
+CRS transformation service.
+
+Reprojects geometries to Wisconsin Transverse Mercator (EPSG:3071) for the
+GDB processors:
+- Transformers are cached process-wide by (source WKT, target EPSG), so each
+  layer, batch and resumed batch reuses the same pyproj Transformer
+- Geometry arrays are transformed with one pyproj call over all their
+  coordinates (shapely 2 transform), instead of a Python callback per
+  coordinate sequence
+
+pyproj Transformers are safe to share between threads (each thread gets its
+own PROJ context).
+"""
+
+from functools import lru_cache
+from typing import Any, Optional
+
+import numpy as np
+import shapely
+from pyproj import CRS, Transformer
+
+from .logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Target EPSG code for Wisconsin data
+WISCONSIN_EPSG = 3071
+
+# Distinct (source CRS, target) transformers kept per process
+TRANSFORMER_CACHE_SIZE = 32
+
+
+def get_transformer(source_wkt: str, target_epsg: int = WISCONSIN_EPSG) -> Optional[Transformer]:
+    """
+    Get the cached Transformer from a source CRS to an EPSG code.
+
+    Args:
+        source_wkt: Source CRS as WKT
+        target_epsg: Target EPSG code (default: 3071)
+
+    Returns:
+        Transformer (always_xy), or None if the source already is the target CRS
+    """
+    return _cached_transformer(source_wkt, target_epsg)
+
+
+@lru_cache(maxsize=TRANSFORMER_CACHE_SIZE)
+def _cached_transformer(source_wkt: str, target_epsg: int) -> Optional[Transformer]:
+    """Build a Transformer (cache keyed by both arguments, always passed positionally)."""
+    source = CRS.from_wkt(source_wkt)
+    if source.to_epsg() == target_epsg:
+        return None
+
+    logger.debug(f"Creating transformer {source.to_epsg() or source.name} → EPSG:{target_epsg}")
+    return Transformer.from_crs(source, CRS.from_epsg(target_epsg), always_xy=True)
+
+
+def transformer_for(source_crs: Any, target_epsg: int = WISCONSIN_EPSG) -> Optional[Transformer]:
+    """
+    Get the cached Transformer for a layer's CRS.
+
+    Args:
+        source_crs: Anything pyproj accepts (fiona CRS, EPSG string, WKT, pyproj CRS)
+        target_epsg: Target EPSG code (default: 3071)
+
+    Returns:
+        Transformer, or None if no transformation is needed
+
+    Raises:
+        pyproj.exceptions.CRSError: If the source CRS cannot be parsed
+    """
+    wkt = CRS.from_user_input(source_crs).to_wkt()
+    return get_transformer(wkt, target_epsg)
+
+
+def transform_geometries(geometries: np.ndarray, transformer: Transformer) -> np.ndarray:
+    """
+    Transform an array of geometries with one pyproj call over all their coordinates.
+
+    Args:
+        geometries: Object array of shapely geometries (2D, 3D or mixed)
+        transformer: Transformer from get_transformer/transformer_for
+
+    Returns:
+        np.ndarray: Transformed geometries, in the same order
+    """
+    def transform_coords(coords: np.ndarray) -> np.ndarray:
+        return np.column_stack(transformer.transform(*coords.T))
+
+    has_z = shapely.has_z(geometries)
+    out = np.empty(len(geometries), dtype=object)
+    if (~has_z).any():
+        out[~has_z] = shapely.transform(geometries[~has_z], transform_coords)
+    if has_z.any():
+        out[has_z] = shapely.transform(geometries[has_z], transform_coords, include_z=True)
+    return out
+
+
+def transform_geometry(geometry: Any, transformer: Transformer) -> Any:
+    """Transform one shapely geometry (see transform_geometries)."""
+    return transform_geometries(np.array([geometry], dtype=object), transformer)[0]
+
+
+__all__ = [
+    "WISCONSIN_EPSG",
+    "get_transformer",
+    "transformer_for",
+    "transform_geometries",
+    "transform_geometry",
+]
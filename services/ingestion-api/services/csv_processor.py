@@ -5,20 +5,43 @@ Handles CSV file uploads for PARCEL, RETR, and DFI data:
 - Stream processing with memory-efficient chunking
 - Encoding detection and validation
 - Column validation based on source type
+- Vectorized row validation and content hashing per chunk
+- Bounding box, centroid and area of parcel geometries (vectorized per chunk)
+- Optional parallel processing of record-aligned byte ranges
 - RabbitMQ message publishing
-- Batch progress tracking
+- Batch progress tracking with resumable checkpoints
 """
 
+import asyncio
+import bisect
+import csv
+import io
 import logging
+import multiprocessing
+import queue
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Union
 from uuid import UUID
+import numpy as np
 import pandas as pd
-import chardet
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import shapely
 
+from shared.hash_utils import HASH_VERSION, compute_content_hashes
 from shared.models import V11ParcelRecord, RETRRecord, DFIRecord
-from shared.rabbitmq import publish_message
+from shared.aio_rabbitmq import close_rabbitmq_connection, publish_batch
 from .batch_tracker import update_batch_progress, complete_batch, fail_batch
+from .broker_pause import (
+    PauseHook, RangePauses, batch_pause_hook, publish_or_pause, range_pause_hook
+)
+from .hash_index import get_hash_index
+from .chunk_validator import ChunkValidator, get_chunk_validator
+from .csv_ranges import ByteRangeReader, CsvByteRange, plan_csv_ranges
+from .encoding_detector import detect_file_encoding
+from .geometry_metrics import METRIC_FIELDS, compute_geometry_metrics, message_metrics
+from .upload_inspector import UploadInspection
 from .logging_utils import get_logger, set_batch_id
 from .background_utils import safe_background_task
 
@@ -31,76 +54,38 @@ SOURCE_TYPE_MODELS = {
     "DFI": DFIRecord,
 }
 
+# CSV parser engines selectable per upload or via Settings.CSV_PARSER_ENGINE
+PARSER_ENGINES = ("pandas", "arrow")
+
+# Bytes handed to the Arrow CSV reader per block
+ARROW_BLOCK_SIZE = 1024 * 1024  # 1MB (read-ahead memory grows with block size)
+
+# Seconds between progress merges while byte ranges are processed in parallel
+PROGRESS_INTERVAL = 2.0
+
 
 def detect_encoding(file_path: Path, sample_size: int = 500000) -> str:
     """
     Detect CSV file encoding with fallback chain.
 
-    Reads a sample of the file to determine encoding, then validates
-    by attempting to decode the entire file. Falls back through common
-    encodings if detection fails.
+    Streams the whole file through StreamingEncodingDetector, so candidate
+    encodings are validated against every byte rather than a leading sample.
+    Used when no upload inspection is available.
 
     Args:
         file_path: Path to the CSV file
-        sample_size: Number of bytes to sample (default: 500KB)
+        sample_size: Maximum bytes fed to the statistical detector (default: 500KB)
 
     Returns:
-        str: Detected encoding (e.g., 'utf-8', 'iso-8859-1', 'cp1252')
+        str: Detected encoding (e.g., 'utf-8', 'latin-1', 'windows-1252')
     """
-    # Read larger sample for better detection (500KB default)
-    with open(file_path, 'rb') as f:
-        raw_data = f.read(sample_size)
-        result = chardet.detect(raw_data)
-        detected_encoding = result['encoding']
-        confidence = result['confidence']
+    detection = detect_file_encoding(file_path, max_detect_bytes=sample_size)
 
-    logger.info(
-        f"Detected encoding: {detected_encoding} (confidence: {confidence:.2%})"
-    )
+    for encoding, offsets in detection.error_offsets.items():
+        if offsets:
+            logger.debug(f"Encoding {encoding} undecodable at byte offsets {offsets}")
 
-    # ASCII detection is often incorrect - treat as UTF-8
-    if detected_encoding and detected_encoding.lower() == 'ascii':
-        logger.info("ASCII detected, treating as UTF-8 for broader compatibility")
-        detected_encoding = 'utf-8'
-
-    # Fallback encoding chain (in order of preference)
-    encoding_chain = []
-
-    # Start with detected encoding if confidence is reasonable
-    if detected_encoding and confidence >= 0.6:
-        encoding_chain.append(detected_encoding)
-
-    # Common encodings for US data
-    encoding_chain.extend(['utf-8', 'latin-1', 'cp1252', 'iso-8859-1'])
-
-    # Remove duplicates while preserving order
-    seen = set()
-    encoding_chain = [
-        enc for enc in encoding_chain
-        if enc and enc.lower() not in seen and not seen.add(enc.lower())
-    ]
-
-    # Try each encoding by attempting to read first chunk
-    for encoding in encoding_chain:
-        try:
-            # Test by reading first 10 rows with pandas
-            pd.read_csv(file_path, encoding=encoding, nrows=10)
-            logger.info(f"Validated encoding: {encoding}")
-            return encoding
-        except (UnicodeDecodeError, UnicodeError):
-            logger.debug(f"Encoding {encoding} failed, trying next...")
-            continue
-        except Exception as e:
-            # Other errors (malformed CSV, etc.) - not encoding related
-            logger.debug(f"Non-encoding error with {encoding}: {e}")
-            continue
-
-    # Last resort: UTF-8 with error handling
-    logger.warning(
-        "All encoding attempts failed, using UTF-8 with error replacement. "
-        "Some characters may be corrupted."
-    )
-    return 'utf-8'
+    return detection.encoding
 
 
 def validate_csv_columns(
@@ -149,13 +134,22 @@ async def process_csv_async(
     source_type: Literal["PARCEL", "RETR", "DFI"],
     batch_id: UUID,
     source_name: str,
-    chunk_size: int = 1000
+    chunk_size: int = 1000,
+    inspection: Optional[UploadInspection] = None,
+    parser_engine: Literal["pandas", "arrow"] = "pandas",
+    workers: int = 1,
+    encoding: Optional[str] = None,
+    resume_from: Optional[Dict[str, Any]] = None,
+    hash_index_path: Optional[Path] = None,
+    geometry_metrics: bool = True
 ) -> None:
     """
     Process a CSV file asynchronously.
 
     Reads CSV in chunks, validates data, and publishes to RabbitMQ.
-    Updates batch progress throughout processing.
+    Updates batch progress throughout processing, with a checkpoint of the
+    position after each confirmed chunk (nearest record boundary byte offset
+    and row number, or per-range rows when processing byte ranges).
 
     Args:
         csv_path: Path to the CSV file
@@ -163,6 +157,18 @@ async def process_csv_async(
         batch_id: Import batch ID for tracking
         source_name: Name of the data source
         chunk_size: Number of rows to process per chunk (default: 1000)
+        inspection: Upload inspection from the upload stream; when given, its
+            encoding and sample are reused instead of re-reading the file
+        parser_engine: CSV parser ('pandas' or 'arrow', default: 'pandas')
+        workers: Worker processes; above 1, large files are split into
+            record-aligned byte ranges processed in parallel (default: 1)
+        encoding: Known file encoding (skips detection when no inspection is given)
+        resume_from: Checkpoint position of an interrupted run; processing
+            continues after the last confirmed chunk
+        hash_index_path: Local content hash index; rows whose hash is already
+            in raw_imports are counted as duplicates instead of published
+        geometry_metrics: Attach the bbox, centroid and area of every PARCEL
+            row's geometry_wkt (default: True)
 
     Raises:
         Exception: Any processing errors (caller should catch and fail_batch)
@@ -175,117 +181,658 @@ async def process_csv_async(
     )
 
     try:
-        # Detect encoding with robust fallback
-        encoding = detect_encoding(csv_path)
-
-        # Get the appropriate Pydantic model for this source type
+        # Get the columnar validator for this source type's Pydantic model
         model_class = SOURCE_TYPE_MODELS[source_type]
+        validator = get_chunk_validator(model_class)
 
         # Read CSV in chunks for memory efficiency
         total_processed = 0
         total_failed = 0
+        total_duplicates = 0
         chunk_num = 0
-
-        # First pass: validate columns with first chunk
-        try:
-            first_chunk = pd.read_csv(
-                csv_path,
-                encoding=encoding,
-                nrows=100,
-                encoding_errors='replace'  # Replace bad characters instead of failing
+        position = resume_from or {}
+
+        if inspection is not None and inspection.sample is not None:
+            # Reuse encoding and sample gathered while the upload streamed to disk
+            encoding = inspection.encoding
+            validate_csv_columns(inspection.sample, source_type)
+        else:
+            # Detect encoding with robust fallback (unless already known, e.g. on resume)
+            encoding = encoding or detect_encoding(csv_path)
+
+            # First pass: validate columns with first chunk
+            try:
+                first_chunk = pd.read_csv(
+                    csv_path,
+                    encoding=encoding,
+                    nrows=100,
+                    encoding_errors='replace'  # Replace bad characters instead of failing
+                )
+                validate_csv_columns(first_chunk, source_type)
+            except UnicodeDecodeError as e:
+                # If encoding still fails, try one more time with latin-1 (never fails)
+                logger.warning(
+                    f"Encoding {encoding} failed during validation, falling back to latin-1: {e}"
+                )
+                encoding = 'latin-1'
+                first_chunk = pd.read_csv(csv_path, encoding=encoding, nrows=100)
+                validate_csv_columns(first_chunk, source_type)
+
+        if "ranges" in position:
+            # Resume the byte ranges planned by the interrupted run
+            ranges = [
+                CsvByteRange(
+                    index=entry["index"], start=entry["start"],
+                    end=entry["end"], rows_before=entry["rows_before"]
+                )
+                for entry in position["ranges"]
+            ]
+        elif workers > 1 and not position:
+            ranges = plan_csv_ranges(csv_path, workers, inspection)
+        else:
+            ranges = []
+
+        if len(ranges) > 1 or "ranges" in position:
+            # Parallel mode: one worker process per record-aligned byte range
+            resumed = position.get("ranges", [])
+            total_processed, total_failed, total_duplicates = await _process_ranges_parallel(
+                csv_path, ranges, encoding, chunk_size, parser_engine,
+                batch_id, source_type, source_name, resumed=resumed,
+                hash_index_path=hash_index_path, geometry_metrics=geometry_metrics
+            )
+            total_processed += sum(entry["rows_done"] for entry in resumed)
+        else:
+            # Record boundaries let checkpoints point at a byte offset near the row
+            boundaries = list(inspection.record_boundaries) if inspection is not None else []
+            byte_range = None
+            skip_rows = total_processed = position.get("row_number", 0)
+
+            if position.get("byte_offset") is not None:
+                boundaries.insert(0, (position["byte_offset"], position["rows_before"]))
+                byte_range = (position["byte_offset"], Path(csv_path).stat().st_size)
+                skip_rows -= position["rows_before"]
+
+            if total_processed:
+                logger.info(
+                    f"Resuming CSV batch {batch_id} after row {total_processed} "
+                    f"(byte offset: {byte_range[0] if byte_range else 0})"
+                )
+
+            # Process CSV in chunks
+            on_pause = batch_pause_hook(batch_id)
+            chunks = _skip_rows(
+                read_csv_chunks(csv_path, encoding, chunk_size, parser_engine, byte_range=byte_range),
+                skip_rows
             )
-            validate_csv_columns(first_chunk, source_type)
-        except UnicodeDecodeError as e:
-            # If encoding still fails, try one more time with latin-1 (never fails)
+            for chunk in chunks:
+                chunk_num += 1
+                chunk_processed, chunk_failed, chunk_duplicates = await _process_chunk(
+                    chunk, validator, parser_engine, batch_id, source_type,
+                    source_name, total_processed, chunk_num, on_pause,
+                    hash_index_path, geometry_metrics
+                )
+                chunk_successful = chunk_processed - chunk_failed
+                total_processed += chunk_processed
+                total_failed += chunk_failed
+                total_duplicates += chunk_duplicates
+
+                # Update batch progress and checkpoint after each chunk
+                await update_batch_progress(
+                    batch_id=batch_id,
+                    processed_count=chunk_processed,
+                    new_count=chunk_successful - chunk_duplicates,  # Will be updated by deduplication service
+                    duplicate_count=chunk_duplicates,
+                    failed_count=chunk_failed,
+                    checkpoint=_row_checkpoint(boundaries, total_processed)
+                )
+
+                logger.info(
+                    f"Chunk {chunk_num} complete: {chunk_successful}/{chunk_processed} succeeded "
+                    f"({chunk_duplicates} known duplicates not published)"
+                )
+
+        # Mark batch as completed
+        await complete_batch(batch_id, total_processed)
+
+        logger.info(
+            f"CSV processing complete: {total_processed} rows processed, "
+            f"{total_failed} failed, {total_duplicates} known duplicates (batch: {batch_id})"
+        )
+
+    except Exception as e:
+        logger.error(f"CSV processing failed (batch: {batch_id}): {e}", exc_info=True)
+        await fail_batch(batch_id, f"CSV processing error: {str(e)}")
+        raise
+
+
+async def _process_chunk(
+    chunk: Union[pd.DataFrame, pa.Table],
+    validator: ChunkValidator,
+    parser_engine: str,
+    batch_id: UUID,
+    source_type: str,
+    source_name: str,
+    rows_before: int,
+    chunk_num: int,
+    on_pause: PauseHook,
+    hash_index_path: Optional[Path] = None,
+    geometry_metrics: bool = True
+) -> Tuple[int, int, int]:
+    """
+    Validate and hash one chunk, then publish its valid rows with confirms.
+
+    Rows whose content hash is in the local hash index are already in
+    raw_imports; they are not published. While the broker is unavailable
+    the batch is paused and the chunk waits, and while the queue is too full
+    the batch is throttled (see broker_pause).
+
+    Args:
+        rows_before: Data rows in the file before this chunk (for source_row_number)
+        on_pause: Hook told when the batch pauses or is throttled, and resumes
+        hash_index_path: Local content hash index (None disables suppression)
+        geometry_metrics: Attach geometry metrics to PARCEL rows
+
+    Returns:
+        tuple: (rows processed, rows failed validation or publishing, known duplicates)
+    """
+    logger.debug(f"Processing chunk {chunk_num} ({len(chunk)} rows)")
+
+    # Validate the whole chunk column-wise
+    if parser_engine == "arrow":
+        result = validator.validate_arrow(chunk)
+    else:
+        result = validator.validate(chunk)
+    chunk_failed = result.failed_count
+    if source_type == "PARCEL" and geometry_metrics:
+        _attach_geometry_metrics(result.records, result.valid_mask)
+
+    # Content hashes for the whole chunk, computed over the coerced columns
+    content_hashes = compute_content_hashes(source_type, result.columns, len(result.records))
+
+    # Drop rows already in raw_imports before they reach the broker
+    hash_index = get_hash_index(hash_index_path)
+    known = hash_index.contains(content_hashes) if hash_index is not None else None
+    chunk_duplicates = 0
+
+    messages = []
+    row_numbers = []
+    for pos, raw_data in enumerate(result.records):
+        row_number = rows_before + pos + 1
+
+        if raw_data is None:
             logger.warning(
-                f"Encoding {encoding} failed during validation, falling back to latin-1: {e}"
+                f"Failed to process row {row_number}: {result.errors[pos]}"
             )
-            encoding = 'latin-1'
-            first_chunk = pd.read_csv(csv_path, encoding=encoding, nrows=100)
-            validate_csv_columns(first_chunk, source_type)
+            continue
+
+        if known is not None and known[pos]:
+            chunk_duplicates += 1
+            continue
+
+        messages.append({
+            "batch_id": str(batch_id),
+            "source_type": source_type,
+            "source_file": source_name,
+            "source_row_number": row_number,
+            "content_hash": content_hashes[pos],
+            "hash_version": HASH_VERSION,
+            **message_metrics(raw_data),
+            "raw_data": raw_data
+        })
+        row_numbers.append(row_number)
+
+    # Publish the whole chunk to the deduplication queue with confirms
+    try:
+        outcomes = await publish_or_pause(publish_batch, 'deduplication', messages, on_pause)
+    except Exception as e:
+        logger.warning(f"Failed to publish chunk {chunk_num}: {e}")
+        outcomes = [False] * len(messages)
+
+    for row_number, published in zip(row_numbers, outcomes):
+        if not published:
+            logger.error(f"Failed to publish message for row {row_number}")
+            chunk_failed += 1
+
+    return len(chunk), chunk_failed, chunk_duplicates
+
+
+def _attach_geometry_metrics(records: List[Optional[Dict[str, Any]]], valid_mask: np.ndarray) -> None:
+    """
+    Add the bbox, centroid and area of each valid parcel's geometry_wkt to its raw_data.
+
+    The chunk's WKT is parsed in one shapely call; rows whose WKT does not
+    parse (or is empty) are left without metrics.
+    """
+    positions = np.flatnonzero(valid_mask)
+    if not len(positions):
+        return
+
+    geometries = shapely.from_wkt(
+        np.array([records[pos]["geometry_wkt"] for pos in positions], dtype=object),
+        on_invalid="ignore"
+    )
+    metrics = compute_geometry_metrics(geometries)
+    has_metrics = ~np.isnan(metrics["bbox_minx"])
+    rows = zip(*(metrics[name].tolist() for name in METRIC_FIELDS))
+
+    for pos, usable, values in zip(positions, has_metrics, rows):
+        if usable:
+            records[pos].update(zip(METRIC_FIELDS, values))
+
+
+def _row_checkpoint(boundaries: List[Tuple[int, int]], row_number: int) -> Dict[str, Any]:
+    """
+    Checkpoint position after row_number data rows of a sequential run.
+
+    Includes the nearest record boundary at or before the row, so a resumed
+    run seeks there and only re-parses the rows in between.
+    """
+    position: Dict[str, Any] = {"row_number": row_number}
+    i = bisect.bisect_right([rows_before for _, rows_before in boundaries], row_number)
+    if i:
+        position["byte_offset"], position["rows_before"] = boundaries[i - 1]
+    return position
+
+
+def _skip_rows(
+    chunks: Iterable[Union[pd.DataFrame, pa.Table]],
+    rows: int
+) -> Iterator[Union[pd.DataFrame, pa.Table]]:
+    """Drop the first rows from a stream of chunks (already processed before a resume)."""
+    for chunk in chunks:
+        if rows >= len(chunk):
+            rows -= len(chunk)
+            continue
+        if rows:
+            if isinstance(chunk, pd.DataFrame):
+                chunk = chunk.iloc[rows:].reset_index(drop=True)
+            else:
+                chunk = chunk.slice(rows)
+            rows = 0
+        yield chunk
+
+
+# Progress queue of a range worker process (set by _init_range_worker)
+_range_progress = None
+
+
+def _init_range_worker(progress_queue) -> None:
+    """Process pool initializer: remember the queue used to report chunk progress."""
+    global _range_progress
+    _range_progress = progress_queue
+
+
+def _create_range_executor(workers: int) -> Tuple[Executor, Any]:
+    """
+    Create the worker pool and progress queue for parallel CSV processing.
+
+    Workers are spawned (not forked) so each opens its own broker connection.
+    """
+    context = multiprocessing.get_context("spawn")
+    progress_queue = context.Queue()
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_range_worker,
+        initargs=(progress_queue,)
+    )
+    return executor, progress_queue
+
+
+def process_csv_range(
+    csv_path: Path,
+    byte_range: CsvByteRange,
+    encoding: str,
+    chunk_size: int,
+    parser_engine: str,
+    batch_id: UUID,
+    source_type: str,
+    source_name: str,
+    skip_rows: int = 0,
+    hash_index_path: Optional[Path] = None,
+    geometry_metrics: bool = True
+) -> Tuple[int, int, int]:
+    """
+    Parse, validate and publish one byte range of a CSV (runs in a worker process).
+
+    Chunks are published from an event loop of the worker's own. Each
+    chunk's (range index, processed, failed, duplicates) is put on the
+    progress queue, as is (range index, pause reason or None, status) when
+    the range pauses for the broker or is throttled, and resumes.
+
+    Args:
+        skip_rows: Rows at the start of the range already processed (resume)
+        hash_index_path: Local content hash index (None disables suppression)
+        geometry_metrics: Attach geometry metrics to PARCEL rows
+
+    Returns:
+        tuple: (rows processed, rows failed, known duplicates) for the range,
+            excluding skipped rows
+    """
+    set_batch_id(batch_id)
+    return asyncio.run(_process_range(
+        csv_path, byte_range, encoding, chunk_size, parser_engine, batch_id,
+        source_type, source_name, skip_rows, hash_index_path, geometry_metrics
+    ))
+
 
-        # Process CSV in chunks
+async def _process_range(
+    csv_path: Path,
+    byte_range: CsvByteRange,
+    encoding: str,
+    chunk_size: int,
+    parser_engine: str,
+    batch_id: UUID,
+    source_type: str,
+    source_name: str,
+    skip_rows: int,
+    hash_index_path: Optional[Path],
+    geometry_metrics: bool
+) -> Tuple[int, int, int]:
+    """
+    Publish the chunks of one byte range on the worker's own event loop.
+
+    Returns:
+        tuple: (rows processed, rows failed, known duplicates) for the range
+    """
+    validator = get_chunk_validator(SOURCE_TYPE_MODELS[source_type])
+
+    processed = 0
+    failed = 0
+    duplicates = 0
+    chunks = _skip_rows(
+        read_csv_chunks(
+            csv_path, encoding, chunk_size, parser_engine,
+            byte_range=(byte_range.start, byte_range.end)
+        ),
+        skip_rows
+    )
+    on_pause = range_pause_hook(_range_progress, byte_range.index)
+    try:
+        for chunk_num, chunk in enumerate(chunks, start=1):
+            chunk_processed, chunk_failed, chunk_duplicates = await _process_chunk(
+                chunk, validator, parser_engine, batch_id, source_type, source_name,
+                byte_range.rows_before + skip_rows + processed, chunk_num, on_pause,
+                hash_index_path, geometry_metrics
+            )
+            processed += chunk_processed
+            failed += chunk_failed
+            duplicates += chunk_duplicates
+
+            if _range_progress is not None:
+                _range_progress.put((byte_range.index, chunk_processed, chunk_failed, chunk_duplicates))
+    finally:
+        # The connection belongs to this loop, which ends with the range
+        await close_rabbitmq_connection()
+
+    logger.info(
+        f"CSV range {byte_range.index} complete: {processed - failed}/{processed} succeeded "
+        f"({duplicates} known duplicates not published)"
+    )
+    return processed, failed, duplicates
+
+
+async def _process_ranges_parallel(
+    csv_path: Path,
+    ranges: List[CsvByteRange],
+    encoding: str,
+    chunk_size: int,
+    parser_engine: str,
+    batch_id: UUID,
+    source_type: str,
+    source_name: str,
+    resumed: Optional[List[Dict[str, Any]]] = None,
+    hash_index_path: Optional[Path] = None,
+    geometry_metrics: bool = True
+) -> Tuple[int, int, int]:
+    """
+    Run process_csv_range for every range in a process pool.
+
+    Chunk progress from all workers is merged into import_batches every
+    PROGRESS_INTERVAL seconds, together with a checkpoint of the rows done
+    per range; a finished range's result settles anything still in flight
+    on the queue. The batch is paused (or throttled) while any range is.
+
+    Args:
+        resumed: Range checkpoint entries of an interrupted run; finished
+            ranges are skipped, the others continue after their rows_done
+        hash_index_path: Local content hash index (None disables suppression)
+        geometry_metrics: Attach geometry metrics to PARCEL rows
+
+    Returns:
+        tuple: (rows processed, rows failed, known duplicates) in this run
+    """
+    state = {
+        r.index: {
+            "index": r.index, "start": r.start, "end": r.end,
+            "rows_before": r.rows_before, "rows_done": 0, "done": False
+        }
+        for r in ranges
+    }
+    for entry in resumed or []:
+        state[entry["index"]].update(rows_done=entry["rows_done"], done=entry["done"])
+
+    pending_ranges = [r for r in ranges if not state[r.index]["done"]]
+    if not pending_ranges:
+        return 0, 0, 0
+
+    logger.info(
+        f"Processing {len(pending_ranges)} CSV ranges in parallel (batch: {batch_id})"
+    )
+
+    loop = asyncio.get_running_loop()
+    executor, progress_queue = _create_range_executor(len(pending_ranges))
+    skipped = {r.index: state[r.index]["rows_done"] for r in pending_ranges}
+    reported = {r.index: [0, 0, 0] for r in pending_ranges}
+    pauses = RangePauses(batch_id)
+
+    async def merge_progress(finished) -> None:
+        processed = failed = duplicates = 0
+        while True:
+            try:
+                item = progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            if len(item) == 3:
+                pauses.record(*item)
+                continue
+            index, chunk_processed, chunk_failed, chunk_duplicates = item
+            if state[index]["done"]:
+                continue  # Already settled from the range's result
+            reported[index][0] += chunk_processed
+            reported[index][1] += chunk_failed
+            reported[index][2] += chunk_duplicates
+            processed += chunk_processed
+            failed += chunk_failed
+            duplicates += chunk_duplicates
+
+        # Settle finished ranges from their results (queue items may still be in flight)
+        for future in finished:
+            byte_range = futures[future]
+            range_processed, range_failed, range_duplicates = future.result()
+            processed += range_processed - reported[byte_range.index][0]
+            failed += range_failed - reported[byte_range.index][1]
+            duplicates += range_duplicates - reported[byte_range.index][2]
+            reported[byte_range.index] = [range_processed, range_failed, range_duplicates]
+            state[byte_range.index]["done"] = True
+
+        for index, (range_processed, _, _) in reported.items():
+            state[index]["rows_done"] = skipped[index] + range_processed
+
+        if processed or finished:
+            await update_batch_progress(
+                batch_id=batch_id,
+                processed_count=processed,
+                new_count=processed - failed - duplicates,
+                duplicate_count=duplicates,
+                failed_count=failed,
+                checkpoint={"ranges": [state[index] for index in sorted(state)]}
+            )
+        await pauses.sync()
+
+    try:
+        futures = {
+            loop.run_in_executor(
+                executor, process_csv_range, csv_path, byte_range, encoding,
+                chunk_size, parser_engine, batch_id, source_type, source_name,
+                skipped[byte_range.index], hash_index_path, geometry_metrics
+            ): byte_range
+            for byte_range in pending_ranges
+        }
+
+        pending = set(futures)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, timeout=PROGRESS_INTERVAL, return_when=asyncio.FIRST_EXCEPTION
+            )
+            for future in done:
+                if future.exception() is not None:
+                    raise future.exception()
+            await merge_progress(done)
+
+        total_processed = sum(processed for processed, _, _ in reported.values())
+        total_failed = sum(failed for _, failed, _ in reported.values())
+        total_duplicates = sum(duplicates for _, _, duplicates in reported.values())
+        return total_processed, total_failed, total_duplicates
+
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def read_csv_chunks(
+    csv_path: Path,
+    encoding: str,
+    chunk_size: int = 1000,
+    parser_engine: Literal["pandas", "arrow"] = "pandas",
+    byte_range: Optional[Tuple[int, int]] = None
+) -> Iterator[Union[pd.DataFrame, pa.Table]]:
+    """
+    Read a CSV file in chunks of string columns with stripped column names.
+
+    The pandas engine yields DataFrames of Python strings. The arrow engine
+    yields Arrow tables backed by string buffers, for ChunkValidator.validate_arrow.
+
+    Args:
+        csv_path: Path to the CSV file
+        encoding: File encoding
+        chunk_size: Number of rows per chunk (default: 1000)
+        parser_engine: 'pandas' or 'arrow'
+        byte_range: Optional (start, end) byte offsets of whole records to read
+            instead of the whole file; column names come from the file's header
+
+    Yields:
+        pd.DataFrame or pa.Table: Next chunk of rows
+
+    Raises:
+        ValueError: If parser_engine is not supported
+    """
+    if parser_engine not in PARSER_ENGINES:
+        raise ValueError(
+            f"Unsupported CSV parser engine '{parser_engine}'. "
+            f"Supported: {', '.join(PARSER_ENGINES)}"
+        )
+
+    if parser_engine == "arrow":
+        yield from _read_arrow_chunks(csv_path, encoding, chunk_size, byte_range)
+        return
+
+    if byte_range is not None:
+        source = io.BufferedReader(ByteRangeReader(csv_path, *byte_range))
+        header_options = {"header": None, "names": _read_header(csv_path, encoding)}
+    else:
+        source = csv_path
+        header_options = {}
+
+    try:
         for chunk in pd.read_csv(
-            csv_path,
+            source,
             encoding=encoding,
             chunksize=chunk_size,
-            dtype=str,  # Read all as strings, let Pydantic handle type conversion
+            dtype=str,  # Read all as strings, let the chunk validator handle type conversion
             keep_default_na=False,  # Don't convert empty strings to NaN
             encoding_errors='replace',  # Replace bad characters with � instead of crashing
-            on_bad_lines='warn'  # Log bad lines but continue processing
+            on_bad_lines='warn',  # Log bad lines but continue processing
+            **header_options
         ):
-            chunk_num += 1
-            logger.debug(f"Processing chunk {chunk_num} ({len(chunk)} rows)")
-
-            # Normalize column names to match model fields (case-insensitive)
+            # Normalize column names to match model fields
             chunk.columns = chunk.columns.str.strip()
+            yield chunk
+    finally:
+        if byte_range is not None:
+            source.close()
 
-            # Process each row in the chunk
-            chunk_failed = 0
-            for idx, row in chunk.iterrows():
-                try:
-                    # Convert row to dict, removing empty strings
-                    row_dict = {
-                        k: (v if pd.notna(v) and v != '' else None)
-                        for k, v in row.to_dict().items()
-                    }
-
-                    # Validate with Pydantic model
-                    record = model_class(**row_dict)
-
-                    # Publish to RabbitMQ deduplication queue
-                    message = {
-                        "batch_id": str(batch_id),
-                        "source_type": source_type,
-                        "source_file": source_name,
-                        "source_row_number": int(total_processed + idx + 1),
-                        "raw_data": record.model_dump(exclude_none=True)
-                    }
-
-                    success = publish_message('deduplication', message)
-
-                    if not success:
-                        logger.error(
-                            f"Failed to publish message for row {total_processed + idx + 1}"
-                        )
-                        chunk_failed += 1
-
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to process row {total_processed + idx + 1}: {e}"
-                    )
-                    chunk_failed += 1
-
-            # Update batch progress after each chunk
-            chunk_processed = len(chunk)
-            chunk_successful = chunk_processed - chunk_failed
 
-            await update_batch_progress(
-                batch_id=batch_id,
-                processed_count=chunk_processed,
-                new_count=chunk_successful,  # Will be updated by deduplication service
-                failed_count=chunk_failed
-            )
+def _read_header(csv_path: Path, encoding: str) -> List[str]:
+    """Read the header record's column names (stripped, without a leading BOM)."""
+    with open(csv_path, encoding=encoding, errors='replace', newline='') as f:
+        names = next(csv.reader(f), [])
+    if names:
+        # Excel exports start with a UTF-8 BOM, which pandas drops from the first name
+        names[0] = names[0].lstrip('\ufeff')
+    return [name.strip() for name in names]
 
-            total_processed += chunk_processed
-            total_failed += chunk_failed
 
-            logger.info(
-                f"Chunk {chunk_num} complete: {chunk_successful}/{chunk_processed} succeeded"
+def _read_arrow_chunks(
+    csv_path: Path,
+    encoding: str,
+    chunk_size: int,
+    byte_range: Optional[Tuple[int, int]] = None
+) -> Iterator[pa.Table]:
+    """Stream a CSV through pyarrow's reader, re-sliced into chunk_size-row tables."""
+    # Header read up front so every column can be typed as string (no inference)
+    header = _read_header(csv_path, encoding)
+
+    if not header:
+        return
+
+    def on_invalid_row(row) -> str:
+        # Matches on_bad_lines='warn' in the pandas engine
+        logger.warning(
+            f"Skipping bad CSV line {row.number}: expected {row.expected_columns} "
+            f"fields, saw {row.actual_columns}"
+        )
+        return "skip"
+
+    # A Python file object keeps Arrow's read-ahead bounded; given a path,
+    # the reader buffers the whole file ahead of the consumer
+    if byte_range is not None:
+        source = ByteRangeReader(csv_path, *byte_range)
+    else:
+        source = open(csv_path, 'rb')
+
+    with source:
+        reader = pa_csv.open_csv(
+            source,
+            read_options=pa_csv.ReadOptions(
+                encoding=encoding,
+                column_names=header,
+                skip_rows=0 if byte_range is not None else 1,
+                block_size=ARROW_BLOCK_SIZE
+            ),
+            parse_options=pa_csv.ParseOptions(invalid_row_handler=on_invalid_row),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in header},
+                strings_can_be_null=False  # Keep empty strings, like keep_default_na=False
             )
+        )
 
-        # Mark batch as completed
-        await complete_batch(batch_id, total_processed)
+        pending = []
+        pending_rows = 0
+        for batch in reader:
+            pending.append(batch)
+            pending_rows += batch.num_rows
 
-        logger.info(
-            f"CSV processing complete: {total_processed} rows processed, "
-            f"{total_failed} failed (batch: {batch_id})"
-        )
+            if pending_rows >= chunk_size:
+                table = pa.Table.from_batches(pending)
+                offset = 0
+                while pending_rows - offset >= chunk_size:
+                    yield table.slice(offset, chunk_size)
+                    offset += chunk_size
+                pending = table.slice(offset).to_batches()
+                pending_rows -= offset
 
-    except Exception as e:
-        logger.error(f"CSV processing failed (batch: {batch_id}): {e}", exc_info=True)
-        await fail_batch(batch_id, f"CSV processing error: {str(e)}")
-        raise
+        if pending_rows:
+            yield pa.Table.from_batches(pending, schema=reader.schema)
 
 
 async def count_csv_rows(
@@ -320,18 +867,40 @@ async def count_csv_rows(
     return row_count
 
 
-def validate_csv_format(csv_path: Path) -> tuple[bool, Optional[str]]:
+def validate_csv_format(
+    csv_path: Path,
+    inspection: Optional[UploadInspection] = None
+) -> tuple[bool, Optional[str]]:
     """
     Validate that a file is a valid CSV.
 
     Args:
         csv_path: Path to the CSV file
+        inspection: Upload inspection; when given, its sample is checked
+            instead of re-reading the file
 
     Returns:
         tuple: (is_valid, error_message)
             - is_valid: True if valid CSV, False otherwise
             - error_message: Description of validation failure, or None if valid
     """
+    if inspection is not None:
+        if inspection.byte_size == 0:
+            return False, "File is empty (0 bytes)"
+        if inspection.sample is None:
+            logger.error(f"CSV validation failed: {inspection.sample_error}")
+            return False, inspection.sample_error or "File contains no data"
+        if len(inspection.sample) == 0:
+            return False, "CSV contains no data rows"
+        if len(inspection.sample.columns) == 0:
+            return False, "CSV contains no columns"
+
+        logger.info(
+            f"CSV validation passed: {len(inspection.sample.columns)} columns, "
+            f"encoding={inspection.encoding}"
+        )
+        return True, None
+
     try:
         # Check file is not empty
         if csv_path.stat().st_size == 0:
@@ -0,0 +1,174 @@
+"""
+CSV byte-range planning service.
+
+Splits a saved CSV into contiguous byte ranges that each start at a record
+boundary (newline outside quotes), so ranges can be parsed independently:
+- Boundaries come from the upload inspection (no extra I/O), or from one
+  quote-aware scan of the file when no inspection is available
+- Each range carries the number of data rows before it, so the original
+  source_row_number is preserved
+"""
+
+import io
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .logging_utils import get_logger
+from .upload_inspector import BOUNDARY_BYTES, UploadInspection, UploadInspector
+
+logger = get_logger(__name__)
+
+# Ranges smaller than this are not worth a separate worker
+MIN_RANGE_BYTES = 16 * 1024 * 1024  # 16MB
+
+READ_CHUNK_BYTES = 1024 * 1024  # 1MB
+
+
+@dataclass(frozen=True)
+class CsvByteRange:
+    """
+    A slice of a CSV file made of whole records.
+
+    Attributes:
+        index: Position of the range in the file (0-based)
+        start: First byte of the range (start of a record, after the header)
+        end: Byte after the last one in the range
+        rows_before: Data rows in the file before this range
+    """
+
+    index: int
+    start: int
+    end: int
+    rows_before: int
+
+    @property
+    def size(self) -> int:
+        """Number of bytes in the range."""
+        return self.end - self.start
+
+
+class ByteRangeReader(io.RawIOBase):
+    """
+    Read-only binary file object limited to [start, end) of a file.
+
+    Lets pandas and pyarrow parse a single range without copying it.
+    """
+
+    def __init__(self, path: Path, start: int, end: int):
+        self._file = open(path, "rb")
+        self._file.seek(start)
+        self._remaining = end - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._remaining <= 0:
+            return 0
+        view = memoryview(buffer)[:self._remaining]
+        n = self._file.readinto(view)
+        self._remaining -= n
+        return n
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
+def scan_record_boundaries(
+    csv_path: Path,
+    boundary_bytes: int = BOUNDARY_BYTES
+) -> Tuple[List[Tuple[int, int]], int]:
+    """
+    Find record boundaries with one quote-aware pass over the file.
+
+    Args:
+        csv_path: Path to the CSV file
+        boundary_bytes: Spacing of recorded boundaries (default: 4MB)
+
+    Returns:
+        tuple: (record boundaries as (byte offset, rows before), data row count)
+    """
+    inspector = UploadInspector(sample_rows=1, boundary_bytes=boundary_bytes)
+    with open(csv_path, "rb") as f:
+        while chunk := f.read(READ_CHUNK_BYTES):
+            inspector.feed(chunk)
+    inspection = inspector.finish()
+    return inspection.record_boundaries, inspection.row_count
+
+
+def plan_csv_ranges(
+    csv_path: Path,
+    max_ranges: int,
+    inspection: Optional[UploadInspection] = None,
+    min_range_bytes: int = MIN_RANGE_BYTES
+) -> List[CsvByteRange]:
+    """
+    Split a CSV file into up to max_ranges record-aligned byte ranges.
+
+    Args:
+        csv_path: Path to the CSV file
+        max_ranges: Upper bound on the number of ranges (e.g. worker count)
+        inspection: Upload inspection with record boundaries (scanned if None)
+        min_range_bytes: Smallest range worth splitting off (default: 16MB)
+
+    Returns:
+        List of CsvByteRange covering every data row, in file order. A single
+        range means the file is too small to split.
+    """
+    file_size = inspection.byte_size if inspection is not None else Path(csv_path).stat().st_size
+    n_ranges = max(1, min(max_ranges, file_size // max(min_range_bytes, 1)))
+    if n_ranges == 1:
+        return [CsvByteRange(index=0, start=_header_end(csv_path), end=file_size, rows_before=0)]
+
+    target = file_size / n_ranges
+    if inspection is not None:
+        boundaries = inspection.record_boundaries
+    else:
+        boundaries, _ = scan_record_boundaries(
+            csv_path, boundary_bytes=min(BOUNDARY_BYTES, max(int(target) // 16, 1))
+        )
+
+    header_end = _header_end(csv_path)
+
+    # Pick the first boundary at or past each target offset
+    starts = [(header_end, 0)]
+    for offset, rows_before in boundaries:
+        if len(starts) == n_ranges:
+            break
+        if offset > starts[-1][0] and offset >= target * len(starts):
+            starts.append((offset, rows_before))
+
+    ranges = []
+    for i, (start, rows_before) in enumerate(starts):
+        end = starts[i + 1][0] if i + 1 < len(starts) else file_size
+        ranges.append(CsvByteRange(index=i, start=start, end=end, rows_before=rows_before))
+
+    logger.info(
+        f"Planned {len(ranges)} CSV byte ranges for {csv_path} ({file_size} bytes)"
+    )
+    return ranges
+
+
+def _header_end(csv_path: Path) -> int:
+    """Byte offset just past the header record (quote-aware)."""
+    in_quotes = False
+    offset = 0
+    with open(csv_path, "rb") as f:
+        while chunk := f.read(64 * 1024):
+            for i, byte in enumerate(chunk):
+                if byte == 0x22:  # '"'
+                    in_quotes = not in_quotes
+                elif byte == 0x0A and not in_quotes:  # '\n'
+                    return offset + i + 1
+            offset += len(chunk)
+    return offset
+
+
+__all__ = [
+    "ByteRangeReader",
+    "CsvByteRange",
+    "plan_csv_ranges",
+    "scan_record_boundaries",
+]
@@ -0,0 +1,280 @@
+"""
+Streaming encoding detection service.
+
+Decides the text encoding of an upload from the bytes as they stream past:
+- Every candidate encoding is decoded incrementally over the whole stream
+- Byte offsets of the first undecodable sequences are kept per candidate
+- The statistical detector (chardet) only sees chunks containing non-ASCII
+  bytes and stops early once it is confident
+
+The decision therefore covers the entire file, not just a leading sample,
+without reading the file a second time.
+"""
+
+import codecs
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+from chardet import UniversalDetector
+
+from .logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Candidate encodings in order of preference. latin-1 decodes any byte
+# sequence, so a decision always exists.
+DEFAULT_CANDIDATES = ("utf-8", "windows-1252", "latin-1")
+
+# Minimum detector confidence for its guess to take precedence
+MIN_CONFIDENCE = 0.6
+
+# Stop feeding the statistical detector after this many (non-ASCII bearing) bytes
+MAX_DETECT_BYTES = 4 * 1024 * 1024  # 4MB
+
+# UTF-8 continuation bytes decoded without any error before UTF-8 is
+# considered certain and the statistical detector is no longer consulted
+UTF8_EVIDENCE_BYTES = 64
+
+# Undecodable offsets kept per candidate (decoding of a candidate stops after this)
+MAX_ERROR_OFFSETS = 5
+
+READ_CHUNK_BYTES = 1024 * 1024  # 1MB
+
+
+@dataclass
+class EncodingDetection:
+    """
+    Outcome of streaming encoding detection.
+
+    Attributes:
+        encoding: Chosen encoding (one of the candidates)
+        confidence: Confidence in the choice (0-1)
+        detected: Raw guess from the statistical detector, if any
+        bytes_examined: Total bytes decoded against the candidates
+        error_offsets: First undecodable byte offsets per candidate encoding
+    """
+
+    encoding: str
+    confidence: float
+    detected: Optional[str] = None
+    bytes_examined: int = 0
+    error_offsets: Dict[str, List[int]] = field(default_factory=dict)
+
+
+class _CandidateDecoder:
+    """Incremental strict decoder that records undecodable byte offsets."""
+
+    def __init__(self, encoding: str, max_errors: int):
+        self.encoding = encoding
+        self.max_errors = max_errors
+        self.error_offsets: List[int] = []
+        self.continuation_bytes = 0
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="strict")
+
+    @property
+    def exhausted(self) -> bool:
+        """True once enough errors were recorded to stop decoding."""
+        return len(self.error_offsets) >= self.max_errors
+
+    def feed(self, chunk: bytes, offset: int, final: bool = False) -> None:
+        """Decode the next chunk, recording errors and resynchronizing after each."""
+        if self.exhausted:
+            return
+
+        # Bytes buffered from the previous chunk (split multibyte sequence)
+        pending = self._decoder.getstate()[0]
+        data = pending + chunk if pending else chunk
+        base = offset - len(pending)
+        self._decoder.reset()
+
+        position = 0
+        while True:
+            try:
+                text = self._decoder.decode(data[position:] if position else data, final)
+                consumed = len(data) - position - len(self._decoder.getstate()[0])
+                self.continuation_bytes += consumed - len(text)
+                return
+            except UnicodeDecodeError as e:
+                self.error_offsets.append(base + position + e.start)
+                if self.exhausted:
+                    return
+                position += e.end
+                self._decoder.reset()
+
+
+class StreamingEncodingDetector:
+    """
+    Incremental encoding detector fed with the upload's byte chunks.
+
+    Example:
+        ```python
+        detector = StreamingEncodingDetector()
+        while chunk := await upload_file.read(1024 * 1024):
+            detector.feed(chunk)
+        detection = detector.finish()
+        ```
+    """
+
+    def __init__(
+        self,
+        candidates: Sequence[str] = DEFAULT_CANDIDATES,
+        max_detect_bytes: int = MAX_DETECT_BYTES,
+        max_error_offsets: int = MAX_ERROR_OFFSETS
+    ):
+        self.max_detect_bytes = max_detect_bytes
+        self.byte_size = 0
+
+        # One decoder per distinct codec (e.g. 'latin-1' and 'iso-8859-1' are the same)
+        self._decoders: Dict[str, _CandidateDecoder] = {}
+        for encoding in candidates:
+            name = codecs.lookup(encoding).name
+            if name not in self._decoders:
+                self._decoders[name] = _CandidateDecoder(encoding, max_error_offsets)
+
+        self._detector: Optional[UniversalDetector] = UniversalDetector()
+        self._detect_bytes = 0
+        self._guess: Optional[dict] = None
+
+    @property
+    def detecting(self) -> bool:
+        """True while the statistical detector is still being fed."""
+        return self._detector is not None
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Consume the next chunk of the stream.
+
+        Args:
+            chunk: Raw bytes, in stream order
+        """
+        if not chunk:
+            return
+
+        offset = self.byte_size
+        self.byte_size += len(chunk)
+
+        for decoder in self._decoders.values():
+            decoder.feed(chunk, offset)
+
+        if self._detector is not None and not chunk.isascii():
+            # Pure ASCII chunks carry no evidence between the candidates
+            self._detector.feed(chunk)
+            self._detect_bytes += len(chunk)
+
+            if self._detector.done or self._detect_bytes >= self.max_detect_bytes:
+                self._stop_detector()
+            elif self._utf8_certain():
+                logger.debug(f"UTF-8 confirmed after {self.byte_size} bytes, stopping detector")
+                self._detector = None
+
+    def finish(self) -> EncodingDetection:
+        """
+        Finalize detection once the stream is complete.
+
+        Returns:
+            EncodingDetection for the whole stream
+        """
+        for decoder in self._decoders.values():
+            decoder.feed(b"", self.byte_size, final=True)
+
+        if self._detector is not None:
+            if self._detect_bytes:
+                self._stop_detector()
+            else:
+                self._detector = None  # Never saw a non-ASCII byte
+
+        error_offsets = {
+            decoder.encoding: list(decoder.error_offsets)
+            for decoder in self._decoders.values()
+        }
+        encoding, confidence = self._choose()
+        detected = self._guess.get("encoding") if self._guess else None
+
+        logger.info(
+            f"Detected encoding: {encoding} (confidence: {confidence:.2%}, "
+            f"detector guess: {detected}, bytes: {self.byte_size})"
+        )
+
+        return EncodingDetection(
+            encoding=encoding,
+            confidence=confidence,
+            detected=detected,
+            bytes_examined=self.byte_size,
+            error_offsets=error_offsets,
+        )
+
+    def _stop_detector(self) -> None:
+        """Close the statistical detector and keep its guess."""
+        self._guess = self._detector.close()
+        self._detector = None
+
+    def _utf8_certain(self) -> bool:
+        """True once enough clean multibyte UTF-8 was seen to rule out 8-bit encodings."""
+        utf8 = self._decoders.get("utf-8")
+        return (
+            utf8 is not None
+            and not utf8.error_offsets
+            and utf8.continuation_bytes >= UTF8_EVIDENCE_BYTES
+        )
+
+    def _choose(self) -> tuple[str, float]:
+        """Pick the detector's guess if it decodes cleanly, else the first clean candidate."""
+        clean = [d for d in self._decoders.values() if not d.error_offsets]
+
+        if self._utf8_certain():
+            return self._decoders["utf-8"].encoding, 0.99
+
+        if self._guess and self._guess.get("encoding"):
+            guess = self._guess["encoding"]
+            confidence = self._guess.get("confidence") or 0.0
+            if guess.lower() == "ascii":
+                guess = "utf-8"
+            try:
+                name = codecs.lookup(guess).name
+            except LookupError:
+                name = None
+
+            if confidence >= MIN_CONFIDENCE:
+                match = self._decoders.get(name)
+                if match is not None and not match.error_offsets:
+                    return match.encoding, confidence
+                logger.debug(f"Detector guess {guess} is not a clean candidate, falling back")
+
+        if clean:
+            # Whole-stream decode succeeded; pure ASCII is certain UTF-8
+            confidence = 1.0 if self._guess is None else 0.5
+            return clean[0].encoding, confidence
+
+        logger.warning("All encoding candidates failed, using UTF-8 with error replacement")
+        return "utf-8", 0.0
+
+
+def detect_file_encoding(
+    file_path: Union[str, Path],
+    chunk_size: int = READ_CHUNK_BYTES,
+    **kwargs
+) -> EncodingDetection:
+    """
+    Run streaming encoding detection over a file on disk.
+
+    Args:
+        file_path: Path to the file
+        chunk_size: Bytes read per chunk (default: 1MB)
+        **kwargs: Passed to StreamingEncodingDetector
+
+    Returns:
+        EncodingDetection for the whole file
+    """
+    detector = StreamingEncodingDetector(**kwargs)
+    with open(file_path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            detector.feed(chunk)
+    return detector.finish()
+
+
+__all__ = [
+    "EncodingDetection",
+    "StreamingEncodingDetector",
+    "detect_file_encoding",
+]
@@ -4,95 +4,189 @@ GDB (Geodatabase) file processing service.
 Handles GDB file uploads for Wisconsin V11 Parcel data:
 - ZIP extraction and GDB inspection
 - Layer listing and CRS validation
-- Geometry processing with GeoPandas
+- Geometry processing with GeoPandas, or vectorized shapely over Arrow batches
 - CRS transformation to EPSG:3071
-- RabbitMQ message publishing
-- Batch progress tracking
+- Geometry as WKT, WKB or both; EPSG:3071 WKB from Arrow batches passes through untouched
+- Optional coordinate grid snapping and topology-preserving simplification
+- Bounding box, centroid and area of every parcel (vectorized per chunk)
+- Content hashing per chunk and RabbitMQ message publishing
+- Optional parallel processing of feature ranges, and of several layers as child batches
+- Batch progress tracking with resumable checkpoints
 """
 
+import hashlib
 import logging
+import re
 import zipfile
 import asyncio
-from pathlib import Path
-from typing import Literal, Optional, Dict, Any, List
+import contextvars
+import multiprocessing
+import queue as queue_module
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path, PurePosixPath
+from typing import Literal, Optional, Dict, Any, Iterator, List, Tuple, Union
 from uuid import UUID
 import shutil
 
 import fiona
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import shapely
+from pyogrio.raw import open_arrow
 from shapely.geometry import shape
-from shapely.ops import transform as shapely_transform
-from pyproj import CRS, Transformer
+from pyproj import Transformer
 
-from shared.models import V11ParcelRecord
-from shared.rabbitmq import publish_message
+from shared.hash_utils import HASH_VERSION, compute_content_hashes, compute_record_hashes
+from shared.models import V11ParcelRecord, V11ParcelWKBRecord
+from shared.aio_rabbitmq import close_rabbitmq_connection, publish_batch
 from .batch_tracker import update_batch_progress, complete_batch, fail_batch
+from .broker_pause import (
+    PauseHook, RangePauses, batch_pause_hook, publish_or_pause, range_pause_hook
+)
+from .chunk_validator import ChunkValidator, get_chunk_validator
+from .crs_transform import transform_geometries, transform_geometry, transformer_for
+from .gdb_ranges import GdbFeatureRange, plan_feature_ranges
+from .geometry_metrics import compute_geometry_metrics, geometry_metric_columns, message_metrics
+from .hash_index import get_hash_index
 from .logging_utils import get_logger, set_batch_id
 from .background_utils import safe_background_task
+from .wkb_utils import read_wkb_headers, wkb_to_hex
 
 logger = get_logger(__name__)
 
 # Target CRS for Wisconsin data
 WISCONSIN_CRS = "EPSG:3071"  # Wisconsin Transverse Mercator
 
+# Chunks the reader thread may build ahead of the chunk being published
+READ_AHEAD_CHUNKS = 2
 
-def extract_gdb(zip_path: Path, extract_to: Path) -> Path:
+# GDAL virtual file system prefix for reading inside zip archives
+VSIZIP_PREFIX = "/vsizip/"
+_VSIZIP_PATH = re.compile(r"^/vsizip/(.+?\.zip)/(.+)$", re.IGNORECASE)
+
+# Layers whose metadata is kept in memory (see get_layer_metadata)
+LAYER_METADATA_CACHE_SIZE = 256
+
+# Seconds between progress merges while feature ranges are processed in parallel
+PROGRESS_INTERVAL = 2.0
+
+# Geometry formats of parcel messages: geometry_wkt, geometry_wkb (hex ISO WKB) or both
+GEOMETRY_FORMATS = ("wkt", "wkb", "both")
+
+
+def find_gdb_in_zip(zip_path: Path) -> Tuple[str, List[str]]:
     """
-    Extract a .gdb.zip file to a directory.
+    Find the .gdb directory inside a zip from its central directory (nothing is read or extracted).
 
     Args:
         zip_path: Path to the .gdb.zip file
-        extract_to: Directory to extract to
 
     Returns:
-        Path: Path to the extracted .gdb directory
+        tuple: (archive path of the .gdb directory, archive members inside it)
 
     Raises:
         ValueError: If the zip doesn't contain a .gdb directory
         zipfile.BadZipFile: If the file is not a valid zip
     """
-    logger.info(f"Extracting GDB from {zip_path} to {extract_to}")
+    gdb_members: Dict[str, List[str]] = {}
 
-    # Ensure extraction directory exists
-    extract_to.mkdir(parents=True, exist_ok=True)
-
-    # Extract the zip file
     with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        zip_ref.extractall(extract_to)
-
-    # Find the .gdb directory in the extracted files
-    gdb_dirs = list(extract_to.glob("**/*.gdb"))
-
-    if not gdb_dirs:
+        for name in zip_ref.namelist():
+            parts = PurePosixPath(name).parts
+            for depth, part in enumerate(parts):
+                if part.lower().endswith('.gdb'):
+                    gdb_dir = "/".join(parts[:depth + 1])
+                    gdb_members.setdefault(gdb_dir, []).append(name)
+                    break
+
+    if not gdb_members:
         raise ValueError(
             f"No .gdb directory found in {zip_path}. "
             "Ensure the zip contains a valid GDB."
         )
 
+    gdb_dirs = list(gdb_members)
     if len(gdb_dirs) > 1:
         logger.warning(
             f"Multiple .gdb directories found in {zip_path}. Using first: {gdb_dirs[0]}"
         )
 
-    gdb_path = gdb_dirs[0]
+    return gdb_dirs[0], gdb_members[gdb_dirs[0]]
+
+
+def extract_gdb(zip_path: Path, extract_to: Path, in_place: bool = False) -> Union[Path, str]:
+    """
+    Extract the .gdb directory of a .gdb.zip file, or open it in place.
+
+    Only the members of the .gdb directory are extracted, not the rest of
+    the archive. With in_place, nothing is extracted: the returned GDAL path
+    reads the .gdb straight out of the zip (/vsizip/), so temp disk stays at
+    the size of the upload and the first feature is read in seconds.
+
+    Args:
+        zip_path: Path to the .gdb.zip file
+        extract_to: Directory to extract to (unused in place)
+        in_place: Read the GDB from the zip instead of extracting it
+
+    Returns:
+        Path to the extracted .gdb directory, or the /vsizip/ path (str) in place
+
+    Raises:
+        ValueError: If the zip doesn't contain a .gdb directory
+        zipfile.BadZipFile: If the file is not a valid zip
+    """
+    gdb_dir, members = find_gdb_in_zip(zip_path)
+
+    if in_place:
+        # GDAL needs the double slash of an absolute archive path, which Path would collapse
+        gdb_path = f"{VSIZIP_PREFIX}{Path(zip_path).resolve()}/{gdb_dir}"
+        logger.info(f"Reading GDB in place: {gdb_path}")
+        return gdb_path
+
+    logger.info(f"Extracting GDB {gdb_dir} ({len(members)} files) from {zip_path} to {extract_to}")
+
+    # Ensure extraction directory exists
+    extract_to.mkdir(parents=True, exist_ok=True)
+
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        for member in members:
+            zip_ref.extract(member, extract_to)
+
+    gdb_path = extract_to / gdb_dir
     logger.info(f"Extracted GDB to: {gdb_path}")
 
     return gdb_path
 
 
-def inspect_gdb(gdb_path: Path) -> Dict[str, Any]:
+def is_virtual_path(gdb_path: Union[Path, str]) -> bool:
+    """Whether a GDB path is a GDAL virtual file system path (e.g. /vsizip/) rather than a directory."""
+    return str(gdb_path).startswith("/vsi")
+
+
+def inspect_gdb(gdb_path: Union[Path, str]) -> Dict[str, Any]:
     """
     Inspect a GDB file and return metadata.
 
+    Only the layer list is read up front. Per-layer metadata is read when a
+    layer is first looked up in layer_info, and cached per GDB content and
+    layer (see get_layer_metadata), so auxiliary layers are never opened.
+
     Args:
-        gdb_path: Path to the .gdb directory
+        gdb_path: Path to the .gdb directory (or its /vsizip/ path)
 
     Returns:
         Dict containing:
         - layers: List of layer names
         - default_layer: First layer name
-        - layer_info: Dict of layer metadata (CRS, bounds, feature count)
+        - layer_info: Mapping of layer name to metadata (CRS, bounds, feature count),
+          or {"error": ...} if the layer cannot be read
 
     Example:
         ```python
@@ -111,64 +205,161 @@ def inspect_gdb(gdb_path: Path) -> Dict[str, Any]:
 
     logger.info(f"Found {len(layers)} layer(s): {layers}")
 
-    # Get detailed info for each layer
-    layer_info = {}
-    for layer_name in layers:
-        try:
-            with fiona.open(str(gdb_path), layer=layer_name) as src:
-                # Get CRS
-                crs = src.crs_wkt if src.crs else "Unknown"
+    return {
+        "layers": layers,
+        "default_layer": layers[0] if layers else None,
+        "layer_info": LayerInfo(gdb_path, layers)
+    }
 
-                # Extract EPSG code from CRS
-                crs_epsg = 'Unknown'
-                if src.crs:
-                    # Try to get EPSG code from CRS object
-                    try:
-                        if hasattr(src.crs, 'to_epsg'):
-                            epsg_code = src.crs.to_epsg()
-                            crs_epsg = f"EPSG:{epsg_code}" if epsg_code else 'Unknown'
-                        elif isinstance(src.crs, dict) and 'init' in src.crs:
-                            crs_epsg = src.crs['init']
-                    except Exception:
-                        crs_epsg = 'Unknown'
-
-                # Get bounds
-                bounds = src.bounds if hasattr(src, 'bounds') else None
-
-                # Count features
-                feature_count = len(src)
-
-                layer_info[layer_name] = {
-                    "crs": crs_epsg,
-                    "crs_wkt": crs,
-                    "bounds": bounds,
-                    "feature_count": feature_count,
-                    "schema": dict(src.schema) if hasattr(src, 'schema') else None
-                }
-
-                logger.info(
-                    f"Layer '{layer_name}': {feature_count} features, CRS: {crs_epsg}"
-                )
 
+class LayerInfo(Mapping):
+    """Per-layer metadata of a GDB, read on first access (see inspect_gdb)."""
+
+    def __init__(self, gdb_path: Union[Path, str], layers: List[str]):
+        self._gdb_path = gdb_path
+        self._layers = list(layers)
+
+    def __getitem__(self, layer_name: str) -> Dict[str, Any]:
+        if layer_name not in self._layers:
+            raise KeyError(layer_name)
+        try:
+            return get_layer_metadata(self._gdb_path, layer_name)
         except Exception as e:
             logger.error(f"Error inspecting layer '{layer_name}': {e}")
-            layer_info[layer_name] = {
-                "error": str(e)
-            }
+            return {"error": str(e)}
 
-    return {
-        "layers": layers,
-        "default_layer": layers[0] if layers else None,
-        "layer_info": layer_info
-    }
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layers)
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+
+# Layer metadata by (GDB fingerprint, layer name), most recently used last
+_layer_metadata_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+_layer_metadata_lock = threading.Lock()
+
+
+def get_layer_metadata(gdb_path: Union[Path, str], layer_name: str) -> Dict[str, Any]:
+    """
+    Get the metadata of one layer, cached per GDB content and layer.
+
+    The cache key is the GDB's fingerprint (see gdb_fingerprint), so the
+    upload endpoint and the processor share one read, and a resumed or
+    re-uploaded identical GDB is not read again.
+
+    Args:
+        gdb_path: Path to the .gdb directory (or its /vsizip/ path)
+        layer_name: Layer to describe
+
+    Returns:
+        Dict with crs (EPSG string or 'Unknown'), crs_wkt, bounds, feature_count and schema
+
+    Raises:
+        Exception: Whatever fiona raises if the layer cannot be opened
+    """
+    fingerprint = gdb_fingerprint(gdb_path)
+    key = (fingerprint, layer_name)
+
+    if fingerprint is not None:
+        with _layer_metadata_lock:
+            if key in _layer_metadata_cache:
+                _layer_metadata_cache.move_to_end(key)
+                return dict(_layer_metadata_cache[key])
+
+    metadata = _read_layer_metadata(gdb_path, layer_name)
+
+    if fingerprint is not None:
+        with _layer_metadata_lock:
+            _layer_metadata_cache[key] = metadata
+            while len(_layer_metadata_cache) > LAYER_METADATA_CACHE_SIZE:
+                _layer_metadata_cache.popitem(last=False)
+
+    return dict(metadata)
+
+
+def _read_layer_metadata(gdb_path: Union[Path, str], layer_name: str) -> Dict[str, Any]:
+    """Open one layer and read its CRS, bounds, feature count and schema."""
+    with fiona.open(str(gdb_path), layer=layer_name) as src:
+        # Get CRS
+        crs = src.crs_wkt if src.crs else "Unknown"
+
+        # Extract EPSG code from CRS
+        crs_epsg = 'Unknown'
+        if src.crs:
+            # Try to get EPSG code from CRS object
+            try:
+                if hasattr(src.crs, 'to_epsg'):
+                    epsg_code = src.crs.to_epsg()
+                    crs_epsg = f"EPSG:{epsg_code}" if epsg_code else 'Unknown'
+                elif isinstance(src.crs, dict) and 'init' in src.crs:
+                    crs_epsg = src.crs['init']
+            except Exception:
+                crs_epsg = 'Unknown'
+
+        # Get bounds
+        bounds = src.bounds if hasattr(src, 'bounds') else None
 
+        # Count features
+        feature_count = len(src)
 
-def count_features(gdb_path: Path, layer_name: str) -> int:
+        metadata = {
+            "crs": crs_epsg,
+            "crs_wkt": crs,
+            "bounds": bounds,
+            "feature_count": feature_count,
+            "schema": dict(src.schema) if hasattr(src, 'schema') else None
+        }
+
+    logger.info(f"Layer '{layer_name}': {feature_count} features, CRS: {crs_epsg}")
+    return metadata
+
+
+def gdb_fingerprint(gdb_path: Union[Path, str]) -> Optional[str]:
+    """
+    Content fingerprint of a GDB, without reading its data.
+
+    For a GDB read in place from a zip this is a hash of its members' names,
+    CRC-32s and sizes from the zip's central directory, so it identifies the
+    uploaded content. For an extracted directory it hashes the files' names,
+    sizes and modification times.
+
+    Returns:
+        Hex digest, or None if the GDB cannot be found (metadata is then not cached)
+    """
+    digest = hashlib.sha256()
+
+    match = _VSIZIP_PATH.match(str(gdb_path))
+    if match:
+        zip_path, inner = match.groups()
+        try:
+            with zipfile.ZipFile(zip_path) as zip_ref:
+                members = [
+                    info for info in zip_ref.infolist()
+                    if info.filename.startswith(f"{inner}/")
+                ]
+        except (OSError, zipfile.BadZipFile):
+            return None
+        for info in sorted(members, key=lambda info: info.filename):
+            digest.update(f"{info.filename}\0{info.CRC}\0{info.file_size}\n".encode())
+        return digest.hexdigest()
+
+    if is_virtual_path(gdb_path) or not Path(gdb_path).is_dir():
+        return None
+
+    for file in sorted(Path(gdb_path).rglob("*")):
+        if file.is_file():
+            stat = file.stat()
+            digest.update(f"{file.relative_to(gdb_path)}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def count_features(gdb_path: Union[Path, str], layer_name: str) -> int:
     """
     Fast count of features in a GDB layer.
 
     Args:
-        gdb_path: Path to the .gdb directory
+        gdb_path: Path to the .gdb directory (or its /vsizip/ path)
         layer_name: Name of the layer to count
 
     Returns:
@@ -214,26 +405,112 @@ def transform_to_wisconsin_crs(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     return gdf
 
 
+async def _publish_chunk(
+    messages: List[Dict[str, Any]],
+    chunk_num: int,
+    on_pause: PauseHook,
+    hash_index_path: Optional[Path] = None,
+    content_hashes: Optional[List[str]] = None
+) -> Tuple[int, int]:
+    """
+    Attach content hashes to one chunk of messages and publish it over a
+    confirm-mode channel.
+
+    Messages whose content hash is in the local hash index are already in
+    raw_imports; they are not published. While the broker is unavailable
+    the batch is paused and the chunk waits, and while the queue is too full
+    the batch is throttled (see broker_pause).
+
+    Args:
+        messages: Messages built for the chunk
+        chunk_num: Chunk number (for logging)
+        on_pause: Hook told when the batch pauses or is throttled, and resumes
+        hash_index_path: Local content hash index (None disables suppression)
+        content_hashes: Hashes already computed column-wise (arrow reader)
+
+    Returns:
+        tuple: (messages the broker did not confirm, known duplicates)
+    """
+    if content_hashes is None:
+        content_hashes = compute_record_hashes("PARCEL", (m["raw_data"] for m in messages))
+    for message, content_hash in zip(messages, content_hashes):
+        message["content_hash"] = content_hash
+        message["hash_version"] = HASH_VERSION
+
+    # Drop features already in raw_imports before they reach the broker
+    duplicates = 0
+    hash_index = get_hash_index(hash_index_path)
+    if hash_index is not None and messages:
+        known = hash_index.contains(content_hashes)
+        duplicates = int(known.sum())
+        messages = [message for message, is_known in zip(messages, known) if not is_known]
+
+    try:
+        outcomes = await publish_or_pause(publish_batch, 'deduplication', messages, on_pause)
+    except Exception as e:
+        logger.warning(f"Failed to publish chunk {chunk_num}: {e}")
+        return len(messages), duplicates
+
+    failed = 0
+    for message, published in zip(messages, outcomes):
+        if not published:
+            logger.error(
+                f"Failed to publish message for feature {message['source_row_number']}"
+            )
+            failed += 1
+
+    return failed, duplicates
+
+
 @safe_background_task
 async def process_gdb_async(
-    gdb_path: Path,
+    gdb_path: Union[Path, str],
     layer_name: str,
     batch_id: UUID,
     source_name: str,
-    chunk_size: int = 1000
+    chunk_size: int = 1000,
+    resume_from: Optional[Dict[str, Any]] = None,
+    hash_index_path: Optional[Path] = None,
+    reader_engine: Literal["fiona", "arrow"] = "fiona",
+    workers: int = 1,
+    geometry_format: Literal["wkt", "wkb", "both"] = "wkt",
+    grid_size: float = 0.0,
+    simplify_tolerance: float = 0.0,
+    geometry_metrics: bool = True
 ) -> None:
     """
     Process a GDB file asynchronously.
 
     Reads GDB layer in chunks, transforms geometries, validates data,
-    and publishes to RabbitMQ.
+    and publishes to RabbitMQ. The feature index after each confirmed
+    chunk is checkpointed with the batch progress (or the features done
+    per range, when processing feature ranges).
 
     Args:
-        gdb_path: Path to the .gdb directory
+        gdb_path: Path to the .gdb directory (or its /vsizip/ path)
         layer_name: Name of the layer to process
         batch_id: Import batch ID for tracking
         source_name: Name of the data source
         chunk_size: Number of features to process per chunk
+        resume_from: Checkpoint position of an interrupted run
+            ({"feature_index": n}: the first n features are skipped, or
+            {"ranges": [...]}: finished ranges are skipped)
+        hash_index_path: Local content hash index; features whose hash is
+            already in raw_imports are counted as duplicates instead of published
+        reader_engine: 'fiona' (feature by feature) or 'arrow' (pyogrio record
+            batches, processed with vectorized shapely and the chunk validator)
+        workers: Worker processes; above 1, large layers are split into
+            feature ranges processed in parallel (default: 1)
+        geometry_format: 'wkt' (geometry_wkt), 'wkb' (geometry_wkb, hex ISO
+            WKB) or 'both'. With 'wkb', the arrow reader and a layer already
+            in EPSG:3071, the source WKB is passed through without building
+            shapely geometries.
+        grid_size: Coordinate grid in EPSG:3071 metres that geometries are
+            snapped to, e.g. 0.01 for 1cm (default: 0, full precision)
+        simplify_tolerance: Topology-preserving simplification tolerance in
+            metres, applied before snapping (default: 0, no simplification)
+        geometry_metrics: Attach the bbox, centroid and area of every parcel
+            (default: True; the WKB pass-through needs them off)
 
     Raises:
         Exception: Any processing errors (caller should catch and fail_batch)
@@ -245,7 +522,8 @@ async def process_gdb_async(
             layer_name="V11_Parcels",
             batch_id=uuid4(),
             source_name="Dane County 2025",
-            chunk_size=1000
+            chunk_size=1000,
+            reader_engine="arrow"
         )
         ```
     """
@@ -254,167 +532,81 @@ async def process_gdb_async(
 
     logger.info(
         f"Starting GDB processing: {gdb_path}/{layer_name} "
-        f"(batch: {batch_id}, source: {source_name})"
+        f"(batch: {batch_id}, source: {source_name}, reader: {reader_engine}, "
+        f"geometry: {geometry_format}, grid: {grid_size or 'full precision'}, "
+        f"simplify: {simplify_tolerance or 'off'})"
     )
 
     try:
-        # Open layer with Fiona for streaming (doesn't load everything into memory)
+        # Layer size and CRS (usually cached by the upload's inspection; read off the event loop)
         logger.info(f"Opening layer '{layer_name}' from {gdb_path} for streaming")
+        layer_metadata = await asyncio.to_thread(get_layer_metadata, gdb_path, layer_name)
+        total_features = layer_metadata["feature_count"]
+        source_crs = layer_metadata["crs_wkt"] if layer_metadata["crs_wkt"] != "Unknown" else None
+        logger.info(f"Layer contains {total_features:,} features (streaming mode)")
+
+        transformer = None
+
+        # Check if we need CRS transformation (transformers are cached per process)
+        if source_crs:
+            try:
+                transformer = transformer_for(source_crs)
+                if transformer is not None:
+                    logger.info(f"CRS transformation enabled: {transformer.source_crs.name} → EPSG:3071")
+            except Exception as e:
+                logger.warning(f"Could not determine CRS transformation: {e}")
+
+        context = _LayerContext(
+            batch_id=batch_id,
+            source_file=f"{source_name}/{layer_name}",
+            total_features=total_features,
+            transformer=transformer,
+            hash_index_path=hash_index_path,
+            geometry_format=geometry_format,
+            grid_size=grid_size,
+            simplify_tolerance=simplify_tolerance,
+            geometry_metrics=geometry_metrics
+        )
+        position = resume_from or {}
+
+        if "ranges" in position:
+            # Resume the feature ranges planned by the interrupted run
+            ranges = [
+                GdbFeatureRange(index=entry["index"], start=entry["start"], stop=entry["stop"])
+                for entry in position["ranges"]
+            ]
+        elif workers > 1 and not position:
+            ranges = plan_feature_ranges(total_features, workers)
+        else:
+            ranges = []
+
+        if len(ranges) > 1 or "ranges" in position:
+            # Parallel mode: one worker process per feature range
+            resumed = position.get("ranges", [])
+            total_processed, total_failed, total_duplicates = await _process_ranges_parallel(
+                gdb_path, layer_name, ranges, chunk_size, reader_engine, context, source_name,
+                source_crs=source_crs if transformer is not None else None,
+                resumed=resumed
+            )
+            total_processed += sum(entry["features_done"] for entry in resumed)
+        else:
+            resume_index = position.get("feature_index", 0)
+            if resume_index:
+                # Seek past the features confirmed before the interruption
+                logger.info(f"Resuming GDB batch {batch_id} after feature {resume_index:,}")
 
-        with fiona.open(str(gdb_path), layer=layer_name) as src:
-            total_features = len(src)
-            logger.info(f"Layer contains {total_features:,} features (streaming mode)")
-
-            # Get source CRS
-            source_crs = src.crs
-            needs_transform = False
-            transformer = None
-
-            # Check if we need CRS transformation
-            if source_crs:
-                try:
-                    source_crs_obj = CRS.from_user_input(source_crs)
-                    target_crs_obj = CRS.from_epsg(3071)  # Wisconsin CRS
-
-                    if source_crs_obj.to_epsg() != 3071:
-                        needs_transform = True
-                        transformer = Transformer.from_crs(
-                            source_crs_obj,
-                            target_crs_obj,
-                            always_xy=True
-                        )
-                        logger.info(
-                            f"CRS transformation enabled: {source_crs_obj.to_epsg()} → EPSG:3071"
-                        )
-                except Exception as e:
-                    logger.warning(f"Could not determine CRS transformation: {e}")
-
-            # Process features in chunks using streaming
-            total_processed = 0
-            total_failed = 0
-            chunk_num = 0
-            chunk_features = []
-            chunk_failed = 0
-
-            for feature_idx, feature in enumerate(src, start=1):
-                try:
-                    # Extract properties (attributes)
-                    properties = feature.get('properties', {})
-
-                    # Extract and transform geometry
-                    geometry_dict = feature.get('geometry')
-                    if not geometry_dict:
-                        logger.warning(f"Feature {feature_idx}: No geometry, skipping")
-                        chunk_failed += 1
-                        continue
-
-                    # Convert to Shapely geometry
-                    geometry = shape(geometry_dict)
-
-                    if geometry is None or geometry.is_empty:
-                        logger.warning(f"Feature {feature_idx}: Empty geometry, skipping")
-                        chunk_failed += 1
-                        continue
-
-                    # Transform CRS if needed
-                    if needs_transform and transformer:
-                        geometry = shapely_transform(transformer.transform, geometry)
-
-                    # Convert geometry to WKT
-                    geometry_wkt = geometry.wkt
-                    geometry_type = geometry.geom_type
-
-                    # Build V11ParcelRecord from properties
-                    row_dict = {
-                        k: (v if v is not None and v != '' else None)
-                        for k, v in properties.items()
-                    }
-
-                    # Add geometry fields
-                    row_dict['geometry_wkt'] = geometry_wkt
-                    row_dict['geometry_type'] = geometry_type
-
-                    # Validate with Pydantic model
-                    record = V11ParcelRecord(**row_dict)
-
-                    # Publish to RabbitMQ deduplication queue
-                    message = {
-                        "batch_id": str(batch_id),
-                        "source_type": "PARCEL",
-                        "source_file": f"{source_name}/{layer_name}",
-                        "source_row_number": feature_idx,
-                        "raw_data": record.model_dump(exclude_none=True)
-                    }
-
-                    success = publish_message('deduplication', message)
-
-                    if not success:
-                        logger.error(f"Failed to publish message for feature {feature_idx}")
-                        chunk_failed += 1
-
-                except Exception as e:
-                    logger.warning(f"Failed to process feature {feature_idx}: {e}")
-                    chunk_failed += 1
-
-                # Check if we've completed a chunk
-                chunk_features.append(feature_idx)
-
-                if len(chunk_features) >= chunk_size:
-                    chunk_num += 1
-                    chunk_processed = len(chunk_features)
-                    chunk_successful = chunk_processed - chunk_failed
-
-                    # Update batch progress
-                    await update_batch_progress(
-                        batch_id=batch_id,
-                        processed_count=chunk_processed,
-                        new_count=chunk_successful,
-                        failed_count=chunk_failed
-                    )
-
-                    total_processed += chunk_processed
-                    total_failed += chunk_failed
-
-                    logger.info(
-                        f"Chunk {chunk_num} complete: {chunk_successful}/{chunk_processed} succeeded "
-                        f"(total: {total_processed:,}/{total_features:,}, "
-                        f"{(total_processed/total_features*100):.1f}%)"
-                    )
-
-                    # Reset chunk tracking
-                    chunk_features = []
-                    chunk_failed = 0
-
-                    # Yield to event loop every chunk to keep API responsive
-                    await asyncio.sleep(0)
-
-            # Process remaining features in final partial chunk
-            if chunk_features:
-                chunk_num += 1
-                chunk_processed = len(chunk_features)
-                chunk_successful = chunk_processed - chunk_failed
-
-                await update_batch_progress(
-                    batch_id=batch_id,
-                    processed_count=chunk_processed,
-                    new_count=chunk_successful,
-                    failed_count=chunk_failed
-                )
-
-                total_processed += chunk_processed
-                total_failed += chunk_failed
-
-                logger.info(
-                    f"Final chunk {chunk_num} complete: {chunk_successful}/{chunk_processed} succeeded "
-                    f"(total: {total_processed:,}/{total_features:,})"
-                )
+            # Read, transform and serialize on a reader thread; publish and record progress here
+            chunks = _read_chunks(gdb_path, layer_name, chunk_size, reader_engine, resume_index, context)
+            total_processed, total_failed, total_duplicates = await _process_chunks(
+                chunks, resume_index, context
+            )
 
         # Mark batch as completed
         await complete_batch(batch_id, total_processed)
 
         logger.info(
             f"GDB processing complete: {total_processed:,} features processed, "
-            f"{total_failed:,} failed (batch: {batch_id})"
+            f"{total_failed:,} failed, {total_duplicates:,} known duplicates (batch: {batch_id})"
         )
 
     except Exception as e:
@@ -426,23 +618,900 @@ async def process_gdb_async(
         raise
 
 
-def validate_gdb_format(gdb_path: Path) -> bool:
+@safe_background_task
+async def process_gdb_layers_async(
+    gdb_path: Union[Path, str],
+    layer_batches: Dict[str, UUID],
+    source_name: str,
+    chunk_size: int = 1000,
+    hash_index_path: Optional[Path] = None,
+    reader_engine: Literal["fiona", "arrow"] = "fiona",
+    workers: int = 1,
+    max_concurrent_layers: int = 4,
+    geometry_format: Literal["wkt", "wkb", "both"] = "wkt",
+    grid_size: float = 0.0,
+    simplify_tolerance: float = 0.0,
+    geometry_metrics: bool = True
+) -> None:
+    """
+    Process several layers of one GDB concurrently, each under its own child batch.
+
+    Every layer runs process_gdb_async with its own reader thread (and worker
+    processes, with workers above 1). Child batches add their progress to
+    the parent batch they were created with, which completes once the last
+    child finishes (see batch_tracker). A failed layer fails its child batch
+    only; the other layers carry on.
+
+    Args:
+        gdb_path: Path to the .gdb directory (or its /vsizip/ path)
+        layer_batches: Child batch ID of every layer to process
+        source_name: Name of the data source
+        chunk_size: Number of features to process per chunk
+        hash_index_path: Local content hash index (None disables suppression)
+        reader_engine: 'fiona' or 'arrow'
+        workers: Worker processes per layer (see process_gdb_async)
+        max_concurrent_layers: Layers processed at the same time
+        geometry_format: 'wkt', 'wkb' or 'both' (see process_gdb_async)
+        grid_size: Coordinate grid in metres (0: full precision)
+        simplify_tolerance: Simplification tolerance in metres (0: off)
+        geometry_metrics: Attach the bbox, centroid and area of every parcel
+
+    Example:
+        ```python
+        await process_gdb_layers_async(
+            gdb_path=Path("/tmp/dane.gdb"),
+            layer_batches={"V11_Parcels": parcels_batch_id, "Counties": counties_batch_id},
+            source_name="Dane County 2025"
+        )
+        ```
+    """
+    semaphore = asyncio.Semaphore(max(max_concurrent_layers, 1))
+
+    async def process_layer(layer_name: str, batch_id: UUID) -> None:
+        async with semaphore:
+            await process_gdb_async(
+                gdb_path=gdb_path,
+                layer_name=layer_name,
+                batch_id=batch_id,
+                source_name=source_name,
+                chunk_size=chunk_size,
+                hash_index_path=hash_index_path,
+                reader_engine=reader_engine,
+                workers=workers,
+                geometry_format=geometry_format,
+                grid_size=grid_size,
+                simplify_tolerance=simplify_tolerance,
+                geometry_metrics=geometry_metrics
+            )
+
+    logger.info(
+        f"Processing {len(layer_batches)} layers of {gdb_path}: "
+        + ", ".join(f"{layer} (batch: {batch_id})" for layer, batch_id in layer_batches.items())
+    )
+    await asyncio.gather(
+        *(process_layer(layer_name, batch_id) for layer_name, batch_id in layer_batches.items())
+    )
+
+
+@dataclass
+class _LayerContext:
+    """Per-layer settings shared by the fiona and arrow processing loops."""
+
+    batch_id: UUID
+    source_file: str
+    total_features: int
+    transformer: Optional[Transformer]
+    hash_index_path: Optional[Path]
+    geometry_format: str = "wkt"
+    grid_size: float = 0.0
+    simplify_tolerance: float = 0.0
+    geometry_metrics: bool = True
+
+    @cached_property
+    def batch_id_str(self) -> str:
+        """Batch ID as written into every message."""
+        return str(self.batch_id)
+
+    @property
+    def writes_wkt(self) -> bool:
+        """Messages carry geometry_wkt."""
+        return self.geometry_format in ("wkt", "both")
+
+    @property
+    def writes_wkb(self) -> bool:
+        """Messages carry geometry_wkb."""
+        return self.geometry_format in ("wkb", "both")
+
+    @property
+    def record_model(self) -> type:
+        """Pydantic model the parcel payloads are validated against."""
+        return V11ParcelWKBRecord if self.writes_wkb else V11ParcelRecord
+
+    @property
+    def reduces_geometry(self) -> bool:
+        """Geometries are simplified or snapped to a coordinate grid."""
+        return bool(self.grid_size or self.simplify_tolerance)
+
+    @property
+    def passes_wkb_through(self) -> bool:
+        """Source WKB goes into messages as read (no transformation, reduction or metrics)."""
+        return (
+            self.transformer is None and self.geometry_format == "wkb"
+            and not (self.reduces_geometry or self.geometry_metrics)
+        )
+
+
+@dataclass
+class _ParsedChunk:
+    """One chunk built on the reader thread, ready to publish."""
+
+    messages: List[Dict[str, Any]]
+    content_hashes: List[str]
+    processed: int
+    failed: int
+    feature_index: int  # 1-based index of the chunk's last feature (checkpoint)
+
+
+async def _finish_chunk(
+    context: _LayerContext,
+    chunk: _ParsedChunk,
+    chunk_num: int,
+    total_processed: int
+) -> Tuple[int, int]:
+    """
+    Publish one chunk, then record its progress with the feature index checkpoint.
+
+    Returns:
+        tuple: (failed including unconfirmed publishes, known duplicates)
+    """
+    publish_failed, chunk_duplicates = await _publish_chunk(
+        chunk.messages, chunk_num, batch_pause_hook(context.batch_id),
+        context.hash_index_path, chunk.content_hashes
+    )
+    chunk_failed = chunk.failed + publish_failed
+    chunk_successful = chunk.processed - chunk_failed
+
+    # Update batch progress and checkpoint
+    await update_batch_progress(
+        batch_id=context.batch_id,
+        processed_count=chunk.processed,
+        new_count=chunk_successful - chunk_duplicates,
+        duplicate_count=chunk_duplicates,
+        failed_count=chunk_failed,
+        checkpoint={"feature_index": chunk.feature_index}
+    )
+
+    total_processed += chunk.processed
+    logger.info(
+        f"Chunk {chunk_num} complete: {chunk_successful}/{chunk.processed} succeeded "
+        f"(total: {total_processed:,}/{context.total_features:,}, "
+        f"{(total_processed / max(context.total_features, 1) * 100):.1f}%)"
+    )
+    return chunk_failed, chunk_duplicates
+
+
+async def _process_chunks(
+    chunks: Iterator[_ParsedChunk],
+    resume_index: int,
+    context: _LayerContext
+) -> Tuple[int, int, int]:
+    """
+    Drive a chunk producer on a reader thread and publish its chunks in order.
+
+    The producer (fiona or arrow) runs on its own thread and hands finished
+    chunks over through a queue of READ_AHEAD_CHUNKS, so it reads ahead while
+    a chunk is published, but never further. The event loop only publishes
+    and records progress.
+
+    Returns:
+        tuple: (features processed including resumed ones, failed, known duplicates)
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=READ_AHEAD_CHUNKS)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        """Hand an item to the event loop, waiting for queue space (False once stopped)."""
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while not stop.is_set():
+            try:
+                future.result(timeout=0.5)
+                return True
+            except TimeoutError:
+                continue
+        future.cancel()
+        return False
+
+    def produce() -> None:
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+            put(None)
+        except Exception as e:
+            put(e)
+        finally:
+            chunks.close()  # Release the layer on the thread that opened it
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gdb-reader")
+    # Copy the context so the reader thread logs with this batch's ID
+    producer = loop.run_in_executor(executor, contextvars.copy_context().run, produce)
+
+    total_processed = resume_index
+    total_failed = 0
+    total_duplicates = 0
+    chunk_num = 0
+
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                break
+            if isinstance(chunk, Exception):
+                raise chunk
+
+            chunk_num += 1
+            chunk_failed, chunk_duplicates = await _finish_chunk(
+                context, chunk, chunk_num, total_processed
+            )
+            total_processed += chunk.processed
+            total_failed += chunk_failed
+            total_duplicates += chunk_duplicates
+
+        await producer
+        return total_processed, total_failed, total_duplicates
+
+    finally:
+        stop.set()
+        executor.shutdown(wait=False)
+
+
+# Progress queue of a range worker process (set by _init_range_worker)
+_range_progress = None
+
+
+def _init_range_worker(progress_queue) -> None:
+    """Process pool initializer: remember the queue used to report chunk progress."""
+    global _range_progress
+    _range_progress = progress_queue
+
+
+def _create_range_executor(workers: int) -> Tuple[Executor, Any]:
+    """
+    Create the worker pool and progress queue for parallel feature ranges.
+
+    Workers are spawned (not forked) so each opens its own broker connection
+    and GDAL datasets.
+    """
+    context = multiprocessing.get_context("spawn")
+    progress_queue = context.Queue()
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_range_worker,
+        initargs=(progress_queue,)
+    )
+    return executor, progress_queue
+
+
+def process_gdb_range(
+    gdb_path: Union[Path, str],
+    layer_name: str,
+    feature_range: GdbFeatureRange,
+    chunk_size: int,
+    reader_engine: str,
+    batch_id: UUID,
+    source_name: str,
+    total_features: int,
+    source_crs: Optional[str] = None,
+    skip_features: int = 0,
+    hash_index_path: Optional[Path] = None,
+    geometry_format: str = "wkt",
+    grid_size: float = 0.0,
+    simplify_tolerance: float = 0.0,
+    geometry_metrics: bool = True
+) -> Tuple[int, int, int]:
+    """
+    Read, transform, validate and publish one feature range of a layer (runs in a worker process).
+
+    The range is streamed chunk by chunk, so a worker holds one chunk at a
+    time whatever the size of its range, and published from an event loop
+    of the worker's own. Each chunk's (range index, processed, failed,
+    duplicates) is put on the progress queue, as is (range index, pause
+    reason or None, status) when the range pauses for the broker or is
+    throttled, and resumes.
+
+    Args:
+        source_crs: Layer CRS as WKT when it needs transforming to EPSG:3071
+        skip_features: Features at the start of the range already processed (resume)
+        hash_index_path: Local content hash index (None disables suppression)
+        geometry_format: 'wkt', 'wkb' or 'both' (see process_gdb_async)
+        grid_size: Coordinate grid in metres (0: full precision)
+        simplify_tolerance: Simplification tolerance in metres (0: off)
+        geometry_metrics: Attach the bbox, centroid and area of every parcel
+
+    Returns:
+        tuple: (features processed, failed, known duplicates) for the range,
+            excluding skipped features
+    """
+    set_batch_id(batch_id)
+    context = _LayerContext(
+        batch_id=batch_id,
+        source_file=f"{source_name}/{layer_name}",
+        total_features=total_features,
+        transformer=transformer_for(source_crs) if source_crs else None,
+        hash_index_path=hash_index_path,
+        geometry_format=geometry_format,
+        grid_size=grid_size,
+        simplify_tolerance=simplify_tolerance,
+        geometry_metrics=geometry_metrics
+    )
+
+    return asyncio.run(_process_range(
+        gdb_path, layer_name, feature_range, chunk_size, reader_engine, context, skip_features
+    ))
+
+
+async def _process_range(
+    gdb_path: Union[Path, str],
+    layer_name: str,
+    feature_range: GdbFeatureRange,
+    chunk_size: int,
+    reader_engine: str,
+    context: _LayerContext,
+    skip_features: int
+) -> Tuple[int, int, int]:
+    """
+    Publish the chunks of one feature range on the worker's own event loop.
+
+    Returns:
+        tuple: (features processed, failed, known duplicates) for the range
+    """
+    processed = 0
+    failed = 0
+    duplicates = 0
+    chunks = _read_chunks(
+        gdb_path, layer_name, chunk_size, reader_engine,
+        feature_range.start + skip_features, context, stop=feature_range.stop
+    )
+    on_pause = range_pause_hook(_range_progress, feature_range.index)
+    try:
+        for chunk_num, chunk in enumerate(chunks, start=1):
+            publish_failed, chunk_duplicates = await _publish_chunk(
+                chunk.messages, chunk_num, on_pause, context.hash_index_path, chunk.content_hashes
+            )
+            processed += chunk.processed
+            failed += chunk.failed + publish_failed
+            duplicates += chunk_duplicates
+
+            if _range_progress is not None:
+                _range_progress.put(
+                    (feature_range.index, chunk.processed, chunk.failed + publish_failed, chunk_duplicates)
+                )
+    finally:
+        # The connection belongs to this loop, which ends with the range
+        await close_rabbitmq_connection()
+
+    logger.info(
+        f"GDB range {feature_range.index} complete: {processed - failed}/{processed} succeeded "
+        f"({duplicates} known duplicates not published)"
+    )
+    return processed, failed, duplicates
+
+
+async def _process_ranges_parallel(
+    gdb_path: Union[Path, str],
+    layer_name: str,
+    ranges: List[GdbFeatureRange],
+    chunk_size: int,
+    reader_engine: str,
+    context: _LayerContext,
+    source_name: str,
+    source_crs: Optional[str] = None,
+    resumed: Optional[List[Dict[str, Any]]] = None
+) -> Tuple[int, int, int]:
+    """
+    Run process_gdb_range for every range in a process pool.
+
+    Chunk progress from all workers is merged into import_batches every
+    PROGRESS_INTERVAL seconds, together with a checkpoint of the features
+    done per range; a finished range's result settles anything still in
+    flight on the queue. The batch is paused (or throttled) while any range is.
+
+    Args:
+        source_crs: Layer CRS as WKT when it needs transforming (None otherwise)
+        resumed: Range checkpoint entries of an interrupted run; finished
+            ranges are skipped, the others continue after their features_done
+
+    Returns:
+        tuple: (features processed, failed, known duplicates) in this run
+    """
+    state = {
+        r.index: {
+            "index": r.index, "start": r.start, "stop": r.stop,
+            "features_done": 0, "done": False
+        }
+        for r in ranges
+    }
+    for entry in resumed or []:
+        state[entry["index"]].update(features_done=entry["features_done"], done=entry["done"])
+
+    pending_ranges = [r for r in ranges if not state[r.index]["done"]]
+    if not pending_ranges:
+        return 0, 0, 0
+
+    logger.info(
+        f"Processing {len(pending_ranges)} GDB feature ranges in parallel (batch: {context.batch_id})"
+    )
+
+    loop = asyncio.get_running_loop()
+    executor, progress_queue = _create_range_executor(len(pending_ranges))
+    skipped = {r.index: state[r.index]["features_done"] for r in pending_ranges}
+    reported = {r.index: [0, 0, 0] for r in pending_ranges}
+    pauses = RangePauses(context.batch_id)
+
+    async def merge_progress(finished) -> None:
+        processed = failed = duplicates = 0
+        while True:
+            try:
+                item = progress_queue.get_nowait()
+            except queue_module.Empty:
+                break
+            if len(item) == 3:
+                pauses.record(*item)
+                continue
+            index, chunk_processed, chunk_failed, chunk_duplicates = item
+            if state[index]["done"]:
+                continue  # Already settled from the range's result
+            reported[index][0] += chunk_processed
+            reported[index][1] += chunk_failed
+            reported[index][2] += chunk_duplicates
+            processed += chunk_processed
+            failed += chunk_failed
+            duplicates += chunk_duplicates
+
+        # Settle finished ranges from their results (queue items may still be in flight)
+        for future in finished:
+            feature_range = futures[future]
+            range_processed, range_failed, range_duplicates = future.result()
+            processed += range_processed - reported[feature_range.index][0]
+            failed += range_failed - reported[feature_range.index][1]
+            duplicates += range_duplicates - reported[feature_range.index][2]
+            reported[feature_range.index] = [range_processed, range_failed, range_duplicates]
+            state[feature_range.index]["done"] = True
+
+        for index, (range_processed, _, _) in reported.items():
+            state[index]["features_done"] = skipped[index] + range_processed
+
+        if processed or finished:
+            await update_batch_progress(
+                batch_id=context.batch_id,
+                processed_count=processed,
+                new_count=processed - failed - duplicates,
+                duplicate_count=duplicates,
+                failed_count=failed,
+                checkpoint={"ranges": [state[index] for index in sorted(state)]}
+            )
+        await pauses.sync()
+
+    try:
+        futures = {
+            loop.run_in_executor(
+                executor, process_gdb_range, gdb_path, layer_name, feature_range,
+                chunk_size, reader_engine, context.batch_id, source_name, context.total_features,
+                source_crs, skipped[feature_range.index], context.hash_index_path,
+                context.geometry_format, context.grid_size, context.simplify_tolerance,
+                context.geometry_metrics
+            ): feature_range
+            for feature_range in pending_ranges
+        }
+
+        pending = set(futures)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, timeout=PROGRESS_INTERVAL, return_when=asyncio.FIRST_EXCEPTION
+            )
+            for future in done:
+                if future.exception() is not None:
+                    raise future.exception()
+            await merge_progress(done)
+
+        total_processed = sum(processed for processed, _, _ in reported.values())
+        total_failed = sum(failed for _, failed, _ in reported.values())
+        total_duplicates = sum(duplicates for _, _, duplicates in reported.values())
+        return total_processed, total_failed, total_duplicates
+
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _read_chunks(
+    gdb_path: Union[Path, str],
+    layer_name: str,
+    chunk_size: int,
+    reader_engine: str,
+    start: int,
+    context: _LayerContext,
+    stop: Optional[int] = None
+) -> Iterator[_ParsedChunk]:
+    """Chunk producer of a reader engine for the features [start, stop) of a layer."""
+    if reader_engine == "arrow":
+        return _read_gdb_batches(gdb_path, layer_name, chunk_size, start, context, stop)
+    return _read_gdb_features(gdb_path, layer_name, chunk_size, start, context, stop)
+
+
+def _read_gdb_features(
+    gdb_path: Union[Path, str],
+    layer_name: str,
+    chunk_size: int,
+    resume_index: int,
+    context: _LayerContext,
+    stop: Optional[int] = None
+) -> Iterator[_ParsedChunk]:
+    """
+    Read a layer feature by feature through fiona (fiona reader).
+
+    Yields:
+        _ParsedChunk: Messages and content hashes of chunk_size features
+            (failed features count as processed), up to feature index stop
+    """
+    with fiona.open(str(gdb_path), layer=layer_name) as src:
+        features = src.filter(resume_index, stop) if resume_index or stop is not None else src
+        chunk_messages = []
+        chunk_processed = 0
+
+        for feature_idx, feature in enumerate(features, start=resume_index + 1):
+            message = _feature_message(feature, feature_idx, context)
+            if message is not None:
+                chunk_messages.append(message)
+            chunk_processed += 1
+
+            if chunk_processed >= chunk_size:
+                yield _feature_chunk(chunk_messages, chunk_processed, feature_idx)
+                chunk_messages = []
+                chunk_processed = 0
+
+        # Final partial chunk
+        if chunk_processed:
+            yield _feature_chunk(chunk_messages, chunk_processed, feature_idx)
+
+
+def _feature_chunk(messages: List[Dict[str, Any]], processed: int, feature_index: int) -> _ParsedChunk:
+    """Chunk of fiona messages with their content hashes."""
+    content_hashes = compute_record_hashes("PARCEL", (m["raw_data"] for m in messages))
+    return _ParsedChunk(messages, content_hashes, processed, processed - len(messages), feature_index)
+
+
+def _feature_message(feature: Any, feature_idx: int, context: _LayerContext) -> Optional[Dict[str, Any]]:
+    """
+    Build the message of one fiona feature.
+
+    Returns:
+        The message, or None if the feature has no usable geometry or fails validation
+    """
+    try:
+        # Extract properties (attributes)
+        properties = feature.get('properties', {})
+
+        # Extract and transform geometry
+        geometry_dict = feature.get('geometry')
+        if not geometry_dict:
+            logger.warning(f"Feature {feature_idx}: No geometry, skipping")
+            return None
+
+        # Convert to Shapely geometry
+        geometry = shape(geometry_dict)
+
+        if geometry is None or geometry.is_empty:
+            logger.warning(f"Feature {feature_idx}: Empty geometry, skipping")
+            return None
+
+        # Transform CRS if needed
+        if context.transformer is not None:
+            geometry = transform_geometry(geometry, context.transformer)
+
+        if context.reduces_geometry:
+            geometry = reduce_geometries(geometry, context.grid_size, context.simplify_tolerance)
+            if geometry.is_empty:
+                logger.warning(f"Feature {feature_idx}: Geometry collapsed by grid snapping, skipping")
+                return None
+
+        # Build the parcel record from properties
+        row_dict = {
+            k: (v if v is not None and v != '' else None)
+            for k, v in properties.items()
+        }
+
+        # Add geometry fields
+        if context.writes_wkt:
+            row_dict['geometry_wkt'] = geometry.wkt
+        if context.writes_wkb:
+            row_dict['geometry_wkb'] = shapely.to_wkb(geometry, hex=True, flavor="iso")
+        row_dict['geometry_type'] = geometry.geom_type
+        if context.geometry_metrics:
+            row_dict.update(
+                (name, float(values[0])) for name, values in compute_geometry_metrics([geometry]).items()
+            )
+
+        # Validate with Pydantic model
+        record = context.record_model(**row_dict)
+        return _parcel_message(context, feature_idx, record.model_dump(exclude_none=True))
+
+    except Exception as e:
+        logger.warning(f"Failed to process feature {feature_idx}: {e}")
+        return None
+
+
+def _read_gdb_batches(
+    gdb_path: Union[Path, str],
+    layer_name: str,
+    chunk_size: int,
+    resume_index: int,
+    context: _LayerContext,
+    stop: Optional[int] = None
+) -> Iterator[_ParsedChunk]:
+    """
+    Read a layer as Arrow record batches of chunk_size features (arrow reader).
+
+    Yields:
+        _ParsedChunk: Messages and content hashes of one record batch, up to
+            feature index stop
+    """
+    validator = get_chunk_validator(context.record_model)
+    max_features = None if stop is None else stop - resume_index
+
+    for first_index, batch, wkb in read_gdb_batches(
+        gdb_path, layer_name, chunk_size, skip_features=resume_index, max_features=max_features
+    ):
+        messages, content_hashes, failed = build_parcel_messages(
+            batch, wkb, first_index, validator, context
+        )
+        yield _ParsedChunk(
+            messages, content_hashes, batch.num_rows, failed, first_index + batch.num_rows - 1
+        )
+
+
+def read_gdb_batches(
+    gdb_path: Union[Path, str],
+    layer_name: str,
+    batch_size: int = 1000,
+    skip_features: int = 0,
+    max_features: Optional[int] = None
+) -> Iterator[Tuple[int, pa.RecordBatch, pa.Array]]:
+    """
+    Stream a layer as Arrow record batches through GDAL's Arrow stream (pyogrio).
+
+    Dates are read as ISO strings, like fiona returns them.
+
+    Args:
+        gdb_path: Path to the .gdb directory (or its /vsizip/ path)
+        layer_name: Name of the layer to read
+        batch_size: Maximum features per batch
+        skip_features: Features to skip at the start (resume, feature ranges)
+        max_features: Stop after this many features (default: read to the end)
+
+    Yields:
+        tuple: (1-based index of the batch's first feature, attribute columns,
+            geometries as an Arrow WKB binary column)
+    """
+    with open_arrow(
+        str(gdb_path),
+        layer=layer_name,
+        batch_size=batch_size,
+        skip_features=skip_features,
+        datetime_as_string=True,
+        use_pyarrow=True
+    ) as (meta, reader):
+        geometry_name = meta["geometry_name"] or "wkb_geometry"
+        first_index = skip_features + 1
+        # GDAL's Arrow stream has no feature limit: trim the batch that crosses it
+        remaining = max_features
+
+        for batch in reader:
+            if remaining is not None:
+                if remaining <= 0:
+                    break
+                if batch.num_rows > remaining:
+                    batch = batch.slice(0, remaining)
+                remaining -= batch.num_rows
+            if not batch.num_rows:
+                continue
+            geometry_column = batch.schema.get_field_index(geometry_name)
+            wkb = batch.column(geometry_column)
+            attributes = batch.select(
+                [i for i in range(batch.num_columns) if i != geometry_column]
+            )
+            yield first_index, attributes, wkb
+            first_index += batch.num_rows
+
+
+def build_parcel_messages(
+    batch: pa.RecordBatch,
+    wkb: pa.Array,
+    first_index: int,
+    validator: ChunkValidator,
+    context: _LayerContext
+) -> Tuple[List[Dict[str, Any]], List[str], int]:
+    """
+    Turn one record batch into deduplication messages with whole-batch operations.
+
+    Geometries are parsed, transformed, optionally simplified and snapped,
+    and written as WKT and/or WKB by shapely's vectorized functions, or passed through as WKB when no
+    transformation is needed (see _passthrough_geometry_columns); attributes
+    go through the columnar validator, which yields the same payloads as
+    the context's record model.
+
+    Returns:
+        tuple: (messages, their content hashes, features that failed)
+    """
+    if context.passes_wkb_through:
+        usable, missing, geometry_columns = _passthrough_geometry_columns(wkb)
+    else:
+        usable, missing, geometry_columns = _shapely_geometry_columns(wkb, context)
+
+    failed = 0
+    for pos in np.flatnonzero(~usable):
+        kind = "No" if missing[pos] else "Empty"
+        logger.warning(f"Feature {first_index + pos}: {kind} geometry, skipping")
+        failed += 1
+
+    positions = np.flatnonzero(usable)
+    attributes = batch.take(pa.array(positions)) if len(positions) < batch.num_rows else batch
+    for name, column in geometry_columns.items():
+        attributes = attributes.append_column(name, column)
+
+    result = validator.validate_arrow(attributes)
+    content_hashes = compute_content_hashes("PARCEL", result.columns, len(result.records))
+
+    messages = []
+    hashes = []
+    for pos, raw_data in enumerate(result.records):
+        feature_idx = first_index + int(positions[pos])
+        if raw_data is None:
+            logger.warning(f"Failed to process feature {feature_idx}: {result.errors[pos]}")
+            failed += 1
+            continue
+        messages.append(_parcel_message(context, feature_idx, raw_data))
+        hashes.append(content_hashes[pos])
+
+    return messages, hashes, failed
+
+
+# Geometry type names by shapely type id
+_GEOMETRY_TYPES = np.array([
+    "Point", "LineString", "LinearRing", "Polygon",
+    "MultiPoint", "MultiLineString", "MultiPolygon", "GeometryCollection"
+], dtype=object)
+
+
+def reduce_geometries(geometries: Any, grid_size: float = 0.0, simplify_tolerance: float = 0.0) -> Any:
+    """
+    Simplify geometries and snap their coordinates to a grid (EPSG:3071 metres).
+
+    Simplification preserves topology (no self-intersections or collapsed
+    rings); snapping keeps polygons valid, but geometries smaller than the
+    grid become empty. Snapped coordinates print with no more decimals than
+    the grid size, which shrinks WKT and makes re-ingests byte-identical.
+
+    Args:
+        geometries: A shapely geometry or array of geometries
+        grid_size: Grid size, e.g. 0.01 for 1cm (0: full precision)
+        simplify_tolerance: Simplification tolerance (0: no simplification)
+
+    Returns:
+        The reduced geometry or array of geometries
+    """
+    if simplify_tolerance:
+        geometries = shapely.simplify(geometries, simplify_tolerance, preserve_topology=True)
+    if grid_size:
+        geometries = shapely.set_precision(geometries, grid_size)
+    return geometries
+
+
+def _shapely_geometry_columns(
+    wkb: pa.Array,
+    context: _LayerContext
+) -> Tuple[np.ndarray, np.ndarray, Dict[str, pa.Array]]:
+    """
+    Parse a batch's WKB with shapely, transform it and write the context's geometry columns.
+
+    Returns:
+        tuple: (usable mask, missing mask, geometry columns of the usable features)
+    """
+    geometries = shapely.from_wkb(wkb.to_numpy(zero_copy_only=False), on_invalid="ignore")
+    missing = shapely.is_missing(geometries)
+    usable = ~(missing | shapely.is_empty(geometries))
+
+    geometries = geometries[usable]
+    if context.transformer is not None and len(geometries):
+        geometries = transform_geometries(geometries, context.transformer)
+
+    if context.reduces_geometry and len(geometries):
+        geometries = reduce_geometries(geometries, context.grid_size, context.simplify_tolerance)
+        collapsed = shapely.is_empty(geometries)
+        if collapsed.any():
+            # Parcels smaller than the grid collapse to empty geometries
+            usable[np.flatnonzero(usable)[collapsed]] = False
+            geometries = geometries[~collapsed]
+
+    columns = {}
+    if context.writes_wkt:
+        columns["geometry_wkt"] = pa.array(shapely.to_wkt(geometries, rounding_precision=-1), pa.string())
+    if context.writes_wkb:
+        columns["geometry_wkb"] = pa.array(shapely.to_wkb(geometries, hex=True, flavor="iso"), pa.string())
+    columns["geometry_type"] = pa.array(_GEOMETRY_TYPES[shapely.get_type_id(geometries)], pa.string())
+    if context.geometry_metrics:
+        columns.update(geometry_metric_columns(geometries))
+    return usable, missing, columns
+
+
+def _passthrough_geometry_columns(wkb: pa.Array) -> Tuple[np.ndarray, np.ndarray, Dict[str, pa.Array]]:
+    """
+    Pass a batch's WKB (already in EPSG:3071) through as geometry_wkb.
+
+    Geometry types and emptiness come from the WKB headers, decoded for the
+    whole batch at once, and the WKB is hex-encoded straight from the Arrow
+    buffers; only values the header decoder leaves open (points, EWKB,
+    malformed headers) are parsed by shapely. Like the shapely path, this
+    checks structure, not OGC validity: self-intersecting parcels pass.
+
+    Returns:
+        tuple: (usable mask, missing mask, geometry columns of the usable features)
+    """
+    names, empty, decoded = read_wkb_headers(wkb)
+    missing = ~wkb.is_valid().to_numpy(zero_copy_only=False)
+
+    undecided = np.flatnonzero(~(decoded | missing))
+    if len(undecided):
+        geometries = shapely.from_wkb(
+            wkb.take(pa.array(undecided)).to_numpy(zero_copy_only=False), on_invalid="ignore"
+        )
+        unparsed = shapely.is_missing(geometries)
+        missing[undecided] = unparsed
+        empty[undecided] = ~unparsed & shapely.is_empty(geometries)
+        names[undecided[~unparsed]] = _GEOMETRY_TYPES[shapely.get_type_id(geometries[~unparsed])]
+
+    usable = ~(missing | empty)
+    positions = np.flatnonzero(usable)
+    wkb = wkb.take(pa.array(positions)) if len(positions) < len(wkb) else wkb
+
+    columns = {
+        "geometry_wkb": wkb_to_hex(wkb),
+        "geometry_type": pa.array(names[positions], pa.string()),
+    }
+    return usable, missing, columns
+
+
+def _parcel_message(context: _LayerContext, feature_idx: int, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Deduplication message of one feature (content hash attached at publish)."""
+    return {
+        "batch_id": context.batch_id_str,
+        "source_type": "PARCEL",
+        "source_file": context.source_file,
+        "source_row_number": feature_idx,
+        **message_metrics(raw_data),
+        "raw_data": raw_data
+    }
+
+
+def validate_gdb_format(gdb_path: Union[Path, str]) -> bool:
     """
     Validate that a path is a valid GDB directory.
 
     Args:
-        gdb_path: Path to check
+        gdb_path: Path to check (a /vsizip/ path is only checked by listing its layers)
 
     Returns:
         bool: True if valid GDB, False otherwise
     """
-    if not gdb_path.exists():
-        logger.error(f"GDB path does not exist: {gdb_path}")
-        return False
+    if not is_virtual_path(gdb_path):
+        if not Path(gdb_path).exists():
+            logger.error(f"GDB path does not exist: {gdb_path}")
+            return False
 
-    if not gdb_path.is_dir():
-        logger.error(f"GDB path is not a directory: {gdb_path}")
-        return False
+        if not Path(gdb_path).is_dir():
+            logger.error(f"GDB path is not a directory: {gdb_path}")
+            return False
 
     # Check for required GDB files
     required_files = ['.gdb']  # Fiona checks for internal structure
@@ -485,11 +1554,18 @@ def cleanup_gdb(gdb_path: Path) -> None:
 
 
 __all__ = [
+    "find_gdb_in_zip",
     "extract_gdb",
+    "is_virtual_path",
     "inspect_gdb",
+    "get_layer_metadata",
+    "gdb_fingerprint",
     "count_features",
     "transform_to_wisconsin_crs",
     "process_gdb_async",
+    "read_gdb_batches",
+    "build_parcel_messages",
+    "reduce_geometries",
     "validate_gdb_format",
     "cleanup_gdb",
 ]
@@ -0,0 +1,75 @@
+"""
+GDB feature-range planning service.
+
+Splits a large layer into contiguous feature ranges that worker processes
+read independently: GDAL seeks to a feature index directly (OpenFileGDB
+reads its row index), so a worker starts at its range without reading the
+features before it. Feature indexes stay the layer's own, so
+source_row_number is the same as in a sequential run.
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+from .logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Ranges smaller than this are not worth a separate worker
+MIN_RANGE_FEATURES = 50_000
+
+
+@dataclass(frozen=True)
+class GdbFeatureRange:
+    """
+    A slice of a layer's features.
+
+    Attributes:
+        index: Position of the range in the layer (0-based)
+        start: Features in the layer before this range
+        stop: Features in the layer up to the end of this range
+    """
+
+    index: int
+    start: int
+    stop: int
+
+    @property
+    def size(self) -> int:
+        """Number of features in the range."""
+        return self.stop - self.start
+
+
+def plan_feature_ranges(
+    total_features: int,
+    max_ranges: int,
+    min_range_features: int = MIN_RANGE_FEATURES
+) -> List[GdbFeatureRange]:
+    """
+    Split a layer into up to max_ranges feature ranges of equal size.
+
+    Args:
+        total_features: Features in the layer
+        max_ranges: Upper bound on the number of ranges (e.g. worker count)
+        min_range_features: Smallest range worth splitting off (default: 50000)
+
+    Returns:
+        List of GdbFeatureRange covering every feature, in layer order. A
+        single range means the layer is too small to split.
+    """
+    n_ranges = max(1, min(max_ranges, total_features // max(min_range_features, 1)))
+    bounds = [total_features * i // n_ranges for i in range(n_ranges + 1)]
+    ranges = [
+        GdbFeatureRange(index=i, start=bounds[i], stop=bounds[i + 1])
+        for i in range(n_ranges)
+    ]
+
+    if n_ranges > 1:
+        logger.info(f"Planned {n_ranges} feature ranges for {total_features:,} features")
+    return ranges
+
+
+__all__ = [
+    "GdbFeatureRange",
+    "plan_feature_ranges",
+]
@@ -0,0 +1,91 @@
+"""
+Geometry metrics service.
+
+Computes the bounding box, centroid and area of parcel geometries (EPSG:3071
+metres) for the GDB and CSV processors, with shapely 2 array operations over
+a whole chunk. The metrics are written into raw_data (as the
+V11ParcelRecord metric fields) and onto each message as bbox/centroid/area,
+so consumers can bucket, tile and sanity-check parcels without parsing the
+geometry. Metric fields are not content hash fields: hashes do not change
+with or without them.
+"""
+
+from typing import Any, Dict, Mapping
+
+import numpy as np
+import pyarrow as pa
+import shapely
+
+# raw_data fields of the metrics, in message order (bbox, centroid, area)
+METRIC_FIELDS = (
+    "bbox_minx", "bbox_miny", "bbox_maxx", "bbox_maxy", "centroid_x", "centroid_y", "area"
+)
+
+
+def compute_geometry_metrics(geometries: Any) -> Dict[str, np.ndarray]:
+    """
+    Bounding box, centroid and area of every geometry.
+
+    Args:
+        geometries: Array (or sequence) of shapely geometries; None and empty
+            geometries get NaN metrics
+
+    Returns:
+        Dict of METRIC_FIELDS to float64 arrays
+    """
+    geometries = np.asarray(geometries, dtype=object).reshape(-1)
+    bounds = shapely.bounds(geometries).reshape(-1, 4)
+
+    # GEOS has no coordinates for the centroid of an empty geometry
+    present = ~(shapely.is_missing(geometries) | shapely.is_empty(geometries))
+    centroid_x = np.full(len(geometries), np.nan)
+    centroid_y = np.full(len(geometries), np.nan)
+    centroids = shapely.centroid(geometries[present])
+    centroid_x[present] = shapely.get_x(centroids)
+    centroid_y[present] = shapely.get_y(centroids)
+
+    area = shapely.area(geometries)
+    area[~present] = np.nan
+
+    return {
+        "bbox_minx": bounds[:, 0],
+        "bbox_miny": bounds[:, 1],
+        "bbox_maxx": bounds[:, 2],
+        "bbox_maxy": bounds[:, 3],
+        "centroid_x": centroid_x,
+        "centroid_y": centroid_y,
+        "area": area,
+    }
+
+
+def geometry_metric_columns(geometries: Any) -> Dict[str, pa.Array]:
+    """Metrics of every geometry as Arrow float64 columns (NaN becomes null)."""
+    return {
+        name: pa.array(values, pa.float64(), from_pandas=True)
+        for name, values in compute_geometry_metrics(geometries).items()
+    }
+
+
+def message_metrics(raw_data: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Message-level bbox, centroid and area of a parcel's raw_data.
+
+    Returns:
+        {"bbox": [minx, miny, maxx, maxy], "centroid": [x, y], "area": area},
+        or an empty dict when raw_data has no metrics
+    """
+    if raw_data.get("bbox_minx") is None:
+        return {}
+    return {
+        "bbox": [raw_data["bbox_minx"], raw_data["bbox_miny"], raw_data["bbox_maxx"], raw_data["bbox_maxy"]],
+        "centroid": [raw_data["centroid_x"], raw_data["centroid_y"]],
+        "area": raw_data["area"],
+    }
+
+
+__all__ = [
+    "METRIC_FIELDS",
+    "compute_geometry_metrics",
+    "geometry_metric_columns",
+    "message_metrics",
+]
@@ -0,0 +1,281 @@
+"""
+Local content hash index service.
+
+Keeps a compact, memory-mapped index of content hashes already stored in
+raw_imports, so the processors can drop known duplicates before publishing:
+- The index file is a sorted array of 32-byte SHA-256 digests
+- Lookups are a vectorized binary search over the whole chunk
+- Refreshes read raw_imports.content_hash incrementally (imported_at watermark)
+  and atomically replace the file; readers pick up the new file on next use
+
+A sorted file is exact (no false positives, unlike a Bloom filter), so a
+record is only suppressed if its hash really is in raw_imports. Hashes
+missed by a refresh simply go through the broker and the deduplication
+consumer as before.
+"""
+
+import asyncio
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from shared.database import get_db_pool
+from .logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# One SHA-256 digest per entry
+DIGEST_DTYPE = np.dtype("S32")
+
+# Rows fetched from raw_imports per round trip during a refresh
+REFRESH_FETCH_SIZE = 100_000
+
+
+@dataclass
+class HashIndexMetadata:
+    """
+    Sidecar metadata of an index file.
+
+    Attributes:
+        count: Number of digests in the index
+        watermark: Latest raw_imports.imported_at included (ISO format)
+        refreshed_at: When the index was last written (ISO format)
+    """
+
+    count: int
+    watermark: Optional[str] = None
+    refreshed_at: Optional[str] = None
+
+
+class HashIndex:
+    """
+    Read-only view of an index file.
+
+    Example:
+        ```python
+        index = get_hash_index(Path("/tmp/gdb-processing/hash-index/content_hashes.bin"))
+        if index is not None:
+            known = index.contains(content_hashes)  # boolean array
+        ```
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        size = self.path.stat().st_size
+        if size % DIGEST_DTYPE.itemsize:
+            raise ValueError(f"Corrupt hash index {self.path}: {size} bytes")
+
+        if size:
+            self._digests = np.memmap(self.path, dtype=DIGEST_DTYPE, mode="r")
+        else:
+            self._digests = np.empty(0, dtype=DIGEST_DTYPE)
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+    def contains(self, content_hashes: Sequence[str]) -> np.ndarray:
+        """
+        Check a batch of hex content hashes against the index.
+
+        Args:
+            content_hashes: 64-character hex digests
+
+        Returns:
+            Boolean array, True where the hash is in the index
+        """
+        keys = _to_digests(content_hashes)
+        if not len(self._digests) or not len(keys):
+            return np.zeros(len(keys), dtype=bool)
+
+        positions = np.searchsorted(self._digests, keys)
+        found = np.zeros(len(keys), dtype=bool)
+        in_range = positions < len(self._digests)
+        found[in_range] = self._digests[positions[in_range]] == keys[in_range]
+        return found
+
+
+# Open indexes per path, with the file stat they were opened at
+_open_indexes: Dict[Path, Tuple[Tuple[int, int], HashIndex]] = {}
+
+
+def get_hash_index(path: Union[str, Path, None]) -> Optional[HashIndex]:
+    """
+    Get the index at path, reopening it if the file was replaced.
+
+    Args:
+        path: Index file path (None disables suppression)
+
+    Returns:
+        HashIndex, or None if there is no usable index
+    """
+    if path is None:
+        return None
+
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _open_indexes.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    try:
+        index = HashIndex(path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unusable hash index {path}: {e}")
+        return None
+
+    _open_indexes[path] = (key, index)
+    logger.info(f"Opened hash index {path} ({len(index):,} hashes)")
+    return index
+
+
+def read_metadata(path: Union[str, Path]) -> Optional[HashIndexMetadata]:
+    """Read the sidecar metadata of an index file (None if missing)."""
+    meta_path = _metadata_path(Path(path))
+    try:
+        return HashIndexMetadata(**json.loads(meta_path.read_text()))
+    except FileNotFoundError:
+        return None
+
+
+async def refresh_hash_index(
+    path: Union[str, Path],
+    full: bool = False,
+    fetch_size: int = REFRESH_FETCH_SIZE
+) -> int:
+    """
+    Add hashes stored in raw_imports since the last refresh to the index.
+
+    Args:
+        path: Index file path
+        full: Rebuild from all of raw_imports instead of the watermark
+        fetch_size: Rows fetched per round trip
+
+    Returns:
+        int: Number of hashes in the refreshed index
+    """
+    path = Path(path)
+    metadata = None if full else read_metadata(path)
+    if metadata is not None and not path.exists():
+        metadata = None
+    watermark = datetime.fromisoformat(metadata.watermark) if metadata and metadata.watermark else None
+
+    batches: List[np.ndarray] = []
+    pending: List[str] = []
+    latest = watermark
+    pool = await get_db_pool()
+
+    async with pool.acquire() as conn, conn.transaction():
+        cursor = conn.cursor("""
+            SELECT content_hash, imported_at
+            FROM raw_imports
+            WHERE $1::timestamptz IS NULL OR imported_at > $1
+        """, watermark, prefetch=fetch_size)
+
+        async for row in cursor:
+            pending.append(row["content_hash"])
+            if latest is None or row["imported_at"] > latest:
+                latest = row["imported_at"]
+            if len(pending) >= fetch_size:
+                batches.append(_to_digests(pending, skip_invalid=True))
+                pending = []
+
+    if pending:
+        batches.append(_to_digests(pending, skip_invalid=True))
+
+    count = await asyncio.to_thread(
+        _write_index, path, batches, None if metadata is None else path,
+        latest.isoformat() if latest else None
+    )
+    logger.info(
+        f"Refreshed hash index {path}: {count:,} hashes "
+        f"({sum(len(b) for b in batches):,} read, {'full' if metadata is None else 'incremental'})"
+    )
+    return count
+
+
+def _write_index(
+    path: Path,
+    batches: List[np.ndarray],
+    merge_with: Optional[Path],
+    watermark: Optional[str]
+) -> int:
+    """Sort, merge and atomically replace the index file and its metadata."""
+    digests = np.concatenate(batches) if batches else np.empty(0, dtype=DIGEST_DTYPE)
+    if merge_with is not None and merge_with.exists():
+        digests = np.concatenate([np.fromfile(merge_with, dtype=DIGEST_DTYPE), digests])
+    digests = np.unique(digests)  # Sorted, no repeats
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Per-process temp names: every API worker refreshes the same index
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    digests.tofile(tmp_path)
+    os.replace(tmp_path, path)
+
+    metadata = HashIndexMetadata(
+        count=len(digests),
+        watermark=watermark,
+        refreshed_at=datetime.now().astimezone().isoformat()
+    )
+    meta_path = _metadata_path(path)
+    tmp_meta = meta_path.with_name(f"{meta_path.name}.{os.getpid()}.tmp")
+    tmp_meta.write_text(json.dumps(metadata.__dict__))
+    os.replace(tmp_meta, meta_path)
+
+    return len(digests)
+
+
+async def run_hash_index_refresher(path: Union[str, Path], interval_seconds: float) -> None:
+    """
+    Periodically refresh the index (runs for the service lifetime).
+
+    Args:
+        path: Index file path
+        interval_seconds: Seconds between refreshes
+    """
+    while True:
+        try:
+            await refresh_hash_index(path)
+        except Exception as e:
+            logger.error(f"Failed to refresh hash index {path}: {e}", exc_info=True)
+
+        await asyncio.sleep(interval_seconds)
+
+
+def _to_digests(content_hashes: Sequence[str], skip_invalid: bool = False) -> np.ndarray:
+    """Convert hex digests to an S32 array (invalid ones raise, or are skipped)."""
+    if not skip_invalid:
+        return np.array([bytes.fromhex(h) for h in content_hashes], dtype=DIGEST_DTYPE)
+
+    digests = []
+    for content_hash in content_hashes:
+        if content_hash and len(content_hash) == 64:
+            try:
+                digests.append(bytes.fromhex(content_hash))
+            except ValueError:
+                pass
+    return np.array(digests, dtype=DIGEST_DTYPE)
+
+
+def _metadata_path(path: Path) -> Path:
+    """Sidecar metadata path of an index file."""
+    return path.with_suffix(".json")
+
+
+__all__ = [
+    "HashIndex",
+    "HashIndexMetadata",
+    "get_hash_index",
+    "read_metadata",
+    "refresh_hash_index",
+    "run_hash_index_refresher",
+]
@@ -0,0 +1,94 @@
+"""
+Deferred imports of the processing modules.
+
+The GDB processor pulls in fiona, geopandas, pyogrio, shapely and pyproj, and
+the CSV processor pandas and pyarrow: seconds of startup and hundreds of MB
+of RSS per uvicorn worker, even for workers that only serve /status. Routers
+and the resume watcher reach the processors through lazy functions instead,
+so a processor is imported by the first GDB or CSV job that needs it:
+- import_processor imports a processor off the event loop (upload handlers
+  await it before calling any of its functions)
+- lazy_function stands in for a processor function and imports its module
+  on first call
+- prewarm_processors imports processors at startup (PREWARM_PROCESSORS)
+"""
+
+import asyncio
+import importlib
+import sys
+from types import ModuleType
+from typing import Any, Callable, Iterable
+
+from .logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Processor kinds and their modules
+PROCESSOR_MODULES = {
+    "gdb": "services.gdb_processor",
+    "csv": "services.csv_processor",
+}
+
+
+async def import_processor(kind: str) -> ModuleType:
+    """
+    Import a processor module on a worker thread (immediate once imported).
+
+    Args:
+        kind: 'gdb' or 'csv'
+
+    Returns:
+        The imported module
+    """
+    module_name = PROCESSOR_MODULES[kind]
+    module = sys.modules.get(module_name)
+    if module is None:
+        logger.info(f"Importing {kind.upper()} processor")
+        module = await asyncio.to_thread(importlib.import_module, module_name)
+    return module
+
+
+async def prewarm_processors(kinds: Iterable[str]) -> None:
+    """Import the given processors up front (e.g. at startup)."""
+    for kind in kinds:
+        await import_processor(kind)
+
+
+def lazy_function(module_name: str, function_name: str, is_async: bool = False) -> Callable[..., Any]:
+    """
+    Stand-in for a function of a module that is imported on first call.
+
+    Args:
+        module_name: Module defining the function (e.g. 'services.gdb_processor')
+        function_name: Name of the function in the module
+        is_async: The function is a coroutine function; the stand-in is one
+            too (so BackgroundTasks awaits it) and imports off the event loop
+
+    Returns:
+        A function forwarding its arguments to the real one
+    """
+    if is_async:
+        async def call_async(*args: Any, **kwargs: Any) -> Any:
+            module = sys.modules.get(module_name)
+            if module is None:
+                module = await asyncio.to_thread(importlib.import_module, module_name)
+            return await getattr(module, function_name)(*args, **kwargs)
+
+        stand_in = call_async
+    else:
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return getattr(importlib.import_module(module_name), function_name)(*args, **kwargs)
+
+        stand_in = call
+
+    stand_in.__name__ = stand_in.__qualname__ = function_name
+    stand_in.__doc__ = f"Deferred {module_name}.{function_name} (imported on first call)."
+    return stand_in
+
+
+__all__ = [
+    "PROCESSOR_MODULES",
+    "import_processor",
+    "prewarm_processors",
+    "lazy_function",
+]
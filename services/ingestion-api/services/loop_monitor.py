@@ -0,0 +1,88 @@
+"""
+Event loop lag monitor.
+
+Measures how late the event loop wakes up from a short sleep. Anything
+that blocks the loop thread (synchronous I/O, CPU work outside a worker
+thread) shows up as lag, and the same lag is added to every /status and
+/health request served meanwhile. /health reports the recent figures.
+"""
+
+import asyncio
+from collections import deque
+from typing import Deque, Dict
+
+from .logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Samples kept for the percentiles reported by /health
+LAG_WINDOW = 240
+
+
+class LoopLagMonitor:
+    """
+    Rolling window of event loop lag samples (seconds).
+
+    Example:
+        ```python
+        monitor = LoopLagMonitor()
+        monitor.record(0.002)
+        monitor.snapshot()  # {"last_ms": 2.0, "p50_ms": 2.0, ...}
+        ```
+    """
+
+    def __init__(self, window: int = LAG_WINDOW):
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, lag: float) -> None:
+        """Add one lag sample."""
+        self.samples.append(max(lag, 0.0))
+
+    def snapshot(self) -> Dict[str, float]:
+        """Last, median, p99 and max lag over the window, in milliseconds (empty before the first sample)."""
+        if not self.samples:
+            return {}
+
+        ordered = sorted(self.samples)
+        return {
+            "last_ms": round(self.samples[-1] * 1000, 2),
+            "p50_ms": round(ordered[len(ordered) // 2] * 1000, 2),
+            "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 2),
+            "max_ms": round(ordered[-1] * 1000, 2),
+        }
+
+
+# Process-wide monitor fed by run_loop_lag_monitor
+loop_lag_monitor = LoopLagMonitor()
+
+
+async def run_loop_lag_monitor(
+    interval_seconds: float,
+    warn_ms: float,
+    monitor: LoopLagMonitor = loop_lag_monitor
+) -> None:
+    """
+    Sample the event loop lag every interval (runs for the service lifetime).
+
+    Args:
+        interval_seconds: Seconds between samples
+        warn_ms: Log a warning when one sample exceeds this lag
+        monitor: Monitor to record into
+    """
+    loop = asyncio.get_running_loop()
+
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval_seconds)
+        lag = loop.time() - start - interval_seconds
+        monitor.record(lag)
+
+        if lag * 1000 > warn_ms:
+            logger.warning(f"Event loop lagged {lag * 1000:.0f} ms")
+
+
+__all__ = [
+    "LoopLagMonitor",
+    "loop_lag_monitor",
+    "run_loop_lag_monitor",
+]
@@ -0,0 +1,238 @@
+"""
+Single-pass upload inspection service.
+
+Collects everything the CSV upload path needs while the upload streams to disk:
+- Byte size
+- Encoding evidence and the chosen encoding
+- Row count (quote-aware, blank lines skipped)
+- Header and a parsed sample of the first rows
+- Record boundaries (byte offset, rows before) for splitting into byte ranges
+
+The resulting UploadInspection is handed to the processor with the batch,
+so the saved file is never re-read just to re-derive these facts.
+"""
+
+import io
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .encoding_detector import StreamingEncodingDetector
+from .logging_utils import get_logger
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = get_logger(__name__)
+
+# Bytes of the file head kept in memory for the sample
+SAMPLE_BYTES = 1024 * 1024  # 1MB
+SAMPLE_ROWS = 100
+
+# Spacing of recorded record boundaries
+BOUNDARY_BYTES = 4 * 1024 * 1024  # 4MB
+
+_QUOTE, _NEWLINE, _CARRIAGE_RETURN = ord('"'), ord("\n"), ord("\r")
+
+
+@dataclass
+class UploadInspection:
+    """
+    Facts about an uploaded CSV gathered in a single pass.
+
+    Attributes:
+        byte_size: Total bytes written
+        encoding: Chosen text encoding (e.g., 'utf-8', 'latin-1')
+        encoding_confidence: Detector confidence for the chosen encoding (0-1)
+        encoding_error_offsets: First undecodable byte offsets per candidate encoding
+        record_boundaries: (byte offset where a record starts, data rows before it),
+            roughly every BOUNDARY_BYTES
+        row_count: Number of data rows (excluding header)
+        header: Column names from the first record
+        sample: First rows parsed as strings (None if the sample could not be parsed)
+        sample_error: Parser error for the sample, if any
+    """
+
+    byte_size: int
+    encoding: str
+    encoding_confidence: float
+    row_count: int
+    header: List[str] = field(default_factory=list)
+    sample: Optional["pd.DataFrame"] = None
+    sample_error: Optional[str] = None
+    encoding_error_offsets: Dict[str, List[int]] = field(default_factory=dict)
+    record_boundaries: List[Tuple[int, int]] = field(default_factory=list)
+
+
+class UploadInspector:
+    """
+    Incremental CSV inspector fed with the upload's byte chunks.
+
+    feed() is CPU work (vectorized, a few milliseconds per MB); call it off
+    the event loop, e.g. with asyncio.to_thread.
+
+    Example:
+        ```python
+        inspector = UploadInspector()
+        while chunk := await upload_file.read(1024 * 1024):
+            await f.write(chunk)
+            await asyncio.to_thread(inspector.feed, chunk)
+        inspection = inspector.finish()
+        ```
+    """
+
+    def __init__(
+        self,
+        sample_bytes: int = SAMPLE_BYTES,
+        sample_rows: int = SAMPLE_ROWS,
+        boundary_bytes: int = BOUNDARY_BYTES
+    ):
+        self.sample_bytes = sample_bytes
+        self.sample_rows = sample_rows
+        self.boundary_bytes = boundary_bytes
+        self.byte_size = 0
+
+        self._head = bytearray()
+        self._head_end = 0  # End of the last complete record inside the head
+        self._records = 0
+        self._in_quotes = False
+        self._tail = b"\n"  # Last bytes seen; start-of-file behaves like a line break
+        self._boundaries: List[Tuple[int, int]] = []
+        self._next_boundary = boundary_bytes
+
+        self._encoding_detector = StreamingEncodingDetector()
+
+    def feed(self, chunk: bytes) -> None:
+        """
+        Consume the next chunk of the upload.
+
+        Args:
+            chunk: Raw bytes, in file order
+        """
+        if not chunk:
+            return
+
+        offset = self.byte_size
+        self.byte_size += len(chunk)
+
+        if len(self._head) < self.sample_bytes:
+            self._head += chunk[:self.sample_bytes - len(self._head)]
+
+        self._encoding_detector.feed(chunk)
+        self._scan_records(chunk, offset)
+
+    def finish(self) -> UploadInspection:
+        """
+        Finalize inspection once the upload is fully written.
+
+        Returns:
+            UploadInspection for the uploaded file
+        """
+        records = self._records
+        if self.byte_size and self._tail[-1:] != b"\n":
+            records += 1  # Last record has no trailing newline
+
+        detection = self._encoding_detector.finish()
+        encoding = detection.encoding
+
+        sample, sample_error = self._parse_sample(encoding)
+        header = [str(c).strip() for c in sample.columns] if sample is not None else []
+
+        inspection = UploadInspection(
+            byte_size=self.byte_size,
+            encoding=encoding,
+            encoding_confidence=detection.confidence,
+            row_count=max(records - 1, 0),
+            header=header,
+            sample=sample,
+            sample_error=sample_error,
+            encoding_error_offsets=detection.error_offsets,
+            record_boundaries=list(self._boundaries),
+        )
+
+        logger.info(
+            f"Upload inspection: {inspection.byte_size} bytes, {inspection.row_count} rows, "
+            f"{len(header)} columns, encoding={encoding}"
+        )
+        return inspection
+
+    def _scan_records(self, chunk: bytes, offset: int) -> None:
+        """
+        Count record terminators (newlines outside quotes, skipping blank lines).
+
+        Vectorized over the chunk: a newline is outside quotes when an even
+        number of quotes precede it (the parity carried over from earlier
+        chunks), and ends a blank line when the byte before it, skipping one
+        \\r, is another newline.
+        """
+        import numpy as np  # Deferred with the rest of the numeric stack (see lazy_imports)
+
+        data = np.frombuffer(chunk, dtype=np.uint8)
+        quotes = np.flatnonzero(data == _QUOTE)
+        newlines = np.flatnonzero(data == _NEWLINE)
+        newlines = newlines[(np.searchsorted(quotes, newlines) + self._in_quotes) % 2 == 0]
+        self._in_quotes ^= bool(len(quotes) % 2)
+
+        if newlines.size:
+            # The two bytes before every newline, the last ones of earlier chunks included
+            context = np.frombuffer(self._tail.rjust(2, b"\0") + chunk, dtype=np.uint8)
+            before = context[newlines + 1]
+            blank = (before == _NEWLINE) | (
+                (before == _CARRIAGE_RETURN) & (context[newlines] == _NEWLINE)
+            )
+            records = self._records + np.cumsum(~blank)  # Records ended at each newline
+            positions = offset + newlines
+            self._records = int(records[-1])
+
+            in_head = int(np.searchsorted(positions, self.sample_bytes))
+            if in_head:
+                self._head_end = int(positions[in_head - 1]) + 1
+
+            # records is non-decreasing, so the first newline past a boundary
+            # that follows at least one data row is found by bisection
+            first_data = int(np.searchsorted(records, 1, side="right"))
+            while True:
+                i = max(int(np.searchsorted(positions, self._next_boundary - 1)), first_data)
+                if i >= len(positions):
+                    break
+                boundary = int(positions[i]) + 1
+                self._boundaries.append((boundary, int(records[i]) - 1))
+                self._next_boundary = boundary + self.boundary_bytes
+
+        self._tail = (self._tail + chunk[-2:])[-2:]
+
+    def _parse_sample(self, encoding: str) -> tuple[Optional["pd.DataFrame"], Optional[str]]:
+        """Parse the first rows from the in-memory head."""
+        import pandas as pd  # Deferred: the CSV processor loads pandas with the first job
+
+        if not self.byte_size:
+            return None, "File is empty (0 bytes)"
+
+        # Only complete records, unless the whole file fits in the head
+        if self.byte_size <= len(self._head):
+            head = bytes(self._head)
+        else:
+            head = bytes(self._head[:self._head_end])
+
+        try:
+            sample = pd.read_csv(
+                io.BytesIO(head),
+                encoding=encoding,
+                nrows=self.sample_rows,
+                dtype=str,
+                keep_default_na=False,
+                encoding_errors='replace',
+                on_bad_lines='skip'
+            )
+            return sample, None
+        except pd.errors.EmptyDataError:
+            return None, "File contains no data"
+        except pd.errors.ParserError as e:
+            return None, f"Invalid CSV format: {str(e)[:100]}"
+        except Exception as e:
+            return None, f"Validation error: {str(e)[:100]}"
+
+
+__all__ = [
+    "UploadInspection",
+    "UploadInspector",
+]
@@ -0,0 +1,138 @@
+"""
+WKB utilities for Arrow geometry columns.
+
+Works directly on the offsets and data buffers of an Arrow binary column
+(the WKB geometries of the arrow GDB reader), with numpy over whole
+batches and no geometry objects:
+- Header decoding: byte order, geometry type and element count of every
+  value, giving the geometry type name and whether it is empty
+- Hex encoding into an Arrow string column (uppercase, like PostGIS and
+  shapely's wkb_hex)
+
+Values the header decoder cannot classify (points, EWKB with an SRID,
+malformed headers) are reported as such, so callers can hand just those
+to shapely.
+"""
+
+from typing import Tuple, Union
+
+import numpy as np
+import pyarrow as pa
+
+# WKB geometry type code (modulo the ISO Z/M/ZM offsets) -> geometry type name
+WKB_TYPE_NAMES = np.array([
+    None, "Point", "LineString", "Polygon",
+    "MultiPoint", "MultiLineString", "MultiPolygon", "GeometryCollection"
+], dtype=object)
+
+# Byte order marker, uint32 type code, uint32 element count
+_HEADER_BYTES = 9
+
+# Two uppercase hex digits per byte value
+_HEX_DIGITS = np.frombuffer(
+    b"".join(f"{i:02X}".encode("ascii") for i in range(256)), dtype=np.uint16
+)
+
+
+def _buffers(wkb: Union[pa.Array, pa.ChunkedArray]) -> Tuple[pa.Array, np.ndarray, np.ndarray]:
+    """(array, value offsets, data bytes) of a binary or large_binary column."""
+    if isinstance(wkb, pa.ChunkedArray):
+        wkb = wkb.combine_chunks()
+    offset_type = np.int64 if pa.types.is_large_binary(wkb.type) else np.int32
+    _, offsets_buffer, data_buffer = wkb.buffers()
+
+    offsets = np.frombuffer(offsets_buffer, dtype=offset_type)[wkb.offset:wkb.offset + len(wkb) + 1]
+    data = (
+        np.frombuffer(data_buffer, dtype=np.uint8)
+        if data_buffer is not None else np.empty(0, dtype=np.uint8)
+    )
+    return wkb, offsets.astype(np.int64), data
+
+
+def _read_uint32(header: np.ndarray, start: int, little_endian: np.ndarray) -> np.ndarray:
+    """uint32 at header[:, start:start + 4] in each row's byte order."""
+    b = header[:, start:start + 4].astype(np.uint32)
+    little = b[:, 0] | (b[:, 1] << 8) | (b[:, 2] << 16) | (b[:, 3] << 24)
+    big = b[:, 3] | (b[:, 2] << 8) | (b[:, 1] << 16) | (b[:, 0] << 24)
+    return np.where(little_endian, little, big)
+
+
+def read_wkb_headers(wkb: Union[pa.Array, pa.ChunkedArray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Decode the header of every WKB value in a binary column.
+
+    Args:
+        wkb: Arrow binary or large_binary column of WKB geometries
+
+    Returns:
+        tuple: (geometry type names, empty mask, decoded mask). Values are
+            decoded when their header is a well-formed ISO WKB header of a
+            multi-part, line or polygon type; null values, points (whose
+            emptiness is in the coordinates), EWKB and malformed values are
+            not, and have type None and empty False.
+    """
+    wkb, offsets, data = _buffers(wkb)
+    n = len(wkb)
+    names = np.full(n, None, dtype=object)
+    empty = np.zeros(n, dtype=bool)
+    decoded = np.zeros(n, dtype=bool)
+
+    starts = offsets[:-1]
+    present = np.diff(offsets) >= _HEADER_BYTES
+    if wkb.null_count:
+        present &= wkb.is_valid().to_numpy(zero_copy_only=False)
+    positions = np.flatnonzero(present)
+    if not len(positions):
+        return names, empty, decoded
+
+    header = data[starts[positions, None] + np.arange(_HEADER_BYTES)]
+    byte_order = header[:, 0]
+    code = _read_uint32(header, 1, byte_order == 1)
+    count = _read_uint32(header, 5, byte_order == 1)
+
+    base = code % 1000
+    known = (
+        (byte_order <= 1)
+        & (code < 4000)  # ISO Z/M/ZM offsets only (EWKB sets high flag bits)
+        & (base >= 2) & (base <= 7)
+    )
+
+    positions = positions[known]
+    names[positions] = WKB_TYPE_NAMES[base[known]]
+    empty[positions] = count[known] == 0
+    decoded[positions] = True
+    return names, empty, decoded
+
+
+def wkb_to_hex(wkb: Union[pa.Array, pa.ChunkedArray]) -> pa.StringArray:
+    """
+    Hex-encode every value of a binary column (nulls stay null).
+
+    Args:
+        wkb: Arrow binary or large_binary column
+
+    Returns:
+        pa.StringArray: Uppercase hex strings, twice the length of each value
+    """
+    wkb, offsets, data = _buffers(wkb)
+    first = int(offsets[0]) if len(offsets) else 0
+    last = int(offsets[-1]) if len(offsets) else 0
+
+    digits = _HEX_DIGITS[data[first:last]]
+    hex_offsets = ((offsets - first) * 2).astype(np.int64)
+    validity = wkb.buffers()[0] if wkb.null_count else None
+    if validity is not None and wkb.offset:
+        validity = pa.array(wkb.is_valid().to_numpy(zero_copy_only=False)).buffers()[1]
+
+    return pa.Array.from_buffers(
+        pa.large_string(), len(wkb),
+        [validity, pa.py_buffer(hex_offsets), pa.py_buffer(digits.tobytes())],
+        null_count=wkb.null_count
+    ).cast(pa.string())
+
+
+__all__ = [
+    "WKB_TYPE_NAMES",
+    "read_wkb_headers",
+    "wkb_to_hex",
+]
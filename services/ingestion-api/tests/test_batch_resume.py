@@ -0,0 +1,183 @@
+"""
+Unit tests for resuming interrupted batches.
+
+Tests that claimed checkpoints re-run the right processor with the stored
+options and position, and that batches whose source file is gone fail.
+"""
+
+import asyncio
+import pytest
+from uuid import uuid4
+from unittest.mock import AsyncMock, patch
+
+from services.batch_resume import resume_batch, resume_interrupted_batches
+
+
+def csv_checkpoint(csv_path, position):
+    """Claimed checkpoint of a sequential CSV batch."""
+    return {
+        "batch_id": uuid4(),
+        "file_format": "CSV",
+        "resume_count": 1,
+        "options": {
+            "csv_path": str(csv_path),
+            "source_type": "RETR",
+            "source_name": "Statewide RETR",
+            "chunk_size": 1000,
+            "parser_engine": "arrow",
+            "workers": 1,
+            "encoding": "windows-1252"
+        },
+        "position": position
+    }
+
+
+class TestResumeBatch:
+    """Tests for resume_batch function."""
+
+    @pytest.mark.asyncio
+    async def test_resumes_csv_with_stored_options(self, tmp_path):
+        """Should re-run the CSV processor from the checkpoint position."""
+        csv_file = tmp_path / "retr.csv"
+        csv_file.write_text("PARCEL_ID\n1\n")
+        position = {"row_number": 5000, "byte_offset": 1048576, "rows_before": 4800}
+        checkpoint = csv_checkpoint(csv_file, position)
+
+        with patch('services.batch_resume.process_csv_async', new_callable=AsyncMock) as mock_process:
+            await resume_batch(checkpoint)
+
+        kwargs = mock_process.call_args.kwargs
+        assert kwargs["csv_path"] == csv_file
+        assert kwargs["batch_id"] == checkpoint["batch_id"]
+        assert kwargs["parser_engine"] == "arrow"
+        assert kwargs["encoding"] == "windows-1252"
+        assert kwargs["resume_from"] == position
+
+    @pytest.mark.asyncio
+    async def test_fails_batch_when_source_file_is_gone(self, tmp_path):
+        """Should fail the batch instead of resuming without its file."""
+        checkpoint = csv_checkpoint(tmp_path / "missing.csv", {"row_number": 10})
+
+        with patch('services.batch_resume.process_csv_async', new_callable=AsyncMock) as mock_process, \
+             patch('services.batch_resume.fail_batch', new_callable=AsyncMock) as mock_fail:
+            await resume_batch(checkpoint)
+
+        mock_process.assert_not_called()
+        assert mock_fail.call_args.args[0] == checkpoint["batch_id"]
+        assert "no longer exists" in mock_fail.call_args.args[1]
+
+    @pytest.mark.asyncio
+    async def test_resumes_gdb_and_cleans_up(self, tmp_path):
+        """Should re-run the GDB processor and remove the upload afterwards."""
+        extract_dir = tmp_path / "extract"
+        gdb_path = extract_dir / "parcels.gdb"
+        gdb_path.mkdir(parents=True)
+        upload = tmp_path / "parcels.gdb.zip"
+        upload.touch()
+        checkpoint = {
+            "batch_id": uuid4(),
+            "file_format": "GDB",
+            "resume_count": 1,
+            "options": {
+                "gdb_path": str(gdb_path),
+                "layer_name": "V11_Parcels",
+                "source_name": "Dane County 2025",
+                "chunk_size": 1000,
+                "upload_path": str(upload),
+                "extract_dir": str(extract_dir)
+            },
+            "position": {"feature_index": 3000}
+        }
+
+        with patch('services.batch_resume.process_gdb_async', new_callable=AsyncMock) as mock_process:
+            await resume_batch(checkpoint)
+
+        assert mock_process.call_args.kwargs["resume_from"] == {"feature_index": 3000}
+        assert not upload.exists()
+        assert not extract_dir.exists()
+
+    @pytest.mark.asyncio
+    async def test_gdb_layer_keeps_upload_for_siblings(self, tmp_path):
+        """Should leave the upload in place while sibling layers of the upload are processing."""
+        upload = tmp_path / "parcels.gdb.zip"
+        upload.touch()
+        parent_id = uuid4()
+        checkpoint = {
+            "batch_id": uuid4(),
+            "file_format": "GDB",
+            "resume_count": 1,
+            "options": {
+                "gdb_path": f"/vsizip/{upload}/parcels.gdb",
+                "layer_name": "Counties",
+                "source_name": "Dane County 2025",
+                "chunk_size": 1000,
+                "upload_path": str(upload),
+                "extract_dir": str(tmp_path / "extract"),
+                "workers": 4,
+                "parent_batch_id": str(parent_id)
+            },
+            "position": {"ranges": []}
+        }
+
+        for parent_status, kept in (("processing", True), ("completed", False)):
+            with patch('services.batch_resume.process_gdb_async', new_callable=AsyncMock) as mock_process, \
+                 patch('services.batch_resume.fetch_batch', new_callable=AsyncMock,
+                       return_value={"status": parent_status}) as mock_fetch:
+                await resume_batch(checkpoint)
+
+            assert mock_process.call_args.kwargs["workers"] == 4
+            mock_fetch.assert_called_once_with(parent_id)
+            assert upload.exists() == kept
+
+
+    @pytest.mark.asyncio
+    async def test_gdb_read_in_place_needs_upload(self, tmp_path):
+        """Should fail a GDB read from its zip once the upload is gone."""
+        upload = tmp_path / "parcels.gdb.zip"
+        checkpoint = {
+            "batch_id": uuid4(),
+            "file_format": "GDB",
+            "resume_count": 1,
+            "options": {
+                "gdb_path": f"/vsizip/{upload}/parcels.gdb",
+                "layer_name": "V11_Parcels",
+                "source_name": "Dane County 2025",
+                "chunk_size": 1000,
+                "upload_path": str(upload),
+                "extract_dir": str(tmp_path / "extract")
+            },
+            "position": {"feature_index": 3000}
+        }
+
+        with patch('services.batch_resume.process_gdb_async', new_callable=AsyncMock) as mock_process, \
+             patch('services.batch_resume.fail_batch', new_callable=AsyncMock) as mock_fail:
+            await resume_batch(checkpoint)
+        mock_process.assert_not_called()
+        assert "no longer exists" in mock_fail.call_args.args[1]
+
+        upload.touch()
+        with patch('services.batch_resume.process_gdb_async', new_callable=AsyncMock) as mock_process:
+            await resume_batch(checkpoint)
+        assert mock_process.call_args.kwargs["gdb_path"] == checkpoint["options"]["gdb_path"]
+        assert not upload.exists()
+
+
+class TestResumeInterruptedBatches:
+    """Tests for resume_interrupted_batches function."""
+
+    @pytest.mark.asyncio
+    async def test_resumes_every_claimed_batch(self, tmp_path):
+        """Should start one resume per claimed checkpoint."""
+        csv_file = tmp_path / "retr.csv"
+        csv_file.write_text("PARCEL_ID\n1\n")
+        checkpoints = [csv_checkpoint(csv_file, {}), csv_checkpoint(csv_file, {"row_number": 2})]
+
+        with patch('services.batch_resume.claim_stale_checkpoints', new_callable=AsyncMock,
+                   return_value=checkpoints) as mock_claim, \
+             patch('services.batch_resume.process_csv_async', new_callable=AsyncMock) as mock_process:
+            resumed = await resume_interrupted_batches(300)
+            await asyncio.sleep(0)
+
+        mock_claim.assert_called_once_with(300)
+        assert resumed == [c["batch_id"] for c in checkpoints]
+        assert mock_process.call_count == 2
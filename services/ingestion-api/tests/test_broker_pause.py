@@ -0,0 +1,173 @@
+"""
+Unit tests for pausing batches while RabbitMQ is unavailable.
+
+Tests that an open circuit breaker pauses the batch instead of failing its
+messages, that only unconfirmed messages are republished once the broker
+is back, that a publish held back by queue backpressure throttles the
+batch, and how range workers' pauses are merged into the batch.
+"""
+
+import asyncio
+import queue
+from uuid import uuid4
+from unittest.mock import AsyncMock, call, patch
+
+import pytest
+
+from shared.aio_rabbitmq import CircuitOpenError
+
+from services.broker_pause import (
+    RangePauses,
+    batch_pause_hook,
+    publish_or_pause,
+    range_pause_hook,
+)
+
+
+@pytest.mark.asyncio
+class TestPublishOrPause:
+    """Tests for publish_or_pause."""
+
+    async def test_publishes_without_pausing(self):
+        """Test that a reachable broker publishes straight through."""
+        publish = AsyncMock(return_value=[True, False])
+        on_pause = AsyncMock()
+
+        outcomes = await publish_or_pause(publish, 'deduplication', [{'a': 1}, {'b': 2}], on_pause)
+
+        assert outcomes == [True, False]
+        publish.assert_awaited_once_with('deduplication', [{'a': 1}, {'b': 2}])
+        on_pause.assert_not_awaited()
+
+    async def test_pauses_until_broker_returns(self):
+        """Test pause heartbeats while waiting, then republishing only unconfirmed messages."""
+        messages = [{'row': i} for i in range(3)]
+        publish = AsyncMock(side_effect=[CircuitOpenError([True, False, False], 30), [True, True]])
+        on_pause = AsyncMock()
+
+        with patch('services.broker_pause.wait_for_broker', new_callable=AsyncMock,
+                   side_effect=[False, False, True]) as mock_wait:
+            outcomes = await publish_or_pause(publish, 'deduplication', messages, on_pause)
+
+        assert outcomes == [True, True, True]
+        assert publish.await_args_list[1] == call('deduplication', [{'row': 1}, {'row': 2}])
+        assert mock_wait.await_count == 3
+        reason = on_pause.await_args_list[0].args[0]
+        assert "circuit breaker open" in reason
+        assert on_pause.await_args_list == [call(reason), call(reason), call(reason), call(None)]
+
+    async def test_no_pause_when_everything_was_confirmed(self):
+        """Test that a breaker opening after the last confirm does not pause."""
+        publish = AsyncMock(side_effect=CircuitOpenError([True, True], 30))
+        on_pause = AsyncMock()
+
+        outcomes = await publish_or_pause(publish, 'deduplication', [{'a': 1}, {'b': 2}], on_pause)
+
+        assert outcomes == [True, True]
+        on_pause.assert_not_awaited()
+
+    async def test_throttles_while_backpressure_holds_publish(self):
+        """Test that a publish waiting on backpressure throttles the batch until it is out."""
+        async def slow_publish(queue_name, messages):
+            await asyncio.sleep(0.05)
+            return [True] * len(messages)
+
+        on_pause = AsyncMock()
+        reason = "deduplication queue at 93% of its 1,000,000 message limit"
+
+        with patch('services.broker_pause.THROTTLE_CHECK_SECONDS', 0.01), \
+             patch('services.broker_pause.backpressure_reason', return_value=reason):
+            outcomes = await publish_or_pause(slow_publish, 'deduplication', [{'a': 1}], on_pause)
+
+        assert outcomes == [True]
+        # Reported once (heartbeats are PAUSE_HEARTBEAT_SECONDS apart), then lifted
+        assert on_pause.await_args_list == [call(reason, "throttled"), call(None)]
+
+    async def test_slow_publish_without_backpressure_is_not_throttled(self):
+        """Test that a publish that is merely slow leaves the batch processing."""
+        async def slow_publish(queue_name, messages):
+            await asyncio.sleep(0.03)
+            return [True] * len(messages)
+
+        on_pause = AsyncMock()
+
+        with patch('services.broker_pause.THROTTLE_CHECK_SECONDS', 0.01), \
+             patch('services.broker_pause.backpressure_reason', return_value=None):
+            outcomes = await publish_or_pause(slow_publish, 'deduplication', [{'a': 1}], on_pause)
+
+        assert outcomes == [True]
+        on_pause.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+class TestPauseHooks:
+    """Tests for the batch and range pause hooks."""
+
+    async def test_batch_hook_updates_batch(self):
+        """Test that the batch hook pauses and unpauses the batch row."""
+        batch_id = uuid4()
+        hook = batch_pause_hook(batch_id)
+
+        with patch('services.broker_pause.pause_batch', new_callable=AsyncMock) as mock_pause, \
+             patch('services.broker_pause.unpause_batch', new_callable=AsyncMock) as mock_unpause:
+            await hook("broker down")
+            await hook(None)
+
+        mock_pause.assert_awaited_once_with(batch_id, "broker down")
+        mock_unpause.assert_awaited_once_with(batch_id)
+
+    async def test_batch_hook_throttles_batch(self):
+        """Test that the batch hook records throttling on the batch row."""
+        batch_id = uuid4()
+        hook = batch_pause_hook(batch_id)
+
+        with patch('services.broker_pause.throttle_batch', new_callable=AsyncMock) as mock_throttle, \
+             patch('services.broker_pause.pause_batch', new_callable=AsyncMock) as mock_pause:
+            await hook("queue full", "throttled")
+
+        mock_throttle.assert_awaited_once_with(batch_id, "queue full")
+        mock_pause.assert_not_awaited()
+
+    async def test_range_pauses_merge_into_batch(self):
+        """Test that the batch stays paused while any range is, with a heartbeat per sync."""
+        batch_id = uuid4()
+        progress_queue = queue.Queue()
+        pauses = RangePauses(batch_id)
+
+        await range_pause_hook(progress_queue, 0)("broker down")
+        await range_pause_hook(progress_queue, 1)("broker down")
+        await range_pause_hook(progress_queue, 0)(None)
+
+        with patch('services.broker_pause.pause_batch', new_callable=AsyncMock) as mock_pause, \
+             patch('services.broker_pause.unpause_batch', new_callable=AsyncMock) as mock_unpause:
+            await pauses.sync()  # Nothing reported yet
+            while not progress_queue.empty():
+                pauses.record(*progress_queue.get_nowait())
+            await pauses.sync()
+            await pauses.sync()
+            pauses.record(1, None)
+            await pauses.sync()
+            await pauses.sync()
+
+        assert mock_pause.await_args_list == [call(batch_id, "broker down")] * 2
+        mock_unpause.assert_awaited_once_with(batch_id)
+
+    async def test_paused_range_outranks_throttled_range(self):
+        """Test that the batch is paused while any range is, else throttled while any range is."""
+        batch_id = uuid4()
+        pauses = RangePauses(batch_id)
+
+        with patch('services.broker_pause.pause_batch', new_callable=AsyncMock) as mock_pause, \
+             patch('services.broker_pause.throttle_batch', new_callable=AsyncMock) as mock_throttle, \
+             patch('services.broker_pause.unpause_batch', new_callable=AsyncMock) as mock_unpause:
+            pauses.record(0, "queue full", "throttled")
+            pauses.record(1, "broker down")
+            await pauses.sync()
+            pauses.record(1, None)
+            await pauses.sync()
+            pauses.record(0, None, "throttled")
+            await pauses.sync()
+
+        mock_pause.assert_awaited_once_with(batch_id, "broker down")
+        mock_throttle.assert_awaited_once_with(batch_id, "queue full")
+        mock_unpause.assert_awaited_once_with(batch_id)
@@ -0,0 +1,240 @@
+"""
+Unit tests for the columnar chunk validator.
+
+Verifies that vectorized validation matches the per-row Pydantic path:
+- raw_data payloads identical to model_dump(exclude_none=True)
+- Empty-to-null and whitespace handling
+- Float/int parsing (fast path and fallback)
+- Required-field checks and error reasons
+- Arrow tables/record batches validate identically to DataFrames
+"""
+
+import pytest
+import pandas as pd
+import pyarrow as pa
+from pydantic import ValidationError
+
+from shared.models import V11ParcelRecord, RETRRecord, DFIRecord
+from services.chunk_validator import get_chunk_validator, ChunkValidator
+
+
+def _expected(model_class, chunk: pd.DataFrame):
+    """Reference results using the original per-row Pydantic path."""
+    expected = []
+    for _, row in chunk.iterrows():
+        row_dict = {
+            k: (v if pd.notna(v) and v != '' else None)
+            for k, v in row.to_dict().items()
+        }
+        try:
+            expected.append(model_class(**row_dict).model_dump(exclude_none=True))
+        except ValidationError:
+            expected.append(None)
+    return expected
+
+
+class TestPayloadEquivalence:
+    """raw_data payloads must match model_dump(exclude_none=True) exactly."""
+
+    def test_parcel_chunk_matches_model_dump(self):
+        """Test parcel rows with mixed whitespace, empties and numbers."""
+        chunk = pd.DataFrame({
+            "STATEID": ["WI001", "  WI002  ", "", "WI004", "WI005"],
+            "OWNERNME1": ["Jane Doe", "   ", "Bob", "José Núñez", "A\x1cB\x1c"],
+            "CNTASSDVALUE": ["350000.00", "1_000", "", "1e3", "abc"],
+            "GISACRES": [".5", "5.", "inf", " 2.25 ", "+3"],
+            "geometry_wkt": ["POLYGON((0 0,1 0,1 1,0 0))"] * 4 + [""],
+            "geometry_type": ["Polygon"] * 5,
+            "EXTRA_COLUMN": ["ignored"] * 5,
+        }, dtype=object)
+
+        result = get_chunk_validator(V11ParcelRecord).validate(chunk)
+
+        assert result.records == _expected(V11ParcelRecord, chunk)
+
+    def test_retr_int_field_matches_model_dump(self):
+        """Test int parsing including values pydantic accepts only via fallback."""
+        chunk = pd.DataFrame({
+            "PARCEL_ID": ["1", "2", "3", "4", "5"],
+            "NUM_PARCELS": ["3", "00012", "3.0", "3.5", " 4 "],
+            "SALE_AMOUNT": ["350000.00", "-12.5E2", "", "0", "1,000"],
+        }, dtype=object)
+
+        result = get_chunk_validator(RETRRecord).validate(chunk)
+
+        assert result.records == _expected(RETRRecord, chunk)
+
+    def test_nan_cells_treated_as_missing(self):
+        """Test that NaN (short rows) becomes null like empty strings."""
+        chunk = pd.DataFrame({
+            "ENTITY_ID": ["E1", float("nan")],
+            "ENTITY_NAME": [float("nan"), "Acme LLC"],
+        }, dtype=object)
+
+        result = get_chunk_validator(DFIRecord).validate(chunk)
+
+        assert result.records == [{"ENTITY_ID": "E1"}, {"ENTITY_NAME": "Acme LLC"}]
+
+    def test_handles_pandas_string_dtype(self):
+        """Test chunks read with a pandas string dtype."""
+        chunk = pd.DataFrame({
+            "PARCEL_ID": [" 12-345 ", ""],
+            "SALE_AMOUNT": ["275000.00", "12"],
+        }, dtype="string")
+
+        result = get_chunk_validator(RETRRecord).validate(chunk)
+
+        assert result.records == [
+            {"PARCEL_ID": "12-345", "SALE_AMOUNT": 275000.0},
+            {"SALE_AMOUNT": 12.0},
+        ]
+
+
+class TestValidityMaskAndErrors:
+    """Tests for the validity mask and per-row error reasons."""
+
+    def test_flags_missing_required_geometry(self):
+        """Test required geometry fields produce per-row errors."""
+        chunk = pd.DataFrame({
+            "STATEID": ["WI001", "WI002"],
+            "geometry_wkt": ["POINT(0 0)", ""],
+            "geometry_type": ["Point", "Point"],
+        }, dtype=object)
+
+        result = get_chunk_validator(V11ParcelRecord).validate(chunk)
+
+        assert result.valid_mask.tolist() == [True, False]
+        assert result.valid_count == 1
+        assert result.failed_count == 1
+        assert result.errors[0] is None
+        assert "geometry_wkt" in result.errors[1]
+        assert result.records[1] is None
+
+    def test_missing_required_column_fails_every_row(self):
+        """Test a missing required column fails all rows."""
+        chunk = pd.DataFrame({"STATEID": ["WI001", "WI002"]}, dtype=object)
+
+        result = get_chunk_validator(V11ParcelRecord).validate(chunk)
+
+        assert result.failed_count == 2
+        assert all("geometry_wkt: Field required" in e for e in result.errors)
+        assert all("geometry_type: Field required" in e for e in result.errors)
+
+    def test_reports_unparseable_number(self):
+        """Test float parse failures carry the pydantic message."""
+        chunk = pd.DataFrame({"SALE_AMOUNT": ["not-a-number"]}, dtype=object)
+
+        result = get_chunk_validator(RETRRecord).validate(chunk)
+
+        assert result.valid_mask.tolist() == [False]
+        assert result.errors[0].startswith("SALE_AMOUNT: Input should be a valid number")
+
+    def test_non_string_values_use_model_rules(self):
+        """Test non-string cells (e.g. from GDB attributes) follow pydantic coercion."""
+        chunk = pd.DataFrame({
+            "ENTITY_ID": [123, "E2"],
+        }, dtype=object)
+
+        result = get_chunk_validator(DFIRecord).validate(chunk)
+
+        assert result.valid_mask.tolist() == [False, True]
+        assert "ENTITY_ID" in result.errors[0]
+
+    def test_empty_chunk(self):
+        """Test validating an empty chunk."""
+        chunk = pd.DataFrame({"PARCEL_ID": []}, dtype=object)
+
+        result = get_chunk_validator(RETRRecord).validate(chunk)
+
+        assert result.records == []
+        assert result.valid_count == 0
+
+
+class TestArrowValidation:
+    """validate_arrow must match validate on the same data."""
+
+    @pytest.mark.parametrize("model_class, data", [
+        (V11ParcelRecord, {
+            "STATEID": ["WI001", "  WI002  ", "", "WI004"],
+            "OWNERNME1": ["Jane Doe", "   ", "José Núñez", "A\x1cB\x1c"],
+            "CNTASSDVALUE": ["350000.00", "1_000", "", "abc"],
+            "GISACRES": [".5", "inf", " 2.25 ", "+3"],
+            "geometry_wkt": ["POINT(0 0)"] * 3 + [""],
+            "geometry_type": ["Point"] * 4,
+        }),
+        (RETRRecord, {
+            "PARCEL_ID": ["1", "2", "3", "4", "5"],
+            "NUM_PARCELS": ["+3", "00012", "3.5", "99999999999999999999", "-0"],
+            "SALE_AMOUNT": ["-12.5E2", "", "0", "1,000", "-0"],
+        }),
+    ])
+    def test_matches_dataframe_validation(self, model_class, data):
+        """Test payloads and errors match the pandas path exactly."""
+        chunk = pd.DataFrame(data, dtype=object)
+        validator = get_chunk_validator(model_class)
+
+        expected = validator.validate(chunk)
+        for arrow_chunk in (
+            pa.Table.from_pydict(data),
+            pa.RecordBatch.from_pydict(data),
+        ):
+            result = validator.validate_arrow(arrow_chunk)
+            assert result.records == expected.records
+            assert result.errors == expected.errors
+            assert result.valid_mask.tolist() == expected.valid_mask.tolist()
+
+    def test_non_ascii_digits_match_model(self):
+        """Test Unicode and full-width digits are rejected by both engines, as by the model."""
+        data = {
+            "PARCEL_ID": ["1", "2", "3", "4"],
+            "NUM_PARCELS": ["12", "\u0661\u0662", "\uff11\uff12", "3"],
+            "SALE_AMOUNT": ["\u0661\u0662", "12", "1.5", "\uff11\uff12.5"],
+        }
+        chunk = pd.DataFrame(data, dtype=object)
+        validator = get_chunk_validator(RETRRecord)
+        expected = _expected(RETRRecord, chunk)
+
+        result = validator.validate(chunk)
+        arrow_result = validator.validate_arrow(pa.table(data))
+
+        assert expected == [None] * 4
+        assert result.records == expected
+        assert arrow_result.records == expected
+        assert arrow_result.errors == result.errors
+
+    def test_null_cells_treated_as_missing(self):
+        """Test Arrow nulls behave like empty strings."""
+        table = pa.table({"ENTITY_ID": ["E1", None], "ENTITY_NAME": [None, "Acme LLC"]})
+
+        result = get_chunk_validator(DFIRecord).validate_arrow(table)
+
+        assert result.records == [{"ENTITY_ID": "E1"}, {"ENTITY_NAME": "Acme LLC"}]
+
+    def test_non_string_columns_use_model_rules(self):
+        """Test typed Arrow columns fall back to pydantic coercion."""
+        table = pa.table({"SALE_AMOUNT": [1.5, None], "NUM_PARCELS": [2, 3]})
+
+        result = get_chunk_validator(RETRRecord).validate_arrow(table)
+
+        assert result.records == [
+            {"SALE_AMOUNT": 1.5, "NUM_PARCELS": 2},
+            {"NUM_PARCELS": 3},
+        ]
+
+
+class TestGetChunkValidator:
+    """Tests for validator caching."""
+
+    def test_returns_cached_validator(self):
+        """Test validators are compiled once per model."""
+        assert get_chunk_validator(RETRRecord) is get_chunk_validator(RETRRecord)
+
+    def test_compiles_field_specs(self):
+        """Test field kinds and required flags are derived from the model."""
+        validator = ChunkValidator(V11ParcelRecord)
+        specs = {spec.name: spec for spec in validator.fields}
+
+        assert specs["STATEID"].kind == "str"
+        assert specs["CNTASSDVALUE"].kind == "float"
+        assert specs["geometry_wkt"].required is True
+        assert specs["STATEID"].required is False
@@ -0,0 +1,86 @@
+"""
+Unit tests for the CRS transformation service.
+
+Tests the process-wide transformer cache and that array transforms match
+per-coordinate pyproj transforms for 2D, 3D and multi-part geometries.
+"""
+
+import numpy as np
+import pytest
+import shapely
+from pyproj import CRS, Transformer
+from shapely.geometry import MultiPolygon, Point, Polygon
+
+from services.crs_transform import (
+    _cached_transformer,
+    get_transformer,
+    transform_geometries,
+    transform_geometry,
+    transformer_for,
+)
+
+
+def reference_transform(geometry, source="EPSG:4326"):
+    """Transform coordinate by coordinate with a fresh Transformer."""
+    transformer = Transformer.from_crs(source, "EPSG:3071", always_xy=True)
+    return shapely.transform(
+        geometry,
+        lambda coords: np.array([transformer.transform(*c) for c in coords]),
+        include_z=shapely.has_z(geometry)
+    )
+
+
+class TestTransformerCache:
+    """Tests for get_transformer and transformer_for functions."""
+
+    def test_reuses_transformers(self):
+        """Test equal source CRSs share one Transformer, however they are given."""
+        first = transformer_for("EPSG:4326")
+        second = transformer_for(CRS.from_epsg(4326))
+        third = get_transformer(CRS.from_epsg(4326).to_wkt())
+
+        assert first is second is third
+        assert _cached_transformer.cache_info().hits >= 2
+
+    def test_no_transformer_for_target_crs(self):
+        """Test layers already in EPSG:3071 need no transformation."""
+        assert transformer_for("EPSG:3071") is None
+
+    def test_other_targets(self):
+        """Test the target EPSG is part of the cache key."""
+        assert transformer_for("EPSG:4326", 3071) is not transformer_for("EPSG:4326", 26916)
+
+    def test_rejects_unknown_crs(self):
+        """Test unparseable CRSs raise."""
+        with pytest.raises(Exception):
+            transformer_for("not a crs")
+
+
+class TestTransformGeometries:
+    """Tests for transform_geometries and transform_geometry functions."""
+
+    def test_matches_per_coordinate_transform(self):
+        """Test 2D, 3D and multi-part geometries transform like pyproj per coordinate."""
+        square = Polygon([(-89.4, 43.0), (-89.3, 43.0), (-89.3, 43.1), (-89.4, 43.1)])
+        geometries = np.array([
+            square,
+            Point(-89.4, 43.07, 260.0),
+            MultiPolygon([square, shapely.affinity.translate(square, 0.5)]),
+        ], dtype=object)
+
+        result = transform_geometries(geometries, transformer_for("EPSG:4326"))
+
+        for actual, geometry in zip(result, geometries):
+            expected = reference_transform(geometry)
+            assert actual.geom_type == geometry.geom_type
+            assert shapely.has_z(actual) == shapely.has_z(geometry)
+            assert shapely.equals_exact(actual, expected, tolerance=1e-6)
+
+    def test_single_geometry(self):
+        """Test one geometry transforms like the array form."""
+        point = Point(-89.4, 43.07)
+        transformer = transformer_for("EPSG:4326")
+
+        assert transform_geometry(point, transformer).equals(
+            transform_geometries(np.array([point], dtype=object), transformer)[0]
+        )
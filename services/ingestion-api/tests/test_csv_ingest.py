@@ -11,7 +11,9 @@ Tests CSV file upload, validation, processing, and error handling:
 """
 
 import pytest
+import queue
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from uuid import uuid4
 from unittest.mock import AsyncMock, MagicMock, patch, call
@@ -19,6 +21,7 @@ import pandas as pd
 from fastapi.testclient import TestClient
 
 from main import app
+from shared.hash_utils import HASH_VERSION, compute_parcel_hash, compute_retr_hash
 from services.csv_processor import (
     detect_encoding,
     validate_csv_columns,
@@ -26,6 +29,33 @@ from services.csv_processor import (
     count_csv_rows,
     validate_csv_format
 )
+from services import csv_processor
+from services.csv_ranges import plan_csv_ranges
+from services.upload_inspector import UploadInspector
+
+
+def inspect_file(csv_path, chunk_size=1024 * 1024):
+    """Run an UploadInspector over a file the way the upload path does."""
+    inspector = UploadInspector()
+    with open(csv_path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            inspector.feed(chunk)
+    return inspector.finish()
+
+
+def publish_all(queue, messages):
+    """publish_batch stand-in where the broker confirms every message."""
+    return [True] * len(messages)
+
+
+def publish_none(queue, messages):
+    """publish_batch stand-in where the broker confirms nothing."""
+    return [False] * len(messages)
+
+
+def published_count(mock_publish):
+    """Total number of messages handed to a mocked publish_batch."""
+    return sum(len(c.args[1]) for c in mock_publish.call_args_list)
 
 
 @pytest.fixture
@@ -158,7 +188,7 @@ class TestProcessCSVAsync:
         """Test successful parcel CSV processing."""
         batch_id = uuid4()
 
-        with patch('services.csv_processor.publish_message', return_value=True) as mock_publish, \
+        with patch('services.csv_processor.publish_batch', side_effect=publish_all) as mock_publish, \
              patch('services.csv_processor.update_batch_progress', new_callable=AsyncMock) as mock_update, \
              patch('services.csv_processor.complete_batch', new_callable=AsyncMock) as mock_complete:
 
@@ -171,7 +201,7 @@ class TestProcessCSVAsync:
             )
 
             # Verify RabbitMQ publishing
-            assert mock_publish.call_count == 3  # 3 rows in sample CSV
+            assert published_count(mock_publish) == 3  # 3 rows in sample CSV
 
             # Verify batch progress updated
             assert mock_update.called
@@ -184,7 +214,7 @@ class TestProcessCSVAsync:
         """Test successful RETR CSV processing."""
         batch_id = uuid4()
 
-        with patch('services.csv_processor.publish_message', return_value=True) as mock_publish, \
+        with patch('services.csv_processor.publish_batch', side_effect=publish_all) as mock_publish, \
              patch('services.csv_processor.update_batch_progress', new_callable=AsyncMock), \
              patch('services.csv_processor.complete_batch', new_callable=AsyncMock):
 
@@ -195,14 +225,15 @@ class TestProcessCSVAsync:
                 source_name="Test RETR"
             )
 
-            assert mock_publish.call_count == 3
+            assert published_count(mock_publish) == 3
+            assert mock_publish.call_count == 1  # One confirmed batch per chunk
 
     @pytest.mark.asyncio
     async def test_publishes_correct_message_format(self, sample_parcel_csv):
         """Test that messages are published in correct format."""
         batch_id = uuid4()
 
-        with patch('services.csv_processor.publish_message', return_value=True) as mock_publish, \
+        with patch('services.csv_processor.publish_batch', side_effect=publish_all) as mock_publish, \
              patch('services.csv_processor.update_batch_progress', new_callable=AsyncMock), \
              patch('services.csv_processor.complete_batch', new_callable=AsyncMock):
 
@@ -215,7 +246,8 @@ class TestProcessCSVAsync:
 
             # Check first message format
             first_call = mock_publish.call_args_list[0]
-            queue, message = first_call[0]
+            queue, messages = first_call[0]
+            message = messages[0]
 
             assert queue == "deduplication"
             assert message["batch_id"] == str(batch_id)
@@ -224,13 +256,48 @@ class TestProcessCSVAsync:
             assert "source_row_number" in message
             assert "raw_data" in message
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("engine", ["pandas", "arrow"])
+    async def test_attaches_geometry_metrics(self, tmp_path, engine):
+        """Test parcel messages carry the bbox, centroid and area of their geometry_wkt."""
+        csv_file = tmp_path / "parcels.csv"
+        csv_file.write_text(
+            "STATEID,geometry_wkt,geometry_type\n"
+            'WI1,"POLYGON((0 0, 4 0, 4 2, 0 2, 0 0))",Polygon\n'
+            'WI2,"MULTIPOLYGON(((10 10, 12 10, 12 12, 10 12, 10 10)))",MultiPolygon\n'
+            "WI3,not wkt,Polygon\n"
+        )
+
+        with patch('services.csv_processor.publish_batch', side_effect=publish_all) as mock_publish, \
+             patch('services.csv_processor.update_batch_progress', new_callable=AsyncMock), \
+             patch('services.csv_processor.complete_batch', new_callable=AsyncMock):
+
+            await process_csv_async(
+                csv_path=csv_file,
+                source_type="PARCEL",
+                batch_id=uuid4(),
+                source_name="Test Parcels",
+                parser_engine=engine
+            )
+
+        messages = [m for c in mock_publish.call_args_list for m in c.args[1]]
+        assert messages[0]["bbox"] == [0.0, 0.0, 4.0, 2.0]
+        assert messages[0]["centroid"] == [2.0, 1.0]
+        assert messages[0]["area"] == 8.0
+        assert messages[1]["raw_data"]["centroid_x"] == 11.0
+        assert messages[1]["raw_data"]["area"] == 4.0
+        # Unparseable WKT is published without metrics
+        assert "bbox" not in messages[2]
+        assert "area" not in messages[2]["raw_data"]
+        assert [m["content_hash"] for m in messages] == [compute_parcel_hash(m["raw_data"]) for m in messages]
+
     @pytest.mark.asyncio
     async def test_handles_failed_messages(self, sample_parcel_csv):
         """Test handling of failed message publishing."""
         batch_id = uuid4()
 
         # Simulate some messages failing
-        with patch('services.csv_processor.publish_message', return_value=False) as mock_publish, \
+        with patch('services.csv_processor.publish_batch', side_effect=publish_none) as mock_publish, \
              patch('services.csv_processor.update_batch_progress', new_callable=AsyncMock) as mock_update, \
              patch('services.csv_processor.complete_batch', new_callable=AsyncMock):
 
@@ -252,11 +319,11 @@ class TestProcessCSVAsync:
         batch_id = uuid4()
 
         # Make every message fail
-        with patch('services.csv_processor.publish_message', side_effect=Exception("Test error")), \
+        with patch('services.csv_processor.publish_batch', side_effect=Exception("Test error")), \
              patch('services.csv_processor.update_batch_progress', new_callable=AsyncMock) as mock_update, \
              patch('services.csv_processor.complete_batch', new_callable=AsyncMock) as mock_complete:
 
-            # Should NOT raise - exceptions are caught per-row
+            # Should NOT raise - publish exceptions fail the chunk's rows
             await process_csv_async(
                 csv_path=sample_parcel_csv,
                 source_type="PARCEL",
@@ -284,10 +351,9 @@ class TestProcessCSVAsync:
         batch_id = uuid4()
         chunk_size = 3
 
-        with patch('services.csv_processor.publish_message', return_value=True), \
+        with patch('services.csv_processor.publish_batch', side_effect=publish_all), \
              patch('services.csv_processor.update_batch_progress', new_callable=AsyncMock) as mock_update, \
-             patch('services.csv_processor.complete_batch', new_callable=AsyncMock), \
-             patch('services.csv_processor.SOURCE_TYPE_MODELS', {"RETR": MagicMock(return_value=MagicMock(model_dump=lambda **kw: {}))}):
+             patch('services.csv_processor.complete_batch', new_callable=AsyncMock):
 
             await process_csv_async(
                 csv_path=csv_file,
@@ -301,6 +367,320 @@ class TestProcessCSVAsync:
             # 10 rows / 3 per chunk = 4 chunks
             assert mock_update.call_count == 4
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("bom", ["", "\ufeff"])  # Excel exports start with a BOM
+    async def test_arrow_engine_matches_pandas(self, tmp_path, bom):
+        """Test the arrow engine publishes the same messages as the pandas engine."""
+        csv_file = tmp_path / "retr.csv"
+        csv_file.write_text(
+            bom + " PARCEL_ID ,SALE_AMOUNT,NUM_PARCELS,GRANTOR\n"
+            "001,275000.00,1,\"Smith, John\"\n"
+            "002,,2,  Doe Jane  \n"
+            "\n"
+            "003,not-a-number,1,\"Multi\nLine\"\n"
+            "004,1e3,+2,Acme LLC\n"
+            "005,-12.5,3,Núñez\n",
+            encoding="utf-8"
+        )
+
+        published = {}
+        for engine in ("pandas", "arrow"):
+            with patch('services.csv_processor.publish_batch', side_effect=publish_all) as mock_publish, \
+                 patch('services.csv_processor.update_batch_progress', new_callable=AsyncMock) as mock_update, \
+                 patch('services.csv_processor.complete_batch', new_callable=AsyncMock) as mock_complete:
+
+                await process_csv_async(
+                    csv_path=csv_file,
+                    source_type="RETR",
+                    batch_id=uuid4(),
+                    source_name="Test RETR",
+                    chunk_size=2,
+                    parser_engine=engine
+                )
+
+            published[engine] = [
+                (m["source_row_number"], m["raw_data"])
+                for c in mock_publish.call_args_list for m in c.args[1]
+            ]
+            assert mock_update.call_count == 3
+            assert mock_complete.call_args.args[1] == 5
+
+        assert published["arrow"] == published["pandas"]
+        assert [row for row, _ in published["arrow"]] == [1, 2, 4, 5]
+        assert published["arrow"][0][1]["PARCEL_ID"] == "001"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("engine", ["pandas", "arrow"])
+    async def test_attaches_content_hashes(self, tmp_path, engine):
+        """Test every message carries the canonical content hash of its raw_data."""
+        csv_file = tmp_path / "retr.csv"
+        csv_file.write_text(
+            "PARCEL_ID,TRANSFER_DATE,GRANTOR,SALE_AMOUNT\n"
+            "12-345,03/01/2024,Smith,250000\n"
+            "12 345,2024-03-01, SMITH ,250000.00\n"
+            "99-999,,Doe,\n"
+        )
+
+        with patch('services.csv_processor.publish_batch', side_effect=publish_all) as mock_publish, \
+             patch('services.csv_processor.update_batch_progress', new_callable=AsyncMock), \
+             patch('services.csv_processor.complete_batch', new_callable=AsyncMock):
+
+            await process_csv_async(
+                csv_path=csv_file,
+                source_type="RETR",
+                batch_id=uuid4(),
+                source_name="Test RETR",
+                chunk_size=2,
+                parser_engine=engine
+            )
+
+        messages = [m for c in mock_publish.call_args_list for m in c.args[1]]
+        assert [m["content_hash"] for m in messages] == [
+            compute_retr_hash(m["raw_data"]) for m in messages
+        ]
+        assert all(m["hash_version"] == HASH_VERSION for m in messages)
+        # Same transfer after normalization
+        assert messages[0]["content_hash"] == messages[1]["content_hash"]
+        assert messages[2]["content_hash"] != messages[0]["content_hash"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("engine", ["pandas", "arrow"])
+    async def test_suppresses_known_duplicates(self, tmp_path, engine):
+        """Test rows whose hash is in the local index are counted, not published."""
+        csv_file = tmp_path / "retr.csv"
+        csv_file.write_text(
+            "PARCEL_ID,GRANTOR,SALE_AMOUNT\n"
+            "12-345,Smith,250000\n"
+            "12-346,Jones,180000\n"
+            "12-347,Doe,99000\n"
+        )
+        index_path = tmp_path / "content_hashes.bin"
+        known = compute_retr_hash({"PARCEL_ID": "12-346", "GRANTOR": "Jones", "SALE_AMOUNT": 180000.0})
+        index_path.write_bytes(bytes.fromhex(known))
+
+        with patch('services.csv_processor.publish_batch', side_effect=publish_all) as mock_publish, \
+             patch('services.csv_processor.update_batch_progress', new_callable=AsyncMock) as mock_progress, \
+             patch('services.csv_processor.complete_batch', new_callable=AsyncMock):
+
+            await process_csv_async(
+                csv_path=csv_file,
+                source_type="RETR",
+                batch_id=uuid4(),
+                source_name="Test RETR",
+                chunk_size=10,
+                parser_engine=engine,
+                hash_index_path=index_path
+            )
+
+        messages = [m for c in mock_publish.call_args_list for m in c.args[1]]
+        assert [m["source_row_number"] for m in messages] == [1, 3]
+        assert known not in [m["content_hash"] for m in messages]
+
+        progress = mock_progress.call_args.kwargs
+        assert progress["processed_count"] == 3
+        assert progress["new_count"] == 2
+        assert progress["duplicate_count"] == 1
+        assert progress["failed_count"] == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("engine", ["pandas", "arrow"])
+    async def test_parallel_ranges_preserve_row_numbers(self, tmp_path, engine):
+        """Test parallel byte-range processing publishes the same rows as sequential."""
+        rows = "".join(
+            f'{i},"Owner {i}\nc/o Agent",{i}.50\n' + ("\n" if i % 5 == 0 else "")
+            for i in range(1, 301)
+        )
+        csv_file = tmp_path / "retr.csv"
+        csv_file.write_text("PARCEL_ID,GRANTOR,SALE_AMOUNT\n" + rows)
+
+        def thread_executor(workers):
+            progress = queue.Queue()
+            executor = ThreadPoolExecutor(
+                max_workers=workers,
+                initializer=csv_processor._init_range_worker,
+                initargs=(progress,)
+            )
+            return executor, progress
+
+        published = {}
+        for workers in (1, 4):
+            with patch('services.csv_processor.publish_batch', side_effect=publish_all) as mock_publish, \
+                 patch('services.csv_processor.update_batch_progress', new_callable=AsyncMock) as mock_update, \
+                 patch('services.csv_processor.complete_batch', new_callable=AsyncMock) as mock_complete, \
+                 patch('services.csv_processor._create_range_executor', side_effect=thread_executor), \
+                 patch('services.csv_processor.plan_csv_ranges',
+                       side_effect=lambda path, n, inspection: plan_csv_ranges(
+                           path, n, inspection, min_range_bytes=1)) as mock_plan:
+
+                await process_csv_async(
+                    csv_path=csv_file,
+                    source_type="RETR",
+                    batch_id=uuid4(),
+                    source_name="Test RETR",
+                    chunk_size=40,
+                    parser_engine=engine,
+                    workers=workers
+                )
+
+            published[workers] = sorted(
+                (m["source_row_number"], m["raw_data"]["PARCEL_ID"])
+                for c in mock_publish.call_args_list for m in c.args[1]
+            )
+            assert mock_complete.call_args.args[1] == 300
+            assert sum(c.kwargs["processed_count"] for c in mock_update.call_args_list) == 300
+
+        assert mock_plan.called
+        assert published[4] == published[1]
+        assert published[4] == [(i, str(i)) for i in range(1, 301)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("engine", ["pandas", "arrow"])
+    async def test_resumes_from_sequential_checkpoint(self, tmp_path, engine):
+        """Test a resumed run continues after the checkpointed row from its byte offset."""
+        rows = "".join(f'{i},"Owner {i}\nc/o Agent",{i}.50\n' for i in range(1, 301))
+        csv_file = tmp_path / "retr.csv"
+        csv_file.write_text("PARCEL_ID,GRANTOR,SALE_AMOUNT\n" + rows)
+
+        inspector = UploadInspector(boundary_bytes=256)
+        inspector.feed(csv_file.read_bytes())
+        inspection = inspector.finish()
+
+        with patch('services.csv_processor.publish_batch', side_effect=publish_all), \
+             patch('services.csv_processor.update_batch_progress', new_callable=AsyncMock) as mock_update, \
+             patch('services.csv_processor.complete_batch', new_callable=AsyncMock):
+
+            await process_csv_async(
+                csv_path=csv_file,
+                source_type="RETR",
+                batch_id=uuid4(),
+                source_name="Test RETR",
+                chunk_size=40,
+                inspection=inspection,
+                parser_engine=engine
+            )
+
+        checkpoints = [c.kwargs["checkpoint"] for c in mock_update.call_args_list]
+        assert [cp["row_number"] for cp in checkpoints] == [40, 80, 120, 160, 200, 240, 280, 300]
+        checkpoint = checkpoints[2]
+        assert 0 < checkpoint["rows_before"] <= 120
+
+        with patch('services.csv_processor.publish_batch', side_effect=publish_all) as mock_publish, \
+             patch('services.csv_processor.update_batch_progress', new_callable=AsyncMock) as mock_update, \
+             patch('services.csv_processor.complete_batch', new_callable=AsyncMock) as mock_complete, \
+             patch('services.csv_processor.detect_encoding') as mock_detect:
+
+            await process_csv_async(
+                csv_path=csv_file,
+                source_type="RETR",
+                batch_id=uuid4(),
+                source_name="Test RETR",
+                chunk_size=40,
+                parser_engine=engine,
+                encoding="utf-8",
+                resume_from=checkpoint
+            )
+
+        mock_detect.assert_not_called()
+        assert [
+            (m["source_row_number"], m["raw_data"]["PARCEL_ID"])
+            for c in mock_publish.call_args_list for m in c.args[1]
+        ] == [(i, str(i)) for i in range(121, 301)]
+        assert sum(c.kwargs["processed_count"] for c in mock_update.call_args_list) == 180
+        assert mock_complete.call_args.args[1] == 300
+
+    @pytest.mark.asyncio
+    async def test_resumes_parallel_ranges(self, tmp_path):
+        """Test a resumed parallel run skips finished ranges and rows already done."""
+        rows = "".join(f'{i},"Owner {i}",{i}.50\n' for i in range(1, 301))
+        csv_file = tmp_path / "retr.csv"
+        csv_file.write_text("PARCEL_ID,GRANTOR,SALE_AMOUNT\n" + rows)
+
+        ranges = plan_csv_ranges(csv_file, 3, min_range_bytes=1)
+        assert len(ranges) == 3
+        resumed = [
+            {"index": r.index, "start": r.start, "end": r.end, "rows_before": r.rows_before,
+             "rows_done": 0, "done": False}
+            for r in ranges
+        ]
+        resumed[0].update(rows_done=ranges[1].rows_before, done=True)
+        resumed[1]["rows_done"] = 10
+
+        def thread_executor(workers):
+            progress = queue.Queue()
+            executor = ThreadPoolExecutor(
+                max_workers=workers,
+                initializer=csv_processor._init_range_worker,
+                initargs=(progress,)
+            )
+            return executor, progress
+
+        with patch('services.csv_processor.publish_batch', side_effect=publish_all) as mock_publish, \
+             patch('services.csv_processor.update_batch_progress', new_callable=AsyncMock) as mock_update, \
+             patch('services.csv_processor.complete_batch', new_callable=AsyncMock) as mock_complete, \
+             patch('services.csv_processor._create_range_executor', side_effect=thread_executor):
+
+            await process_csv_async(
+                csv_path=csv_file,
+                source_type="RETR",
+                batch_id=uuid4(),
+                source_name="Test RETR",
+                chunk_size=25,
+                encoding="utf-8",
+                resume_from={"ranges": resumed}
+            )
+
+        skipped = ranges[1].rows_before + 10
+        assert sorted(
+            m["source_row_number"] for c in mock_publish.call_args_list for m in c.args[1]
+        ) == list(range(skipped + 1, 301))
+        assert sum(c.kwargs["processed_count"] for c in mock_update.call_args_list) == 300 - skipped
+        assert mock_complete.call_args.args[1] == 300
+
+        final = mock_update.call_args_list[-1].kwargs["checkpoint"]["ranges"]
+        assert all(entry["done"] for entry in final)
+        assert sum(entry["rows_done"] for entry in final) == 300
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_parser_engine(self, sample_retr_csv):
+        """Test an unknown parser engine fails the batch."""
+        batch_id = uuid4()
+
+        with patch('services.csv_processor.publish_batch', side_effect=publish_all), \
+             patch('services.csv_processor.fail_batch', new_callable=AsyncMock) as mock_fail:
+
+            await process_csv_async(
+                csv_path=sample_retr_csv,
+                source_type="RETR",
+                batch_id=batch_id,
+                source_name="Test RETR",
+                parser_engine="polars"
+            )
+
+            assert "Unsupported CSV parser engine" in mock_fail.call_args.args[1]
+
+    @pytest.mark.asyncio
+    async def test_reuses_upload_inspection(self, sample_parcel_csv):
+        """Test that an upload inspection skips encoding detection and the sample read."""
+        batch_id = uuid4()
+        inspection = inspect_file(sample_parcel_csv)
+
+        with patch('services.csv_processor.publish_batch', side_effect=publish_all) as mock_publish, \
+             patch('services.csv_processor.detect_encoding') as mock_detect, \
+             patch('services.csv_processor.update_batch_progress', new_callable=AsyncMock), \
+             patch('services.csv_processor.complete_batch', new_callable=AsyncMock) as mock_complete:
+
+            await process_csv_async(
+                csv_path=sample_parcel_csv,
+                source_type="PARCEL",
+                batch_id=batch_id,
+                source_name="Test Parcels",
+                inspection=inspection
+            )
+
+            mock_detect.assert_not_called()
+            assert published_count(mock_publish) == 3
+            mock_complete.assert_called_once_with(batch_id, 3)
+
 
 class TestCountCSVRows:
     """Tests for CSV row counting."""
@@ -348,24 +728,42 @@ class TestValidateCSVFormat:
         assert is_valid is False
         assert error_msg is not None
 
+    def test_validates_from_inspection(self, sample_parcel_csv):
+        """Test validation using an upload inspection instead of re-reading."""
+        inspection = inspect_file(sample_parcel_csv)
+        sample_parcel_csv.unlink()  # Must not be needed any more
+
+        is_valid, error_msg = validate_csv_format(sample_parcel_csv, inspection=inspection)
+        assert is_valid is True
+        assert error_msg is None
+
+    def test_rejects_empty_file_from_inspection(self, tmp_path):
+        """Test empty uploads are rejected from the inspection."""
+        empty = tmp_path / "empty.csv"
+        empty.write_bytes(b"")
+
+        is_valid, error_msg = validate_csv_format(empty, inspection=inspect_file(empty))
+        assert is_valid is False
+        assert error_msg == "File is empty (0 bytes)"
+
 
 class TestCSVUploadEndpoints:
     """Tests for CSV upload endpoints."""
 
+    @patch('routers.csv_ingest.process_csv_async', new_callable=AsyncMock)
     @patch('routers.csv_ingest.create_batch', new_callable=AsyncMock)
-    @patch('routers.csv_ingest.count_csv_rows', new_callable=AsyncMock)
     @patch('routers.csv_ingest.validate_csv_format', return_value=(True, None))
     @patch('routers.csv_ingest.settings')
-    def test_parcel_csv_upload_success(self, mock_settings, mock_validate, mock_count, mock_create_batch, client, sample_parcel_csv):
+    def test_parcel_csv_upload_success(self, mock_settings, mock_validate, mock_create_batch, mock_process, client, sample_parcel_csv):
         """Test successful parcel CSV upload."""
         # Mock settings
         mock_settings.ALLOWED_CSV_EXTENSIONS = [".csv"]
         mock_settings.max_upload_size_bytes = 5000 * 1024 * 1024
         mock_settings.TEMP_STORAGE_PATH = "/tmp/test"
         mock_settings.BATCH_SIZE = 1000
+        mock_settings.CSV_PARSER_ENGINE = "pandas"
 
         mock_create_batch.return_value = uuid4()
-        mock_count.return_value = 3
 
         with open(sample_parcel_csv, 'rb') as f:
             response = client.post(
@@ -380,6 +778,37 @@ class TestCSVUploadEndpoints:
         assert data["source_type"] == "PARCEL"
         assert data["file_format"] == "CSV"
 
+        # Row count and inspection come from the single upload pass
+        assert data["total_records"] == 3
+        assert mock_create_batch.call_args.kwargs["total_records"] == 3
+        inspection = mock_process.call_args.kwargs["inspection"]
+        assert inspection.row_count == 3
+        assert mock_validate.call_args.kwargs["inspection"] is inspection
+        assert mock_process.call_args.kwargs["parser_engine"] == "pandas"
+
+    @patch('routers.csv_ingest.process_csv_async', new_callable=AsyncMock)
+    @patch('routers.csv_ingest.create_batch', new_callable=AsyncMock)
+    @patch('routers.csv_ingest.settings')
+    def test_parser_engine_selected_per_upload(self, mock_settings, mock_create_batch, mock_process, client, sample_retr_csv):
+        """Test the parser_engine form field overrides the configured default."""
+        mock_settings.ALLOWED_CSV_EXTENSIONS = [".csv"]
+        mock_settings.max_upload_size_bytes = 5000 * 1024 * 1024
+        mock_settings.TEMP_STORAGE_PATH = "/tmp/test"
+        mock_settings.BATCH_SIZE = 1000
+        mock_settings.CSV_PARSER_ENGINE = "pandas"
+
+        mock_create_batch.return_value = uuid4()
+
+        with open(sample_retr_csv, 'rb') as f:
+            response = client.post(
+                "/api/v1/ingest/retr",
+                files={"file": ("test_retr.csv", f, "text/csv")},
+                data={"source_name": "Test RETR 2025", "parser_engine": "arrow"}
+            )
+
+        assert response.status_code == 202
+        assert mock_process.call_args.kwargs["parser_engine"] == "arrow"
+
     @patch('routers.csv_ingest.settings')
     def test_rejects_invalid_file_extension(self, mock_settings, client, tmp_path):
         """Test rejection of invalid file extensions."""
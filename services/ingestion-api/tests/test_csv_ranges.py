@@ -0,0 +1,117 @@
+"""
+Unit tests for CSV byte-range planning.
+
+Tests splitting a CSV into record-aligned byte ranges:
+- Range starts fall on record boundaries (quoted newlines respected)
+- rows_before matches the data rows preceding each range
+- Boundaries from an upload inspection match a fresh scan
+- ByteRangeReader exposes only its slice
+- Ranges of a file starting with a BOM read the same columns as the whole file
+"""
+
+import io
+
+import pandas as pd
+import pytest
+
+from services.csv_processor import read_csv_chunks
+from services.csv_ranges import ByteRangeReader, plan_csv_ranges, scan_record_boundaries
+from services.upload_inspector import UploadInspector
+
+
+@pytest.fixture
+def quoted_csv(tmp_path):
+    """CSV with quoted multi-line fields and blank lines."""
+    rows = "".join(
+        f'{i},"line one\nline two {i}",{i * 1.5}\n' + ("\n" if i % 7 == 0 else "")
+        for i in range(2000)
+    )
+    csv_file = tmp_path / "quoted.csv"
+    csv_file.write_bytes(("ID,NOTE,VALUE\n" + rows).encode("utf-8"))
+    return csv_file
+
+
+def read_range(csv_file, byte_range):
+    """Parse one range with the file's header, as the workers do."""
+    with ByteRangeReader(csv_file, byte_range.start, byte_range.end) as reader:
+        return pd.read_csv(io.BufferedReader(reader), header=None, names=["ID", "NOTE", "VALUE"], dtype=str)
+
+
+class TestPlanCsvRanges:
+    """Tests for plan_csv_ranges."""
+
+    def test_ranges_cover_every_row_once(self, quoted_csv):
+        """Test ranges split on record boundaries and keep row numbering."""
+        ranges = plan_csv_ranges(quoted_csv, max_ranges=4, min_range_bytes=1)
+        from_scan = scan_record_boundaries(quoted_csv)
+
+        assert len(ranges) == 4
+        assert ranges[0].rows_before == 0
+        assert ranges[-1].end == quoted_csv.stat().st_size
+        assert from_scan[1] == 2000
+
+        ids = []
+        for byte_range in ranges:
+            frame = read_range(quoted_csv, byte_range)
+            # rows_before equals the ID of the first row in each range
+            assert int(frame["ID"].iloc[0]) == byte_range.rows_before
+            assert frame["NOTE"].str.startswith("line one\nline two").all()
+            ids.extend(frame["ID"].astype(int).tolist())
+
+        assert ids == list(range(2000))
+
+    def test_uses_inspection_boundaries(self, quoted_csv):
+        """Test planning from upload inspection boundaries matches a fresh scan."""
+        inspector = UploadInspector(boundary_bytes=4096)
+        data = quoted_csv.read_bytes()
+        for start in range(0, len(data), 1000):
+            inspector.feed(data[start:start + 1000])
+        inspection = inspector.finish()
+
+        from_inspection = plan_csv_ranges(quoted_csv, 3, inspection, min_range_bytes=1)
+
+        assert len(from_inspection) == 3
+        for byte_range in from_inspection:
+            frame = read_range(quoted_csv, byte_range)
+            assert int(frame["ID"].iloc[0]) == byte_range.rows_before
+
+    def test_small_file_is_single_range(self, quoted_csv):
+        """Test files below the minimum range size are not split."""
+        ranges = plan_csv_ranges(quoted_csv, max_ranges=8)
+
+        assert len(ranges) == 1
+        assert ranges[0].rows_before == 0
+
+    @pytest.mark.parametrize("engine", ["pandas", "arrow"])
+    def test_ranges_of_bom_file_match_whole_file(self, tmp_path, engine):
+        """Test ranges name columns like a sequential read when the file starts with a BOM."""
+        csv_file = tmp_path / "bom.csv"
+        csv_file.write_bytes(
+            ("\ufeffPARCEL_ID,SALE_AMOUNT\n" + "".join(f"{i:03d},{i}\n" for i in range(300))).encode("utf-8")
+        )
+
+        def rows(chunks):
+            return [
+                row for chunk in chunks
+                for row in (chunk.to_pylist() if engine == "arrow" else chunk.to_dict("records"))
+            ]
+
+        whole = rows(read_csv_chunks(csv_file, "utf-8", 100, engine))
+        ranges = plan_csv_ranges(csv_file, max_ranges=3, min_range_bytes=1)
+        in_ranges = [
+            row for byte_range in ranges
+            for row in rows(read_csv_chunks(csv_file, "utf-8", 100, engine, (byte_range.start, byte_range.end)))
+        ]
+
+        assert len(ranges) == 3
+        assert in_ranges == whole
+        assert whole[0] == {"PARCEL_ID": "000", "SALE_AMOUNT": "0"}
+
+
+def test_byte_range_reader_limits_reads(tmp_path):
+    """Test the reader stops at the end of its range."""
+    data_file = tmp_path / "data.bin"
+    data_file.write_bytes(b"0123456789")
+
+    with ByteRangeReader(data_file, 2, 7) as reader:
+        assert io.BufferedReader(reader, buffer_size=2).read() == b"23456"
@@ -0,0 +1,112 @@
+"""
+Unit tests for streaming encoding detection.
+
+Tests whole-stream encoding decisions:
+- UTF-8, Windows-1252 and Latin-1 files
+- Non-ASCII bytes appearing only deep in the stream
+- Undecodable byte offsets per candidate
+- Multibyte sequences split across chunk boundaries
+- Early stop of the statistical detector
+"""
+
+import pytest
+
+from services.encoding_detector import StreamingEncodingDetector, detect_file_encoding
+
+
+def detect_bytes(data: bytes, chunk_size: int = 1024 * 1024, **kwargs):
+    """Feed raw bytes to a detector in fixed-size chunks."""
+    detector = StreamingEncodingDetector(**kwargs)
+    for start in range(0, len(data), chunk_size):
+        detector.feed(data[start:start + chunk_size])
+    return detector.finish()
+
+
+class TestEncodingDecision:
+    """Tests for the chosen encoding."""
+
+    def test_pure_ascii_is_utf8(self):
+        """Test an ASCII-only stream is treated as UTF-8."""
+        detection = detect_bytes(b"a,b\n1,2\n" * 100)
+
+        assert detection.encoding == "utf-8"
+        assert detection.confidence == 1.0
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 1024])
+    def test_utf8_split_across_chunks(self, chunk_size):
+        """Test multibyte characters split across chunk boundaries stay valid UTF-8."""
+        data = "OWNER\nJosé Núñez\nFrançois Gagné\n".encode("utf-8")
+
+        detection = detect_bytes(data, chunk_size)
+
+        assert detection.encoding == "utf-8"
+        assert detection.error_offsets["utf-8"] == []
+
+    def test_latin1_deep_in_stream(self):
+        """Test non-ASCII owner names far past any leading sample are caught."""
+        data = b"OWNER\n" + b"SMITH JOHN\n" * 100000 + "NÚÑEZ JOSÉ\n".encode("latin-1")
+
+        detection = detect_bytes(data)
+
+        assert detection.encoding != "utf-8"
+        assert detection.error_offsets["utf-8"][0] == data.index(b"\xda")
+        data.decode(detection.encoding)
+
+    def test_windows1252_undefined_byte_falls_back_to_latin1(self):
+        """Test bytes undefined in Windows-1252 rule it out."""
+        data = b"OWNER\nA\x81B\n"
+
+        detection = detect_bytes(data)
+
+        assert detection.encoding == "latin-1"
+        assert detection.error_offsets["windows-1252"] == [data.index(b"\x81")]
+
+
+class TestErrorOffsets:
+    """Tests for recorded undecodable offsets."""
+
+    def test_records_first_offsets_and_stops(self):
+        """Test offsets are capped per candidate."""
+        data = b"x\xff" * 10
+
+        detection = detect_bytes(data, chunk_size=3, max_error_offsets=3)
+
+        assert detection.error_offsets["utf-8"] == [1, 3, 5]
+
+    def test_truncated_sequence_at_end(self):
+        """Test an incomplete multibyte sequence at end of stream is an error."""
+        data = "abc".encode("utf-8") + "é".encode("utf-8")[:1]
+
+        detection = detect_bytes(data, chunk_size=2)
+
+        assert detection.error_offsets["utf-8"] == [3]
+
+
+class TestEarlyStop:
+    """Tests for early stopping of the statistical detector."""
+
+    def test_stops_once_utf8_is_certain(self):
+        """Test the detector stops consuming once UTF-8 evidence is strong."""
+        detector = StreamingEncodingDetector()
+        detector.feed("Ñandú Café Müller\n".encode("utf-8") * 50)
+
+        assert detector.detecting is False
+        assert detector.finish().encoding == "utf-8"
+
+    def test_ascii_chunks_not_fed_to_detector(self):
+        """Test ASCII-only chunks never count towards the detector budget."""
+        detector = StreamingEncodingDetector(max_detect_bytes=10)
+        detector.feed(b"plain ascii\n" * 10)
+
+        assert detector.detecting is True
+
+
+def test_detect_file_encoding(tmp_path):
+    """Test detection over a file on disk."""
+    csv_file = tmp_path / "latin1.csv"
+    csv_file.write_bytes("field1,field2\nvalué,café\n".encode("latin-1"))
+
+    detection = detect_file_encoding(csv_file, chunk_size=4)
+
+    assert detection.encoding in ("windows-1252", "latin-1")
+    assert detection.bytes_examined == csv_file.stat().st_size
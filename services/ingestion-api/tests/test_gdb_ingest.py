@@ -161,6 +161,67 @@ class TestGDBUploadEndpoint:
         # Verify custom layer was used
         assert response.total_records == 999
 
+    @pytest.mark.asyncio
+    @patch('routers.gdb_ingest.settings')
+    @patch('routers.gdb_ingest.save_upload_file', new_callable=AsyncMock)
+    @patch('routers.gdb_ingest.extract_gdb')
+    @patch('routers.gdb_ingest.inspect_gdb')
+    @patch('routers.gdb_ingest.validate_gdb_format', return_value=True)
+    @patch('routers.gdb_ingest.create_batch', new_callable=AsyncMock)
+    async def test_gdb_upload_with_several_layers(
+        self,
+        mock_create_batch,
+        mock_validate,
+        mock_inspect,
+        mock_extract,
+        mock_save,
+        mock_settings,
+        mock_gdb_zip_file,
+        mock_gdb_info
+    ):
+        """Should create a parent batch and one child batch per layer."""
+        from routers.gdb_ingest import process_gdb_layers_async
+
+        mock_settings.ALLOWED_GDB_EXTENSIONS = [".gdb.zip", ".zip"]
+        mock_settings.max_upload_size_bytes = 5000 * 1024 * 1024
+        mock_settings.TEMP_STORAGE_PATH = "/tmp/gdb-processing"
+        mock_settings.BATCH_SIZE = 1000
+        mock_settings.GDB_PARALLEL_WORKERS = 4
+
+        mock_save.return_value = 1024
+        mock_extract.return_value = Path("/tmp/extract/test.gdb")
+        mock_gdb_info["layer_info"]["Counties"] = {"crs": "epsg:3071", "feature_count": 72}
+        mock_inspect.return_value = mock_gdb_info
+
+        parent_id, parcels_id, counties_id = uuid4(), uuid4(), uuid4()
+        mock_create_batch.side_effect = [parent_id, parcels_id, counties_id]
+
+        background_tasks = MagicMock()
+
+        response = await upload_parcel_gdb(
+            background_tasks=background_tasks,
+            file=mock_gdb_zip_file,
+            source_name="Test County",
+            layer_name="V11_Parcels, Counties"
+        )
+
+        assert response.batch_id == parent_id
+        assert response.total_records == 12345 + 72
+        assert response.child_batches == {"V11_Parcels": parcels_id, "Counties": counties_id}
+
+        parent, parcels, counties = [c.kwargs for c in mock_create_batch.call_args_list]
+        assert parent["total_records"] == 12345 + 72
+        assert parent.get("processing_options") is None
+        assert parcels["parent_batch_id"] == counties["parent_batch_id"] == parent_id
+        assert parcels["processing_options"]["layer_name"] == "V11_Parcels"
+        assert counties["processing_options"]["parent_batch_id"] == str(parent_id)
+        assert counties["total_records"] == 72
+
+        task = background_tasks.add_task.call_args_list[0]
+        assert task.args[0] is process_gdb_layers_async
+        assert task.kwargs["layer_batches"] == {"V11_Parcels": parcels_id, "Counties": counties_id}
+        assert task.kwargs["workers"] == 4
+
     @pytest.mark.asyncio
     @patch('routers.gdb_ingest.settings')
     async def test_rejects_invalid_file_extension(self, mock_settings, mock_gdb_zip_file):
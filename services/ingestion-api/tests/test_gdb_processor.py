@@ -12,8 +12,15 @@ from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime, timezone
 import geopandas as gpd
 import pandas as pd
+import pyarrow as pa
+import shapely
 from shapely.geometry import Polygon
 
+from shared.hash_utils import HASH_VERSION, compute_parcel_hash
+from shared.models import V11ParcelWKBRecord
+
+from services.chunk_validator import get_chunk_validator
+
 from services.gdb_processor import (
     extract_gdb,
     inspect_gdb,
@@ -22,6 +29,9 @@ from services.gdb_processor import (
     process_gdb_async,
     validate_gdb_format,
     cleanup_gdb,
+    build_parcel_messages,
+    reduce_geometries,
+    _LayerContext,
     WISCONSIN_CRS
 )
 
@@ -292,14 +302,20 @@ class TestCleanupGDB:
         cleanup_gdb(Path("/nonexistent/path"))
 
 
+def write_layer(tmp_path, gdf):
+    """Write a GeoDataFrame as the V11_Parcels layer of a GeoPackage fiona can read."""
+    path = tmp_path / "test.gpkg"
+    gdf.to_file(path, layer="V11_Parcels", driver="GPKG")
+    return path
+
+
 @pytest.mark.asyncio
 class TestProcessGDBAsync:
     """Tests for process_gdb_async function."""
 
     async def test_processes_gdb_successfully(self, tmp_path):
         """Should process GDB layer and publish to RabbitMQ."""
-        # Create mock GeoDataFrame
-        gdf = gpd.GeoDataFrame(
+        gdb_path = write_layer(tmp_path, gpd.GeoDataFrame(
             {
                 "STATEID": ["WI001", "WI002", "WI003"],
                 "PARCELID": ["123", "124", "125"],
@@ -312,25 +328,26 @@ class TestProcessGDBAsync:
                 Polygon([(500400, 200000), (500400, 200100), (500500, 200100)])
             ],
             crs=WISCONSIN_CRS
-        )
+        ))
 
         batch_id = uuid4()
 
-        with patch('services.gdb_processor.gpd.read_file', return_value=gdf), \
-             patch('services.gdb_processor.publish_message', return_value=True) as mock_publish, \
+        with patch('services.gdb_processor.publish_batch', side_effect=lambda queue, messages: [True] * len(messages)) as mock_publish, \
              patch('services.gdb_processor.update_batch_progress', new_callable=AsyncMock) as mock_update, \
              patch('services.gdb_processor.complete_batch', new_callable=AsyncMock) as mock_complete:
 
             await process_gdb_async(
-                gdb_path=tmp_path / "test.gdb",
+                gdb_path=gdb_path,
                 layer_name="V11_Parcels",
                 batch_id=batch_id,
                 source_name="Test County",
                 chunk_size=2  # Small chunk size to test chunking
             )
 
-            # Verify all 3 features were published
-            assert mock_publish.call_count == 3
+            # Verify all 3 features were published (one batch per chunk)
+            messages = [m for c in mock_publish.call_args_list for m in c.args[1]]
+            assert [m["raw_data"]["STATEID"] for m in messages] == ["WI001", "WI002", "WI003"]
+            assert messages[1]["raw_data"]["STREETNAME"] == "OAK AVE"
 
             # Verify batch progress was updated
             assert mock_update.call_count == 2  # 2 chunks (2 + 1)
@@ -340,22 +357,20 @@ class TestProcessGDBAsync:
 
     async def test_handles_geometry_transformation(self, tmp_path):
         """Should transform geometry to Wisconsin CRS if needed."""
-        # Create GeoDataFrame in WGS84
-        gdf = gpd.GeoDataFrame(
+        gdb_path = write_layer(tmp_path, gpd.GeoDataFrame(
             {"STATEID": ["WI001"], "PARCELID": ["123"]},
             geometry=[Polygon([(-89.4, 43.0), (-89.4, 43.1), (-89.3, 43.1)])],
             crs="EPSG:4326"
-        )
+        ))
 
         batch_id = uuid4()
 
-        with patch('services.gdb_processor.gpd.read_file', return_value=gdf), \
-             patch('services.gdb_processor.publish_message', return_value=True) as mock_publish, \
+        with patch('services.gdb_processor.publish_batch', side_effect=lambda queue, messages: [True] * len(messages)) as mock_publish, \
              patch('services.gdb_processor.update_batch_progress', new_callable=AsyncMock), \
              patch('services.gdb_processor.complete_batch', new_callable=AsyncMock):
 
             await process_gdb_async(
-                gdb_path=tmp_path / "test.gdb",
+                gdb_path=gdb_path,
                 layer_name="V11_Parcels",
                 batch_id=batch_id,
                 source_name="Test",
@@ -365,32 +380,34 @@ class TestProcessGDBAsync:
             # Verify message was published with WKT geometry
             assert mock_publish.call_count == 1
             call_args = mock_publish.call_args[0]
-            message = call_args[1]
+            message = call_args[1][0]
 
-            # Verify geometry was included
-            assert "geometry_wkt" in message["raw_data"]
-            assert "geometry_type" in message["raw_data"]
+            # Verify geometry was included, in Wisconsin Transverse Mercator metres
+            expected = gpd.GeoSeries(
+                [Polygon([(-89.4, 43.0), (-89.4, 43.1), (-89.3, 43.1)])], crs="EPSG:4326"
+            ).to_crs(WISCONSIN_CRS)[0]
+            assert shapely.from_wkt(message["raw_data"]["geometry_wkt"]).equals_exact(expected, 1e-3)
+            assert message["raw_data"]["geometry_type"] == "Polygon"
 
     async def test_handles_empty_geometry(self, tmp_path):
         """Should skip features with empty geometry."""
-        gdf = gpd.GeoDataFrame(
+        gdb_path = write_layer(tmp_path, gpd.GeoDataFrame(
             {"STATEID": ["WI001", "WI002"], "PARCELID": ["123", "124"]},
             geometry=[
                 Polygon([(500000, 200000), (500000, 200100), (500100, 200100)]),
                 None  # Empty geometry
             ],
             crs=WISCONSIN_CRS
-        )
+        ))
 
         batch_id = uuid4()
 
-        with patch('services.gdb_processor.gpd.read_file', return_value=gdf), \
-             patch('services.gdb_processor.publish_message', return_value=True) as mock_publish, \
-             patch('services.gdb_processor.update_batch_progress', new_callable=AsyncMock), \
+        with patch('services.gdb_processor.publish_batch', side_effect=lambda queue, messages: [True] * len(messages)) as mock_publish, \
+             patch('services.gdb_processor.update_batch_progress', new_callable=AsyncMock) as mock_update, \
              patch('services.gdb_processor.complete_batch', new_callable=AsyncMock):
 
             await process_gdb_async(
-                gdb_path=tmp_path / "test.gdb",
+                gdb_path=gdb_path,
                 layer_name="V11_Parcels",
                 batch_id=batch_id,
                 source_name="Test",
@@ -398,13 +415,15 @@ class TestProcessGDBAsync:
             )
 
             # Only 1 feature should be published (WI001)
-            assert mock_publish.call_count == 1
+            messages = [m for c in mock_publish.call_args_list for m in c.args[1]]
+            assert [m["raw_data"]["STATEID"] for m in messages] == ["WI001"]
+            assert mock_update.call_args.kwargs["failed_count"] == 1
 
     async def test_handles_processing_errors(self, tmp_path):
         """Should fail batch if processing encounters errors."""
         batch_id = uuid4()
 
-        with patch('services.gdb_processor.gpd.read_file', side_effect=Exception("Read error")), \
+        with patch('services.gdb_processor.fiona.open', side_effect=Exception("Read error")), \
              patch('services.gdb_processor.fail_batch', new_callable=AsyncMock) as mock_fail:
 
             # Background task wrapper suppresses exceptions to prevent service crash
@@ -422,24 +441,16 @@ class TestProcessGDBAsync:
             assert fail_args[0] == batch_id
             assert "Read error" in fail_args[1]
 
-    async def test_processes_in_chunks(self, tmp_path):
+    async def test_processes_in_chunks(self, parcel_layer):
         """Should process features in chunks for memory efficiency."""
-        # Create GeoDataFrame with 5 features
-        gdf = gpd.GeoDataFrame(
-            {"STATEID": [f"WI{i:03d}" for i in range(5)], "PARCELID": [f"{i}" for i in range(5)]},
-            geometry=[Polygon([(500000 + i * 100, 200000), (500000 + i * 100, 200100), (500100 + i * 100, 200100)]) for i in range(5)],
-            crs=WISCONSIN_CRS
-        )
-
         batch_id = uuid4()
 
-        with patch('services.gdb_processor.gpd.read_file', return_value=gdf), \
-             patch('services.gdb_processor.publish_message', return_value=True), \
+        with patch('services.gdb_processor.publish_batch', side_effect=lambda queue, messages: [True] * len(messages)) as mock_publish, \
              patch('services.gdb_processor.update_batch_progress', new_callable=AsyncMock) as mock_update, \
              patch('services.gdb_processor.complete_batch', new_callable=AsyncMock):
 
             await process_gdb_async(
-                gdb_path=tmp_path / "test.gdb",
+                gdb_path=parcel_layer,
                 layer_name="V11_Parcels",
                 batch_id=batch_id,
                 source_name="Test",
@@ -448,3 +459,566 @@ class TestProcessGDBAsync:
 
             # Verify batch progress was updated 3 times (2+2+1)
             assert mock_update.call_count == 3
+            assert [len(c.args[1]) for c in mock_publish.call_args_list] == [2, 2, 1]
+
+
+@pytest.fixture
+def parcel_layer(tmp_path):
+    """Write a 5-feature parcel layer readable through fiona (GeoPackage)."""
+    path = tmp_path / "parcels.gpkg"
+    gpd.GeoDataFrame(
+        {"STATEID": [f"WI{i:03d}" for i in range(5)], "PARCELID": [f"{i}" for i in range(5)]},
+        geometry=[Polygon([(500000 + i * 100, 200000), (500000 + i * 100, 200100), (500100 + i * 100, 200100)]) for i in range(5)],
+        crs=WISCONSIN_CRS
+    ).to_file(path, layer="V11_Parcels", driver="GPKG")
+    return path
+
+
+@pytest.mark.asyncio
+class TestResumeGDB:
+    """Tests for checkpointed, resumable GDB processing."""
+
+    async def test_checkpoints_feature_index(self, parcel_layer):
+        """Should checkpoint the feature index with every progress update."""
+        with patch('services.gdb_processor.publish_batch', side_effect=lambda queue, messages: [True] * len(messages)), \
+             patch('services.gdb_processor.update_batch_progress', new_callable=AsyncMock) as mock_update, \
+             patch('services.gdb_processor.complete_batch', new_callable=AsyncMock):
+
+            await process_gdb_async(
+                gdb_path=parcel_layer,
+                layer_name="V11_Parcels",
+                batch_id=uuid4(),
+                source_name="Test",
+                chunk_size=2
+            )
+
+        assert [c.kwargs["checkpoint"] for c in mock_update.call_args_list] == [
+            {"feature_index": 2}, {"feature_index": 4}, {"feature_index": 5}
+        ]
+
+    async def test_resumes_after_checkpoint(self, parcel_layer):
+        """Should skip features before the checkpoint and keep their numbering."""
+        batch_id = uuid4()
+
+        with patch('services.gdb_processor.publish_batch', side_effect=lambda queue, messages: [True] * len(messages)) as mock_publish, \
+             patch('services.gdb_processor.update_batch_progress', new_callable=AsyncMock), \
+             patch('services.gdb_processor.complete_batch', new_callable=AsyncMock) as mock_complete:
+
+            await process_gdb_async(
+                gdb_path=parcel_layer,
+                layer_name="V11_Parcels",
+                batch_id=batch_id,
+                source_name="Test",
+                chunk_size=2,
+                resume_from={"feature_index": 2}
+            )
+
+        published = [m for c in mock_publish.call_args_list for m in c.args[1]]
+        assert [m["source_row_number"] for m in published] == [3, 4, 5]
+        assert [m["raw_data"]["STATEID"] for m in published] == ["WI002", "WI003", "WI004"]
+        mock_complete.assert_called_once_with(batch_id, 5)
+
+
+@pytest.mark.asyncio
+async def test_attaches_content_hashes(parcel_layer):
+    """Should attach the canonical parcel hash to every published feature."""
+    with patch('services.gdb_processor.publish_batch', side_effect=lambda queue, messages: [True] * len(messages)) as mock_publish, \
+         patch('services.gdb_processor.update_batch_progress', new_callable=AsyncMock), \
+         patch('services.gdb_processor.complete_batch', new_callable=AsyncMock):
+
+        await process_gdb_async(
+            gdb_path=parcel_layer,
+            layer_name="V11_Parcels",
+            batch_id=uuid4(),
+            source_name="Test",
+            chunk_size=2
+        )
+
+    messages = [m for c in mock_publish.call_args_list for m in c.args[1]]
+    assert len(messages) == 5
+    assert [m["content_hash"] for m in messages] == [compute_parcel_hash(m["raw_data"]) for m in messages]
+    assert all(m["hash_version"] == HASH_VERSION for m in messages)
+
+
+@pytest.mark.asyncio
+async def test_suppresses_known_duplicates(parcel_layer, tmp_path):
+    """Should count features whose hash is in the local index as duplicates, not publish them."""
+    publish_all = lambda queue, messages: [True] * len(messages)
+
+    # First run: learn the hashes of the published features
+    with patch('services.gdb_processor.publish_batch', side_effect=publish_all) as mock_publish, \
+         patch('services.gdb_processor.update_batch_progress', new_callable=AsyncMock), \
+         patch('services.gdb_processor.complete_batch', new_callable=AsyncMock):
+        await process_gdb_async(parcel_layer, "V11_Parcels", uuid4(), "Test", chunk_size=2)
+
+    hashes = [m["content_hash"] for c in mock_publish.call_args_list for m in c.args[1]]
+    index_path = tmp_path / "content_hashes.bin"
+    index_path.write_bytes(b"".join(sorted(bytes.fromhex(h) for h in hashes[:3])))
+
+    with patch('services.gdb_processor.publish_batch', side_effect=publish_all) as mock_publish, \
+         patch('services.gdb_processor.update_batch_progress', new_callable=AsyncMock) as mock_update, \
+         patch('services.gdb_processor.complete_batch', new_callable=AsyncMock):
+        await process_gdb_async(
+            parcel_layer, "V11_Parcels", uuid4(), "Test", chunk_size=2, hash_index_path=index_path
+        )
+
+    messages = [m for c in mock_publish.call_args_list for m in c.args[1]]
+    assert [m["source_row_number"] for m in messages] == [4, 5]
+    assert [c.kwargs["duplicate_count"] for c in mock_update.call_args_list] == [2, 1, 0]
+    assert [c.kwargs["new_count"] for c in mock_update.call_args_list] == [0, 1, 1]
+
+
+@pytest.fixture
+def mixed_layer(tmp_path):
+    """Layer in WGS84 with typed attributes, blank values and unusable geometries."""
+    path = tmp_path / "mixed.gpkg"
+    gpd.GeoDataFrame(
+        {
+            "STATEID": ["WI001", " WI002 ", "", "WI004", "WI005", "WI006"],
+            "OWNERNME1": ["SMITH", None, "DOE", "ROE", "  ", "LEE"],
+            "CNTASSDVALUE": [250000.0, None, 1.5, 99000.0, 0.0, 12.25],
+            "ASSDACRES": [1, 2, 3, None, 5, 6],
+            "LOADDATE": ["2024-01-01", None, "2024-03-05", "", "2024-05-06", "x"],
+        },
+        geometry=[
+            Polygon([(-89.40, 43.07), (-89.39, 43.07), (-89.39, 43.08)]),
+            Polygon([(-89.38, 43.07), (-89.37, 43.07), (-89.37, 43.08)]),
+            None,
+            Polygon([(-89.36, 43.07), (-89.35, 43.07), (-89.35, 43.08)]),
+            Polygon([(-89.34, 43.07), (-89.33, 43.07), (-89.33, 43.08)]),
+            Polygon([(-89.32, 43.07), (-89.31, 43.07), (-89.31, 43.08)]),
+        ],
+        crs="EPSG:4326"
+    ).to_file(path, layer="V11_Parcels", driver="GPKG")
+    return path
+
+
+async def run_gdb(layer_path, engine, **kwargs):
+    """Process a layer with one reader engine; returns (messages, progress kwargs, completed count)."""
+    with patch('services.gdb_processor.publish_batch', side_effect=lambda queue, messages: [True] * len(messages)) as mock_publish, \
+         patch('services.gdb_processor.update_batch_progress', new_callable=AsyncMock) as mock_update, \
+         patch('services.gdb_processor.complete_batch', new_callable=AsyncMock) as mock_complete:
+
+        await process_gdb_async(
+            gdb_path=layer_path,
+            layer_name="V11_Parcels",
+            batch_id=uuid4(),
+            source_name="Test",
+            reader_engine=engine,
+            **kwargs
+        )
+
+    messages = [m for c in mock_publish.call_args_list for m in c.args[1]]
+    for message in messages:
+        message.pop("batch_id")
+    progress = [c.kwargs for c in mock_update.call_args_list]
+    for update in progress:
+        update.pop("batch_id")
+    return messages, progress, mock_complete.call_args.args[1]
+
+
+@pytest.mark.asyncio
+class TestArrowReader:
+    """Tests for the pyogrio/Arrow batch reader."""
+
+    async def test_matches_fiona_reader(self, mixed_layer):
+        """Should publish the same messages and progress as the per-feature reader."""
+        fiona_run = await run_gdb(mixed_layer, "fiona", chunk_size=4)
+        arrow_run = await run_gdb(mixed_layer, "arrow", chunk_size=4)
+
+        assert arrow_run == fiona_run
+
+        messages, progress, completed = arrow_run
+        assert [m["source_row_number"] for m in messages] == [1, 2, 4, 5, 6]
+        assert [p["failed_count"] for p in progress] == [1, 0]
+        assert completed == 6
+        # Reprojected from WGS84 into Wisconsin Transverse Mercator metres
+        assert messages[0]["raw_data"]["geometry_wkt"].startswith("POLYGON ((5")
+        assert messages[0]["raw_data"]["CNTASSDVALUE"] == 250000.0
+
+    async def test_matches_fiona_reader_in_wisconsin_crs(self, parcel_layer):
+        """Should match the per-feature reader when no transformation is needed."""
+        assert await run_gdb(parcel_layer, "arrow", chunk_size=2) == \
+            await run_gdb(parcel_layer, "fiona", chunk_size=2)
+
+    async def test_resumes_after_checkpoint(self, parcel_layer):
+        """Should skip checkpointed features and keep their numbering."""
+        messages, progress, completed = await run_gdb(
+            parcel_layer, "arrow", chunk_size=2, resume_from={"feature_index": 2}
+        )
+
+        assert [m["source_row_number"] for m in messages] == [3, 4, 5]
+        assert [p["checkpoint"] for p in progress] == [{"feature_index": 4}, {"feature_index": 5}]
+        assert completed == 5
+
+
+@pytest.mark.asyncio
+class TestGeometryFormat:
+    """Tests for WKT/WKB geometry output and the WKB pass-through."""
+
+    @pytest.mark.parametrize("engine", ["fiona", "arrow"])
+    async def test_formats_describe_same_geometry(self, mixed_layer, engine):
+        """Should send the same features and hashes with WKB in place of, or next to, WKT."""
+        wkt_messages, wkt_progress, _ = await run_gdb(mixed_layer, engine, chunk_size=4)
+        wkb_messages, wkb_progress, _ = await run_gdb(mixed_layer, engine, chunk_size=4, geometry_format="wkb")
+        both_messages, _, _ = await run_gdb(mixed_layer, engine, chunk_size=4, geometry_format="both")
+
+        assert wkb_progress == wkt_progress
+        for wkt, wkb, both in zip(wkt_messages, wkb_messages, both_messages, strict=True):
+            assert "geometry_wkt" not in wkb["raw_data"]
+            assert both["raw_data"]["geometry_wkt"] == wkt["raw_data"]["geometry_wkt"]
+            assert both["raw_data"]["geometry_wkb"] == wkb["raw_data"]["geometry_wkb"]
+            assert shapely.from_wkb(wkb["raw_data"].pop("geometry_wkb")).equals_exact(
+                shapely.from_wkt(wkt["raw_data"].pop("geometry_wkt")), 1e-9
+            )
+            assert wkb == wkt
+
+    async def test_passes_wisconsin_wkb_through(self, parcel_layer):
+        """Should pass EPSG:3071 WKB through without parsing geometries, like fiona would write it."""
+        options = {"chunk_size": 2, "geometry_format": "wkb", "geometry_metrics": False}
+        fiona_run = await run_gdb(parcel_layer, "fiona", **options)
+        with patch('services.gdb_processor.shapely.from_wkb', side_effect=AssertionError("parsed")):
+            arrow_run = await run_gdb(parcel_layer, "arrow", **options)
+
+        assert arrow_run == fiona_run
+        assert arrow_run[0][0]["raw_data"]["geometry_type"] == "Polygon"
+
+    async def test_passthrough_skips_unusable_geometries(self):
+        """Should skip null and empty WKB and fall back to shapely for points only."""
+        geometries = [
+            shapely.from_wkt("POLYGON ((0 0, 1 0, 1 1, 0 0))"),
+            None,
+            shapely.from_wkt("MULTIPOLYGON EMPTY"),
+            shapely.from_wkt("POINT (2 3)"),
+            shapely.from_wkt("POINT EMPTY"),
+        ]
+        wkb = pa.array(
+            [None if g is None else shapely.to_wkb(g, flavor="iso") for g in geometries], pa.binary()
+        )
+        batch = pa.RecordBatch.from_pydict({"STATEID": [f"WI{i}" for i in range(5)]})
+        context = _LayerContext(
+            batch_id=uuid4(), source_file="Test/V11_Parcels", total_features=5,
+            transformer=None, hash_index_path=None, geometry_format="wkb", geometry_metrics=False
+        )
+
+        messages, hashes, failed = build_parcel_messages(
+            batch, wkb, 1, get_chunk_validator(V11ParcelWKBRecord), context
+        )
+
+        assert failed == 3
+        assert len(hashes) == 2
+        assert [m["source_row_number"] for m in messages] == [1, 4]
+        assert [m["raw_data"]["geometry_type"] for m in messages] == ["Polygon", "Point"]
+        assert messages[1]["raw_data"]["geometry_wkb"] == shapely.to_wkb(geometries[3], hex=True)
+
+
+@pytest.mark.asyncio
+class TestGeometryMetrics:
+    """Tests for the bbox, centroid and area attached to parcel messages."""
+
+    @pytest.mark.parametrize("engine", ["fiona", "arrow"])
+    async def test_attaches_metrics(self, mixed_layer, engine):
+        """Should attach the metrics of the written geometry to raw_data and the message."""
+        messages, _, _ = await run_gdb(mixed_layer, engine, chunk_size=4)
+
+        for message in messages:
+            raw_data = message["raw_data"]
+            geometry = shapely.from_wkt(raw_data["geometry_wkt"])
+            assert message["bbox"] == pytest.approx(list(geometry.bounds))
+            assert message["bbox"] == [raw_data[f] for f in ("bbox_minx", "bbox_miny", "bbox_maxx", "bbox_maxy")]
+            assert message["centroid"] == pytest.approx([geometry.centroid.x, geometry.centroid.y])
+            assert message["area"] == pytest.approx(geometry.area)
+            # Wisconsin Transverse Mercator metres, not degrees
+            assert message["area"] > 1000
+
+    async def test_metrics_leave_hashes_unchanged(self, mixed_layer):
+        """Should publish the same hashes with and without metrics."""
+        with_metrics, _, _ = await run_gdb(mixed_layer, "arrow", chunk_size=4)
+        without_metrics, _, _ = await run_gdb(mixed_layer, "arrow", chunk_size=4, geometry_metrics=False)
+
+        assert [m["content_hash"] for m in with_metrics] == [m["content_hash"] for m in without_metrics]
+        assert "bbox" not in without_metrics[0]
+        assert "area" not in without_metrics[0]["raw_data"]
+
+
+class TestCoordinatePrecision:
+    """Tests for grid snapping and simplification of geometries."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("engine", ["fiona", "arrow"])
+    async def test_snaps_to_grid(self, mixed_layer, engine):
+        """Should write coordinates on the grid with unchanged features and hashes."""
+        full = await run_gdb(mixed_layer, engine, chunk_size=4)
+        snapped = await run_gdb(mixed_layer, engine, chunk_size=4, grid_size=0.01)
+
+        assert [m["content_hash"] for m in snapped[0]] == [m["content_hash"] for m in full[0]]
+        for reduced, original in zip(snapped[0], full[0], strict=True):
+            wkt = reduced["raw_data"]["geometry_wkt"]
+            assert len(wkt) < len(original["raw_data"]["geometry_wkt"])
+            coordinates = shapely.get_coordinates(shapely.from_wkt(wkt))
+            assert abs(coordinates * 100 - (coordinates * 100).round()).max() < 1e-6
+        assert snapped[1:] == full[1:]
+
+    @pytest.mark.asyncio
+    async def test_engines_agree(self, mixed_layer):
+        """Should reduce geometries the same way with both reader engines."""
+        options = {"chunk_size": 4, "grid_size": 0.5, "simplify_tolerance": 2.0, "geometry_format": "both"}
+        assert await run_gdb(mixed_layer, "arrow", **options) == await run_gdb(mixed_layer, "fiona", **options)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("engine", ["fiona", "arrow"])
+    async def test_collapsed_parcels_fail(self, parcel_layer, engine):
+        """Should skip parcels that collapse on a grid coarser than they are."""
+        messages, progress, completed = await run_gdb(
+            parcel_layer, engine, chunk_size=5, grid_size=1000, geometry_format="wkb"
+        )
+
+        assert messages == []
+        assert progress[0]["failed_count"] == 5
+        assert completed == 5
+
+    def test_simplify_preserves_topology(self):
+        """Should drop vertices within the tolerance and keep polygons valid."""
+        polygon = Polygon([(0, 0), (50, 0.05), (100, 0), (100, 100), (0, 100)])
+
+        reduced = reduce_geometries(polygon, grid_size=0.01, simplify_tolerance=0.1)
+
+        assert len(reduced.exterior.coords) == 5
+        assert reduced.is_valid
+        assert reduce_geometries(polygon) is polygon
+
+
+@pytest.mark.asyncio
+class TestReaderThread:
+    """Tests for reading layers off the event loop."""
+
+    @pytest.mark.parametrize("engine", ["fiona", "arrow"])
+    async def test_reads_off_the_event_loop(self, parcel_layer, engine):
+        """Should build messages on the reader thread and publish on the loop thread."""
+        import threading
+        import services.gdb_processor as gdb_processor
+
+        threads = {}
+        build = gdb_processor._feature_message if engine == "fiona" else gdb_processor.build_parcel_messages
+        publish = gdb_processor._publish_chunk
+
+        def record_build(*args, **kwargs):
+            threads["build"] = threading.current_thread()
+            return build(*args, **kwargs)
+
+        async def record_publish(*args, **kwargs):
+            threads["publish"] = threading.current_thread()
+            return await publish(*args, **kwargs)
+
+        with patch.object(gdb_processor, build.__name__, side_effect=record_build), \
+             patch.object(gdb_processor, "_publish_chunk", side_effect=record_publish):
+            messages, _, completed = await run_gdb(parcel_layer, engine, chunk_size=2)
+
+        assert len(messages) == completed == 5
+        assert threads["publish"] is threading.current_thread()
+        assert threads["build"] is not threading.current_thread()
+
+    async def test_reader_errors_fail_the_batch(self, parcel_layer):
+        """Should raise reader thread errors on the event loop and fail the batch."""
+        with patch('services.gdb_processor.read_gdb_batches', side_effect=RuntimeError("Read error")), \
+             patch('services.gdb_processor.complete_batch', new_callable=AsyncMock) as mock_complete, \
+             patch('services.gdb_processor.fail_batch', new_callable=AsyncMock) as mock_fail:
+            await process_gdb_async(
+                gdb_path=parcel_layer,
+                layer_name="V11_Parcels",
+                batch_id=uuid4(),
+                source_name="Test",
+                reader_engine="arrow"
+            )
+
+        mock_complete.assert_not_called()
+        assert "Read error" in mock_fail.call_args.args[1]
+
+
+@pytest.fixture
+def zipped_gdb(tmp_path):
+    """Zip of a File Geodatabase (parcels plus an auxiliary layer) nested next to other files."""
+    gdb_dir = tmp_path / "parcels.gdb"
+    parcels = gpd.GeoDataFrame(
+        {"STATEID": [f"WI{i:03d}" for i in range(5)], "PARCELID": [f"{i}" for i in range(5)]},
+        geometry=[Polygon([(500000 + i * 100, 200000), (500000 + i * 100, 200100), (500100 + i * 100, 200100)]) for i in range(5)],
+        crs=WISCONSIN_CRS
+    )
+    parcels.to_file(gdb_dir, layer="V11_Parcels", driver="OpenFileGDB")
+    parcels.head(1).to_file(gdb_dir, layer="Counties", driver="OpenFileGDB")
+
+    zip_path = tmp_path / "county.gdb.zip"
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("county/README.txt", "Not part of the GDB")
+        for file in gdb_dir.iterdir():
+            zf.write(file, f"county/parcels.gdb/{file.name}")
+    return zip_path
+
+
+class TestReadGDBInPlace:
+    """Tests for reading GDBs from the uploaded zip."""
+
+    def test_extracts_only_gdb_members(self, zipped_gdb, tmp_path):
+        """Should extract the .gdb directory and nothing else from the archive."""
+        extract_dir = tmp_path / "extract"
+        gdb_path = extract_gdb(zipped_gdb, extract_dir)
+
+        assert gdb_path == extract_dir / "county" / "parcels.gdb"
+        assert not (extract_dir / "county" / "README.txt").exists()
+        assert validate_gdb_format(gdb_path)
+
+    def test_reads_in_place(self, zipped_gdb, tmp_path):
+        """Should return a /vsizip/ path without extracting anything."""
+        extract_dir = tmp_path / "extract"
+        gdb_path = extract_gdb(zipped_gdb, extract_dir, in_place=True)
+
+        assert gdb_path == f"/vsizip/{zipped_gdb.resolve()}/county/parcels.gdb"
+        assert not extract_dir.exists()
+        assert validate_gdb_format(gdb_path)
+        assert inspect_gdb(gdb_path)["layers"] == ["V11_Parcels", "Counties"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("engine", ["fiona", "arrow"])
+    async def test_processes_in_place_like_extracted(self, zipped_gdb, tmp_path, engine):
+        """Should publish the same messages from the zip as from the extracted GDB."""
+        extracted = extract_gdb(zipped_gdb, tmp_path / "extract")
+        in_place = extract_gdb(zipped_gdb, tmp_path / "unused", in_place=True)
+
+        messages, progress, completed = await run_gdb(in_place, engine, chunk_size=2)
+
+        assert completed == 5
+        assert (messages, progress, completed) == await run_gdb(extracted, engine, chunk_size=2)
+
+
+class TestLayerMetadataCache:
+    """Tests for lazy, cached layer inspection."""
+
+    @pytest.mark.asyncio
+    async def test_reads_each_layer_once(self, zipped_gdb, tmp_path):
+        """Should read only looked-up layers, once for inspection and processing."""
+        import services.gdb_processor as gdb_processor
+
+        gdb_path = extract_gdb(zipped_gdb, tmp_path / "unused", in_place=True)
+        with patch.object(
+            gdb_processor, "_read_layer_metadata", side_effect=gdb_processor._read_layer_metadata
+        ) as mock_read:
+            info = inspect_gdb(gdb_path)
+            assert mock_read.call_count == 0
+
+            assert info["layer_info"]["V11_Parcels"]["feature_count"] == 5
+            assert inspect_gdb(gdb_path)["layer_info"]["V11_Parcels"]["crs"] == "EPSG:3071"
+            _, _, completed = await run_gdb(gdb_path, "arrow")
+
+        assert completed == 5
+        assert [c.args[1] for c in mock_read.call_args_list] == ["V11_Parcels"]
+
+    def test_unreadable_layer_reports_error(self, zipped_gdb, tmp_path):
+        """Should report a layer that cannot be read instead of raising."""
+        gdb_path = extract_gdb(zipped_gdb, tmp_path / "unused", in_place=True)
+        layer_info = inspect_gdb(gdb_path)["layer_info"]
+
+        with patch('services.gdb_processor._read_layer_metadata', side_effect=RuntimeError("Corrupt")):
+            assert layer_info["Counties"] == {"error": "Corrupt"}
+        assert layer_info.get("Missing") is None
+        assert list(layer_info) == ["V11_Parcels", "Counties"]
+
+    def test_fingerprint_follows_content(self, zipped_gdb, tmp_path):
+        """Should fingerprint the zipped GDB by content, not by upload name."""
+        import shutil
+        from services.gdb_processor import gdb_fingerprint
+
+        renamed = shutil.copy(zipped_gdb, tmp_path / "reupload.zip")
+        with zipfile.ZipFile(tmp_path / "other.zip", 'w') as zf:
+            zf.writestr("county/parcels.gdb/a00000001.gdbtable", "different")
+
+        def in_place(path):
+            return extract_gdb(Path(path), tmp_path / "unused", in_place=True)
+
+        assert gdb_fingerprint(in_place(zipped_gdb)) == gdb_fingerprint(in_place(renamed))
+        assert gdb_fingerprint(in_place(zipped_gdb)) != gdb_fingerprint(in_place(tmp_path / "other.zip"))
+        assert gdb_fingerprint(Path("/fake/test.gdb")) is None
+
+
+def thread_range_executor(workers):
+    """Range worker pool on threads, so the patched publishing applies to the workers."""
+    import queue
+    from concurrent.futures import ThreadPoolExecutor
+    import services.gdb_processor as gdb_processor
+
+    progress = queue.Queue()
+    executor = ThreadPoolExecutor(
+        max_workers=workers,
+        initializer=gdb_processor._init_range_worker,
+        initargs=(progress,)
+    )
+    return executor, progress
+
+
+@pytest.mark.asyncio
+class TestFeatureRanges:
+    """Tests for processing feature ranges of a layer in parallel."""
+
+    @pytest.mark.parametrize("engine", ["fiona", "arrow"])
+    async def test_parallel_ranges_match_sequential(self, mixed_layer, engine):
+        """Should publish the same features, numbered the same, as a sequential run."""
+        from services.gdb_ranges import plan_feature_ranges
+
+        with patch('services.gdb_processor._create_range_executor', side_effect=thread_range_executor), \
+             patch('services.gdb_processor.plan_feature_ranges',
+                   side_effect=lambda total, n: plan_feature_ranges(total, n, min_range_features=1)):
+            messages, progress, completed = await run_gdb(mixed_layer, engine, chunk_size=1, workers=3)
+
+        sequential, _, _ = await run_gdb(mixed_layer, engine, chunk_size=1)
+        assert completed == 6
+        assert sorted(messages, key=lambda m: m["source_row_number"]) == sequential
+        assert sum(p["processed_count"] for p in progress) == 6
+        assert sum(p["failed_count"] for p in progress) == 6 - len(sequential)
+
+        final = progress[-1]["checkpoint"]["ranges"]
+        assert [(entry["start"], entry["stop"]) for entry in final] == [(0, 2), (2, 4), (4, 6)]
+        assert all(entry["done"] for entry in final)
+        assert sum(entry["features_done"] for entry in final) == 6
+
+    async def test_resumes_parallel_ranges(self, parcel_layer):
+        """Should skip finished ranges and the features a range already confirmed."""
+        resumed = [
+            {"index": 0, "start": 0, "stop": 1, "features_done": 1, "done": True},
+            {"index": 1, "start": 1, "stop": 3, "features_done": 1, "done": False},
+            {"index": 2, "start": 3, "stop": 5, "features_done": 0, "done": False},
+        ]
+
+        with patch('services.gdb_processor._create_range_executor', side_effect=thread_range_executor):
+            messages, progress, completed = await run_gdb(
+                parcel_layer, "arrow", chunk_size=2, resume_from={"ranges": resumed}
+            )
+
+        assert sorted(m["source_row_number"] for m in messages) == [3, 4, 5]
+        assert sum(p["processed_count"] for p in progress) == 3
+        assert completed == 5
+
+
+@pytest.mark.asyncio
+async def test_processes_layers_as_child_batches(zipped_gdb, tmp_path):
+    """Should process every layer concurrently under its own batch."""
+    from services.gdb_processor import process_gdb_layers_async
+
+    gdb_path = extract_gdb(zipped_gdb, tmp_path / "unused", in_place=True)
+    layer_batches = {"V11_Parcels": uuid4(), "Counties": uuid4()}
+
+    with patch('services.gdb_processor.publish_batch', side_effect=lambda queue, messages: [True] * len(messages)) as mock_publish, \
+         patch('services.gdb_processor.update_batch_progress', new_callable=AsyncMock), \
+         patch('services.gdb_processor.complete_batch', new_callable=AsyncMock) as mock_complete, \
+         patch('services.gdb_processor.fail_batch', new_callable=AsyncMock) as mock_fail:
+        await process_gdb_layers_async(
+            gdb_path, layer_batches, "Dane County", chunk_size=2, reader_engine="arrow"
+        )
+
+    messages = [m for c in mock_publish.call_args_list for m in c.args[1]]
+    assert sorted((m["batch_id"], m["source_file"]) for m in messages) == sorted(
+        [(str(layer_batches["V11_Parcels"]), "Dane County/V11_Parcels")] * 5
+        + [(str(layer_batches["Counties"]), "Dane County/Counties")]
+    )
+    assert sorted(c.args for c in mock_complete.call_args_list) == sorted(
+        [(layer_batches["V11_Parcels"], 5), (layer_batches["Counties"], 1)]
+    )
+    mock_fail.assert_not_called()
@@ -0,0 +1,34 @@
+"""
+Unit tests for GDB feature-range planning.
+
+Tests splitting a layer into contiguous feature ranges for worker processes.
+"""
+
+from services.gdb_ranges import plan_feature_ranges
+
+
+class TestPlanFeatureRanges:
+    """Tests for plan_feature_ranges."""
+
+    def test_ranges_cover_every_feature_once(self):
+        """Test ranges are contiguous, ordered and about equal in size."""
+        ranges = plan_feature_ranges(1_000_003, max_ranges=4, min_range_features=1000)
+
+        assert len(ranges) == 4
+        assert [r.index for r in ranges] == [0, 1, 2, 3]
+        assert ranges[0].start == 0
+        assert ranges[-1].stop == 1_000_003
+        for previous, current in zip(ranges, ranges[1:]):
+            assert current.start == previous.stop
+        assert max(r.size for r in ranges) - min(r.size for r in ranges) <= 1
+
+    def test_small_layer_is_single_range(self):
+        """Test layers below the minimum range size are not split."""
+        ranges = plan_feature_ranges(80_000, max_ranges=8)
+
+        assert len(ranges) == 1
+        assert (ranges[0].start, ranges[0].stop) == (0, 80_000)
+
+    def test_ranges_limited_by_minimum_size(self):
+        """Test a layer is split into no more ranges than it has minimum-size slices."""
+        assert len(plan_feature_ranges(150_000, max_ranges=8)) == 3
@@ -0,0 +1,61 @@
+"""
+Unit tests for the geometry metrics service.
+
+Tests vectorized bbox, centroid and area against shapely's per-geometry
+properties, and the message-level metrics.
+"""
+
+import math
+
+import pytest
+import shapely
+
+from services.geometry_metrics import (
+    METRIC_FIELDS,
+    compute_geometry_metrics,
+    geometry_metric_columns,
+    message_metrics,
+)
+
+GEOMETRIES = [
+    shapely.from_wkt("POLYGON ((0 0, 4 0, 4 2, 0 2, 0 0), (1 1, 2 1, 2 1.5, 1 1))"),
+    shapely.from_wkt("MULTIPOLYGON (((10 10, 12 10, 12 12, 10 12, 10 10)), ((20 20, 21 20, 21 21, 20 20)))"),
+    None,
+    shapely.from_wkt("POLYGON EMPTY"),
+]
+
+
+class TestComputeGeometryMetrics:
+    """Tests for compute_geometry_metrics."""
+
+    def test_matches_shapely_properties(self):
+        """Test metrics match each geometry's bounds, centroid and area."""
+        metrics = compute_geometry_metrics(GEOMETRIES)
+
+        assert tuple(metrics) == METRIC_FIELDS
+        for pos, geometry in enumerate(GEOMETRIES[:2]):
+            bbox = [metrics[f][pos] for f in ("bbox_minx", "bbox_miny", "bbox_maxx", "bbox_maxy")]
+            assert bbox == list(geometry.bounds)
+            assert metrics["centroid_x"][pos] == pytest.approx(geometry.centroid.x)
+            assert metrics["centroid_y"][pos] == pytest.approx(geometry.centroid.y)
+            assert metrics["area"][pos] == pytest.approx(geometry.area)
+
+    def test_missing_and_empty_geometries_are_nan(self):
+        """Test None and empty geometries get NaN metrics (null Arrow values)."""
+        metrics = compute_geometry_metrics(GEOMETRIES)
+        columns = geometry_metric_columns(GEOMETRIES)
+
+        assert all(math.isnan(metrics["bbox_minx"][pos]) for pos in (2, 3))
+        assert columns["centroid_x"].null_count == 2
+        assert columns["area"].to_pylist()[:2] == [pytest.approx(7.75), pytest.approx(4.5)]
+
+
+class TestMessageMetrics:
+    """Tests for message_metrics."""
+
+    def test_groups_raw_data_metrics(self):
+        """Test bbox, centroid and area are grouped from raw_data fields."""
+        raw_data = dict(zip(METRIC_FIELDS, [0.0, 0.0, 4.0, 2.0, 2.0, 1.0, 8.0]), STATEID="WI1")
+
+        assert message_metrics(raw_data) == {"bbox": [0.0, 0.0, 4.0, 2.0], "centroid": [2.0, 1.0], "area": 8.0}
+        assert message_metrics({"STATEID": "WI1"}) == {}
@@ -0,0 +1,150 @@
+"""
+Unit tests for the local content hash index.
+
+Tests lookups against the sorted index file, reopening after a refresh
+replaced it, and incremental refreshes from raw_imports.
+"""
+
+import hashlib
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from services.hash_index import HashIndex, get_hash_index, read_metadata, refresh_hash_index
+
+
+def digest(value):
+    """Hex content hash of a test value."""
+    return hashlib.sha256(value.encode()).hexdigest()
+
+
+def mock_pool(rows):
+    """Database pool whose cursor yields the given raw_imports rows."""
+    async def cursor_rows():
+        for row in rows:
+            yield row
+
+    conn = MagicMock()
+    conn.cursor = MagicMock(side_effect=lambda *args, **kwargs: cursor_rows())
+
+    @asynccontextmanager
+    async def transaction():
+        yield
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    conn.transaction = transaction
+    pool = MagicMock()
+    pool.acquire = acquire
+    return pool, conn
+
+
+def write_index(path, hashes):
+    """Write an index file directly (sorted raw digests)."""
+    path.write_bytes(b"".join(sorted(bytes.fromhex(h) for h in hashes)))
+
+
+class TestHashIndex:
+    """Tests for HashIndex lookups."""
+
+    def test_contains_known_hashes(self, tmp_path):
+        """Test lookups find exactly the indexed hashes."""
+        known = [digest(f"known-{i}") for i in range(100)]
+        path = tmp_path / "content_hashes.bin"
+        write_index(path, known)
+
+        index = HashIndex(path)
+        queries = [known[0], digest("new"), known[99], known[42], digest("other")]
+
+        assert len(index) == 100
+        assert index.contains(queries).tolist() == [True, False, True, True, False]
+
+    def test_empty_index(self, tmp_path):
+        """Test an empty index knows no hashes."""
+        path = tmp_path / "content_hashes.bin"
+        path.write_bytes(b"")
+
+        assert HashIndex(path).contains([digest("a")]).tolist() == [False]
+
+    def test_rejects_truncated_file(self, tmp_path):
+        """Test a file that is not whole digests is rejected."""
+        path = tmp_path / "content_hashes.bin"
+        path.write_bytes(b"x" * 40)
+
+        with pytest.raises(ValueError, match="Corrupt hash index"):
+            HashIndex(path)
+
+
+class TestGetHashIndex:
+    """Tests for get_hash_index function."""
+
+    def test_missing_index_disables_suppression(self, tmp_path):
+        """Test no index is returned without a path or file."""
+        assert get_hash_index(None) is None
+        assert get_hash_index(tmp_path / "missing.bin") is None
+
+    def test_reopens_replaced_file(self, tmp_path):
+        """Test the cached index is reused until the file changes."""
+        path = tmp_path / "content_hashes.bin"
+        write_index(path, [digest("a")])
+
+        first = get_hash_index(path)
+        assert get_hash_index(path) is first
+
+        write_index(path, [digest("a"), digest("b")])
+        second = get_hash_index(path)
+
+        assert second is not first
+        assert second.contains([digest("b")]).tolist() == [True]
+
+
+class TestRefreshHashIndex:
+    """Tests for refresh_hash_index function."""
+
+    @pytest.mark.asyncio
+    async def test_builds_then_merges_incrementally(self, tmp_path):
+        """Test a refresh reads only rows after the watermark and merges them."""
+        path = tmp_path / "hash-index" / "content_hashes.bin"
+        imported_at = datetime(2025, 2, 1, tzinfo=timezone.utc)
+
+        pool, conn = mock_pool([
+            {"content_hash": digest("a"), "imported_at": imported_at},
+            {"content_hash": digest("b"), "imported_at": imported_at + timedelta(hours=1)},
+            {"content_hash": "not-a-hash", "imported_at": imported_at},
+        ])
+        with patch('services.hash_index.get_db_pool', new_callable=AsyncMock, return_value=pool):
+            assert await refresh_hash_index(path) == 2
+
+        # First refresh reads everything
+        assert conn.cursor.call_args.args[1] is None
+        assert read_metadata(path).watermark == (imported_at + timedelta(hours=1)).isoformat()
+
+        pool, conn = mock_pool([
+            {"content_hash": digest("b"), "imported_at": imported_at + timedelta(hours=1)},
+            {"content_hash": digest("c"), "imported_at": imported_at + timedelta(hours=2)},
+        ])
+        with patch('services.hash_index.get_db_pool', new_callable=AsyncMock, return_value=pool):
+            assert await refresh_hash_index(path) == 3
+
+        assert conn.cursor.call_args.args[1] == imported_at + timedelta(hours=1)
+        index = get_hash_index(path)
+        assert index.contains([digest("a"), digest("b"), digest("c"), digest("d")]).tolist() == [
+            True, True, True, False
+        ]
+
+    @pytest.mark.asyncio
+    async def test_full_rebuild_drops_old_entries(self, tmp_path):
+        """Test a full refresh replaces the index instead of merging."""
+        path = tmp_path / "content_hashes.bin"
+        write_index(path, [digest("gone")])
+
+        pool, conn = mock_pool([
+            {"content_hash": digest("a"), "imported_at": datetime(2025, 2, 1, tzinfo=timezone.utc)},
+        ])
+        with patch('services.hash_index.get_db_pool', new_callable=AsyncMock, return_value=pool):
+            assert await refresh_hash_index(path, full=True) == 1
+
+        assert HashIndex(path).contains([digest("gone"), digest("a")]).tolist() == [False, True]
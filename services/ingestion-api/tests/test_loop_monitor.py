@@ -0,0 +1,52 @@
+"""
+Unit tests for the event loop lag monitor.
+
+Tests the reported window statistics and that a blocked loop is measured.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from services.loop_monitor import LoopLagMonitor, run_loop_lag_monitor
+
+
+class TestLoopLagMonitor:
+    """Tests for LoopLagMonitor."""
+
+    def test_snapshot(self):
+        """Test last, median, p99 and max over the window."""
+        monitor = LoopLagMonitor(window=100)
+        for ms in range(1, 101):
+            monitor.record(ms / 1000)
+
+        assert monitor.snapshot() == {"last_ms": 100.0, "p50_ms": 51.0, "p99_ms": 100.0, "max_ms": 100.0}
+
+    def test_window_and_empty(self):
+        """Test old samples fall out of the window and no samples report nothing."""
+        monitor = LoopLagMonitor(window=2)
+        assert monitor.snapshot() == {}
+
+        for lag in (1.0, 0.002, -0.001):
+            monitor.record(lag)
+
+        assert monitor.snapshot()["max_ms"] == 2.0
+        assert monitor.snapshot()["last_ms"] == 0.0
+
+
+class TestRunLoopLagMonitor:
+    """Tests for run_loop_lag_monitor."""
+
+    @pytest.mark.asyncio
+    async def test_measures_blocked_loop(self):
+        """Test blocking the loop thread shows up as lag."""
+        monitor = LoopLagMonitor()
+        task = asyncio.create_task(run_loop_lag_monitor(0.01, warn_ms=1000, monitor=monitor))
+        await asyncio.sleep(0.05)
+
+        time.sleep(0.2)  # Block the event loop
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        assert monitor.snapshot()["max_ms"] >= 150
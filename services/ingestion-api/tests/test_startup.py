@@ -0,0 +1,114 @@
+"""
+Startup benchmark and unit tests for lazy processor imports.
+
+Imports the app in a fresh interpreter, with and without the processors
+pre-warmed, and checks that the lazy app loads none of the geospatial or
+pandas stack and stays well below the pre-warmed RSS.
+"""
+
+import json
+import logging
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from services.lazy_imports import PROCESSOR_MODULES, import_processor, lazy_function
+
+logger = logging.getLogger(__name__)
+
+SERVICE_DIR = Path(__file__).resolve().parent.parent
+SHARED_DIR = SERVICE_DIR.parent / "shared"
+
+# Modules a lazy startup must not import
+HEAVY_MODULES = ("pandas", "pyarrow", "shapely", "fiona", "geopandas", "pyproj", "pyogrio")
+
+# Peak RSS from /proc (ru_maxrss would include the forking pytest process)
+STARTUP_SCRIPT = """
+import asyncio, json, resource, sys, time
+
+def peak_rss_mb():
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+start = time.perf_counter()
+import main
+if {prewarm}:
+    from services.lazy_imports import prewarm_processors
+    asyncio.run(prewarm_processors(["gdb", "csv"]))
+print(json.dumps({{
+    "seconds": time.perf_counter() - start,
+    "rss_mb": peak_rss_mb(),
+    "heavy": sorted(name for name in {heavy!r} if name in sys.modules),
+}}))
+"""
+
+
+def measure_startup(prewarm: bool) -> dict:
+    """Import main in a fresh interpreter and report time, peak RSS and heavy modules."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SHARED_DIR), env.get("PYTHONPATH")]))
+    env.setdefault("DATABASE_URL", "postgresql://user@localhost:5432/db")
+    env.setdefault("RABBITMQ_URL", "amqp://user@localhost:5672/")
+
+    result = subprocess.run(
+        [sys.executable, "-c", STARTUP_SCRIPT.format(prewarm=prewarm, heavy=HEAVY_MODULES)],
+        cwd=SERVICE_DIR, env=env, capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestStartupBenchmark:
+    """Startup time and RSS of the app with lazy and pre-warmed processors."""
+
+    def test_lazy_startup_skips_heavy_imports(self, record_property):
+        """Test the lazy app is much lighter than the pre-warmed one."""
+        lazy = measure_startup(prewarm=False)
+        prewarmed = measure_startup(prewarm=True)
+        for name, startup in (("lazy", lazy), ("prewarmed", prewarmed)):
+            record_property(f"{name}_startup_seconds", round(startup["seconds"], 3))
+            record_property(f"{name}_startup_rss_mb", round(startup["rss_mb"]))
+        logger.info(
+            f"Startup: lazy {lazy['seconds']:.2f}s / {lazy['rss_mb']:.0f} MB, "
+            f"pre-warmed {prewarmed['seconds']:.2f}s / {prewarmed['rss_mb']:.0f} MB"
+        )
+
+        assert lazy["heavy"] == []
+        assert {"pandas", "shapely"} <= set(prewarmed["heavy"])
+        assert lazy["rss_mb"] < prewarmed["rss_mb"] * 0.75
+        assert lazy["seconds"] < prewarmed["seconds"]
+
+
+class TestLazyFunction:
+    """Tests for lazy_function and import_processor."""
+
+    def test_forwards_sync_call(self):
+        """Test a sync stand-in imports its module and forwards arguments."""
+        dumps = lazy_function("json", "dumps")
+
+        assert dumps.__name__ == "dumps"
+        assert dumps({"a": 1}, sort_keys=True) == '{"a": 1}'
+
+    @pytest.mark.asyncio
+    async def test_forwards_async_call(self):
+        """Test an async stand-in is a coroutine function awaiting the real one."""
+        sleep = lazy_function("asyncio", "sleep", is_async=True)
+
+        assert await sleep(0, result="done") == "done"
+
+    @pytest.mark.asyncio
+    async def test_import_processor(self):
+        """Test import_processor returns the processor module."""
+        module = await import_processor("csv")
+
+        assert module.__name__ == PROCESSOR_MODULES["csv"]
+        assert module is sys.modules[PROCESSOR_MODULES["csv"]]
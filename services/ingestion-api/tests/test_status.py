@@ -1,15 +1,16 @@
 """
 Unit tests for batch status endpoint.
 
-Tests the GET /api/v1/ingest/status/{batch_id} endpoint.
+Tests the GET /api/v1/ingest/status/{batch_id} and
+POST /api/v1/ingest/status/{batch_id}/resume endpoints.
 """
 
 import pytest
 from datetime import datetime, timezone
 from uuid import uuid4
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from routers.status import get_batch_status
+from routers.status import get_batch_status, resume_batch_processing
 from models.schemas import BatchStatusResponse
 
 
@@ -233,3 +234,152 @@ class TestGetBatchStatus:
         assert response.total_records == 0
         assert response.processed_records == 0
         assert response.progress_percent is None  # Avoid division by zero
+
+    @pytest.mark.asyncio
+    @patch('routers.status.fetch_batch', new_callable=AsyncMock)
+    async def test_returns_child_batches(self, mock_fetch):
+        """Should list the layer batches of a multi-layer GDB upload."""
+        batch_id = uuid4()
+        child_ids = [uuid4(), uuid4()]
+
+        mock_fetch.return_value = {
+            "batch_id": batch_id,
+            "source_name": "Dane County 2025",
+            "source_type": "PARCEL",
+            "file_format": "GDB",
+            "status": "processing",
+            "total_records": 12417,
+            "processed_records": 6000,
+            "new_records": 6000,
+            "duplicate_records": 0,
+            "failed_records": 0,
+            "started_at": datetime.now(timezone.utc),
+            "completed_at": None,
+            "error": None,
+            "parent_batch_id": None,
+            "child_batch_ids": child_ids
+        }
+
+        response = await get_batch_status(batch_id)
+
+        assert response.parent_batch_id is None
+        assert response.child_batch_ids == child_ids
+
+
+def processing_batch(batch_id):
+    """Batch row of an interrupted CSV batch."""
+    return {
+        "batch_id": batch_id,
+        "source_name": "Statewide RETR",
+        "source_type": "RETR",
+        "file_format": "CSV",
+        "status": "processing",
+        "total_records": 10000,
+        "processed_records": 4000,
+        "new_records": 4000,
+        "duplicate_records": 0,
+        "failed_records": 0,
+        "started_at": datetime.now(timezone.utc),
+        "completed_at": None,
+        "error": None
+    }
+
+
+class TestResumeBatch:
+    """Tests for POST /api/v1/ingest/status/{batch_id}/resume endpoint."""
+
+    @pytest.mark.asyncio
+    @patch('routers.status.claim_stale_checkpoints', new_callable=AsyncMock)
+    @patch('routers.status.fetch_batch', new_callable=AsyncMock)
+    async def test_resumes_stale_batch(self, mock_fetch, mock_claim):
+        """Should claim the checkpoint and resume processing in the background."""
+        batch_id = uuid4()
+        checkpoint = {"batch_id": batch_id, "file_format": "CSV", "options": {}, "position": {"row_number": 4000}}
+        mock_fetch.return_value = processing_batch(batch_id)
+        mock_claim.return_value = [checkpoint]
+        background_tasks = MagicMock()
+
+        response = await resume_batch_processing(batch_id, background_tasks)
+
+        assert response.batch_id == batch_id
+        assert response.status == "processing"
+        assert mock_claim.call_args.args[1] == batch_id
+        background_tasks.add_task.assert_called_once()
+        assert background_tasks.add_task.call_args.args[1] is checkpoint
+
+    @pytest.mark.asyncio
+    @patch('routers.status.claim_stale_checkpoints', new_callable=AsyncMock)
+    @patch('routers.status.fetch_batch', new_callable=AsyncMock)
+    async def test_resumes_abandoned_paused_batch(self, mock_fetch, mock_claim):
+        """Should resume a paused batch whose worker stopped waiting for the broker."""
+        batch_id = uuid4()
+        checkpoint = {"batch_id": batch_id, "file_format": "CSV", "options": {}, "position": {"row_number": 4000}}
+        mock_fetch.return_value = {**processing_batch(batch_id), "status": "paused"}
+        mock_claim.return_value = [checkpoint]
+        background_tasks = MagicMock()
+
+        response = await resume_batch_processing(batch_id, background_tasks)
+
+        assert response.status == "processing"
+        background_tasks.add_task.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch('routers.status.claim_stale_checkpoints', new_callable=AsyncMock)
+    @patch('routers.status.fetch_batch', new_callable=AsyncMock)
+    async def test_resumes_abandoned_throttled_batch(self, mock_fetch, mock_claim):
+        """Should resume a throttled batch whose worker died while held back by backpressure."""
+        batch_id = uuid4()
+        checkpoint = {"batch_id": batch_id, "file_format": "CSV", "options": {}, "position": {"row_number": 4000}}
+        mock_fetch.return_value = {**processing_batch(batch_id), "status": "throttled"}
+        mock_claim.return_value = [checkpoint]
+        background_tasks = MagicMock()
+
+        response = await resume_batch_processing(batch_id, background_tasks)
+
+        assert response.status == "processing"
+        background_tasks.add_task.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch('routers.status.fetch_batch', new_callable=AsyncMock)
+    async def test_rejects_finished_batch(self, mock_fetch):
+        """Should return 409 for a batch that is no longer processing."""
+        from fastapi import HTTPException
+
+        batch_id = uuid4()
+        mock_fetch.return_value = {**processing_batch(batch_id), "status": "completed"}
+
+        with pytest.raises(HTTPException) as exc_info:
+            await resume_batch_processing(batch_id, MagicMock())
+
+        assert exc_info.value.status_code == 409
+
+    @pytest.mark.asyncio
+    @patch('routers.status.fetch_checkpoint', new_callable=AsyncMock)
+    @patch('routers.status.claim_stale_checkpoints', new_callable=AsyncMock, return_value=[])
+    @patch('routers.status.fetch_batch', new_callable=AsyncMock)
+    async def test_rejects_batch_still_in_progress(self, mock_fetch, mock_claim, mock_checkpoint):
+        """Should return 409 while the batch's checkpoint is still advancing."""
+        from fastapi import HTTPException
+
+        batch_id = uuid4()
+        mock_fetch.return_value = processing_batch(batch_id)
+        mock_checkpoint.return_value = {"batch_id": batch_id, "updated_at": datetime.now(timezone.utc)}
+        background_tasks = MagicMock()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await resume_batch_processing(batch_id, background_tasks)
+
+        assert exc_info.value.status_code == 409
+        assert "still making progress" in exc_info.value.detail["message"]
+        background_tasks.add_task.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch('routers.status.fetch_batch', new_callable=AsyncMock, return_value=None)
+    async def test_returns_404_for_nonexistent_batch(self, mock_fetch):
+        """Should return 404 when the batch doesn't exist."""
+        from fastapi import HTTPException
+
+        with pytest.raises(HTTPException) as exc_info:
+            await resume_batch_processing(uuid4(), MagicMock())
+
+        assert exc_info.value.status_code == 404
@@ -0,0 +1,100 @@
+"""
+Unit tests for single-pass upload inspection.
+
+Verifies that facts gathered while the upload streams match what
+re-reading the saved file would produce:
+- Row counts (quoted newlines, blank lines, CRLF, chunk boundaries)
+- Encoding choice (UTF-8 vs Latin-1)
+- Header and sample rows
+- Empty and header-only uploads
+"""
+
+import io
+
+import pandas as pd
+import pytest
+
+from services.upload_inspector import UploadInspector
+
+
+def inspect_bytes(data: bytes, chunk_size: int = 1024 * 1024, **kwargs):
+    """Feed raw bytes to an inspector in fixed-size chunks."""
+    inspector = UploadInspector(**kwargs)
+    for start in range(0, len(data), chunk_size):
+        inspector.feed(data[start:start + chunk_size])
+    return inspector.finish()
+
+
+class TestRowCount:
+    """Row counts must match what pandas reads from the file."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1024])
+    @pytest.mark.parametrize("data", [
+        b"a,b\n1,2\n3,4\n",
+        b"a,b\n1,2\n3,4",
+        b"a,b\r\n1,2\r\n3,4\r\n",
+        b"a,b\n\n1,2\n\n\n3,4\n\n",
+        b'a,b\n"multi\nline",2\n"x ""quoted"" \r\n",4\n',
+        b'a,b\n"POLYGON((0 0, 1 0))",Polygon\n5,6\n',
+    ])
+    def test_matches_pandas(self, data, chunk_size):
+        """Test quote-aware counting regardless of chunk boundaries."""
+        expected = len(pd.read_csv(io.BytesIO(data), dtype=str))
+
+        assert inspect_bytes(data, chunk_size).row_count == expected
+
+    def test_header_only(self):
+        """Test a header-only file has zero rows."""
+        assert inspect_bytes(b"a,b\n").row_count == 0
+
+
+class TestEncoding:
+    """Tests for encoding selection."""
+
+    def test_utf8_file(self):
+        """Test a UTF-8 file is detected as UTF-8."""
+        data = "name,city\nJosé,Montréal\n".encode("utf-8")
+
+        assert inspect_bytes(data, chunk_size=5).encoding.lower() in ("utf-8", "utf8")
+
+    def test_invalid_utf8_after_head_rejects_utf8(self):
+        """Test UTF-8 is rejected when invalid bytes appear past the sample head."""
+        data = b"name\n" + b"plain ascii\n" * 200 + "Jos\xe9\n".encode("latin-1")
+
+        inspection = inspect_bytes(data, chunk_size=64, sample_bytes=256)
+
+        assert inspection.encoding.lower() not in ("utf-8", "utf8", "ascii")
+        data.decode(inspection.encoding)
+
+
+class TestSample:
+    """Tests for header and sample parsing."""
+
+    def test_header_and_sample(self):
+        """Test header names are stripped and sample values kept as strings."""
+        data = b" PARCEL_ID ,SALE_AMOUNT\n001,12.50\n002,\n"
+
+        inspection = inspect_bytes(data)
+
+        assert inspection.header == ["PARCEL_ID", "SALE_AMOUNT"]
+        assert inspection.sample["SALE_AMOUNT"].tolist() == ["12.50", ""]
+        assert inspection.sample_error is None
+
+    def test_sample_limited_to_complete_records(self):
+        """Test the sample never contains a record cut off by the head limit."""
+        data = b"a,b\n" + b"".join(b"%d,value%d\n" % (i, i) for i in range(1000))
+
+        inspection = inspect_bytes(data, chunk_size=100, sample_bytes=1000)
+
+        assert inspection.row_count == 1000
+        last = inspection.sample.iloc[-1]
+        assert last["b"] == f"value{last['a']}"
+
+    def test_empty_file(self):
+        """Test an empty upload."""
+        inspection = inspect_bytes(b"")
+
+        assert inspection.byte_size == 0
+        assert inspection.row_count == 0
+        assert inspection.sample is None
+        assert inspection.sample_error == "File is empty (0 bytes)"
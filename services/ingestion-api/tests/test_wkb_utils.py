@@ -0,0 +1,76 @@
+"""
+Unit tests for WKB utilities.
+
+Tests header decoding and hex encoding of Arrow WKB columns against shapely.
+"""
+
+import pyarrow as pa
+import shapely
+
+from services.wkb_utils import read_wkb_headers, wkb_to_hex
+
+GEOMETRIES = [
+    "POLYGON ((0 0, 1 0, 1 1, 0 0))",
+    "MULTIPOLYGON (((0 0, 1 0, 1 1, 0 0)), ((5 5, 6 5, 6 6, 5 5)))",
+    "POLYGON EMPTY",
+    "LINESTRING Z (0 0 1, 1 1 2)",
+    "POINT (1 2)",
+]
+
+
+def wkb_column(wkts, byte_order=1):
+    """Arrow binary column of ISO WKB (None stays null)."""
+    return pa.array(
+        [None if w is None else shapely.to_wkb(shapely.from_wkt(w), flavor="iso", byte_order=byte_order)
+         for w in wkts],
+        pa.binary()
+    )
+
+
+class TestReadWKBHeaders:
+    """Tests for read_wkb_headers."""
+
+    def test_decodes_types_and_emptiness(self):
+        """Test types and empty flags match shapely for both byte orders; points are left open."""
+        for byte_order in (0, 1):
+            names, empty, decoded = read_wkb_headers(wkb_column(GEOMETRIES + [None], byte_order))
+
+            assert list(names) == ["Polygon", "MultiPolygon", "Polygon", "LineString", None, None]
+            assert list(empty) == [False, False, True, False, False, False]
+            assert list(decoded) == [True, True, True, True, False, False]
+
+    def test_leaves_ewkb_and_malformed_values_open(self):
+        """Test EWKB with an SRID and truncated or unknown headers are not decoded."""
+        ewkb = shapely.to_wkb(
+            shapely.set_srid(shapely.from_wkt(GEOMETRIES[0]), 3071), flavor="extended", include_srid=True
+        )
+        column = pa.array([ewkb, b"\x01\x03\x00", b"\x01\x63\x00\x00\x00\x00\x00\x00\x00"], pa.binary())
+
+        assert list(read_wkb_headers(column)[2]) == [False, False, False]
+
+    def test_reads_sliced_columns(self):
+        """Test a column slice is decoded from its own offset."""
+        names, empty, _ = read_wkb_headers(wkb_column(GEOMETRIES).slice(1, 2))
+
+        assert list(names) == ["MultiPolygon", "Polygon"]
+        assert list(empty) == [False, True]
+
+
+class TestWKBToHex:
+    """Tests for wkb_to_hex."""
+
+    def test_matches_shapely_hex(self):
+        """Test hex strings match shapely's, with nulls kept and slices honoured."""
+        column = wkb_column(GEOMETRIES + [None])
+        expected = [
+            None if w is None else shapely.to_wkb(shapely.from_wkt(w), hex=True, flavor="iso")
+            for w in GEOMETRIES + [None]
+        ]
+
+        assert wkb_to_hex(column).to_pylist() == expected
+        assert wkb_to_hex(column.slice(2)).to_pylist() == expected[2:]
+        assert wkb_to_hex(pa.chunked_array([column[:2], column[2:]])).to_pylist() == expected
+
+    def test_empty_column(self):
+        """Test an empty column encodes to an empty string column."""
+        assert wkb_to_hex(pa.array([], pa.binary())).to_pylist() == []
@@ -5,7 +5,9 @@ This package provides common functionality for:
 - Configuration management (Pydantic Settings)
 - Data models (Pydantic)
 - Database connections (asyncpg)
-- Message queue clients (RabbitMQ)
+- Message queue clients (RabbitMQ, blocking and asyncio), message body codecs
+  a local spool for unpublished messages and queue-depth backpressure
+- Content hashing for deduplication
 """
 
 __version__ = "0.1.0"
@@ -15,4 +17,9 @@ __all__ = [
     "models",
     "database",
     "rabbitmq",
+    "aio_rabbitmq",
+    "codecs",
+    "spool",
+    "backpressure",
+    "hash_utils",
 ]
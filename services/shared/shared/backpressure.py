@@ -0,0 +1,343 @@
+"""
+Queue-depth-aware publish rate limiting.
+
+Bounded queues (x-max-length, e.g. deduplication at 1,000,000 messages)
+drop or dead-letter messages once they are full, so publishers slow down
+before that (see shared.aio_rabbitmq):
+- QueueBackpressure samples the queue's depth and consumer count at most
+  every SAMPLE_INTERVAL_SECONDS (a passive queue declare) and estimates how
+  fast the consumers drain it from successive samples
+- Below the low watermark publishing is unlimited; between the low and
+  high watermark a token bucket limits it to a rate falling from twice the
+  drain rate to nothing; at the high watermark publishing waits until the
+  consumers have brought the queue back down
+- LocalQueue stands in for a broker queue in tests
+
+Rates are per process; with several publishing processes the high
+watermark is what keeps the queue below its limit.
+
+Example:
+    ```python
+    backpressure = QueueBackpressure('deduplication', 1_000_000, depth_source)
+    await backpressure.acquire(len(messages))  # Waits while throttled
+    print(backpressure.reason())
+    ```
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Watermarks as a fraction of x-max-length and the lowest throttled rate in
+# messages per second (overridable via RABBITMQ_BACKPRESSURE_LOW_WATERMARK /
+# RABBITMQ_BACKPRESSURE_HIGH_WATERMARK / RABBITMQ_BACKPRESSURE_MIN_RATE)
+DEFAULT_LOW_WATERMARK = 0.5
+DEFAULT_HIGH_WATERMARK = 0.9
+DEFAULT_MIN_RATE = 100.0
+
+# Seconds between queue depth samples
+SAMPLE_INTERVAL_SECONDS = 2.0
+
+# Weight of the newest sample in the drain rate estimate
+DRAIN_RATE_SMOOTHING = 0.5
+
+# Returns (message count, consumer count) of a queue, or None while unknown
+DepthSource = Callable[[str], Awaitable[Optional[Tuple[int, int]]]]
+
+
+class TokenBucket:
+    """
+    Token bucket limiting a message rate.
+
+    Holds up to `burst_seconds` of tokens. A batch larger than the bucket
+    waits for a full bucket and leaves it in debt, so large batches keep
+    the average rate too.
+
+    Args:
+        rate: Messages per second (None: unlimited, 0: nothing passes)
+        burst_seconds: Seconds of tokens the bucket holds
+        clock: Monotonic clock (replaceable in tests)
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.burst_seconds = burst_seconds
+        self.clock = clock
+        self.rate: Optional[float] = None
+        self.capacity = 0.0
+        self.tokens = 0.0
+        self._updated = clock()
+        self.set_rate(rate)
+
+    def set_rate(self, rate: Optional[float]) -> None:
+        """Change the rate; a bucket that was unlimited starts full."""
+        self._refill()
+        if rate is None:
+            self.rate = None
+            return
+        capacity = max(rate * self.burst_seconds, 1.0)
+        self.tokens = capacity if self.rate is None else min(self.tokens, capacity)
+        self.rate = rate
+        self.capacity = capacity
+
+    def _refill(self) -> None:
+        now = self.clock()
+        if self.rate:
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def take(self, count: int) -> float:
+        """
+        Take tokens for `count` messages if they are available.
+
+        Returns:
+            float: 0 if taken, otherwise seconds until they would be
+                (inf while the rate is 0)
+        """
+        if self.rate is None:
+            return 0.0
+        if self.rate == 0:
+            return math.inf
+        self._refill()
+        needed = min(count, self.capacity)
+        if self.tokens >= needed - 1e-9:  # Refills may fall short by rounding
+            self.tokens -= count
+            return 0.0
+        return (needed - self.tokens) / self.rate
+
+
+class QueueBackpressure:
+    """
+    Publish rate of one bounded queue, adapted to its depth.
+
+    The depth is sampled lazily by acquire(). While the depth is unknown
+    (not connected yet) publishing is not limited, and a sample that fails
+    (e.g. broker unreachable) lifts the limit, leaving outages to the
+    publisher's circuit breaker.
+
+    Args:
+        queue: Queue name
+        max_length: The queue's x-max-length
+        depth_source: Returns the queue's (message count, consumer count),
+            or None while unknown
+        low_watermark: Fill fraction where throttling starts
+            (default: RABBITMQ_BACKPRESSURE_LOW_WATERMARK or 0.5)
+        high_watermark: Fill fraction where publishing stops
+            (default: RABBITMQ_BACKPRESSURE_HIGH_WATERMARK or 0.9)
+        min_rate: Lowest rate below the high watermark, in messages per second
+            (default: RABBITMQ_BACKPRESSURE_MIN_RATE or 100)
+        sample_interval: Seconds between depth samples
+        clock: Monotonic clock (replaceable in tests)
+    """
+
+    def __init__(
+        self,
+        queue: str,
+        max_length: int,
+        depth_source: DepthSource,
+        low_watermark: Optional[float] = None,
+        high_watermark: Optional[float] = None,
+        min_rate: Optional[float] = None,
+        sample_interval: float = SAMPLE_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.queue = queue
+        self.max_length = max_length
+        self.depth_source = depth_source
+        self.low_watermark = low_watermark if low_watermark is not None else float(
+            os.getenv("RABBITMQ_BACKPRESSURE_LOW_WATERMARK", DEFAULT_LOW_WATERMARK)
+        )
+        self.high_watermark = high_watermark if high_watermark is not None else float(
+            os.getenv("RABBITMQ_BACKPRESSURE_HIGH_WATERMARK", DEFAULT_HIGH_WATERMARK)
+        )
+        self.min_rate = min_rate if min_rate is not None else float(
+            os.getenv("RABBITMQ_BACKPRESSURE_MIN_RATE", DEFAULT_MIN_RATE)
+        )
+        self.sample_interval = sample_interval
+        self.clock = clock
+        self.bucket = TokenBucket(clock=clock)
+        self.depth: Optional[int] = None
+        self.consumers = 0
+        self.drain_rate: Optional[float] = None
+        self.throttled_seconds = 0.0
+        self._published = 0
+        self._sampled_at = -math.inf
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Current publish rate limit (None: unlimited)."""
+        return self.bucket.rate
+
+    @property
+    def fill(self) -> float:
+        """Last sampled depth as a fraction of max_length."""
+        return (self.depth or 0) / self.max_length
+
+    async def acquire(self, count: int) -> float:
+        """
+        Wait until `count` messages may be published.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        started = self.clock()
+        while True:
+            if self.clock() - self._sampled_at >= self.sample_interval:
+                async with self._lock:
+                    if self.clock() - self._sampled_at >= self.sample_interval:
+                        await self.sample()
+
+            wait = self.bucket.take(count)
+            if wait == 0:
+                self._published += count
+                waited = self.clock() - started
+                self.throttled_seconds += waited
+                return waited
+            await asyncio.sleep(min(wait, self.sample_interval))
+
+    async def sample(self) -> None:
+        """Read the queue's depth and adapt the rate to it."""
+        now = self.clock()
+        try:
+            sampled = await self.depth_source(self.queue)
+        except Exception as e:
+            logger.warning(f"Could not read the depth of {self.queue}, not throttling: {e}")
+            self.depth = None
+            self._published = 0
+            self._sampled_at = now
+            self._set_rate(None)
+            return
+        if sampled is None:
+            return  # Sampled again by the next acquire
+
+        depth, consumers = sampled
+        if self.depth is not None and now > self._sampled_at:
+            # Whatever left the queue since the last sample (our publishes included)
+            drained = max(0, self.depth + self._published - depth) / (now - self._sampled_at)
+            self.drain_rate = drained if self.drain_rate is None else (
+                DRAIN_RATE_SMOOTHING * drained + (1 - DRAIN_RATE_SMOOTHING) * self.drain_rate
+            )
+        self.depth = depth
+        self.consumers = consumers
+        self._published = 0
+        self._sampled_at = now
+        self._set_rate(self._target_rate())
+
+    def _target_rate(self) -> Optional[float]:
+        """Rate for the last sample (None: unlimited)."""
+        fill = self.fill
+        if fill < self.low_watermark:
+            return None
+        if fill >= self.high_watermark:
+            return 0.0
+        headroom = (self.high_watermark - fill) / (self.high_watermark - self.low_watermark)
+        drain_rate = self.drain_rate if self.consumers else 0.0
+        return max(self.min_rate, 2 * (drain_rate or 0.0) * headroom)
+
+    def _set_rate(self, rate: Optional[float]) -> None:
+        if (rate is None) != (self.rate is None):
+            if rate is None:
+                logger.info(f"{self.queue} queue below its low watermark, no longer throttling")
+            else:
+                logger.warning(f"Throttling publishes: {self._describe(rate)}")
+        self.bucket.set_rate(rate)
+
+    def reason(self) -> Optional[str]:
+        """Why publishing is throttled, or None while it is not."""
+        return None if self.rate is None else self._describe(self.rate)
+
+    def _describe(self, rate: float) -> str:
+        queue = f"{self.queue} queue at {self.fill:.0%} of its {self.max_length:,} message limit"
+        if rate == 0:
+            return f"{queue}, waiting for consumers to drain it"
+        return f"{queue}, publishing limited to {rate:,.0f} messages/s"
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Backpressure metrics.
+
+        Returns:
+            dict: depth, fill, consumers, drain_rate (messages/s), throttled
+                (1 or 0), rate (messages/s while throttled) and
+                throttled_seconds (publishes waiting in total)
+        """
+        return {
+            "depth": self.depth or 0,
+            "fill": round(self.fill, 4),
+            "consumers": self.consumers,
+            "drain_rate": round(self.drain_rate or 0.0, 1),
+            "throttled": int(self.rate is not None),
+            "rate": round(self.rate or 0.0, 1),
+            "throttled_seconds": round(self.throttled_seconds, 3),
+        }
+
+
+class LocalQueue:
+    """
+    In-process stand-in for a bounded broker queue.
+
+    Published messages wait until the consumers drain them at
+    `consume_rate` messages per second; messages past max_length are
+    dropped, as the broker would. passive_declare() is a DepthSource.
+
+    Args:
+        consume_rate: Messages per second the consumers take
+        consumers: Consumer count (0: nothing is drained)
+        depth: Messages already in the queue
+        max_length: Queue limit (None: unbounded)
+        clock: Monotonic clock (replaceable in tests)
+    """
+
+    def __init__(
+        self,
+        consume_rate: float,
+        consumers: int = 1,
+        depth: int = 0,
+        max_length: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.consume_rate = consume_rate
+        self.consumers = consumers
+        self.max_length = max_length
+        self.clock = clock
+        self.dropped = 0
+        self._depth = float(depth)
+        self._updated = clock()
+
+    @property
+    def depth(self) -> int:
+        """Messages in the queue now."""
+        now = self.clock()
+        if self.consumers:
+            self._depth = max(0.0, self._depth - (now - self._updated) * self.consume_rate)
+        self._updated = now
+        return int(self._depth)
+
+    def publish(self, count: int) -> None:
+        """Enqueue `count` messages, dropping what does not fit."""
+        depth = self.depth
+        accepted = count if self.max_length is None else max(0, min(count, self.max_length - depth))
+        self.dropped += count - accepted
+        self._depth += accepted
+
+    async def passive_declare(self, queue: str) -> Tuple[int, int]:
+        """The queue's (message count, consumer count), like a passive declare."""
+        return self.depth, self.consumers
+
+
+__all__ = [
+    "DepthSource",
+    "TokenBucket",
+    "QueueBackpressure",
+    "LocalQueue",
+]
@@ -0,0 +1,257 @@
+"""
+Message codecs for RabbitMQ bodies.
+
+This module provides:
+- Serializers: 'json' (stdlib), 'orjson' (same JSON, faster) and 'msgpack' (binary)
+- Optional zstd compression, with an optional shared dictionary trained on sample records
+- Codec specs like "msgpack+zstd", selected per publish or via RABBITMQ_MESSAGE_CODEC
+- decode_message() for consumers, driven by the AMQP content_type/content_encoding
+
+The codec travels with every message: content_type names the serializer
+('application/json' or 'application/msgpack') and content_encoding names the
+compression ('zstd'). Messages without them are JSON, so the default 'json'
+codec keeps old consumers working, and upgraded consumers read every codec.
+Roll out consumers before switching producers to a binary codec.
+
+orjson, msgpack and zstandard are optional: they are imported when a codec
+that needs them is first used.
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+# Codec used when none is given (overridable per process via RABBITMQ_MESSAGE_CODEC)
+DEFAULT_CODEC = "json"
+
+# Compression level for zstd bodies (fast levels compress small messages nearly as well)
+ZSTD_LEVEL = 3
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+ZSTD_ENCODING = "zstd"
+
+
+@dataclass(frozen=True)
+class MessageCodec:
+    """
+    Serializer plus optional compression for message bodies.
+
+    Attributes:
+        name: Codec spec (e.g. "msgpack+zstd")
+        content_type: AMQP content_type of the serialized body
+        content_encoding: AMQP content_encoding ('zstd' or None)
+        encode: Message dict -> body
+    """
+
+    name: str
+    content_type: str
+    content_encoding: Optional[str]
+    encode: Callable[[Dict[str, Any]], Union[str, bytes]]
+
+
+def _import_optional(module: str) -> Any:
+    """Import an optional codec dependency with an actionable error."""
+    try:
+        return __import__(module)
+    except ImportError as e:
+        raise ValueError(
+            f"Message codec requires the '{module}' package (install shared[codecs])"
+        ) from e
+
+
+@lru_cache(maxsize=None)
+def _json_loads() -> Callable[[Union[str, bytes]], Any]:
+    """Fastest available JSON parser (orjson when installed)."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+def _serializer(name: str) -> Tuple[str, Callable[[Dict[str, Any]], Union[str, bytes]]]:
+    """(content_type, encode) of a serializer name."""
+    if name == "json":
+        return JSON_CONTENT_TYPE, json.dumps
+    if name == "orjson":
+        orjson = _import_optional("orjson")
+        return JSON_CONTENT_TYPE, orjson.dumps
+    if name == "msgpack":
+        msgpack = _import_optional("msgpack")
+        return MSGPACK_CONTENT_TYPE, msgpack.packb
+    raise ValueError(f"Unknown message serializer '{name}'. Supported: json, orjson, msgpack")
+
+
+@lru_cache(maxsize=None)
+def get_codec(spec: Optional[str] = None) -> MessageCodec:
+    """
+    Get the codec for a spec: serializer name, optionally followed by "+zstd".
+
+    Args:
+        spec: e.g. "json", "orjson", "msgpack", "msgpack+zstd"
+            (default: RABBITMQ_MESSAGE_CODEC or DEFAULT_CODEC)
+
+    Returns:
+        MessageCodec
+
+    Raises:
+        ValueError: If the spec is unknown or its package is not installed
+
+    Example:
+        ```python
+        codec = get_codec("msgpack+zstd")
+        body = codec.encode({"batch_id": "uuid", "raw_data": {...}})
+        ```
+    """
+    spec = spec or os.getenv("RABBITMQ_MESSAGE_CODEC", DEFAULT_CODEC)
+    serializer, _, compression = spec.partition("+")
+    content_type, serialize = _serializer(serializer)
+
+    if not compression:
+        return MessageCodec(spec, content_type, None, serialize)
+    if compression != ZSTD_ENCODING:
+        raise ValueError(f"Unknown message compression '{compression}'. Supported: zstd")
+
+    dictionary = _configured_dictionary()
+    local = threading.local()  # zstd compressors must not be shared between threads
+
+    def encode(message: Dict[str, Any]) -> bytes:
+        compressor = getattr(local, "compressor", None)
+        if compressor is None:
+            compressor = local.compressor = _import_optional("zstandard").ZstdCompressor(
+                level=ZSTD_LEVEL, dict_data=dictionary
+            )
+        body = serialize(message)
+        return compressor.compress(body.encode("utf-8") if isinstance(body, str) else body)
+
+    return MessageCodec(spec, content_type, ZSTD_ENCODING, encode)
+
+
+def decode_message(
+    body: bytes,
+    content_type: Optional[str] = None,
+    content_encoding: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Decode a message body using its AMQP properties.
+
+    Args:
+        body: Message body
+        content_type: properties.content_type (None means JSON)
+        content_encoding: properties.content_encoding (None means uncompressed)
+
+    Returns:
+        The message dict
+
+    Raises:
+        ValueError: If the content type or encoding is not supported
+
+    Example:
+        ```python
+        def on_message(channel, method, properties, body):
+            message = decode_message(body, properties.content_type, properties.content_encoding)
+        ```
+    """
+    if content_encoding == ZSTD_ENCODING:
+        body = _zstd_decompress(body)
+    elif content_encoding not in (None, "", "identity"):
+        raise ValueError(f"Unsupported message content_encoding '{content_encoding}'")
+
+    if content_type in (None, "", JSON_CONTENT_TYPE):
+        try:
+            return _json_loads()(body)
+        except ValueError:
+            return json.loads(body)  # e.g. NaN written by json.dumps, which orjson rejects
+    if content_type == MSGPACK_CONTENT_TYPE:
+        return _import_optional("msgpack").unpackb(body, raw=False)
+    raise ValueError(f"Unsupported message content_type '{content_type}'")
+
+
+# zstd dictionaries by dictionary ID (zstd frames name the dictionary they need)
+_zstd_dictionaries: Dict[int, Any] = {}
+
+
+def train_zstd_dictionary(
+    messages: Iterable[Dict[str, Any]],
+    serializer: str = "msgpack",
+    dict_size: int = 16 * 1024
+) -> bytes:
+    """
+    Train a zstd dictionary on sample messages.
+
+    A dictionary holds the field names and common values shared by all
+    records, so small bodies compress well on their own.
+
+    Args:
+        messages: Representative messages (a few thousand records)
+        serializer: Serializer the dictionary will be used with
+        dict_size: Maximum dictionary size in bytes
+
+    Returns:
+        bytes: Dictionary to save and point RABBITMQ_ZSTD_DICTIONARY at
+    """
+    zstandard = _import_optional("zstandard")
+    _, serialize = _serializer(serializer)
+    samples = []
+    for message in messages:
+        body = serialize(message)
+        samples.append(body.encode("utf-8") if isinstance(body, str) else body)
+    return zstandard.train_dictionary(dict_size, samples).as_bytes()
+
+
+def load_zstd_dictionary(data: Union[bytes, Path, str]) -> int:
+    """
+    Register a zstd dictionary for decompression.
+
+    Args:
+        data: Dictionary bytes or a path to a dictionary file
+
+    Returns:
+        int: Dictionary ID
+    """
+    zstandard = _import_optional("zstandard")
+    if not isinstance(data, bytes):
+        data = Path(data).read_bytes()
+    dictionary = zstandard.ZstdCompressionDict(data)
+    _zstd_dictionaries[dictionary.dict_id()] = dictionary
+    return dictionary.dict_id()
+
+
+def _configured_dictionary() -> Any:
+    """Dictionary from RABBITMQ_ZSTD_DICTIONARY (None if unset)."""
+    path = os.getenv("RABBITMQ_ZSTD_DICTIONARY")
+    if not path:
+        return None
+    dict_id = load_zstd_dictionary(path)
+    return _zstd_dictionaries[dict_id]
+
+
+def _zstd_decompress(body: bytes) -> bytes:
+    """Decompress a zstd body, with the dictionary its frame names."""
+    zstandard = _import_optional("zstandard")
+    dict_id = zstandard.get_frame_parameters(body).dict_id
+
+    dictionary = None
+    if dict_id:
+        if dict_id not in _zstd_dictionaries:
+            _configured_dictionary()
+        dictionary = _zstd_dictionaries.get(dict_id)
+        if dictionary is None:
+            raise ValueError(f"Message needs unknown zstd dictionary {dict_id}")
+
+    return zstandard.ZstdDecompressor(dict_data=dictionary).decompress(body)
+
+
+__all__ = [
+    "DEFAULT_CODEC",
+    "MessageCodec",
+    "get_codec",
+    "decode_message",
+    "train_zstd_dictionary",
+    "load_zstd_dictionary",
+]
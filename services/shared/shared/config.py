@@ -5,6 +5,7 @@ Provides base settings class with common configuration (DATABASE_URL, RABBITMQ_U
 that all services inherit from.
 """
 
+import os
 from pathlib import Path
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -54,6 +55,23 @@ def find_dotenv() -> str | None:
     return None
 
 
+# Settings that shared modules read from the environment (os.getenv) rather
+# than from a settings object; see BaseServiceSettings.export_environment()
+ENVIRONMENT_SETTINGS = (
+    "RABBITMQ_MESSAGE_CODEC",
+    "RABBITMQ_ZSTD_DICTIONARY",
+    "RABBITMQ_CHANNEL_POOL_SIZE",
+    "RABBITMQ_POOL_CONNECTIONS",
+    "RABBITMQ_BREAKER_FAILURES",
+    "RABBITMQ_BREAKER_RESET_SECONDS",
+    "RABBITMQ_SPOOL_SEGMENT_MB",
+    "RABBITMQ_SPOOL_DRAIN_RATE",
+    "RABBITMQ_BACKPRESSURE_LOW_WATERMARK",
+    "RABBITMQ_BACKPRESSURE_HIGH_WATERMARK",
+    "RABBITMQ_BACKPRESSURE_MIN_RATE",
+)
+
+
 class BaseServiceSettings(BaseSettings):
     """
     Base configuration for all services.
@@ -142,6 +160,73 @@ class BaseServiceSettings(BaseSettings):
         le=1000
     )
 
+    RABBITMQ_MESSAGE_CODEC: str = Field(
+        "json",
+        description="Message body codec: json, orjson or msgpack, optionally +zstd (e.g. msgpack+zstd)"
+    )
+    RABBITMQ_ZSTD_DICTIONARY: str | None = Field(
+        None,
+        description="Path to a zstd dictionary for +zstd codecs (see shared.codecs.train_zstd_dictionary)"
+    )
+    RABBITMQ_CHANNEL_POOL_SIZE: int = Field(
+        8,
+        description="Publishing channels per event loop (shared.aio_rabbitmq), leased one per publishing task",
+        ge=1,
+        le=256
+    )
+    RABBITMQ_POOL_CONNECTIONS: int = Field(
+        2,
+        description="Broker connections the publishing channels are spread over",
+        ge=1,
+        le=32
+    )
+    RABBITMQ_BREAKER_FAILURES: int = Field(
+        5,
+        description="Consecutive failed publish attempts that open the publishing circuit breaker",
+        ge=1,
+        le=1000
+    )
+    RABBITMQ_BREAKER_RESET_SECONDS: float = Field(
+        30.0,
+        description="Seconds an open circuit breaker fails fast before a half-open probe of the broker",
+        gt=0,
+        le=3600
+    )
+    RABBITMQ_SPOOL_PATH: str | None = Field(
+        None,
+        description="Directory of the local publish spool for messages the broker did not take (unset: disabled)"
+    )
+    RABBITMQ_SPOOL_SEGMENT_MB: int = Field(
+        64,
+        description="Size in MB at which a spool segment is sealed for replay",
+        ge=1,
+        le=4096
+    )
+    RABBITMQ_SPOOL_DRAIN_RATE: int = Field(
+        2000,
+        description="Messages per second replayed from the spool once the broker is back",
+        ge=1,
+        le=1000000
+    )
+    RABBITMQ_BACKPRESSURE_LOW_WATERMARK: float = Field(
+        0.5,
+        description="Fill fraction of a bounded queue (x-max-length) where publishing to it is throttled",
+        gt=0,
+        le=1
+    )
+    RABBITMQ_BACKPRESSURE_HIGH_WATERMARK: float = Field(
+        0.9,
+        description="Fill fraction of a bounded queue where publishing waits for consumers to drain it",
+        gt=0,
+        le=1
+    )
+    RABBITMQ_BACKPRESSURE_MIN_RATE: float = Field(
+        100.0,
+        description="Lowest throttled publish rate (messages per second) below the high watermark",
+        ge=1,
+        le=1000000
+    )
+
     LOG_LEVEL: str = Field(
         "INFO",
         description="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"
@@ -160,5 +245,19 @@ class BaseServiceSettings(BaseSettings):
         description="Environment name (development, staging, production)"
     )
 
+    def export_environment(self) -> None:
+        """
+        Export the settings listed in ENVIRONMENT_SETTINGS to os.environ.
+
+        Shared modules (e.g. shared.codecs) read these with os.getenv, so
+        values coming only from the .env file would otherwise be ignored.
+        Call once at startup, before the first publish; spawned worker
+        processes inherit the exported values.
+        """
+        for name in ENVIRONMENT_SETTINGS:
+            value = getattr(self, name)
+            if value is not None:
+                os.environ[name] = str(value)
+
 
-__all__ = ["BaseServiceSettings", "find_dotenv"]
+__all__ = ["BaseServiceSettings", "ENVIRONMENT_SETTINGS", "find_dotenv"]
@@ -0,0 +1,299 @@
+"""
+Content hashing utilities for deduplication.
+
+This module provides:
+- Canonical, versioned content hashes for PARCEL, RETR and DFI records
+- Single-record functions (compute_parcel_hash, compute_retr_hash, compute_dfi_hash)
+- A column-wise batch function for whole chunks (compute_content_hashes)
+- Normalization helpers shared by both paths
+
+A hash is the SHA-256 hex digest of the record's canonical JSON (selected
+fields, normalized, sorted keys). raw_imports.content_hash holds 64
+characters, so the hash version travels next to the digest (the message's
+hash_version field) instead of being prefixed to it. Any change to the
+selected fields or the normalization must add a new version.
+"""
+
+import hashlib
+import json
+import re
+from datetime import date
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from dateutil import parser as date_parser
+
+# Version of the canonical form produced by default
+HASH_VERSION = "v1"
+
+# JSON string encoder used by json.dumps (ensure_ascii=True)
+_encode_json_string = json.encoder.encode_basestring_ascii
+
+_ISO_DATE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})(?:[T ].*)?")
+_US_DATE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_COMPACT_DATE = re.compile(r"(\d{4})(\d{2})(\d{2})")
+
+
+def normalize_string(value: Any) -> str:
+    """Uppercase, trim, handle None."""
+    if value is None:
+        return ""
+    return str(value).upper().strip()
+
+
+def normalize_number(value: Any) -> str:
+    """Convert to string with fixed precision."""
+    if value is None:
+        return "0"
+    try:
+        return f"{float(value):.2f}"
+    except (ValueError, TypeError):
+        return "0"
+
+
+def normalize_date(value: Any) -> str:
+    """Convert to ISO date string (YYYY-MM-DD); unparseable values are normalized as strings."""
+    if value is None:
+        return ""
+    return _normalize_date_text(str(value).strip())
+
+
+@lru_cache(maxsize=65536)
+def _normalize_date_text(text: str) -> str:
+    """Parse one date string (cached: date columns repeat heavily)."""
+    if not text:
+        return ""
+
+    for pattern, order in ((_ISO_DATE, "ymd"), (_US_DATE, "mdy"), (_COMPACT_DATE, "ymd")):
+        match = pattern.fullmatch(text)
+        if match:
+            parts = dict(zip(order, (int(g) for g in match.groups())))
+            try:
+                return date(parts["y"], parts["m"], parts["d"]).isoformat()
+            except ValueError:
+                break
+
+    try:
+        return date_parser.parse(text).date().isoformat()
+    except (ValueError, OverflowError):
+        return text.upper()
+
+
+def normalize_parcel_id(value: Any) -> str:
+    """Remove dashes, spaces, normalize."""
+    if value is None:
+        return ""
+    return str(value).upper().replace('-', '').replace(' ', '').strip()
+
+
+# Canonical fields per version and source type: (canonical key, record field, normalizer)
+HashFields = Tuple[Tuple[str, str, Callable[[Any], str]], ...]
+
+_HASH_FIELDS: Dict[str, Dict[str, HashFields]] = {
+    "v1": {
+        # Location, ownership and assessment fields that define a parcel
+        "PARCEL": (
+            ('STATEID', 'STATEID', normalize_string),
+            ('ADDNUM', 'ADDNUM', normalize_string),
+            ('STREETNAME', 'STREETNAME', normalize_string),
+            ('STREETTYPE', 'STREETTYPE', normalize_string),
+            ('PLACENAME', 'PLACENAME', normalize_string),
+            ('ZIPCODE', 'ZIPCODE', normalize_string),
+            ('CONAME', 'CONAME', normalize_string),
+            ('OWNERNME1', 'OWNERNME1', normalize_string),
+            ('OWNERNME2', 'OWNERNME2', normalize_string),
+            ('PSTLADRESS', 'PSTLADRESS', normalize_string),
+            ('ASSESSYEAR', 'ASSESSYEAR', normalize_string),
+            ('CNTASSDVALUE', 'CNTASSDVALUE', normalize_number),
+            ('PROPCLASS', 'PROPCLASS', normalize_string),
+        ),
+        "RETR": (
+            ('parcel_id', 'PARCEL_ID', normalize_parcel_id),
+            ('transfer_date', 'TRANSFER_DATE', normalize_date),
+            ('doc_number', 'DOC_NUMBER', normalize_string),
+            ('grantor', 'GRANTOR', normalize_string),
+            ('grantee', 'GRANTEE', normalize_string),
+            ('sale_amount', 'SALE_AMOUNT', normalize_number),
+        ),
+        "DFI": (
+            ('entity_id', 'ENTITY_ID', normalize_string),
+            ('entity_name', 'ENTITY_NAME', normalize_string),
+            ('entity_type', 'ENTITY_TYPE', normalize_string),
+            ('status', 'STATUS', normalize_string),
+            ('agent_name', 'AGENT_NAME', normalize_string),
+            ('agent_address', 'AGENT_ADDRESS', normalize_string),
+            ('effective_date', 'EFFECTIVE_DATE', normalize_date),
+        ),
+    },
+}
+
+
+def hash_fields(source_type: str, version: str = HASH_VERSION) -> HashFields:
+    """
+    Canonical fields of a source type, sorted by canonical key.
+
+    Args:
+        source_type: 'PARCEL', 'RETR' or 'DFI'
+        version: Hash version (default: HASH_VERSION)
+
+    Returns:
+        Tuple of (canonical key, record field, normalizer)
+
+    Raises:
+        ValueError: If the version or source type is unknown
+    """
+    if version not in _HASH_FIELDS:
+        raise ValueError(f"Unknown hash version '{version}'. Supported: {', '.join(_HASH_FIELDS)}")
+    fields = _HASH_FIELDS[version].get(source_type)
+    if fields is None:
+        raise ValueError(f"No content hash defined for source type '{source_type}'")
+    return tuple(sorted(fields, key=lambda f: f[0]))
+
+
+def compute_content_hash(
+    source_type: str,
+    raw_data: Mapping[str, Any],
+    version: str = HASH_VERSION
+) -> str:
+    """
+    Compute the content hash of one record.
+
+    Args:
+        source_type: 'PARCEL', 'RETR' or 'DFI'
+        raw_data: Record fields (e.g. a model_dump payload)
+        version: Hash version (default: HASH_VERSION)
+
+    Returns:
+        str: SHA-256 hex digest (64 characters)
+
+    Example:
+        ```python
+        content_hash = compute_content_hash("RETR", {"PARCEL_ID": "12-345", "SALE_AMOUNT": 250000.0})
+        ```
+    """
+    canonical = {
+        key: normalize(raw_data.get(name))
+        for key, name, normalize in hash_fields(source_type, version)
+    }
+    canonical_json = json.dumps(canonical, sort_keys=True)
+    return hashlib.sha256(canonical_json.encode('utf-8')).hexdigest()
+
+
+def compute_parcel_hash(raw_data: Mapping[str, Any]) -> str:
+    """Compute SHA-256 hash for parcel record (current version)."""
+    return compute_content_hash("PARCEL", raw_data)
+
+
+def compute_retr_hash(raw_data: Mapping[str, Any]) -> str:
+    """Compute SHA-256 hash for RETR (Real Estate Transfer Return) record (current version)."""
+    return compute_content_hash("RETR", raw_data)
+
+
+def compute_dfi_hash(raw_data: Mapping[str, Any]) -> str:
+    """Compute SHA-256 hash for DFI (corporate entity) record (current version)."""
+    return compute_content_hash("DFI", raw_data)
+
+
+def compute_content_hashes(
+    source_type: str,
+    columns: Mapping[str, Sequence[Any]],
+    n_rows: Optional[int] = None,
+    version: str = HASH_VERSION
+) -> List[str]:
+    """
+    Compute content hashes for a whole chunk given column-wise values.
+
+    Each canonical field is normalized and JSON-encoded once per distinct
+    value in its column;
+    rows are then assembled from the encoded columns and digested. The
+    result is identical to compute_content_hash on each row.
+
+    Args:
+        source_type: 'PARCEL', 'RETR' or 'DFI'
+        columns: Field name -> values (None for missing); absent fields count as missing
+        n_rows: Number of rows (default: length of the first column)
+        version: Hash version (default: HASH_VERSION)
+
+    Returns:
+        List of SHA-256 hex digests, one per row
+
+    Example:
+        ```python
+        hashes = compute_content_hashes("RETR", {
+            "PARCEL_ID": ["12-345", "12-346"],
+            "SALE_AMOUNT": [250000.0, None],
+        })
+        ```
+    """
+    if n_rows is None:
+        n_rows = len(next(iter(columns.values()))) if columns else 0
+
+    encoded_columns = []
+    prefixes = []
+    for i, (key, name, normalize) in enumerate(hash_fields(source_type, version)):
+        values = columns.get(name)
+        if values is None:
+            encoded = [_encode_json_string(normalize(None))] * n_rows
+        else:
+            encoded = _encode_column(values, normalize)
+        encoded_columns.append(encoded)
+        prefixes.append(("{" if i == 0 else ", ") + _encode_json_string(key) + ": ")
+
+    hashes = []
+    sha256 = hashlib.sha256
+    for row in zip(*encoded_columns):
+        canonical_json = "".join([p + v for p, v in zip(prefixes, row)]) + "}"
+        hashes.append(sha256(canonical_json.encode('utf-8')).hexdigest())
+    return hashes
+
+
+def _encode_column(values: Sequence[Any], normalize: Callable[[Any], str]) -> List[str]:
+    """Normalize and JSON-encode a column, once per distinct value (columns repeat heavily)."""
+    # Equal values of different types (1, 1.0, True) normalize differently
+    if len(set(map(type, values)) - {type(None)}) > 1:
+        return [_encode_json_string(normalize(value)) for value in values]
+    try:
+        encoded = {value: _encode_json_string(normalize(value)) for value in set(values)}
+    except TypeError:  # Unhashable values
+        return [_encode_json_string(normalize(value)) for value in values]
+    return [encoded[value] for value in values]
+
+
+def compute_record_hashes(
+    source_type: str,
+    records: Iterable[Mapping[str, Any]],
+    version: str = HASH_VERSION
+) -> List[str]:
+    """
+    Compute content hashes for row-wise records via the column-wise path.
+
+    Args:
+        source_type: 'PARCEL', 'RETR' or 'DFI'
+        records: Record payloads
+        version: Hash version (default: HASH_VERSION)
+
+    Returns:
+        List of SHA-256 hex digests, one per record
+    """
+    records = list(records)
+    columns = {
+        name: [record.get(name) for record in records]
+        for _, name, _ in hash_fields(source_type, version)
+    }
+    return compute_content_hashes(source_type, columns, len(records), version)
+
+
+__all__ = [
+    "HASH_VERSION",
+    "hash_fields",
+    "compute_content_hash",
+    "compute_content_hashes",
+    "compute_record_hashes",
+    "compute_parcel_hash",
+    "compute_retr_hash",
+    "compute_dfi_hash",
+    "normalize_string",
+    "normalize_number",
+    "normalize_date",
+    "normalize_parcel_id",
+]
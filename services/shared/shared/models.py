@@ -78,6 +78,28 @@ class V11ParcelRecord(BaseModel):
     geometry_wkt: str = Field(..., description="Well-Known Text geometry")
     geometry_type: str = Field(..., description="Geometry type (MultiPolygon, Polygon, etc.)")
 
+    # === Geometry metrics (EPSG:3071 metres, computed at ingest) ===
+    bbox_minx: Optional[float] = Field(None, description="Bounding box minimum X")
+    bbox_miny: Optional[float] = Field(None, description="Bounding box minimum Y")
+    bbox_maxx: Optional[float] = Field(None, description="Bounding box maximum X")
+    bbox_maxy: Optional[float] = Field(None, description="Bounding box maximum Y")
+    centroid_x: Optional[float] = Field(None, description="Centroid X")
+    centroid_y: Optional[float] = Field(None, description="Centroid Y")
+    area: Optional[float] = Field(None, description="Area in square metres")
+
+
+class V11ParcelWKBRecord(V11ParcelRecord):
+    """
+    V11 parcel record carrying its geometry as WKB.
+
+    Same schema as V11ParcelRecord, with the geometry as hex-encoded ISO WKB
+    in EPSG:3071 (accepted as-is by PostGIS ST_GeomFromWKB/::geometry);
+    geometry_wkt is optional and only present when both formats are sent.
+    """
+
+    geometry_wkt: Optional[str] = Field(None, description="Well-Known Text geometry (optional)")
+    geometry_wkb: str = Field(..., description="Hex-encoded ISO Well-Known Binary geometry")
+
 
 class RETRRecord(BaseModel):
     """
@@ -161,6 +183,7 @@ class DFIRecord(BaseModel):
 
 __all__ = [
     "V11ParcelRecord",
+    "V11ParcelWKBRecord",
     "RETRRecord",
     "DFIRecord",
 ]
@@ -4,22 +4,62 @@ RabbitMQ connection and messaging utilities.
 This module provides:
 - RabbitMQ connection management with singleton pattern
 - Message publishing with retry logic and persistence
+- Batched publishing with publisher confirms
 - Queue declarations for Layer 1 processing
+- Pluggable body codecs (shared.codecs), announced via content_type/content_encoding
+
+These are blocking (pika.BlockingConnection); code running on an asyncio
+event loop publishes through shared.aio_rabbitmq instead.
 """
 
 import pika
-import json
 import os
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Callable, Dict, List
 import logging
 import time
 
+from .codecs import decode_message, get_codec
+
 logger = logging.getLogger(__name__)
 
 # Global connection and channel (singleton)
 _rabbitmq_connection: Optional[pika.BlockingConnection] = None
 _rabbitmq_channel: Optional[pika.channel.Channel] = None
 
+# Confirm-mode channel for batched publishing (singleton, same connection)
+_confirm_channel: Optional[pika.channel.Channel] = None
+_confirm_tracker: Optional["_ConfirmTracker"] = None
+
+# How long each event-loop pass may block while waiting for confirms
+CONFIRM_POLL_INTERVAL = 0.005
+
+# Layer 1 topology (declared here and by shared.aio_rabbitmq)
+DEAD_LETTER_EXCHANGE = 'dlx.dead-letter'
+QUEUE_ARGUMENTS: Dict[str, Dict[str, Any]] = {
+    # Deduplication queue (ingestion-api → deduplication-service)
+    'deduplication': {
+        'x-queue-type': 'quorum',
+        'x-max-length': 1000000,
+        'x-message-ttl': 86400000,  # 24 hours
+        'x-dead-letter-exchange': DEAD_LETTER_EXCHANGE,
+        'x-dead-letter-routing-key': 'dlq.deduplication'
+    },
+    # Processing queues (deduplication-service → Layer 2)
+    **{
+        f'processing.{source_type}': {
+            'x-queue-type': 'quorum',
+            'x-message-ttl': 86400000,
+            'x-dead-letter-exchange': DEAD_LETTER_EXCHANGE,
+            'x-dead-letter-routing-key': f'dlq.processing.{source_type}'
+        }
+        for source_type in ['parcel', 'retr', 'dfi']
+    }
+}
+DEAD_LETTER_QUEUES = [
+    'dlq.deduplication',
+    *(f'dlq.processing.{source_type}' for source_type in ['parcel', 'retr', 'dfi'])
+]
+
 
 def get_rabbitmq_connection() -> pika.channel.Channel:
     """
@@ -80,53 +120,23 @@ def _declare_queues(channel: pika.channel.Channel) -> None:
     """
     logger.info("Declaring RabbitMQ queues")
 
-    # Deduplication queue (ingestion-api → deduplication-service)
-    channel.queue_declare(
-        queue='deduplication',
-        durable=True,
-        arguments={
-            'x-queue-type': 'quorum',
-            'x-max-length': 1000000,
-            'x-message-ttl': 86400000,  # 24 hours
-            'x-dead-letter-exchange': 'dlx.dead-letter',
-            'x-dead-letter-routing-key': 'dlq.deduplication'
-        }
-    )
-
-    # Processing queues (deduplication-service → Layer 2)
-    for source_type in ['parcel', 'retr', 'dfi']:
-        channel.queue_declare(
-            queue=f'processing.{source_type}',
-            durable=True,
-            arguments={
-                'x-queue-type': 'quorum',
-                'x-message-ttl': 86400000,
-                'x-dead-letter-exchange': 'dlx.dead-letter',
-                'x-dead-letter-routing-key': f'dlq.processing.{source_type}'
-            }
-        )
+    # Deduplication and processing queues
+    for queue, arguments in QUEUE_ARGUMENTS.items():
+        channel.queue_declare(queue=queue, durable=True, arguments=arguments)
 
     # Dead letter exchange
     channel.exchange_declare(
-        exchange='dlx.dead-letter',
+        exchange=DEAD_LETTER_EXCHANGE,
         exchange_type='direct',
         durable=True
     )
 
     # Dead letter queues
-    channel.queue_declare(queue='dlq.deduplication', durable=True)
-    channel.queue_bind(
-        queue='dlq.deduplication',
-        exchange='dlx.dead-letter',
-        routing_key='dlq.deduplication'
-    )
-
-    for source_type in ['parcel', 'retr', 'dfi']:
-        dlq_name = f'dlq.processing.{source_type}'
+    for dlq_name in DEAD_LETTER_QUEUES:
         channel.queue_declare(queue=dlq_name, durable=True)
         channel.queue_bind(
             queue=dlq_name,
-            exchange='dlx.dead-letter',
+            exchange=DEAD_LETTER_EXCHANGE,
             routing_key=dlq_name
         )
 
@@ -137,7 +147,8 @@ def publish_message(
     queue: str,
     message: Dict[str, Any],
     max_retries: int = 3,
-    retry_delay: float = 1.0
+    retry_delay: float = 1.0,
+    codec: Optional[str] = None
 ) -> bool:
     """
     Publish a message to a RabbitMQ queue with retry logic.
@@ -147,9 +158,10 @@ def publish_message(
 
     Args:
         queue: The queue name to publish to
-        message: The message dictionary to publish (will be JSON-encoded)
+        message: The message dictionary to publish (encoded with the codec)
         max_retries: Maximum number of retry attempts
         retry_delay: Delay in seconds between retries
+        codec: Body codec spec, e.g. "msgpack+zstd" (default: RABBITMQ_MESSAGE_CODEC or json)
 
     Returns:
         bool: True if message was published successfully, False otherwise
@@ -163,6 +175,9 @@ def publish_message(
         })
         ```
     """
+    message_codec = get_codec(codec)
+    body = message_codec.encode(message)
+
     for attempt in range(max_retries):
         try:
             channel = get_rabbitmq_connection()
@@ -170,10 +185,11 @@ def publish_message(
             channel.basic_publish(
                 exchange='',
                 routing_key=queue,
-                body=json.dumps(message),
+                body=body,
                 properties=pika.BasicProperties(
                     delivery_mode=2,  # Persistent
-                    content_type='application/json'
+                    content_type=message_codec.content_type,
+                    content_encoding=message_codec.content_encoding
                 )
             )
 
@@ -194,6 +210,291 @@ def publish_message(
     return False
 
 
+class _ConfirmTracker:
+    """
+    Tracks outstanding publisher confirms on a confirm-mode channel.
+
+    The broker numbers deliveries per channel starting at 1, so the tracker
+    mirrors that counter locally and maps delivery tags back to message indexes.
+    """
+
+    def __init__(self) -> None:
+        self.selected = False
+        self.next_tag = 1
+        self.pending: Dict[int, int] = {}  # delivery_tag -> message index
+        self.outcomes: Dict[int, bool] = {}  # message index -> acked
+
+    def register(self, index: int) -> None:
+        """Record that message `index` was just published on the channel."""
+        self.pending[self.next_tag] = index
+        self.next_tag += 1
+
+    def on_select_ok(self, _frame: Any) -> None:
+        """Callback for Confirm.SelectOk."""
+        self.selected = True
+
+    def on_confirm(self, frame: Any) -> None:
+        """Callback for Basic.Ack / Basic.Nack (possibly covering multiple tags)."""
+        method = frame.method
+        acked = isinstance(method, pika.spec.Basic.Ack)
+
+        if method.multiple:
+            tags = [
+                tag for tag in self.pending
+                if method.delivery_tag == 0 or tag <= method.delivery_tag
+            ]
+        elif method.delivery_tag in self.pending:
+            tags = [method.delivery_tag]
+        else:
+            tags = []
+
+        for tag in tags:
+            self.outcomes[self.pending.pop(tag)] = acked
+
+
+def _wait_for(predicate: Callable[[], bool], timeout: float) -> bool:
+    """
+    Drive the blocking connection's I/O until `predicate` holds or `timeout` expires.
+
+    Returns:
+        bool: True if the predicate became true, False on timeout
+    """
+    deadline = time.monotonic() + timeout
+
+    while not predicate():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        _rabbitmq_connection.process_data_events(
+            time_limit=min(remaining, CONFIRM_POLL_INTERVAL)
+        )
+
+    return True
+
+
+def get_confirm_channel(timeout: float = 30.0) -> pika.channel.Channel:
+    """
+    Get or create the confirm-mode channel used for batched publishing.
+
+    The channel shares the singleton connection. Confirms are registered on
+    the underlying channel rather than through BlockingChannel.confirm_delivery(),
+    which would wait for a broker round trip after every single publish.
+
+    Args:
+        timeout: Seconds to wait for the broker to enable confirm mode
+
+    Returns:
+        pika.channel.Channel: Open channel in confirm mode
+
+    Raises:
+        pika.exceptions.AMQPChannelError: If confirm mode is not acknowledged in time
+    """
+    global _confirm_channel, _confirm_tracker
+
+    get_rabbitmq_connection()
+
+    if _confirm_channel is None or not _confirm_channel.is_open:
+        logger.info("Opening confirm-mode RabbitMQ channel")
+
+        channel = _rabbitmq_connection.channel()
+        tracker = _ConfirmTracker()
+        channel._impl.confirm_delivery(
+            ack_nack_callback=tracker.on_confirm,
+            callback=tracker.on_select_ok
+        )
+
+        if not _wait_for(lambda: tracker.selected, timeout):
+            raise pika.exceptions.AMQPChannelError(
+                "Timed out waiting for broker to enable publisher confirms"
+            )
+
+        _confirm_channel = channel
+        _confirm_tracker = tracker
+
+    return _confirm_channel
+
+
+def _reset_confirm_channel() -> None:
+    """Drop the confirm channel so the next batch starts with fresh delivery tags."""
+    global _confirm_channel, _confirm_tracker
+
+    if _confirm_channel is not None:
+        try:
+            _confirm_channel.close()
+        except Exception as e:
+            logger.debug(f"Error closing confirm channel: {e}")
+
+    _confirm_channel = None
+    _confirm_tracker = None
+
+
+def publish_batch(
+    queue: str,
+    messages: List[Dict[str, Any]],
+    max_retries: int = 3,
+    retry_delay: float = 1.0,
+    confirm_timeout: float = 30.0,
+    codec: Optional[str] = None
+) -> List[bool]:
+    """
+    Publish a batch of messages over a confirm-mode channel.
+
+    Every message is serialized once, all of them are written to the channel,
+    and then the broker's acks are collected for the whole batch in a single
+    wait. Nacked or unconfirmed messages are retried; a message only counts as
+    published once the broker has confirmed it.
+
+    Args:
+        queue: The queue name to publish to
+        messages: Message dictionaries to publish (each encoded with the codec)
+        max_retries: Maximum number of attempts for unconfirmed messages
+        retry_delay: Delay in seconds between retries
+        confirm_timeout: Seconds to wait for the broker to confirm a batch
+        codec: Body codec spec, e.g. "msgpack+zstd" (default: RABBITMQ_MESSAGE_CODEC or json)
+
+    Returns:
+        List[bool]: Per-message outcome, True if the broker confirmed it
+
+    Example:
+        ```python
+        outcomes = publish_batch('deduplication', messages)
+        failed = outcomes.count(False)
+        ```
+    """
+    if not messages:
+        return []
+
+    message_codec = get_codec(codec)
+    properties = pika.BasicProperties(
+        delivery_mode=2,  # Persistent
+        content_type=message_codec.content_type,
+        content_encoding=message_codec.content_encoding
+    )
+    bodies = [message_codec.encode(message) for message in messages]
+    outcomes = [False] * len(messages)
+    pending = list(range(len(messages)))
+
+    for attempt in range(max_retries):
+        tracker = None
+        try:
+            channel = get_confirm_channel(confirm_timeout)
+            tracker = _confirm_tracker
+            tracker.outcomes = {}
+
+            for index in pending:
+                channel._impl.basic_publish(
+                    exchange='',
+                    routing_key=queue,
+                    body=bodies[index],
+                    properties=properties
+                )
+                tracker.register(index)
+
+            if not _wait_for(lambda: not tracker.pending, confirm_timeout):
+                logger.warning(
+                    f"Timed out waiting for {len(tracker.pending)} confirms from {queue}"
+                )
+                tracker.pending.clear()  # Late confirms for these tags are ignored
+
+        except Exception as e:
+            logger.warning(
+                f"Failed to publish batch to {queue} (attempt {attempt + 1}/{max_retries}): {e}"
+            )
+            _reset_confirm_channel()
+
+        # Keep whatever the broker confirmed, even if the attempt failed part way
+        if tracker is not None:
+            for index, acked in tracker.outcomes.items():
+                outcomes[index] = acked
+
+        pending = [index for index in pending if not outcomes[index]]
+
+        if not pending:
+            if attempt > 0:
+                logger.info(
+                    f"Batch of {len(messages)} published to {queue} after {attempt + 1} attempts"
+                )
+            return outcomes
+
+        if attempt < max_retries - 1:
+            time.sleep(retry_delay * (attempt + 1))  # Exponential backoff
+
+    logger.error(
+        f"Failed to publish {len(pending)}/{len(messages)} messages to {queue} "
+        f"after {max_retries} attempts"
+    )
+    return outcomes
+
+
+class BatchPublisher:
+    """
+    Streaming publisher that buffers messages and publishes them in confirmed batches.
+
+    Messages are handed to publish_batch() whenever the buffer reaches
+    `batch_size`, and on flush()/context exit. Running counters track how many
+    messages the broker confirmed or rejected.
+
+    Example:
+        ```python
+        with BatchPublisher('deduplication', batch_size=1000) as publisher:
+            for message in messages:
+                publisher.add(message)
+
+        print(publisher.published_count, publisher.failed_count)
+        ```
+    """
+
+    def __init__(self, queue: str, batch_size: int = 1000, **publish_kwargs: Any):
+        self.queue = queue
+        self.batch_size = batch_size
+        self.publish_kwargs = publish_kwargs
+        self.published_count = 0
+        self.failed_count = 0
+        self._buffer: List[Dict[str, Any]] = []
+
+    def add(self, message: Dict[str, Any]) -> Optional[List[bool]]:
+        """
+        Buffer a message, publishing the buffer once it is full.
+
+        Returns:
+            Per-message outcomes if a batch was published, otherwise None
+        """
+        self._buffer.append(message)
+
+        if len(self._buffer) >= self.batch_size:
+            return self.flush()
+        return None
+
+    def flush(self) -> List[bool]:
+        """
+        Publish all buffered messages and wait for their confirms.
+
+        Returns:
+            List[bool]: Per-message outcomes for the flushed messages
+        """
+        if not self._buffer:
+            return []
+
+        messages, self._buffer = self._buffer, []
+        outcomes = publish_batch(self.queue, messages, **self.publish_kwargs)
+
+        confirmed = sum(outcomes)
+        self.published_count += confirmed
+        self.failed_count += len(outcomes) - confirmed
+        return outcomes
+
+    @property
+    def pending_count(self) -> int:
+        """Number of buffered messages not yet published."""
+        return len(self._buffer)
+
+    def __enter__(self) -> "BatchPublisher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.flush()
+
+
 def close_rabbitmq_connection() -> None:
     """
     Close the RabbitMQ connection.
@@ -211,6 +512,8 @@ def close_rabbitmq_connection() -> None:
     """
     global _rabbitmq_connection, _rabbitmq_channel
 
+    _reset_confirm_channel()
+
     if _rabbitmq_channel is not None:
         try:
             _rabbitmq_channel.close()
@@ -256,6 +559,10 @@ def check_rabbitmq_health() -> bool:
 __all__ = [
     "get_rabbitmq_connection",
     "publish_message",
+    "publish_batch",
+    "get_confirm_channel",
+    "BatchPublisher",
+    "decode_message",
     "close_rabbitmq_connection",
     "check_rabbitmq_health",
 ]
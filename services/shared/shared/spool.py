@@ -0,0 +1,324 @@
+"""
+Local durable message spool.
+
+Messages the broker did not take (unreachable, blocked, nacked) are appended
+to segment files in a local directory instead of being dropped, and replayed
+once the broker is back (see shared.aio_rabbitmq):
+- Append-only segments, one open segment per process; a segment is sealed
+  for replay once it reaches its size or age limit
+- One fsync per appended batch, so a chunk of messages costs one disk flush
+- Records carry a CRC32, so a segment torn by a crash is read up to its last
+  complete record
+- Sealed segments are claimed for replay by atomic rename, so several
+  processes can share one spool directory; segments left open or claimed by
+  a process that died are adopted
+
+File names: `<time_ns>-<owner>.open` while written, `.seg` once sealed and
+`.<drainer owner>.drain` while replayed. The owner is `<pid>_<start>`, the
+process start time telling a restarted process apart from an earlier one
+with the same pid (in a container, usually pid 1 on every start).
+
+Example:
+    ```python
+    spool = open_spool("/tmp/gdb-processing/publish-spool")
+    spool.append("deduplication", bodies, "application/json", None)
+
+    segment = spool.claim()
+    for message in spool.read(segment):
+        publish(message.queue, message.body)
+    spool.remove(segment)
+    ```
+"""
+
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import uuid
+import zlib
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Segment limits (the size is overridable via RABBITMQ_SPOOL_SEGMENT_MB)
+DEFAULT_SEGMENT_MB = 64
+SEGMENT_MAX_SECONDS = 60.0
+
+# Record frame: CRC32 of header + body, header length, body length
+_FRAME = struct.Struct("<IHI")
+
+
+class SpooledMessage(NamedTuple):
+    """One spooled message, body already encoded with its codec."""
+    queue: str
+    body: bytes
+    content_type: Optional[str]
+    content_encoding: Optional[str]
+
+
+class MessageSpool:
+    """
+    Append-only segment files of unpublished messages.
+
+    Thread safe within a process (appends come from publishing threads);
+    processes sharing the directory each write their own segment.
+
+    Args:
+        directory: Spool directory (created if missing)
+        segment_max_bytes: Size at which the open segment is sealed
+            (default: RABBITMQ_SPOOL_SEGMENT_MB or 64 MB)
+        segment_max_seconds: Age at which the open segment is sealed on the next append
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        segment_max_bytes: Optional[int] = None,
+        segment_max_seconds: float = SEGMENT_MAX_SECONDS
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes or int(
+            os.getenv("RABBITMQ_SPOOL_SEGMENT_MB", DEFAULT_SEGMENT_MB)
+        ) * 1024 * 1024
+        self.segment_max_seconds = segment_max_seconds
+        self.pid = os.getpid()
+        self.owner = f"{self.pid}_{_process_start(self.pid) or uuid.uuid4().hex}"
+        self._lock = threading.Lock()
+        self._file = None
+        self._path: Optional[Path] = None
+        self._opened_at = 0.0
+        self._appended = 0
+        self._replayed = 0
+
+    def append(
+        self,
+        queue: str,
+        bodies: List[bytes],
+        content_type: Optional[str],
+        content_encoding: Optional[str]
+    ) -> None:
+        """
+        Append encoded messages for a queue and fsync them.
+
+        Returns once the messages are on disk.
+
+        Raises:
+            OSError: If the spool cannot be written (e.g. disk full)
+        """
+        if not bodies:
+            return
+
+        header = json.dumps(
+            {"queue": queue, "content_type": content_type, "content_encoding": content_encoding},
+            separators=(",", ":")
+        ).encode("utf-8")
+        with self._lock:
+            if self._file is None:
+                self._open_segment()
+            for body in bodies:
+                crc = zlib.crc32(body, zlib.crc32(header))
+                self._file.write(_FRAME.pack(crc, len(header), len(body)))
+                self._file.write(header)
+                self._file.write(body)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._appended += len(bodies)
+
+            if (self._file.tell() >= self.segment_max_bytes
+                    or time.monotonic() - self._opened_at >= self.segment_max_seconds):
+                self._seal()
+
+    def seal(self) -> None:
+        """Seal this process's open segment (if any) so it can be replayed."""
+        with self._lock:
+            self._seal()
+
+    def _open_segment(self) -> None:
+        """Start a new open segment (lock held)."""
+        self._path = self.directory / f"{time.time_ns():020d}-{self.owner}.open"
+        self._file = open(self._path, "ab")
+        self._opened_at = time.monotonic()
+        _fsync_directory(self.directory)
+
+    def _seal(self) -> None:
+        """Close the open segment and rename it to .seg (lock held)."""
+        if self._file is None:
+            return
+        self._file.close()
+        self._path.rename(self._path.with_suffix(".seg"))
+        _fsync_directory(self.directory)
+        self._file = None
+        self._path = None
+
+    def claim(self) -> Optional[Path]:
+        """
+        Claim the oldest sealed segment for replay.
+
+        Segments of processes that died while writing or replaying are
+        sealed again first.
+
+        Returns:
+            Path of the claimed segment, or None if there is none
+        """
+        self._adopt_orphans()
+        for path in sorted(self.directory.glob("*.seg")):
+            claimed = path.with_suffix(f".{self.owner}.drain")
+            try:
+                path.rename(claimed)
+            except FileNotFoundError:
+                continue  # Claimed by another process first
+            return claimed
+        return None
+
+    def release(self, segment: Path) -> None:
+        """Return a claimed segment unfinished (replayed again later)."""
+        segment.rename(self.directory / f"{_segment_base(segment)}.seg")
+
+    def remove(self, segment: Path, replayed: int = 0) -> None:
+        """Delete a fully replayed segment."""
+        segment.unlink(missing_ok=True)
+        self._replayed += replayed
+
+    def read(self, segment: Path) -> Iterator[SpooledMessage]:
+        """
+        Read the messages of a segment in order.
+
+        Stops at the first incomplete or corrupt record (a write torn by a crash).
+        """
+        headers: Dict[bytes, Tuple[str, Optional[str], Optional[str]]] = {}
+        with open(segment, "rb") as f:
+            while True:
+                frame = f.read(_FRAME.size)
+                if len(frame) < _FRAME.size:
+                    return
+                crc, header_len, body_len = _FRAME.unpack(frame)
+                header = f.read(header_len)
+                body = f.read(body_len)
+                if len(body) < body_len or zlib.crc32(body, zlib.crc32(header)) != crc:
+                    logger.warning(f"Spool segment {segment.name} ends with a torn record")
+                    return
+                if header not in headers:
+                    fields = json.loads(header)
+                    headers[header] = (fields["queue"], fields["content_type"], fields["content_encoding"])
+                queue, content_type, content_encoding = headers[header]
+                yield SpooledMessage(queue, body, content_type, content_encoding)
+
+    def _adopt_orphans(self) -> None:
+        """Seal .open and .drain segments whose owning process is gone."""
+        for path in list(self.directory.glob("*.open")) + list(self.directory.glob("*.drain")):
+            if path == self._path:
+                continue
+            owner = path.name.split(".")[1] if path.suffix == ".drain" else (
+                _segment_base(path).split("-", 1)[1]
+            )
+            if self._owner_alive(owner):
+                continue
+            try:
+                path.rename(self.directory / f"{_segment_base(path)}.seg")
+                logger.info(f"Adopted spool segment {path.name} of exited process {owner}")
+            except FileNotFoundError:
+                continue
+
+    def _owner_alive(self, owner: str) -> bool:
+        """Whether the process that owns a segment (`<pid>_<start>`) is still running."""
+        if owner == self.owner:
+            return True
+        pid, _, started = owner.partition("_")
+        if int(pid) == self.pid or not _pid_alive(int(pid)):
+            return False  # An earlier process with our pid (restarted), or one that exited
+        # A live pid may have been reused since; without /proc, assume it was not
+        return not started or _process_start(int(pid)) in (None, started)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Spool metrics.
+
+        Returns:
+            dict: segments and bytes on disk (all processes), messages
+                appended and replayed by this process
+        """
+        segments = [
+            path for pattern in ("*.open", "*.seg", "*.drain")
+            for path in self.directory.glob(pattern)
+        ]
+        size = 0
+        for path in segments:
+            try:
+                size += path.stat().st_size
+            except FileNotFoundError:
+                pass
+        return {
+            "segments": len(segments),
+            "bytes": size,
+            "appended": self._appended,
+            "replayed": self._replayed,
+        }
+
+
+def _segment_base(path: Path) -> str:
+    """`<time_ns>-<owner>` part of a segment file name."""
+    return path.name.split(".", 1)[0]
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process with this pid exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _process_start(pid: int) -> Optional[str]:
+    """Start time of a process in clock ticks since boot (None without /proc)."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[19]
+    except (OSError, IndexError):
+        return None
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist file creations and renames in a directory."""
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+# One spool per directory and process (open segments are per process)
+_spools: Dict[Tuple[int, str], MessageSpool] = {}
+
+
+def open_spool(directory: Optional[Union[str, Path]] = None) -> Optional[MessageSpool]:
+    """
+    Get this process's spool for a directory.
+
+    Args:
+        directory: Spool directory (default: RABBITMQ_SPOOL_PATH)
+
+    Returns:
+        MessageSpool, or None when no directory is configured (spooling disabled)
+    """
+    directory = directory or os.getenv("RABBITMQ_SPOOL_PATH")
+    if not directory:
+        return None
+    key = (os.getpid(), str(directory))
+    spool = _spools.get(key)
+    if spool is None:
+        spool = _spools[key] = MessageSpool(directory)
+    return spool
+
+
+__all__ = [
+    "SpooledMessage",
+    "MessageSpool",
+    "open_spool",
+]
@@ -0,0 +1,523 @@
+"""
+Unit tests for asyncio RabbitMQ publishing.
+
+Tests shared.aio_rabbitmq against a mocked aio-pika connection:
+- AsyncPublisher.publish_batch() with publisher confirms and retries
+- ChannelPool leasing, recycling and utilization metrics
+- CircuitBreaker fail-fast publishing and half-open probes
+- Spooling messages the broker does not take, and replaying them
+- Backpressure on bounded queues
+- Connection recovery and non-blocking backoff
+- Queue declarations
+- Per-loop publishers, health checks and close
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aio_pika.exceptions import DeliveryError
+from pamqp.commands import Basic
+
+from shared.aio_rabbitmq import (
+    AsyncPublisher,
+    ChannelPool,
+    CircuitBreaker,
+    CircuitOpenError,
+    check_rabbitmq_health,
+    close_rabbitmq_connection,
+    get_publisher,
+    publish_batch,
+)
+from shared.backpressure import LocalQueue, QueueBackpressure
+from shared.codecs import decode_message
+from shared.rabbitmq import DEAD_LETTER_QUEUES, QUEUE_ARGUMENTS
+from shared.spool import MessageSpool
+
+
+def make_channel(publish):
+    """Mock confirm-mode channel whose default exchange publishes with `publish`."""
+    channel = MagicMock()
+    channel.is_closed = False
+    channel.close = AsyncMock()
+    channel.declare_queue = AsyncMock()
+    channel.declare_exchange = AsyncMock()
+    channel.default_exchange.publish = AsyncMock(side_effect=publish)
+    return channel
+
+
+def make_connection(nack_bodies=()):
+    """
+    Build a mock robust connection whose channels ack every publish.
+
+    Messages whose decoded body is in `nack_bodies` are nacked on their
+    first publish only, like a broker that recovers. Every channel() call
+    opens a new channel; the first one is returned alongside the connection
+    and all of them are in connection.opened.
+    """
+    nacked = []
+
+    async def publish(message, routing_key, timeout=None):
+        body = decode_message(message.body, message.content_type, message.content_encoding)
+        if body in nack_bodies and body not in nacked:
+            nacked.append(body)
+            raise DeliveryError(None, Basic.Nack(delivery_tag=1))
+        return Basic.Ack(delivery_tag=1)
+
+    first = make_channel(publish)
+    connection = MagicMock()
+    connection.is_closed = False
+    connection.opened = []
+
+    async def open_channel(publisher_confirms=False):
+        channel = first if not connection.opened else make_channel(publish)
+        connection.opened.append(channel)
+        return channel
+
+    connection.channel = AsyncMock(side_effect=open_channel)
+    connection.close = AsyncMock()
+    connection.transport.connection.ready = AsyncMock()  # Not blocked
+    return connection, first
+
+
+@pytest.mark.asyncio
+class TestAsyncPublisher:
+    """Tests for AsyncPublisher."""
+
+    async def test_publishes_all_messages_with_confirms(self):
+        """Test that every message is published persistently and confirmed."""
+        connection, channel = make_connection()
+        messages = [{'row': i} for i in range(5)]
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock, return_value=connection):
+            outcomes = await AsyncPublisher().publish_batch('deduplication', messages)
+
+        assert outcomes == [True] * 5
+        calls = channel.default_exchange.publish.call_args_list
+        assert [json.loads(c.args[0].body) for c in calls] == messages
+        assert all(c.kwargs['routing_key'] == 'deduplication' for c in calls)
+        assert all(c.args[0].delivery_mode == 2 for c in calls)
+        connection.channel.assert_awaited_once_with(publisher_confirms=True)
+
+    async def test_announces_codec_in_properties(self):
+        """Test that binary codecs set content_type/content_encoding for consumers."""
+        connection, channel = make_connection()
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock, return_value=connection):
+            await AsyncPublisher().publish_batch('deduplication', [{'row': 1}], codec='msgpack+zstd')
+
+        message = channel.default_exchange.publish.call_args.args[0]
+        assert message.content_type == 'application/msgpack'
+        assert message.content_encoding == 'zstd'
+
+    async def test_retries_only_nacked_messages(self):
+        """Test that nacked messages are republished after an awaited backoff."""
+        connection, channel = make_connection(nack_bodies=[{'row': 1}])
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock, return_value=connection), \
+             patch('shared.aio_rabbitmq.asyncio.sleep', new_callable=AsyncMock) as mock_sleep, \
+             patch('time.sleep') as mock_blocking_sleep:
+            outcomes = await AsyncPublisher().publish_batch(
+                'deduplication', [{'row': i} for i in range(3)], retry_delay=0.5
+            )
+
+        assert outcomes == [True, True, True]
+        assert channel.default_exchange.publish.call_count == 4
+        assert json.loads(channel.default_exchange.publish.call_args.args[0].body) == {'row': 1}
+        mock_sleep.assert_awaited_once_with(0.5)
+        mock_blocking_sleep.assert_not_called()
+
+    async def test_recovers_from_connection_failure(self):
+        """Test that a failed connect is retried and the batch still goes out."""
+        connection, channel = make_connection()
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock,
+                   side_effect=[ConnectionError("refused"), connection]) as mock_connect, \
+             patch('shared.aio_rabbitmq.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            outcomes = await AsyncPublisher().publish_batch('deduplication', [{'a': 1}, {'b': 2}])
+
+        assert outcomes == [True, True]
+        assert mock_connect.await_count == 2
+        mock_sleep.assert_awaited_once_with(1.0)
+
+    async def test_reports_failures_after_max_retries(self):
+        """Test per-message failure outcomes when publishing keeps failing."""
+        connection, channel = make_connection()
+        channel.default_exchange.publish.side_effect = ConnectionError("Connection lost")
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock, return_value=connection), \
+             patch('shared.aio_rabbitmq.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            outcomes = await AsyncPublisher().publish_batch(
+                'deduplication', [{'a': 1}, {'b': 2}], max_retries=3
+            )
+
+        assert outcomes == [False, False]
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [1.0, 2.0]
+
+    async def test_reopens_closed_channel(self):
+        """Test that a closed channel is replaced on the next publish."""
+        connection, channel = make_connection()
+        publisher = AsyncPublisher(connections=1)
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock, return_value=connection) as mock_connect:
+            await publisher.publish('deduplication', {'a': 1})
+            channel.is_closed = True
+            await publisher.publish('deduplication', {'a': 2})
+
+        assert mock_connect.await_count == 1
+        assert connection.channel.await_count == 2
+        assert publisher.pool.stats()["recycled"] == 1
+
+    async def test_declares_queues(self):
+        """Test that the Layer 1 queues and dead letter queues are declared on connect."""
+        connection, channel = make_connection()
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock, return_value=connection):
+            await AsyncPublisher().publish('deduplication', {'a': 1})
+
+        declared = {c.args[0]: c.kwargs for c in channel.declare_queue.call_args_list}
+        assert declared['deduplication']['arguments']['x-max-length'] == 1000000
+        assert set(declared) == set(QUEUE_ARGUMENTS) | set(DEAD_LETTER_QUEUES)
+        channel.declare_exchange.assert_awaited_once()
+
+    async def test_empty_batch(self):
+        """Test that an empty batch does not connect."""
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock) as mock_connect:
+            assert await AsyncPublisher().publish_batch('deduplication', []) == []
+        mock_connect.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestChannelPool:
+    """Tests for ChannelPool leasing and AsyncPublisher's use of it."""
+
+    async def test_concurrent_batches_publish_on_separate_channels(self):
+        """Test that concurrent batches lease different channels over several connections."""
+        connection, _ = make_connection()
+        gate = asyncio.Event()
+        publisher = AsyncPublisher(pool_size=4, connections=2)
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock, return_value=connection) as mock_connect:
+            async def held_batch(row):
+                async with publisher.pool.lease():
+                    await gate.wait()
+                return await publisher.publish_batch('deduplication', [{'row': row}])
+
+            tasks = [asyncio.create_task(held_batch(row)) for row in range(3)]
+            await asyncio.sleep(0)
+            stats = publisher.pool.stats()
+            gate.set()
+            outcomes = await asyncio.gather(*tasks)
+
+        assert stats["in_use"] == 3 and stats["utilization"] == 0.75
+        assert outcomes == [[True]] * 3
+        assert len(connection.opened) == 3
+        assert mock_connect.await_count == 2
+
+    async def test_waits_when_pool_exhausted(self):
+        """Test that a lease waits for a channel once all are leased."""
+        opened = []
+
+        async def open_channel():
+            channel = make_channel(None)
+            opened.append(channel)
+            return channel
+
+        pool = ChannelPool(open_channel, size=1)
+        async with pool.lease() as first:
+            waiter = asyncio.create_task(_lease_once(pool))
+            await asyncio.sleep(0.01)
+            assert pool.stats()["waiting"] == 1
+            assert not waiter.done()
+
+        assert await waiter is first
+        assert len(opened) == 1
+        assert pool.stats()["avg_wait_ms"] > 0
+
+    async def test_recycles_channel_after_error(self):
+        """Test that a channel whose lease raised is closed and replaced."""
+        opened = []
+
+        async def open_channel():
+            channel = make_channel(None)
+            opened.append(channel)
+            return channel
+
+        pool = ChannelPool(open_channel, size=2)
+        with pytest.raises(ConnectionError):
+            async with pool.lease():
+                raise ConnectionError("channel closed by broker")
+
+        async with pool.lease() as channel:
+            pass
+
+        assert channel is opened[1]
+        opened[0].close.assert_awaited_once()
+        stats = pool.stats()
+        assert (stats["open"], stats["idle"], stats["recycled"], stats["leases"]) == (1, 1, 1, 2)
+
+
+@pytest.mark.asyncio
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker and fail-fast publishing."""
+
+    async def test_half_open_lets_one_probe_through(self):
+        """Test the open/half-open/closed transitions of the breaker itself."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.01)
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED and breaker.allow()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN and not breaker.allow()
+
+        await asyncio.sleep(0.02)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow() and not breaker.allow()
+
+        breaker.record_failure()  # Failed probe re-opens at once
+        assert breaker.state == CircuitBreaker.OPEN
+
+        await asyncio.sleep(0.02)
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.stats()["trips"] == 1
+
+    async def test_fails_fast_once_open(self):
+        """Test that publishing stops connecting after the threshold and raises CircuitOpenError."""
+        publisher = AsyncPublisher(breaker=CircuitBreaker(failure_threshold=2, reset_timeout=30))
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock,
+                   side_effect=ConnectionError("refused")) as mock_connect, \
+             patch('shared.aio_rabbitmq.asyncio.sleep', new_callable=AsyncMock):
+            with pytest.raises(CircuitOpenError) as first:
+                await publisher.publish_batch('deduplication', [{'a': 1}, {'b': 2}], max_retries=3)
+            with pytest.raises(CircuitOpenError):
+                await publisher.publish_batch('deduplication', [{'c': 3}])
+            healthy = await publisher.check_health()
+
+        assert first.value.outcomes == [False, False]
+        assert first.value.retry_in > 0
+        assert mock_connect.await_count == 2
+        assert healthy is False
+
+    async def test_nacks_do_not_open_breaker(self):
+        """Test that a broker answering with nacks counts as reachable."""
+        connection, channel = make_connection(nack_bodies=[{'row': 0}, {'row': 1}])
+        publisher = AsyncPublisher(breaker=CircuitBreaker(failure_threshold=1, reset_timeout=30))
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock, return_value=connection), \
+             patch('shared.aio_rabbitmq.asyncio.sleep', new_callable=AsyncMock):
+            outcomes = await publisher.publish_batch('deduplication', [{'row': 0}, {'row': 1}])
+
+        assert outcomes == [True, True]
+        assert publisher.breaker.state == CircuitBreaker.CLOSED
+
+    async def test_probe_closes_breaker_when_broker_returns(self):
+        """Test that wait_until_available probes after the reset timeout and publishing resumes."""
+        connection, channel = make_connection()
+        publisher = AsyncPublisher(breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0.01))
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock,
+                   side_effect=[ConnectionError("refused"), ConnectionError("refused"), connection]):
+            with pytest.raises(CircuitOpenError):
+                await publisher.publish_batch('deduplication', [{'a': 1}], retry_delay=0)
+
+            assert await publisher.wait_until_available(timeout=2.0) is True
+            outcomes = await publisher.publish_batch('deduplication', [{'a': 1}])
+
+        assert outcomes == [True]
+        assert publisher.breaker.stats()["trips"] == 1
+
+    async def test_wait_times_out_while_broker_is_down(self):
+        """Test that waiting gives up after the timeout while probes keep failing."""
+        publisher = AsyncPublisher(breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0.01))
+        publisher.breaker.record_failure()
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock,
+                   side_effect=ConnectionError("refused")) as mock_connect:
+            assert await publisher.wait_until_available(timeout=0.1) is False
+
+        assert mock_connect.await_count >= 1
+        assert publisher.breaker.state != CircuitBreaker.CLOSED
+
+
+@pytest.mark.asyncio
+class TestSpool:
+    """Tests for spooling unpublished messages and replaying them."""
+
+    async def test_spools_while_breaker_is_open(self, tmp_path):
+        """Test that an open breaker spools the batch instead of raising."""
+        spool = MessageSpool(tmp_path)
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+        publisher = AsyncPublisher(breaker=breaker, spool=spool)
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock) as mock_connect:
+            outcomes = await publisher.publish_batch('deduplication', [{'a': 1}, {'b': 2}])
+
+        assert outcomes == [True, True]
+        mock_connect.assert_not_called()
+        spool.seal()
+        assert [json.loads(m.body) for m in spool.read(spool.claim())] == [{'a': 1}, {'b': 2}]
+
+    async def test_spools_messages_unconfirmed_after_retries(self, tmp_path):
+        """Test that only the messages the broker never confirmed are spooled."""
+        spool = MessageSpool(tmp_path)
+        connection, channel = make_connection()
+        acked = Basic.Ack(delivery_tag=1)
+        channel.default_exchange.publish.side_effect = [
+            acked, DeliveryError(None, Basic.Nack(delivery_tag=2)),
+            DeliveryError(None, Basic.Nack(delivery_tag=3)),
+        ]
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock, return_value=connection), \
+             patch('shared.aio_rabbitmq.asyncio.sleep', new_callable=AsyncMock):
+            outcomes = await AsyncPublisher(spool=spool).publish_batch(
+                'deduplication', [{'a': 1}, {'b': 2}], max_retries=2
+            )
+
+        assert outcomes == [True, True]
+        spool.seal()
+        assert [json.loads(m.body) for m in spool.read(spool.claim())] == [{'b': 2}]
+
+    async def test_spools_when_connection_is_blocked(self, tmp_path):
+        """Test that a connection blocked by the broker spools without publishing."""
+        spool = MessageSpool(tmp_path)
+        connection, channel = make_connection()
+        publisher = AsyncPublisher(spool=spool, connections=1)
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock, return_value=connection):
+            await publisher.publish('deduplication', {'a': 1})
+            connection.transport.connection.ready.side_effect = asyncio.Event().wait
+            assert await publisher.publish('deduplication', {'b': 2}) is True
+
+        assert channel.default_exchange.publish.call_count == 1
+        assert spool.stats()["appended"] == 1
+
+    async def test_drains_spool_at_controlled_rate(self, tmp_path):
+        """Test that replay publishes spooled messages in paced batches and removes the segment."""
+        spool = MessageSpool(tmp_path)
+        spool.append('deduplication', [f'{{"row":{i}}}'.encode() for i in range(5)], 'application/json', None)
+        connection, channel = make_connection()
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock, return_value=connection), \
+             patch('shared.aio_rabbitmq.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            replayed = await AsyncPublisher(spool=spool).drain_spool(max_rate=10, batch_size=2)
+
+        assert replayed == 5
+        calls = channel.default_exchange.publish.call_args_list
+        assert [json.loads(c.args[0].body)['row'] for c in calls] == [0, 1, 2, 3, 4]
+        assert calls[0].args[0].content_type == 'application/json'
+        assert [round(c.args[0], 1) for c in mock_sleep.await_args_list] == [0.2, 0.2, 0.1]
+        assert spool.stats()["segments"] == 0
+
+    async def test_drain_resumes_where_it_stopped(self, tmp_path):
+        """Test that a failed replay releases the segment and continues from the failed batch."""
+        spool = MessageSpool(tmp_path)
+        spool.append('deduplication', [f'{{"row":{i}}}'.encode() for i in range(4)], 'application/json', None)
+        connection, channel = make_connection()
+        publish = channel.default_exchange.publish
+        publish.side_effect = [Basic.Ack(delivery_tag=1)] * 2 + [ConnectionError("lost")] * 2
+        publisher = AsyncPublisher(spool=spool)
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock, return_value=connection), \
+             patch('shared.aio_rabbitmq.asyncio.sleep', new_callable=AsyncMock):
+            first = await publisher.drain_spool(max_rate=1000, batch_size=2)
+            publish.side_effect = None
+            publish.return_value = Basic.Ack(delivery_tag=1)
+            publish.reset_mock()
+            second = await publisher.drain_spool(max_rate=1000, batch_size=2)
+
+        assert (first, second) == (2, 2)
+        assert [json.loads(c.args[0].body)['row'] for c in publish.call_args_list] == [2, 3]
+        assert spool.stats()["segments"] == 0
+        assert spool.stats()["appended"] == 4
+
+
+@pytest.mark.asyncio
+class TestBackpressure:
+    """Tests for publishing to bounded queues under backpressure."""
+
+    async def test_samples_depth_with_passive_declare(self):
+        """Test that the depth of a bounded queue is read over the open connection only."""
+        connection, channel = make_connection()
+        declared = MagicMock()
+        declared.declaration_result.message_count = 600_000
+        declared.declaration_result.consumer_count = 2
+        declared.bind = AsyncMock()
+        channel.declare_queue.return_value = declared
+        publisher = AsyncPublisher(connections=1)
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock, return_value=connection):
+            await publisher.publish('deduplication', {'a': 1})  # Not connected yet: no sample
+            assert publisher.backpressure('deduplication').depth is None
+            await publisher.publish('deduplication', {'b': 2})
+
+        channel.declare_queue.assert_any_await('deduplication', passive=True)
+        backpressure = publisher.backpressure('deduplication')
+        assert backpressure.stats()["depth"] == 600_000
+        assert "60% of its 1,000,000 message limit" in backpressure.reason()
+        assert publisher.backpressure('processing.parcel') is None  # No x-max-length
+
+    async def test_publish_waits_until_queue_drains(self):
+        """Test that a publish to a queue over its high watermark waits for the consumers."""
+        connection, channel = make_connection()
+        local = LocalQueue(consume_rate=2_000_000, depth=950_000)
+        publisher = AsyncPublisher()
+        publisher._backpressure['deduplication'] = QueueBackpressure(
+            'deduplication', 1_000_000, local.passive_declare, sample_interval=0.01
+        )
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock, return_value=connection):
+            outcomes = await publisher.publish_batch('deduplication', [{'a': 1}, {'b': 2}])
+
+        assert outcomes == [True, True]
+        backpressure = publisher.backpressure('deduplication')
+        assert backpressure.throttled_seconds > 0
+        assert backpressure.fill < 0.9
+
+
+@pytest.mark.asyncio
+class TestModuleFunctions:
+    """Tests for the per-loop publisher functions."""
+
+    async def test_one_publisher_per_loop(self):
+        """Test that the running loop reuses its publisher and other loops get their own."""
+        publisher = get_publisher()
+        assert get_publisher() is publisher
+
+        other = await asyncio.to_thread(lambda: asyncio.run(_current_publisher()))
+        assert other is not publisher
+
+        await close_rabbitmq_connection()
+        assert get_publisher() is not publisher
+
+    async def test_publish_batch_and_close(self):
+        """Test module-level publishing and closing the loop's connection."""
+        await close_rabbitmq_connection()
+        connection, channel = make_connection()
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock, return_value=connection):
+            assert await publish_batch('deduplication', [{'a': 1}]) == [True]
+            assert await check_rabbitmq_health() is True
+            await close_rabbitmq_connection()
+
+        connection.close.assert_awaited_once()
+
+    async def test_health_check_fails_when_unreachable(self):
+        """Test that an unreachable broker reports unhealthy instead of raising."""
+        await close_rabbitmq_connection()
+
+        with patch('aio_pika.connect_robust', new_callable=AsyncMock, side_effect=ConnectionError("refused")):
+            assert await check_rabbitmq_health() is False
+
+
+async def _current_publisher() -> AsyncPublisher:
+    return get_publisher()
+
+
+async def _lease_once(pool: ChannelPool):
+    async with pool.lease() as channel:
+        return channel
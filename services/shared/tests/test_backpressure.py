@@ -0,0 +1,153 @@
+"""
+Unit tests for queue-depth-aware publish rate limiting.
+
+Tests the token bucket, how QueueBackpressure adapts the publish rate to
+the depth and drain rate of a queue, and publishing into a LocalQueue
+stand-in without overflowing it. Time is simulated with a fake clock.
+"""
+
+import math
+from unittest.mock import patch
+
+import pytest
+
+from shared.backpressure import LocalQueue, QueueBackpressure, TokenBucket
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told (or when slept on)."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def make_backpressure(local: LocalQueue, clock: FakeClock, **kwargs) -> QueueBackpressure:
+    return QueueBackpressure(
+        'deduplication', 1_000_000, local.passive_declare,
+        low_watermark=0.5, high_watermark=0.9, min_rate=10, clock=clock, **kwargs
+    )
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_unlimited_and_stopped(self):
+        """Test that no rate never waits and a zero rate never passes."""
+        bucket = TokenBucket()
+        assert bucket.take(1_000_000) == 0
+
+        bucket.set_rate(0)
+        assert bucket.take(1) == math.inf
+
+    def test_large_batches_keep_the_rate(self):
+        """Test that a batch larger than the bucket leaves it in debt."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=100, clock=clock)
+
+        assert bucket.take(500) == 0  # Full bucket, 400 in debt
+        assert bucket.take(100) == pytest.approx(5.0)
+        clock.now += 5.0
+        assert bucket.take(100) == 0
+
+
+@pytest.mark.asyncio
+class TestQueueBackpressure:
+    """Tests for QueueBackpressure."""
+
+    async def test_unlimited_below_low_watermark(self):
+        """Test that a queue below its low watermark is not throttled."""
+        clock = FakeClock()
+        backpressure = make_backpressure(LocalQueue(1000, depth=100_000, clock=clock), clock)
+
+        assert await backpressure.acquire(10_000) == 0
+        assert backpressure.rate is None
+        assert backpressure.reason() is None
+        assert backpressure.stats()["depth"] == 100_000
+
+    async def test_rate_follows_drain_rate(self):
+        """Test that the rate between the watermarks scales the measured drain rate."""
+        clock = FakeClock()
+        backpressure = make_backpressure(LocalQueue(1000, depth=700_000, clock=clock), clock)
+
+        await backpressure.sample()
+        assert backpressure.rate == 10  # Drain rate not measured yet
+        assert "70% of its 1,000,000 message limit" in backpressure.reason()
+
+        clock.now += 10.0
+        await backpressure.sample()
+        assert backpressure.drain_rate == pytest.approx(1000)
+        # Queue at 69%: 2 * 1000 msg/s * (0.9 - 0.69) / (0.9 - 0.5)
+        assert backpressure.rate == pytest.approx(1050)
+
+    async def test_waits_at_high_watermark_until_drained(self):
+        """Test that publishing stops above the high watermark until consumers catch up."""
+        clock = FakeClock()
+        backpressure = make_backpressure(LocalQueue(10_000, depth=950_000, clock=clock), clock)
+
+        with patch('shared.backpressure.asyncio.sleep', side_effect=clock.sleep):
+            waited = await backpressure.acquire(100)
+
+        assert waited >= 5.0  # 50,000 messages over the watermark at 10,000/s
+        assert backpressure.fill < 0.9
+        assert backpressure.stats()["throttled"] == 1
+
+    async def test_publishing_never_overflows_the_queue(self):
+        """Test that a publisher faster than the consumers settles between the watermarks."""
+        clock = FakeClock()
+        local = LocalQueue(5000, depth=400_000, max_length=1_000_000, clock=clock)
+        backpressure = make_backpressure(local, clock)
+        peak = 0
+
+        with patch('shared.backpressure.asyncio.sleep', side_effect=clock.sleep):
+            for _ in range(2000):
+                await backpressure.acquire(1000)
+                local.publish(1000)
+                clock.now += 0.01  # Publisher alone would do 100,000 msg/s
+                peak = max(peak, local.depth)
+
+        assert local.dropped == 0
+        assert 500_000 < peak < 900_000  # Publish rate meets the drain rate at 70%
+
+    async def test_unknown_or_unreadable_depth_does_not_throttle(self):
+        """Test that an unknown depth is sampled again and a failed sample lifts the limit."""
+        clock = FakeClock()
+        samples = [None, (950_000, 1), ConnectionError("refused")]
+
+        async def depth_source(queue):
+            sample = samples.pop(0)
+            if isinstance(sample, Exception):
+                raise sample
+            return sample
+
+        backpressure = QueueBackpressure('deduplication', 1_000_000, depth_source, clock=clock)
+
+        assert await backpressure.acquire(1) == 0  # Not connected yet
+        await backpressure.sample()
+        assert backpressure.rate == 0
+        await backpressure.sample()
+        assert backpressure.rate is None
+
+
+class TestLocalQueue:
+    """Tests for the LocalQueue stand-in."""
+
+    def test_drains_and_drops(self):
+        """Test that consumers drain the queue and messages past max_length are dropped."""
+        clock = FakeClock()
+        local = LocalQueue(100, depth=50, max_length=200, clock=clock)
+
+        local.publish(300)
+        assert (local.depth, local.dropped) == (200, 150)
+
+        clock.now += 1.5
+        assert local.depth == 50
+
+        local.consumers = 0
+        clock.now += 10
+        assert local.depth == 50
@@ -0,0 +1,145 @@
+"""
+Unit tests for message body codecs.
+
+Tests that every codec round-trips through decode_message using only the
+AMQP content_type/content_encoding, that plain JSON stays readable, and
+that zstd dictionaries are found from the frame's dictionary ID.
+"""
+
+import json
+import pytest
+
+from shared.codecs import (
+    decode_message,
+    get_codec,
+    load_zstd_dictionary,
+    train_zstd_dictionary,
+)
+
+
+def parcel_message(i):
+    """Deduplication message shaped like the ingestion API's."""
+    return {
+        "batch_id": "7d9f2c1e-0000-4000-8000-000000000000",
+        "source_type": "PARCEL",
+        "source_file": "Dane County 2025/V11_Parcels",
+        "source_row_number": i,
+        "content_hash": f"{i:064x}",
+        "hash_version": "v1",
+        "raw_data": {
+            "STATEID": f"WI{i:09d}",
+            "OWNERNME1": f"OWNER {i}",
+            "PLACENAME": "MADISON",
+            "CNTASSDVALUE": 250000.0 + i,
+            "ASSDACRES": None,
+        },
+    }
+
+
+class TestGetCodec:
+    """Tests for get_codec function."""
+
+    @pytest.mark.parametrize("spec,content_type,content_encoding", [
+        ("json", "application/json", None),
+        ("orjson", "application/json", None),
+        ("msgpack", "application/msgpack", None),
+        ("msgpack+zstd", "application/msgpack", "zstd"),
+        ("orjson+zstd", "application/json", "zstd"),
+    ])
+    def test_round_trips_through_properties(self, spec, content_type, content_encoding):
+        """Test each codec is decoded from its announced content type and encoding."""
+        codec = get_codec(spec)
+        message = parcel_message(1)
+
+        body = codec.encode(message)
+
+        assert codec.content_type == content_type
+        assert codec.content_encoding == content_encoding
+        assert decode_message(body, codec.content_type, codec.content_encoding) == message
+
+    def test_json_bodies_stay_plain_json(self):
+        """Test the default codec writes what old consumers parse with json.loads."""
+        message = parcel_message(2)
+
+        assert json.loads(get_codec("json").encode(message)) == message
+        assert json.loads(get_codec("orjson").encode(message)) == message
+
+    def test_defaults_to_environment(self, monkeypatch):
+        """Test the codec defaults to RABBITMQ_MESSAGE_CODEC."""
+        get_codec.cache_clear()
+        monkeypatch.setenv("RABBITMQ_MESSAGE_CODEC", "msgpack")
+        try:
+            assert get_codec().content_type == "application/msgpack"
+        finally:
+            get_codec.cache_clear()
+
+    @pytest.mark.parametrize("spec", ["yaml", "msgpack+gzip"])
+    def test_rejects_unknown_specs(self, spec):
+        """Test unknown serializers and compressions are rejected."""
+        with pytest.raises(ValueError, match="Unknown message"):
+            get_codec(spec)
+
+
+class TestDecodeMessage:
+    """Tests for decode_message function."""
+
+    def test_missing_properties_mean_json(self):
+        """Test messages from producers that set no properties decode as JSON."""
+        assert decode_message(b'{"row": 1}') == {"row": 1}
+
+    def test_accepts_stdlib_json_extensions(self):
+        """Test NaN written by json.dumps still decodes."""
+        body = json.dumps({"value": float("nan")})
+
+        assert decode_message(body.encode(), "application/json")["value"] != 0
+
+    def test_rejects_unsupported_properties(self):
+        """Test unknown content types and encodings are rejected."""
+        with pytest.raises(ValueError, match="content_type"):
+            decode_message(b"", "text/csv")
+        with pytest.raises(ValueError, match="content_encoding"):
+            decode_message(b"", "application/json", "gzip")
+
+
+class TestZstdDictionary:
+    """Tests for trained zstd dictionaries."""
+
+    def test_dictionary_shrinks_and_decodes(self, tmp_path, monkeypatch):
+        """Test a trained dictionary compresses better and is found from the frame."""
+        dictionary = train_zstd_dictionary(
+            (parcel_message(i) for i in range(2000)), dict_size=4096
+        )
+        path = tmp_path / "v11.zdict"
+        path.write_bytes(dictionary)
+
+        message = parcel_message(5000)
+        plain = get_codec("msgpack+zstd").encode(message)
+
+        get_codec.cache_clear()
+        monkeypatch.setenv("RABBITMQ_ZSTD_DICTIONARY", str(path))
+        try:
+            with_dictionary = get_codec("msgpack+zstd").encode(message)
+        finally:
+            get_codec.cache_clear()
+
+        assert len(with_dictionary) < len(plain)
+        assert decode_message(with_dictionary, "application/msgpack", "zstd") == message
+
+    def test_unknown_dictionary_is_an_error(self, tmp_path, monkeypatch):
+        """Test a body needing a dictionary the consumer lacks fails clearly."""
+        dictionary = train_zstd_dictionary(
+            (parcel_message(i) for i in range(2000)), dict_size=4096
+        )
+        import zstandard
+        compressor = zstandard.ZstdCompressor(dict_data=zstandard.ZstdCompressionDict(dictionary))
+        body = compressor.compress(get_codec("msgpack").encode(parcel_message(1)))
+
+        import shared.codecs
+        monkeypatch.setattr(shared.codecs, "_zstd_dictionaries", {})
+        monkeypatch.delenv("RABBITMQ_ZSTD_DICTIONARY", raising=False)
+
+        with pytest.raises(ValueError, match="unknown zstd dictionary"):
+            decode_message(body, "application/msgpack", "zstd")
+
+        load_zstd_dictionary(dictionary)
+        assert decode_message(body, "application/msgpack", "zstd") == parcel_message(1)
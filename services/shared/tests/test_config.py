@@ -243,6 +243,24 @@ class TestBaseServiceSettings:
         assert settings.DATABASE_URL == "postgresql://localhost"
         # UNKNOWN_FIELD is ignored, not set as attribute
 
+    def test_export_environment_publishes_dotenv_values(self, tmp_path):
+        """Test that codec settings from a .env file reach os.environ (read by shared.codecs)."""
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "DATABASE_URL=postgresql://localhost\n"
+            "RABBITMQ_URL=amqp://localhost\n"
+            "RABBITMQ_MESSAGE_CODEC=msgpack+zstd\n"
+        )
+
+        with patch.dict(os.environ, {}, clear=True):
+            settings = BaseServiceSettings(_env_file=str(env_file))
+            assert "RABBITMQ_MESSAGE_CODEC" not in os.environ
+
+            settings.export_environment()
+
+            assert os.environ["RABBITMQ_MESSAGE_CODEC"] == "msgpack+zstd"
+            assert "RABBITMQ_ZSTD_DICTIONARY" not in os.environ  # Unset stays unset
+
 
 class TestServiceSettingsInheritance:
     """Tests for inheriting from BaseServiceSettings."""
@@ -0,0 +1,159 @@
+"""
+Unit tests for content hashing utilities.
+
+Tests canonical content hashes for deduplication:
+- Determinism, case and whitespace normalization
+- Field normalization helpers (numbers, dates, parcel IDs)
+- Batch (column-wise) hashes identical to single-record hashes
+- Version and source type handling
+"""
+
+import hashlib
+import json
+
+import pytest
+
+from shared.hash_utils import (
+    HASH_VERSION,
+    compute_content_hash,
+    compute_content_hashes,
+    compute_dfi_hash,
+    compute_parcel_hash,
+    compute_record_hashes,
+    compute_retr_hash,
+    normalize_date,
+    normalize_number,
+    normalize_parcel_id,
+)
+
+
+class TestSingleRecordHashes:
+    """Tests for compute_parcel_hash, compute_retr_hash and compute_dfi_hash."""
+
+    def test_parcel_hash_deterministic(self):
+        """Same data should produce same hash."""
+        data1 = {'STATEID': 'WI123456', 'ADDNUM': '123', 'STREETNAME': 'MAIN'}
+        data2 = {'STATEID': 'WI123456', 'ADDNUM': '123', 'STREETNAME': 'MAIN'}
+
+        assert compute_parcel_hash(data1) == compute_parcel_hash(data2)
+
+    def test_parcel_hash_case_and_whitespace_insensitive(self):
+        """Hash should ignore case and surrounding whitespace."""
+        data1 = {'STATEID': ' wi123456 ', 'STREETNAME': 'main'}
+        data2 = {'STATEID': 'WI123456', 'STREETNAME': 'MAIN'}
+
+        assert compute_parcel_hash(data1) == compute_parcel_hash(data2)
+
+    def test_different_data_different_hash(self):
+        """Different data should produce different hash."""
+        assert compute_parcel_hash({'STATEID': 'WI123456'}) != compute_parcel_hash({'STATEID': 'WI999999'})
+
+    def test_ignores_non_canonical_fields(self):
+        """Geometry and other non-canonical fields don't affect the hash."""
+        data = {'STATEID': 'WI123456'}
+
+        assert compute_parcel_hash(data) == compute_parcel_hash(
+            {**data, 'geometry_wkt': 'POLYGON((0 0, 1 0, 1 1, 0 0))', 'PARCELID': 'x'}
+        )
+
+    def test_hash_is_sha256_of_canonical_json(self):
+        """Hash is the 64-character digest of the sorted canonical JSON."""
+        canonical = {
+            'parcel_id': '12345', 'transfer_date': '2024-03-01', 'doc_number': 'D1',
+            'grantor': 'SMITH', 'grantee': 'JONES', 'sale_amount': '250000.00',
+        }
+        expected = hashlib.sha256(json.dumps(canonical, sort_keys=True).encode('utf-8')).hexdigest()
+
+        content_hash = compute_retr_hash({
+            'PARCEL_ID': '12-345', 'TRANSFER_DATE': '03/01/2024', 'DOC_NUMBER': 'd1',
+            'GRANTOR': 'Smith', 'GRANTEE': 'Jones', 'SALE_AMOUNT': 250000,
+        })
+
+        assert content_hash == expected
+        assert len(content_hash) == 64
+
+    def test_dfi_hash(self):
+        """DFI hash normalizes the effective date."""
+        assert compute_dfi_hash({'ENTITY_ID': 'E1', 'EFFECTIVE_DATE': '20240301'}) == \
+            compute_dfi_hash({'ENTITY_ID': 'e1', 'EFFECTIVE_DATE': '2024-03-01'})
+
+    def test_unknown_source_type_and_version(self):
+        """Unknown source types and versions are rejected."""
+        with pytest.raises(ValueError, match="source type"):
+            compute_content_hash("DEEDS", {})
+        with pytest.raises(ValueError, match="hash version"):
+            compute_content_hash("RETR", {}, version="v0")
+
+
+class TestNormalization:
+    """Tests for normalization helpers."""
+
+    @pytest.mark.parametrize("value,expected", [
+        (None, "0"), ("1234.5", "1234.50"), (1234, "1234.00"), ("n/a", "0"),
+    ])
+    def test_normalize_number(self, value, expected):
+        """Test fixed-precision numbers."""
+        assert normalize_number(value) == expected
+
+    @pytest.mark.parametrize("value,expected", [
+        (None, ""), ("", ""), ("2024-03-01", "2024-03-01"), ("2024-3-1", "2024-03-01"),
+        ("2024-03-01T10:30:00", "2024-03-01"), ("3/1/2024", "2024-03-01"),
+        ("20240301", "2024-03-01"), ("March 1, 2024", "2024-03-01"), ("unknown", "UNKNOWN"),
+    ])
+    def test_normalize_date(self, value, expected):
+        """Test dates in common formats become ISO dates."""
+        assert normalize_date(value) == expected
+
+    def test_normalize_parcel_id(self):
+        """Test dashes and spaces are removed."""
+        assert normalize_parcel_id(" 12-345 678a ") == "12345678A"
+
+
+class TestBatchHashes:
+    """Tests for compute_content_hashes and compute_record_hashes."""
+
+    RECORDS = [
+        {'PARCEL_ID': '12-345', 'TRANSFER_DATE': '2024-03-01', 'GRANTOR': 'Smith', 'SALE_AMOUNT': 250000.0},
+        {'PARCEL_ID': '12-346', 'GRANTEE': 'Müller & Søn "LLC"', 'SALE_AMOUNT': None},
+        {},
+    ]
+
+    def test_matches_single_record_hashes(self):
+        """Column-wise hashes equal the per-record hashes."""
+        columns = {
+            name: [record.get(name) for record in self.RECORDS]
+            for name in ('PARCEL_ID', 'TRANSFER_DATE', 'GRANTOR', 'GRANTEE', 'SALE_AMOUNT')
+        }
+
+        assert compute_content_hashes("RETR", columns) == [
+            compute_content_hash("RETR", record) for record in self.RECORDS
+        ]
+
+    def test_repeated_and_mixed_type_values(self):
+        """Repeated values and equal values of different types hash like single records."""
+        records = [{'STATEID': value} for value in ('WI1', 'WI1', None, 1, 1.0, True, 'wi1 ')]
+        columns = {'STATEID': [record['STATEID'] for record in records]}
+
+        assert compute_content_hashes("PARCEL", columns) == [
+            compute_parcel_hash(record) for record in records
+        ]
+        assert compute_content_hashes("PARCEL", {'STATEID': ['WI1', 'WI1 ', 'WI1']}) == [
+            compute_parcel_hash({'STATEID': value}) for value in ('WI1', 'WI1 ', 'WI1')
+        ]
+
+    def test_missing_columns_count_as_missing(self):
+        """Absent columns hash like missing fields."""
+        hashes = compute_content_hashes("PARCEL", {'STATEID': ['WI1', None]})
+
+        assert hashes == [compute_parcel_hash({'STATEID': 'WI1'}), compute_parcel_hash({})]
+
+    def test_record_hashes(self):
+        """Row-wise records go through the column-wise path."""
+        assert compute_record_hashes("RETR", self.RECORDS) == [
+            compute_retr_hash(record) for record in self.RECORDS
+        ]
+
+    def test_empty_batch(self):
+        """An empty chunk has no hashes."""
+        assert compute_content_hashes("DFI", {}, n_rows=0) == []
+        assert HASH_VERSION == "v1"
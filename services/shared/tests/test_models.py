@@ -3,6 +3,7 @@ Unit tests for Pydantic data models.
 
 Tests validation, field types, and model behavior for:
 - V11ParcelRecord (Wisconsin V11 Parcel Database)
+- V11ParcelWKBRecord (V11 parcels with WKB geometry)
 - RETRRecord (Real Estate Transfer Returns)
 - DFIRecord (DFI Corporate Entities)
 """
@@ -10,7 +11,7 @@ Tests validation, field types, and model behavior for:
 import pytest
 from pydantic import ValidationError
 
-from shared.models import V11ParcelRecord, RETRRecord, DFIRecord
+from shared.models import V11ParcelRecord, V11ParcelWKBRecord, RETRRecord, DFIRecord
 
 
 class TestV11ParcelRecord:
@@ -135,6 +136,34 @@ class TestV11ParcelRecord:
         assert record.geometry_type == "Polygon"
 
 
+class TestV11ParcelWKBRecord:
+    """Tests for V11ParcelWKBRecord model."""
+
+    def test_wkb_without_wkt(self):
+        """Test that WKB geometry replaces the required WKT."""
+        record = V11ParcelWKBRecord(
+            STATEID="WI123456",
+            geometry_wkb="010300000000000000",
+            geometry_type="Polygon"
+        )
+        assert record.geometry_wkt is None
+        assert record.model_dump(exclude_none=True) == {
+            "STATEID": "WI123456",
+            "geometry_wkb": "010300000000000000",
+            "geometry_type": "Polygon"
+        }
+
+    def test_missing_wkb(self):
+        """Test that WKB geometry is required even when WKT is given."""
+        with pytest.raises(ValidationError) as exc_info:
+            V11ParcelWKBRecord(
+                geometry_wkt="POLYGON((0 0, 1 0, 1 1, 0 1, 0 0))",
+                geometry_type="Polygon"
+            )
+
+        assert [e['loc'][0] for e in exc_info.value.errors()] == ['geometry_wkb']
+
+
 class TestRETRRecord:
     """Tests for RETRRecord model."""
 
@@ -4,6 +4,7 @@ Unit tests for RabbitMQ connection utilities.
 Tests RabbitMQ connection management and message publishing:
 - get_rabbitmq_connection() singleton pattern
 - publish_message() with retry logic
+- publish_batch() / BatchPublisher with publisher confirms
 - close_rabbitmq_connection() cleanup
 - check_rabbitmq_health() health checks
 - Queue declarations
@@ -17,6 +18,9 @@ from unittest.mock import MagicMock, patch, call
 from shared.rabbitmq import (
     get_rabbitmq_connection,
     publish_message,
+    publish_batch,
+    BatchPublisher,
+    decode_message,
     close_rabbitmq_connection,
     check_rabbitmq_health
 )
@@ -28,9 +32,49 @@ def reset_connection():
     import shared.rabbitmq
     shared.rabbitmq._rabbitmq_connection = None
     shared.rabbitmq._rabbitmq_channel = None
+    shared.rabbitmq._confirm_channel = None
+    shared.rabbitmq._confirm_tracker = None
     yield
     shared.rabbitmq._rabbitmq_connection = None
     shared.rabbitmq._rabbitmq_channel = None
+    shared.rabbitmq._confirm_channel = None
+    shared.rabbitmq._confirm_tracker = None
+
+
+def make_confirming_connection(nack_tags=()):
+    """
+    Build a mock connection whose channels emulate publisher confirms.
+
+    Every published message is acked (or nacked if its delivery tag is in
+    `nack_tags`) the next time the connection processes data events.
+    """
+    mock_connection = MagicMock(spec=pika.BlockingConnection)
+    mock_connection.is_closed = False
+    mock_channel = MagicMock()
+    mock_channel.is_open = True
+    mock_connection.channel.return_value = mock_channel
+
+    state = {"callbacks": None, "published": 0, "confirmed": 0}
+
+    def confirm_delivery(ack_nack_callback, callback):
+        state["callbacks"] = ack_nack_callback
+        callback(MagicMock())  # Confirm.SelectOk
+
+    def basic_publish(**kwargs):
+        state["published"] += 1
+
+    def process_data_events(time_limit=0):
+        while state["confirmed"] < state["published"]:
+            state["confirmed"] += 1
+            tag = state["confirmed"]
+            method_cls = pika.spec.Basic.Nack if tag in nack_tags else pika.spec.Basic.Ack
+            state["callbacks"](MagicMock(method=method_cls(delivery_tag=tag, multiple=False)))
+
+    mock_channel._impl.confirm_delivery.side_effect = confirm_delivery
+    mock_channel._impl.basic_publish.side_effect = basic_publish
+    mock_connection.process_data_events.side_effect = process_data_events
+
+    return mock_connection, mock_channel
 
 
 class TestGetRabbitmqConnection:
@@ -284,6 +328,126 @@ class TestPublishMessage:
             assert mock_sleep.call_args_list[1][0][0] == 2.0  # Second retry: 1.0 * 2
 
 
+class TestPublishBatch:
+    """Tests for publish_batch() function."""
+
+    def test_publishes_all_messages_with_confirms(self):
+        """Test that a batch is published and every message is confirmed."""
+        mock_connection, mock_channel = make_confirming_connection()
+        messages = [{'row': i} for i in range(5)]
+
+        with patch('pika.BlockingConnection', return_value=mock_connection):
+            outcomes = publish_batch('deduplication', messages)
+
+        assert outcomes == [True] * 5
+        assert mock_channel._impl.basic_publish.call_count == 5
+        mock_channel._impl.confirm_delivery.assert_called_once()
+
+    def test_messages_serialized_once_and_persistent(self):
+        """Test that bodies are JSON and published as persistent messages."""
+        mock_connection, mock_channel = make_confirming_connection()
+        messages = [{'batch_id': 'b', 'row': 1}]
+
+        with patch('pika.BlockingConnection', return_value=mock_connection):
+            publish_batch('deduplication', messages)
+
+        kwargs = mock_channel._impl.basic_publish.call_args.kwargs
+        assert json.loads(kwargs['body']) == messages[0]
+        assert kwargs['routing_key'] == 'deduplication'
+        assert kwargs['properties'].delivery_mode == 2
+
+    def test_announces_codec_in_properties(self):
+        """Test that binary codecs set content_type/content_encoding for consumers."""
+        mock_connection, mock_channel = make_confirming_connection()
+        messages = [{'batch_id': 'b', 'row': 1}]
+
+        with patch('pika.BlockingConnection', return_value=mock_connection):
+            publish_batch('deduplication', messages, codec='msgpack+zstd')
+
+        kwargs = mock_channel._impl.basic_publish.call_args.kwargs
+        assert kwargs['properties'].content_type == 'application/msgpack'
+        assert kwargs['properties'].content_encoding == 'zstd'
+        assert decode_message(
+            kwargs['body'], kwargs['properties'].content_type, kwargs['properties'].content_encoding
+        ) == messages[0]
+
+    def test_retries_only_nacked_messages(self):
+        """Test that nacked messages are republished and reported per message."""
+        mock_connection, mock_channel = make_confirming_connection(nack_tags={2})
+        messages = [{'row': i} for i in range(3)]
+
+        with patch('pika.BlockingConnection', return_value=mock_connection), \
+             patch('time.sleep'):
+            outcomes = publish_batch('deduplication', messages, max_retries=2)
+
+        # 3 original publishes + 1 retry of the nacked message (delivery tag 4 is acked)
+        assert outcomes == [True, True, True]
+        assert mock_channel._impl.basic_publish.call_count == 4
+        retried = json.loads(mock_channel._impl.basic_publish.call_args.kwargs['body'])
+        assert retried == {'row': 1}
+
+    def test_reports_failures_after_max_retries(self):
+        """Test per-message failure outcomes when publishing keeps failing."""
+        mock_connection, mock_channel = make_confirming_connection()
+        mock_channel._impl.basic_publish.side_effect = Exception("Connection lost")
+
+        with patch('pika.BlockingConnection', return_value=mock_connection), \
+             patch('time.sleep') as mock_sleep:
+            outcomes = publish_batch('deduplication', [{'a': 1}, {'b': 2}], max_retries=3)
+
+        assert outcomes == [False, False]
+        assert mock_sleep.call_count == 2
+
+    def test_times_out_waiting_for_confirms(self):
+        """Test that unconfirmed messages count as failed after the timeout."""
+        mock_connection, mock_channel = make_confirming_connection()
+        mock_connection.process_data_events.side_effect = None  # Broker never acks
+
+        with patch('pika.BlockingConnection', return_value=mock_connection), \
+             patch('time.sleep'):
+            mock_channel._impl.confirm_delivery.side_effect = \
+                lambda ack_nack_callback, callback: callback(MagicMock())
+            outcomes = publish_batch(
+                'deduplication', [{'a': 1}], max_retries=1, confirm_timeout=0.01
+            )
+
+        assert outcomes == [False]
+
+    def test_empty_batch(self):
+        """Test that an empty batch publishes nothing."""
+        assert publish_batch('deduplication', []) == []
+
+
+class TestBatchPublisher:
+    """Tests for the streaming BatchPublisher."""
+
+    def test_flushes_when_buffer_full(self):
+        """Test that a full buffer is published automatically."""
+        mock_connection, mock_channel = make_confirming_connection()
+
+        with patch('pika.BlockingConnection', return_value=mock_connection):
+            publisher = BatchPublisher('deduplication', batch_size=2)
+            assert publisher.add({'row': 1}) is None
+            assert publisher.add({'row': 2}) == [True, True]
+            assert publisher.pending_count == 0
+
+        assert publisher.published_count == 2
+
+    def test_context_manager_flushes_remainder(self):
+        """Test that leftover messages are published on exit."""
+        mock_connection, mock_channel = make_confirming_connection(nack_tags={3})
+
+        with patch('pika.BlockingConnection', return_value=mock_connection), \
+             patch('time.sleep'):
+            with BatchPublisher('deduplication', batch_size=10, max_retries=1) as publisher:
+                for i in range(3):
+                    publisher.add({'row': i})
+
+        assert mock_channel._impl.basic_publish.call_count == 3
+        assert publisher.published_count == 2
+        assert publisher.failed_count == 1
+
+
 class TestCloseRabbitmqConnection:
     """Tests for close_rabbitmq_connection() function."""
 
@@ -0,0 +1,106 @@
+"""
+Unit tests for the local message spool.
+
+Tests appending, sealing and reading segments, torn records, claiming
+segments for replay and adopting segments of exited processes.
+"""
+
+import os
+
+from shared.spool import MessageSpool, SpooledMessage, open_spool
+
+
+def spool_files(spool: MessageSpool, pattern: str = "*"):
+    return sorted(path.name for path in spool.directory.glob(pattern))
+
+
+class TestMessageSpool:
+    """Tests for MessageSpool."""
+
+    def test_append_seal_and_read(self, tmp_path):
+        """Test that appended messages are read back in order once the segment is sealed."""
+        spool = MessageSpool(tmp_path / "spool")
+        spool.append("deduplication", [b'{"a":1}', b'{"b":2}'], "application/json", None)
+        spool.append("geocoding", [b"\x93\x01"], "application/msgpack", "zstd")
+
+        assert spool.claim() is None  # Still open
+        spool.seal()
+        segment = spool.claim()
+
+        assert segment.name.endswith(f".{spool.owner}.drain")
+        assert list(spool.read(segment)) == [
+            SpooledMessage("deduplication", b'{"a":1}', "application/json", None),
+            SpooledMessage("deduplication", b'{"b":2}', "application/json", None),
+            SpooledMessage("geocoding", b"\x93\x01", "application/msgpack", "zstd"),
+        ]
+        assert spool.stats()["appended"] == 3
+
+        spool.remove(segment, replayed=3)
+        assert spool_files(spool) == []
+        assert spool.stats()["replayed"] == 3
+
+    def test_rotates_full_segments(self, tmp_path):
+        """Test that a segment past its size limit is sealed by the append."""
+        spool = MessageSpool(tmp_path, segment_max_bytes=100)
+        spool.append("deduplication", [b"x" * 80], None, None)
+        spool.append("deduplication", [b"y"], None, None)
+
+        assert len(spool_files(spool, "*.seg")) == 1
+        assert len(spool_files(spool, "*.open")) == 1
+
+    def test_stops_at_torn_record(self, tmp_path):
+        """Test that a record cut short by a crash ends the segment."""
+        spool = MessageSpool(tmp_path)
+        spool.append("deduplication", [b"complete", b"torn-record"], None, None)
+        spool.seal()
+        segment = next(tmp_path.glob("*.seg"))
+        segment.write_bytes(segment.read_bytes()[:-4])
+
+        assert [m.body for m in spool.read(segment)] == [b"complete"]
+
+    def test_release_and_claim_once(self, tmp_path):
+        """Test that a claimed segment is invisible to other claims until released."""
+        spool = MessageSpool(tmp_path)
+        spool.append("deduplication", [b"1"], None, None)
+        spool.seal()
+
+        segment = spool.claim()
+        assert spool.claim() is None
+        spool.release(segment)
+        assert spool.claim() is not None
+
+    def test_adopts_segments_of_exited_processes(self, tmp_path):
+        """Test that open and claimed segments of dead processes are replayed."""
+        dead_pid = 2 ** 22 + 12345  # Above the default pid_max
+        spool = MessageSpool(tmp_path)
+        writer = MessageSpool(tmp_path)
+        writer.owner = f"{dead_pid}_1"
+        writer.append("deduplication", [b"orphan"], None, None)
+        (tmp_path / f"00000000000000000001-1_1.{dead_pid}_1.drain").write_bytes(b"")
+        (tmp_path / f"00000000000000000002-{spool.owner}.open").write_bytes(b"")
+
+        segment = spool.claim()
+
+        assert segment.name.startswith("00000000000000000001-1_1.")
+        assert len(spool_files(spool, "*.seg")) == 1  # The dead writer's segment
+        assert len(spool_files(spool, "*.open")) == 1  # Ours stays open
+
+    def test_adopts_segments_of_earlier_process_with_same_pid(self, tmp_path):
+        """Test that segments left by a crashed run with our pid (container restart) are replayed."""
+        crashed = MessageSpool(tmp_path)
+        crashed.owner = f"{os.getpid()}_1"  # Same pid, earlier start
+        crashed.append("deduplication", [b"before-crash"], None, None)
+
+        spool = MessageSpool(tmp_path)
+        segment = spool.claim()
+
+        assert [m.body for m in spool.read(segment)] == [b"before-crash"]
+        assert spool_files(spool, "*.open") == []
+
+    def test_open_spool(self, tmp_path, monkeypatch):
+        """Test that the spool is disabled without a directory and shared per process."""
+        monkeypatch.delenv("RABBITMQ_SPOOL_PATH", raising=False)
+        assert open_spool() is None
+
+        monkeypatch.setenv("RABBITMQ_SPOOL_PATH", str(tmp_path))
+        assert open_spool() is open_spool(tmp_path)